@@ -33,6 +33,7 @@ sys.path.insert(0, project_root)
 
 try:
     from engineering_mcp.tag_definitions import discover_all_tags, get_tag_definitions, TAG_DESCRIPTIONS
+    from engineering_mcp.static_metadata import extract_static_metadata
 except ImportError as e:
     print(f"ERROR: Kann Engineering MCP Module nicht importieren: {e}")
     sys.exit(1)
@@ -88,7 +89,7 @@ def find_python_files(directory: str) -> List[str]:
 
 def parse_tool_tags_from_file(file_path: str) -> Tuple[List[str], int, int]:
     """
-    Extrahiert TOOL_TAGS aus einer Python-Datei.
+    Extrahiert TOOL_TAGS aus einer Python-Datei (statisch per AST, ohne Ausführung).
     
     Args:
         file_path: Pfad zur Python-Datei
@@ -96,77 +97,13 @@ def parse_tool_tags_from_file(file_path: str) -> Tuple[List[str], int, int]:
     Returns:
         Tuple[List[str], int, int]: (tags, start_line, end_line)
     """
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            lines = content.split('\n')
-        
-        # Suche nach TOOL_TAGS = [...]
-        in_tool_tags = False
-        start_line = -1
-        end_line = -1
-        tags = []
-        
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            
-            if 'TOOL_TAGS' in stripped and '=' in stripped:
-                start_line = i + 1  # 1-basiert
-                in_tool_tags = True
-                
-                # Prüfe ob alles in einer Zeile steht
-                if '[' in stripped and ']' in stripped:
-                    # Einzeilige Definition
-                    end_line = i + 1
-                    tag_content = stripped.split('=', 1)[1].strip()
-                    tags = extract_tags_from_string(tag_content)
-                    break
-                elif '[' in stripped:
-                    # Mehrzeilige Definition beginnt
-                    continue
-            
-            elif in_tool_tags:
-                if ']' in stripped:
-                    # Ende der mehrzeiligen Definition
-                    end_line = i + 1
-                    break
-        
-        # Wenn mehrzeilig, extrahiere alle Tags
-        if start_line != -1 and end_line != -1 and start_line != end_line:
-            tag_lines = lines[start_line-1:end_line]
-            tag_content = ' '.join(tag_lines)
-            tags = extract_tags_from_string(tag_content)
-        
-        return tags, start_line, end_line
-        
-    except Exception as e:
-        print(f"Fehler beim Parsen von {file_path}: {e}")
+    extracted = extract_static_metadata(file_path)
+    tags = extracted["constants"].get("TOOL_TAGS")
+    if not isinstance(tags, (list, tuple)):
         return [], -1, -1
-
-def extract_tags_from_string(content: str) -> List[str]:
-    """
-    Extrahiert Tags aus einem String wie 'TOOL_TAGS = ["tag1", "tag2"]'.
     
-    Args:
-        content: String-Inhalt
-        
-    Returns:
-        List[str]: Extrahierte Tags
-    """
-    try:
-        # Entferne TOOL_TAGS = und finde die Liste
-        if 'TOOL_TAGS' in content:
-            content = content.split('=', 1)[1]
-        
-        # Finde alle Strings in Anführungszeichen
-        pattern = r'["\']([^"\']+)["\']'
-        matches = re.findall(pattern, content)
-        
-        return [match.strip() for match in matches if match.strip()]
-        
-    except Exception as e:
-        print(f"Fehler beim Extrahieren der Tags: {e}")
-        return []
+    start_line, end_line = extracted["line_numbers"]["TOOL_TAGS"]
+    return [str(tag).strip() for tag in tags if str(tag).strip()], start_line, end_line
 
 def update_tool_tags_in_file(file_path: str, new_tags: List[str], dry_run: bool = False) -> bool:
     """
@@ -242,7 +179,7 @@ def find_insert_position(lines: List[str]) -> int:
 
 def parse_tool_metadata_from_file(file_path: str) -> Dict[str, Any]:
     """
-    Extrahiert alle Metadaten aus einer Tool-Datei.
+    Extrahiert alle Metadaten aus einer Tool-Datei (statisch per AST, ohne Ausführung).
     
     Args:
         file_path: Pfad zur Python-Datei
@@ -250,101 +187,31 @@ def parse_tool_metadata_from_file(file_path: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Extrahierte Metadaten
     """
+    constants = extract_static_metadata(file_path)["constants"]
     metadata = {}
     
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Metadaten-Pattern definieren
-        patterns = {
-            'tool_metadata': r'TOOL_METADATA\s*=\s*(\{.*?\})',
-            'tool_description': r'TOOL_DESCRIPTION\s*=\s*["\']([^"\']*)["\']',
-            'tool_category': r'TOOL_CATEGORY\s*=\s*["\']([^"\']*)["\']',
-            'has_solving': r'HAS_SOLVING\s*=\s*["\']([^"\']*)["\']',
-            'norm_foundation': r'NORM_FOUNDATION\s*=\s*["\']([^"\']*)["\']',
-            'knowledge_foundation': r'KNOWLEDGE_FOUNDATION\s*=\s*["\']([^"\']*)["\']'
-        }
-        
-        # Extrahiere einfache String-Metadaten
-        for key, pattern in patterns.items():
-            if key == 'tool_metadata':
-                continue  # Spezialbehandlung für TOOL_METADATA
-                
-            match = re.search(pattern, content, re.MULTILINE | re.DOTALL)
-            if match:
-                metadata[key] = match.group(1).strip()
-        
-        # Spezialbehandlung für TOOL_METADATA (Dictionary)
-        tool_metadata_match = re.search(patterns['tool_metadata'], content, re.MULTILINE | re.DOTALL)
-        if tool_metadata_match:
-            try:
-                # Versuche das Dictionary zu parsen
-                metadata_str = tool_metadata_match.group(1)
-                # Einfache Extraktion der Key-Value-Paare
-                dict_content = extract_dict_content(metadata_str)
-                metadata.update(dict_content)
-            except Exception as e:
-                metadata['tool_metadata_raw'] = tool_metadata_match.group(1)
-        
-        # Zusätzliche Pattern für andere Metadaten
-        additional_patterns = {
-            'version': r'__version__\s*=\s*["\']([^"\']*)["\']',
-            'author': r'__author__\s*=\s*["\']([^"\']*)["\']',
-            'date': r'__date__\s*=\s*["\']([^"\']*)["\']'
-        }
-        
-        for key, pattern in additional_patterns.items():
-            match = re.search(pattern, content, re.MULTILINE)
-            if match:
-                metadata[key] = match.group(1).strip()
-                
-    except Exception as e:
-        print(f"Fehler beim Extrahieren der Metadaten aus {file_path}: {e}")
-    
-    return metadata
-
-def extract_dict_content(dict_str: str) -> Dict[str, Any]:
-    """
-    Extrahiert Key-Value-Paare aus einem Dictionary-String.
-    
-    Args:
-        dict_str: String-Repräsentation eines Dictionary
-        
-    Returns:
-        Dict[str, Any]: Extrahierte Key-Value-Paare
-    """
-    result = {}
+    # Einfache String-Metadaten: Schlüssel -> Modul-Konstante
+    string_fields = {
+        'tool_description': 'TOOL_DESCRIPTION',
+        'tool_category': 'TOOL_CATEGORY',
+        'has_solving': 'HAS_SOLVING',
+        'norm_foundation': 'NORM_FOUNDATION',
+        'knowledge_foundation': 'KNOWLEDGE_FOUNDATION',
+        'version': '__version__',
+        'author': '__author__',
+        'date': '__date__'
+    }
+    for key, constant_name in string_fields.items():
+        value = constants.get(constant_name)
+        if isinstance(value, str):
+            metadata[key] = value.strip()
     
-    try:
-        # Entferne äußere Klammern
-        dict_str = dict_str.strip()
-        if dict_str.startswith('{'):
-            dict_str = dict_str[1:]
-        if dict_str.endswith('}'):
-            dict_str = dict_str[:-1]
-        
-        # Einfache Extraktion von "key": "value" Paaren
-        pairs = re.findall(r'["\']([^"\']+)["\']\s*:\s*["\']([^"\']+)["\']', dict_str)
-        for key, value in pairs:
-            result[key] = value
-        
-        # Extraktion von "key": non-string values
-        non_string_pairs = re.findall(r'["\']([^"\']+)["\']\s*:\s*([^,}]+)', dict_str)
-        for key, value in non_string_pairs:
-            value = value.strip()
-            if value not in result.get(key, ''):  # Vermeide Duplikate
-                if value.isdigit():
-                    result[key] = int(value)
-                elif value.lower() in ('true', 'false'):
-                    result[key] = value.lower() == 'true'
-                elif not any(char in value for char in ['"', "'"]):  # Kein String
-                    result[key] = value
-                    
-    except Exception as e:
-        print(f"Fehler beim Parsen des Dictionary-Strings: {e}")
+    # TOOL_METADATA (Meta-Tools): Einträge flach übernehmen
+    tool_metadata = constants.get('TOOL_METADATA')
+    if isinstance(tool_metadata, dict):
+        metadata.update(tool_metadata)
     
-    return result
+    return metadata
 
 def update_tool_metadata_in_file(file_path: str, new_metadata: Dict[str, Any], dry_run: bool = False) -> bool:
     """
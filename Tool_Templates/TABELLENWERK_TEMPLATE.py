@@ -341,6 +341,8 @@ def get_metadata():
         "description": TOOL_DESCRIPTION,  # ✅ Neu
         "tags": TOOL_TAGS,  # ✅ Neu: "tags" statt "tool_tags"
         "has_solving": HAS_SOLVING,
+        # "persistent_cache": True,  # Optional: Ergebnisse überdauern Neustarts (SQLite-Cache)
+        # "data_files": ["Tabellen/[tabelle].csv"],  # Optional: Tabellen-Dateien (Teil der Cache-Version)
         
         # ✅ KRITISCH: Parameters Dictionary für Registry-Discovery
         # ⚠️ WICHTIG: Verwenden Sie IMMER FUNCTION_PARAM_*_NAME Konstanten!
@@ -84,6 +84,7 @@ Genauigkeit: [Bei numerischen Methoden: Toleranz und Fehlerabschätzung]"""
 # Parameter-Definitionen für Metadaten
 PARAMETER_DEUTSCHE_VARIABLE_1 = {
     "type": "string | array",  # ERWEITERT für Batch
+    "dimension": "length",  # Optional: length, area, volume, pressure, force, ... (engineering_mcp/dimensions.py)
     "description": FUNCTION_PARAM_1_DESC,
     "example": FUNCTION_PARAM_1_EXAMPLE,
     "batch_example": ["target", "10 mm", "target"]  # NEU
@@ -91,6 +92,7 @@ PARAMETER_DEUTSCHE_VARIABLE_1 = {
 
 PARAMETER_DEUTSCHE_VARIABLE_2 = {
     "type": "string | array",  # ERWEITERT für Batch
+    "dimension": "length",
     "description": FUNCTION_PARAM_2_DESC,
     "example": FUNCTION_PARAM_2_EXAMPLE,
     "batch_example": ["20 mm", "target", "30 mm"]  # NEU
@@ -98,6 +100,7 @@ PARAMETER_DEUTSCHE_VARIABLE_2 = {
 
 PARAMETER_DEUTSCHE_VARIABLE_3 = {
     "type": "string | array",  # ERWEITERT für Batch
+    "dimension": "length",
     "description": FUNCTION_PARAM_3_DESC,
     "example": FUNCTION_PARAM_3_EXAMPLE,
     "batch_example": ["5 cm", "6 cm", "7 cm"]  # NEU
@@ -169,71 +172,27 @@ PARAMETER_COUNT = len([name for name in globals() if name.startswith('PARAMETER_
 from typing import Dict, Annotated, List, Any, Optional, Union
 import sys
 import os
+import numpy as np
 
 # Import des Einheiten-Utilities
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from engineering_mcp.units_utils import validate_inputs_have_units, optimize_output_unit, UnitsError, ureg
+from engineering_mcp.batch_engine import batch_kernel, run_batch
 
 # ================================================================================================
-# 🔄 BATCH PROCESSING HELPERS 🔄
+# ⚡ BATCH-KERNEL ⚡
 # ================================================================================================
 
-def is_batch_input(params: Dict[str, Any]) -> bool:
-    """
-    Prüft ob die Parameter im Batch-Modus sind.
-    Batch-Modus: ALLE Parameter sind Listen gleicher Länge.
-    """
-    list_params = [k for k, v in params.items() if isinstance(v, list)]
-    
-    # Wenn keine Listen, kein Batch-Modus
-    if not list_params:
-        return False
-    
-    # ALLE Parameter müssen Listen sein
-    if len(list_params) != len(params):
-        return False
-    
-    # Alle Listen müssen gleiche Länge haben
-    lengths = [len(params[k]) for k in list_params]
-    return len(set(lengths)) == 1 and lengths[0] > 0
+# Vektorisierte Berechnung ganzer Batch-Spalten (SI-Arrays) über engineering_mcp.batch_engine.
+# Ein Kernel pro geschlossen lösbarem target-Parameter: Argumente = gegebene Parameter in SI,
+# Rückgabe = Ergebnis in SI (NaN = Zeile ablehnen -> Fehlermeldung über _solve_single()).
+# Numerische Verfahren brauchen keinen Kernel - diese Zeilen laufen über _solve_single().
+# Ausgabeformat (header/trailer/formula) muss exakt dem Ergebnis von _solve_single() entsprechen.
 
-def prepare_batch_combinations(params: Dict[str, Any]) -> List[Dict[str, str]]:
-    """
-    Erstellt Parametersätze für Batch-Verarbeitung.
-    
-    NEU: Alle Parameter müssen Listen gleicher Länge sein!
-    Jeder Index repräsentiert einen vollständigen Parametersatz.
-    
-    Beispiel:
-    Input: {
-        'flaeche': ['target', '10 cm²', 'target'],
-        'radius': ['5 cm', '10 cm', '15 cm'],
-        'durchmesser': ['30 cm', 'target', '45 cm']
-    }
-    Output: [
-        {'flaeche': 'target', 'radius': '5 cm', 'durchmesser': '30 cm'},
-        {'flaeche': '10 cm²', 'radius': '10 cm', 'durchmesser': 'target'},
-        {'flaeche': 'target', 'radius': '15 cm', 'durchmesser': '45 cm'}
-    ]
-    """
-    # Prüfe ob Batch-Modus
-    if not is_batch_input(params):
-        # Einzelberechnung - gib Parameter unverändert zurück
-        return [params]
-    
-    # Batch-Modus: Alle Parameter sind Listen
-    # Hole die Anzahl der Berechnungen (alle Listen haben gleiche Länge)
-    num_calculations = len(next(iter(params.values())))
-    
-    # Erstelle Parametersätze für jeden Index
-    combinations = []
-    for i in range(num_calculations):
-        combo = {}
-        for key, values in params.items():
-            combo[key] = values[i]
-        combinations.append(combo)
-    
-    return combinations
+@batch_kernel(TOOL_NAME, "deutsche_variable_1", formula="[Formel nach Variable 1]",
+              header={"📊 ANALYTICAL SOLUTION": "Geschlossene Formel"})
+def _kernel_deutsche_variable_1(deutsche_variable_2, deutsche_variable_3):
+    return deutsche_variable_2 * deutsche_variable_3
 
 # ================================================================================================
 # 🎯 TOOL FUNCTIONS 🎯
@@ -260,69 +219,9 @@ def solve_tool_name(
             'deutsche_variable_3': deutsche_variable_3
         }
         
-        # Validiere Batch-Format
-        list_params = [k for k, v in params_dict.items() if isinstance(v, list)]
-        if list_params:
-            # Einige Parameter sind Listen - prüfe ob ALLE Listen sind
-            non_list_params = [k for k, v in params_dict.items() if not isinstance(v, list)]
-            if non_list_params:
-                return {
-                    "error": "Batch-Modus erfordert, dass ALLE Parameter Listen sind",
-                    "list_params": list_params,
-                    "non_list_params": non_list_params,
-                    "hinweis": "Entweder alle Parameter als einzelne Werte ODER alle als Listen gleicher Länge"
-                }
-            
-            # Prüfe ob alle Listen gleiche Länge haben
-            lengths = {k: len(v) for k, v in params_dict.items()}
-            unique_lengths = set(lengths.values())
-            if len(unique_lengths) > 1:
-                return {
-                    "error": "Alle Parameter-Listen müssen die gleiche Länge haben",
-                    "lengths": lengths,
-                    "hinweis": "Jeder Index repräsentiert einen vollständigen Parametersatz"
-                }
-        
-        # Erstelle alle Kombinationen für Batch-Verarbeitung
-        combinations = prepare_batch_combinations(params_dict)
-        
-        # Wenn nur eine Kombination, führe normale Berechnung durch
-        if len(combinations) == 1:
-            return _solve_single(
-                combinations[0]['deutsche_variable_1'],
-                combinations[0]['deutsche_variable_2'],
-                combinations[0]['deutsche_variable_3']
-            )
-        
-        # Batch-Verarbeitung: Berechne alle Kombinationen
-        results = []
-        for i, combo in enumerate(combinations):
-            try:
-                result = _solve_single(
-                    combo['deutsche_variable_1'],
-                    combo['deutsche_variable_2'],
-                    combo['deutsche_variable_3']
-                )
-                # Füge Batch-Index hinzu
-                result['batch_index'] = i
-                result['input_combination'] = combo
-                results.append(result)
-            except Exception as e:
-                # Bei Fehler in einer Berechnung, füge Fehler-Ergebnis hinzu
-                results.append({
-                    'batch_index': i,
-                    'input_combination': combo,
-                    'error': str(e),
-                    'type': type(e).__name__
-                })
-        
-        return {
-            "batch_mode": True,
-            "total_calculations": len(combinations),
-            "successful": sum(1 for r in results if 'error' not in r),
-            "failed": sum(1 for r in results if 'error' in r),
-            "results": results
-        }
+        # ⚡ Batch-Engine: prüft das Batch-Format, rechnet Zeilen mit Kernel vektorisiert,
+        # alle übrigen zeilenweise über _solve_single()
+        return run_batch(TOOL_NAME, params_dict, _solve_single)
         
     except Exception as e:
         return {
@@ -487,10 +386,9 @@ ANPASSUNGS-CHECKLISTE für neue Solving-Tools:
 🔄 BATCH-MODE IMPLEMENTIERUNG:
 
 Das Template enthält bereits vollständige Batch-Unterstützung:
-- is_batch_input() prüft auf Batch-Modus
-- prepare_batch_combinations() erstellt Parametersätze
-- solve_tool_name() validiert und orchestriert
-- _solve_single() enthält die eigentliche Berechnungslogik
+- run_batch() (engineering_mcp.batch_engine) validiert und orchestriert
+- @batch_kernel registriert NumPy-Kernel für geschlossen lösbare targets (ganze Spalten auf einmal)
+- _solve_single() enthält die eigentliche Berechnungslogik (Einzelwerte, Fehlerfälle, numerische targets)
 
 Batch-Regeln:
 - ALLE Parameter müssen Listen gleicher Länge sein
@@ -0,0 +1,646 @@
+"""
+Batch-Engine für Engineering MCP
+
+Gemeinsame Batch-Ausführung für alle Tools mit 'target'-Parametern. Statt dass
+jedes Tool seine Parametersätze einzeln durch _solve_single() schickt, arbeitet
+die Engine spaltenweise:
+
+1. Batch-Format prüfen (gleiche Fehlermeldungen wie bisher in den Tools)
+2. Jede Parameter-Spalte EINMAL nach SI umrechnen (convert_column_to_si)
+3. Zeilen nach target-Parameter gruppieren
+4. Pro Gruppe den vom Tool registrierten NumPy-Kernel auf alle Zeilen anwenden
+5. Ergebnisse EINMAL am Ende in der ursprünglichen Reihenfolge zusammensetzen
+
+Tools registrieren ihre Kernel beim Import:
+
+    @batch_kernel(TOOL_NAME, "flaeche", formula="A = π × r²",
+                  header={"📊 ANALYTICAL SOLUTION": "Geschlossene Formel"})
+    def _kernel_flaeche(radius):
+        return np.pi * radius * radius
+
+Kernel erhalten die gegebenen Parameter als SI-Arrays und liefern das Ergebnis
+in SI. NaN markiert Zeilen, die das Tool selbst ablehnen würde (z.B. verletzte
+Dreiecksungleichung) - diese Zeilen, Zeilen ohne Kernel (numerische Verfahren)
+und fehlerhafte Eingaben laufen weiterhin über _solve_single() des Tools. Damit
+bleiben Fehlermeldungen und Ergebnisformat exakt gleich.
+
+⚡ PERFORMANCE: Ein 50k-Zeilen-Batch von kreis_flaeche braucht statt Sekunden
+nur noch Millisekunden für die Berechnung - übrig bleibt im Wesentlichen der
+Aufbau der Ergebnis-Dicts.
+"""
+
+import inspect
+from typing import Dict, Any, List, Optional, Tuple, NamedTuple, Callable, Mapping
+
+import numpy as np
+
+from engineering_mcp.dimensions import compile_dimension_checks
+
+# SI-Einheitensymbol der si_werte-Ausgabe pro Dimension (wie in den Tools)
+_SI_SYMBOLS = {
+    "length": "m",
+    "area": "m²",
+    "volume": "m³",
+    "pressure": "Pa",
+    "stress": "Pa",
+    "force": "N",
+}
+
+
+class BatchKernel(NamedTuple):
+    """Vektorisierte Berechnung eines target-Parameters inkl. Ausgabeformat"""
+    target: str
+    function: Callable                       # fn(**si_arrays) -> SI-Array (NaN = Zeile ablehnen)
+    formula: str
+    given: Optional[Tuple[str, ...]]         # Reihenfolge gegebene_werte (None = Deklaration)
+    si_order: Optional[Tuple[str, ...]]      # Reihenfolge si_werte (None = target + given)
+    header: Tuple[Tuple[str, Any], ...]      # Schlüssel vor target_parameter
+    trailer: Tuple[Tuple[str, Any], ...]     # Schlüssel zwischen formel und si_werte
+    labels: Mapping[str, str]                # Parametername -> Ausgabe-Schlüssel
+
+
+# Tool-Name -> target -> BatchKernel (wird beim Import der Tool-Module befüllt)
+_BATCH_KERNELS: Dict[str, Dict[str, BatchKernel]] = {}
+
+# Tool-Name -> Parametername -> Dimension (lazy aus get_metadata() des Tools)
+_TOOL_DIMENSIONS: Dict[str, Dict[str, str]] = {}
+
+
+def batch_kernel(tool_name: str, target: str, formula: str,
+                 given: Optional[Tuple[str, ...]] = None,
+                 si_order: Optional[Tuple[str, ...]] = None,
+                 header: Optional[Dict[str, Any]] = None,
+                 trailer: Optional[Dict[str, Any]] = None,
+                 labels: Optional[Dict[str, str]] = None):
+    """
+    Decorator: Registriert einen NumPy-Kernel für einen target-Parameter.
+
+    Args:
+        tool_name: TOOL_NAME des Tools
+        target: Parametername, den der Kernel berechnet
+        formula: Wert für "formel" im Ergebnis
+        given: Reihenfolge der gegebenen Parameter (Standard: Deklarationsreihenfolge)
+        si_order: Reihenfolge der si_werte (Standard: target, dann given)
+        header: Ergebnis-Schlüssel vor "target_parameter"
+        trailer: Ergebnis-Schlüssel zwischen "formel" und "si_werte"
+        labels: Abweichende Ausgabe-Schlüssel (z.B. 'halb_achse_a' -> 'grosse_halbachse')
+
+    Returns:
+        Callable: Decorator, der die Funktion unverändert zurückgibt
+    """
+    def decorator(function: Callable) -> Callable:
+        _BATCH_KERNELS.setdefault(tool_name, {})[target] = BatchKernel(
+            target=target,
+            function=function,
+            formula=formula,
+            given=tuple(given) if given else None,
+            si_order=tuple(si_order) if si_order else None,
+            header=tuple((header or {}).items()),
+            trailer=tuple((trailer or {}).items()),
+            labels=dict(labels or {}),
+        )
+        # Hot-Reload: Modul wurde neu importiert -> Dimensionen neu lesen
+        _TOOL_DIMENSIONS.pop(tool_name, None)
+        return function
+    return decorator
+
+
+def get_batch_kernels(tool_name: str) -> Dict[str, BatchKernel]:
+    """
+    Liefert die registrierten Kernel eines Tools.
+
+    Args:
+        tool_name: TOOL_NAME des Tools
+
+    Returns:
+        Dict: target -> BatchKernel (leer = nur zeilenweise Berechnung)
+    """
+    return dict(_BATCH_KERNELS.get(tool_name, {}))
+
+
+def _get_tool_dimensions(tool_name: str, solve_single: Callable) -> Dict[str, str]:
+    """Deklarierte Dimensionen der Parameter (aus get_metadata() des Tool-Moduls, gecacht)."""
+    dimensions = _TOOL_DIMENSIONS.get(tool_name)
+    if dimensions is None:
+        dimensions = {}
+        module = inspect.getmodule(solve_single)
+        get_metadata = getattr(module, 'get_metadata', None)
+        if get_metadata is not None:
+            checks = compile_dimension_checks(get_metadata().get('parameters') or {}, None, tool_name)
+            dimensions = {check.parameter: check.dimension for check in checks}
+        _TOOL_DIMENSIONS[tool_name] = dimensions
+    return dimensions
+
+
+# ================================================================================================
+# 🔧 BATCH-FORMAT
+# ================================================================================================
+
+def is_batch_input(params: Dict[str, Any]) -> bool:
+    """
+    Prüft, ob mindestens ein Parameter eine Liste ist.
+
+    Args:
+        params: Parametername -> Einzelwert oder Liste
+
+    Returns:
+        bool: True bei Batch-Eingabe
+    """
+    return any(isinstance(value, list) for value in params.values())
+
+
+def validate_batch_format(params: Dict[str, Any], broadcast_scalars: bool = False) -> Optional[Dict]:
+    """
+    Prüft das Batch-Format und liefert ggf. das Fehler-Dict der Tools.
+
+    Args:
+        params: Parametername -> Einzelwert oder Liste
+        broadcast_scalars: Einzelwerte werden auf alle Zeilen übertragen (sonst: alle müssen Listen sein)
+
+    Returns:
+        Optional[Dict]: Fehler-Dict oder None bei gültigem Format
+    """
+    list_params = [k for k, v in params.items() if isinstance(v, list)]
+    if not list_params:
+        return None
+
+    if broadcast_scalars:
+        lengths = {k: len(params[k]) for k in list_params}
+        if len(set(lengths.values())) > 1:
+            return {
+                "error": "Alle Listen-Parameter müssen die gleiche Länge haben",
+                "gefundene_laengen": lengths,
+                "hinweis": "Jeder Index repräsentiert eine vollständige Parameter-Kombination"
+            }
+        return None
+
+    non_list_params = [k for k, v in params.items() if not isinstance(v, list)]
+    if non_list_params:
+        return {
+            "error": "Batch-Modus erfordert, dass ALLE Parameter Listen sind",
+            "list_params": list_params,
+            "non_list_params": non_list_params,
+            "hinweis": "Entweder alle Parameter als einzelne Werte ODER alle als Listen gleicher Länge"
+        }
+
+    lengths = {k: len(v) for k, v in params.items()}
+    if len(set(lengths.values())) > 1:
+        return {
+            "error": "Alle Parameter-Listen müssen die gleiche Länge haben",
+            "lengths": lengths,
+            "hinweis": "Jeder Index repräsentiert einen vollständigen Parametersatz"
+        }
+    return None
+
+
+def prepare_batch_columns(params: Dict[str, Any], broadcast_scalars: bool = False) -> Dict[str, list]:
+    """
+    Bringt alle Parameter auf Spalten gleicher Länge (Batch-Format vorher prüfen).
+
+    Args:
+        params: Parametername -> Einzelwert oder Liste
+        broadcast_scalars: Einzelwerte auf alle Zeilen übertragen
+
+    Returns:
+        Dict: Parametername -> Liste (Listen-Parameter zuerst bei broadcast_scalars)
+    """
+    lists = {k: v for k, v in params.items() if isinstance(v, list)}
+    count = len(next(iter(lists.values()))) if lists else 1
+    if not broadcast_scalars:
+        return {k: (v if isinstance(v, list) else [v]) for k, v in params.items()}
+    columns = dict(lists)
+    for key, value in params.items():
+        if not isinstance(value, list):
+            columns[key] = [value] * count
+    return columns
+
+
+def prepare_batch_combinations(params: Dict[str, Any], broadcast_scalars: bool = False) -> List[Dict]:
+    """
+    Erstellt die Parametersätze eines Batches (ein Dict pro Zeile).
+
+    Args:
+        params: Parametername -> Einzelwert oder Liste
+        broadcast_scalars: Einzelwerte auf alle Zeilen übertragen
+
+    Returns:
+        List[Dict]: Parametersätze; ohne Listen genau [params]
+    """
+    if not is_batch_input(params):
+        return [params]
+    if not broadcast_scalars and not any(len(v) for v in params.values()):
+        # Leere Listen: wie bisher als Einzelaufruf an das Tool
+        return [params]
+    columns = prepare_batch_columns(params, broadcast_scalars)
+    names = list(columns)
+    return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+
+# ================================================================================================
+# ⚡ VEKTORISIERTE AUSFÜHRUNG
+# ================================================================================================
+
+def _run_kernels(tool_name: str, names: List[str], columns: Dict[str, list],
+                 solve_single: Callable) -> Dict[int, Dict]:
+    """
+    Berechnet alle Zeilen, für die ein Kernel existiert.
+
+    Args:
+        tool_name: TOOL_NAME des Tools
+        names: Parameternamen in Deklarationsreihenfolge
+        columns: Parametername -> Spalte (gleiche Länge)
+        solve_single: Zeilenweise Berechnung des Tools (für get_metadata())
+
+    Returns:
+        Dict: Zeilenindex -> fertiges Einzelergebnis (fehlende Zeilen -> zeilenweise)
+    """
+    from engineering_mcp.units_utils import convert_column_to_si, format_output_column
+
+    kernels = _BATCH_KERNELS.get(tool_name)
+    if not kernels:
+        return {}
+    dimensions = _get_tool_dimensions(tool_name, solve_single)
+    if any(name not in dimensions or dimensions[name] not in _SI_SYMBOLS for name in names):
+        return {}
+
+    conversions = {name: convert_column_to_si(columns[name], allow_target=True) for name in names}
+    targets = np.stack([conversions[name].target_mask for name in names])
+    errors = np.stack([conversions[name].error_mask for name in names])
+    single_target = targets.sum(axis=0) == 1
+
+    solved: Dict[int, Dict] = {}
+    for position, target in enumerate(names):
+        kernel = kernels.get(target)
+        if kernel is None:
+            continue
+        given = kernel.given or tuple(name for name in names if name != target)
+        rows_mask = single_target & targets[position] & ~errors.any(axis=0)
+        rows = np.flatnonzero(rows_mask)
+        if rows.size == 0:
+            continue
+
+        inputs = {name: conversions[name].si_values[rows] for name in given}
+        with np.errstate(all='ignore'):
+            result = np.asarray(kernel.function(**inputs), dtype=np.float64)
+            valid = np.isfinite(result) & (result > 0)
+            for values in inputs.values():
+                valid &= values > 0
+        if not valid.any():
+            continue
+        rows = rows[valid]
+        result = result[valid]
+        inputs = {name: values[valid] for name, values in inputs.items()}
+        si_arrays = {target: result, **inputs}
+
+        # Spaltenweise formatieren, danach ein Dict pro Zeile in einem Durchlauf
+        labels = kernel.labels
+        target_label = labels.get(target, target)
+        ergebnis = format_output_column(result, dimensions[target])
+        si_order = kernel.si_order or (target,) + given
+        si_keys = tuple(f"{labels.get(name, name)}_si" for name in si_order)
+        si_rows = zip(*(
+            [f"{value:.6g} {_SI_SYMBOLS[dimensions[name]]}" for value in si_arrays[name].tolist()]
+            for name in si_order
+        ))
+        row_list = rows.tolist()
+        given_keys = tuple(labels.get(name, name) for name in given)
+        given_rows = zip(*([columns[name][row] for row in row_list] for name in given))
+        header = dict(kernel.header)
+        trailer = dict(kernel.trailer)
+        formula = kernel.formula
+
+        for row, given_row, value, si_row in zip(row_list, given_rows, ergebnis, si_rows):
+            solved[row] = {
+                **header,
+                "target_parameter": target,
+                "gegebene_werte": dict(zip(given_keys, given_row)),
+                "ergebnis": {target_label: value},
+                "formel": formula,
+                **trailer,
+                "si_werte": dict(zip(si_keys, si_row)),
+            }
+    return solved
+
+
+def _unique_rows(columns: Dict[str, list]) -> Tuple[List[int], List[int]]:
+    """
+    Ermittelt eindeutige Parametersätze eines Batches.
+
+    Zeilen gelten als gleich, wenn alle Eingabe-Strings gleich sind (Parameter-Reparatur
+    hat Leerzeichen bereits normalisiert). "1 m" und "100 cm" bleiben verschieden, da
+    gegebene_werte und Anzeige-Einheit vom übergebenen String abhängen können.
+
+    Args:
+        columns: Parametername -> Spalte (gleiche Länge)
+
+    Returns:
+        Tuple: (Zeilenindex des ersten Vorkommens je Parametersatz,
+        Position in dieser Liste für jede Zeile)
+    """
+    count = len(next(iter(columns.values()), ()))
+    first: Dict[Tuple, int] = {}
+    unique_rows: List[int] = []
+    source: List[int] = []
+    try:
+        for row, key in enumerate(zip(*columns.values())):
+            position = first.setdefault(key, len(unique_rows))
+            if position == len(unique_rows):
+                unique_rows.append(row)
+            source.append(position)
+    except TypeError:
+        # Nicht hashbare Eingaben - keine Zusammenfassung
+        return list(range(count)), list(range(count))
+    return unique_rows, source
+
+
+def _take_rows(column: list, rows: List[int]) -> list:
+    """Zeilenauswahl einer Spalte (SweepColumn behält ihre SI-Werte)"""
+    take = getattr(column, "take", None)
+    if take is not None:
+        return take(rows)
+    return [column[row] for row in rows]
+
+
+def _copy_result(result: Dict) -> Dict:
+    """Kopie eines Einzelergebnisses für eine weitere Zeile (verschachtelte Dicts eine Ebene tief)"""
+    return {key: (dict(value) if isinstance(value, dict) else value) for key, value in result.items()}
+
+
+def run_batch(tool_name: str, params: Dict[str, Any], solve_single: Callable,
+              broadcast_scalars: bool = False, nest_results: bool = False) -> Dict:
+    """
+    Führt einen (Batch-)Aufruf eines target-Tools aus.
+
+    Einzelwerte gehen unverändert an solve_single(). Bei Listen werden identische
+    Parametersätze nur einmal berechnet, alle Zeilen mit registriertem Kernel
+    vektorisiert, der Rest zeilenweise über solve_single() - das Ergebnisformat
+    ist in allen Fällen identisch.
+
+    Args:
+        tool_name: TOOL_NAME des Tools (Schlüssel der Kernel-Registrierung)
+        params: Parametername -> Einzelwert oder Liste (in Deklarationsreihenfolge)
+        solve_single: Zeilenweise Berechnung des Tools (Keyword-Argumente = Parameternamen)
+        broadcast_scalars: Einzelwerte auf alle Zeilen übertragen (sonst Fehler)
+        nest_results: Einzelergebnis unter "ergebnis" verschachteln (Format der Kesselformel)
+
+    Returns:
+        Dict: Einzelergebnis, Fehler-Dict oder Batch-Ergebnis mit "batch_mode": True
+    """
+    error = validate_batch_format(params, broadcast_scalars)
+    if error is not None:
+        return error
+
+    combinations = prepare_batch_combinations(params, broadcast_scalars)
+    if not is_batch_input(params) or (len(combinations) == 1 and not nest_results):
+        return solve_single(**combinations[0])
+
+    # 🔁 Identische Parametersätze nur einmal berechnen, Ergebnisse danach verteilen
+    columns = prepare_batch_columns(params, broadcast_scalars)
+    unique_rows, source = _unique_rows(columns)
+    if len(unique_rows) < len(combinations):
+        columns = {name: _take_rows(column, unique_rows) for name, column in columns.items()}
+    solved = _run_kernels(tool_name, list(params), columns, solve_single)
+
+    unique_results = []
+    for index, row in enumerate(unique_rows):
+        result = solved.get(index)
+        if result is None:
+            try:
+                result = solve_single(**combinations[row])
+            except Exception as e:
+                result = e
+        unique_results.append(result)
+
+    results = []
+    used = set()
+    for index, combination in enumerate(combinations):
+        result = unique_results[source[index]]
+        if isinstance(result, Exception):
+            if nest_results:
+                results.append({
+                    "batch_index": index,
+                    "input_combination": combination,
+                    "error": f"Berechnungsfehler: {str(result)}"
+                })
+            else:
+                results.append({
+                    "batch_index": index,
+                    "input_combination": combination,
+                    "error": str(result),
+                    "type": type(result).__name__
+                })
+            continue
+        if source[index] in used:
+            result = _copy_result(result)
+        used.add(source[index])
+
+        if not nest_results:
+            result["batch_index"] = index
+            result["input_combination"] = combination
+            results.append(result)
+        elif "error" in result:
+            results.append({"batch_index": index, "input_combination": combination, "error": result["error"]})
+        else:
+            results.append({"batch_index": index, "input_combination": combination, "ergebnis": result})
+
+    failed = sum(1 for r in results if 'error' in r)
+    return {
+        "batch_mode": True,
+        "total_calculations": len(combinations),
+        "successful": len(results) - failed,
+        "failed": failed,
+        "results": results
+    }
+
+
+# ================================================================================================
+# 📡 CHUNK-VERARBEITUNG
+# ================================================================================================
+
+def split_batch(params: Dict[str, Any], chunk_size: int) -> Optional[List[Tuple[int, Dict[str, Any]]]]:
+    """
+    Teilt einen Batch in Zeilenblöcke (für Fortschrittsmeldung und Streaming).
+
+    Einzelwerte werden unverändert an jeden Block weitergegeben. Ein Block mit
+    nur einer Zeile wird vermieden, da run_batch() ihn als Einzelaufruf behandeln würde.
+
+    Args:
+        params: Parametername -> Einzelwert oder Liste
+        chunk_size: Maximale Zeilen pro Block (mindestens 2)
+
+    Returns:
+        Optional[List[Tuple[int, Dict]]]: (Start-Index, Block-Parameter) oder None,
+        wenn nicht geteilt werden muss/kann (kein Batch, ungleiche Längen, kleiner Batch)
+    """
+    lengths = {len(value) for value in params.values() if isinstance(value, list)}
+    if len(lengths) != 1:
+        return None
+    count = lengths.pop()
+    chunk_size = max(2, chunk_size)
+    if count <= chunk_size:
+        return None
+
+    starts = list(range(0, count, chunk_size))
+    if count - starts[-1] == 1:
+        starts.pop()
+    ends = starts[1:] + [count]
+    return [
+        (start, {key: (value[start:end] if isinstance(value, list) else value)
+                 for key, value in params.items()})
+        for start, end in zip(starts, ends)
+    ]
+
+
+def offset_batch_indices(result: Dict, offset: int) -> Dict:
+    """
+    Verschiebt batch_index aller Zeilen eines Block-Ergebnisses auf den Gesamt-Batch.
+
+    Args:
+        result: Batch-Ergebnis eines Blocks (wird verändert)
+        offset: Start-Index des Blocks
+
+    Returns:
+        Dict: Dasselbe Ergebnis
+    """
+    if offset:
+        for row in result.get("results", ()):
+            row["batch_index"] += offset
+    return result
+
+
+def merge_batch_results(parts: List[Dict], keep_results: bool = True) -> Dict:
+    """
+    Fügt Block-Ergebnisse in Reihenfolge zu einem Batch-Ergebnis zusammen.
+
+    Args:
+        parts: Batch-Ergebnisse der Blöcke (batch_index bereits verschoben)
+        keep_results: False, wenn die Zeilen bereits gestreamt wurden (nur Zusammenfassung)
+
+    Returns:
+        Dict: Batch-Ergebnis wie von run_batch()
+    """
+    merged = {
+        "batch_mode": True,
+        "total_calculations": sum(part["total_calculations"] for part in parts),
+        "successful": sum(part["successful"] for part in parts),
+        "failed": sum(part["failed"] for part in parts),
+    }
+    if keep_results:
+        merged["results"] = [row for part in parts for row in part["results"]]
+    else:
+        merged["streamed"] = True
+        merged["chunks"] = len(parts)
+    return merged
+
+
+# ================================================================================================
+# 🎯 ANTWORTFORMAT
+# ================================================================================================
+
+# Erlaubte Werte für result_format in call_tool()
+RESULT_FORMATS = ("rows", "columnar")
+
+# Zeilenfelder, die im Spaltenformat entfallen (stecken bereits in "inputs")
+_ROW_ONLY_KEYS = ("batch_index", "input_combination", "gegebene_werte")
+
+
+def _compact_column(values: list) -> Any:
+    """Gibt eine Spalte mit überall gleichem Wert als Einzelwert zurück (Broadcast)"""
+    if values and values.count(values[0]) == len(values):
+        return values[0]
+    return values
+
+
+def to_columnar(result: Dict) -> Dict:
+    """
+    Wandelt ein Batch-Ergebnis (eine Zeile pro Parametersatz) ins Spaltenformat.
+
+    Statt jede Zeile mit input_combination, gegebene_werte, formel und dem
+    vollständigen si_werte-Block zu wiederholen, gibt es pro Ausgabefeld EIN
+    Array (Index = batch_index, None für fehlgeschlagene bzw. andere Zeilen).
+    Felder, die pro target_parameter konstant sind (formel, berechnungsart, ...),
+    stehen nur einmal unter "per_target". Spalten mit überall gleichem Wert
+    (z.B. übertragene Einzelwerte) werden zum Einzelwert zusammengefasst.
+    Fehler kommen als dünn besetzte Liste.
+
+    Args:
+        result: Rückgabe von run_batch() mit "batch_mode": True
+
+    Returns:
+        Dict: Spaltenformat; Einzelergebnisse, Fehler-Dicts und gestreamte
+        Zusammenfassungen unverändert
+    """
+    if not isinstance(result, dict) or not result.get("batch_mode") or "results" not in result:
+        return result
+
+    rows = result["results"]
+    count = len(rows)
+    inputs: Dict[str, list] = {}
+    targets: List[Optional[str]] = [None] * count
+    columns: Dict[str, Any] = {}
+    scalars: Dict[str, list] = {}
+    errors = []
+
+    for index, row in enumerate(rows):
+        for name, value in (row.get("input_combination") or {}).items():
+            inputs.setdefault(name, [None] * count)[index] = value
+
+        if "error" in row:
+            errors.append({key: value for key, value in row.items() if key != "input_combination"})
+            continue
+
+        # Kesselformel verschachtelt das Einzelergebnis unter "ergebnis"
+        payload = row
+        if "target_parameter" not in row and isinstance(row.get("ergebnis"), dict):
+            payload = row["ergebnis"]
+
+        for key, value in payload.items():
+            if key in _ROW_ONLY_KEYS:
+                continue
+            if key == "target_parameter":
+                targets[index] = value
+            elif isinstance(value, dict):
+                column = columns.setdefault(key, {})
+                for sub_key, sub_value in value.items():
+                    column.setdefault(sub_key, [None] * count)[index] = sub_value
+            else:
+                scalars.setdefault(key, [None] * count)[index] = value
+
+    # Skalare, die pro target_parameter überall gleich sind, nur einmal ausgeben
+    success_rows: Dict[Optional[str], List[int]] = {}
+    for index, row in enumerate(rows):
+        if "error" not in row:
+            success_rows.setdefault(targets[index], []).append(index)
+
+    per_target: Dict[str, Dict[str, Any]] = {}
+    for key, values in scalars.items():
+        constants = {}
+        for target, indices in success_rows.items():
+            first = values[indices[0]]
+            if any(values[i] != first for i in indices):
+                break
+            constants[target] = first
+        else:
+            for target, value in constants.items():
+                per_target.setdefault(str(target), {})[key] = value
+            continue
+        columns[key] = values
+
+    for key, column in columns.items():
+        if isinstance(column, dict):
+            columns[key] = {sub_key: _compact_column(values) for sub_key, values in column.items()}
+        else:
+            columns[key] = _compact_column(column)
+
+    return {
+        "batch_mode": True,
+        "result_format": "columnar",
+        "total_calculations": result.get("total_calculations", count),
+        "successful": result.get("successful", count - len(errors)),
+        "failed": result.get("failed", len(errors)),
+        "inputs": {name: _compact_column(values) for name, values in inputs.items()},
+        "target_parameter": _compact_column(targets),
+        "per_target": per_target,
+        "columns": columns,
+        "errors": errors,
+    }
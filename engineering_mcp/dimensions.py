@@ -0,0 +1,164 @@
+"""
+Dimensions-Prüfung für Engineering MCP
+
+Tools deklarieren pro Parameter die erwartete physikalische Dimension:
+
+    PARAMETER_RADIUS = {
+        "type": "string | array",
+        "dimension": "length",
+        ...
+    }
+
+Bei der Discovery werden diese Angaben EINMALIG zu DimensionCheck-Einträgen
+kompiliert (Exponenten-Tupel für kg, m, s, A, K, mol, cd). Vor dem Aufruf
+des Tools prüft check_parameter_dimensions() jede Parameter-Spalte in einem
+Durchlauf - "5 bar" für einen Radius wird abgelehnt, bevor gerechnet wird.
+
+⚡ VEKTORISIERT: Eine Batch-Spalte wird über convert_column_to_si() geparst,
+die Dimension wird nur pro unterschiedlicher Einheit verglichen (compile_unit
+ist gecacht) und die betroffenen Zeilen per Maske ermittelt.
+"""
+
+from typing import Dict, Any, List, Optional, Tuple, NamedTuple, Mapping
+
+from engineering_mcp.fast_units import FastDimensionality, _BASE_DIMENSIONS
+
+# Dimensionsname -> Exponenten (kg, m, s, A, K, mol, cd)
+DIMENSIONS: Dict[str, Tuple[int, ...]] = {
+    "dimensionless": (0, 0, 0, 0, 0, 0, 0),
+    "length": (0, 1, 0, 0, 0, 0, 0),
+    "area": (0, 2, 0, 0, 0, 0, 0),
+    "volume": (0, 3, 0, 0, 0, 0, 0),
+    "mass": (1, 0, 0, 0, 0, 0, 0),
+    "time": (0, 0, 1, 0, 0, 0, 0),
+    "temperature": (0, 0, 0, 0, 1, 0, 0),
+    "current": (0, 0, 0, 1, 0, 0, 0),
+    "frequency": (0, 0, -1, 0, 0, 0, 0),
+    "velocity": (0, 1, -1, 0, 0, 0, 0),
+    "acceleration": (0, 1, -2, 0, 0, 0, 0),
+    "force": (1, 1, -2, 0, 0, 0, 0),
+    "pressure": (1, -1, -2, 0, 0, 0, 0),
+    "stress": (1, -1, -2, 0, 0, 0, 0),
+    "energy": (1, 2, -2, 0, 0, 0, 0),
+    "torque": (1, 2, -2, 0, 0, 0, 0),
+    "power": (1, 2, -3, 0, 0, 0, 0),
+    "density": (1, -3, 0, 0, 0, 0, 0),
+    "voltage": (1, 2, -3, -1, 0, 0, 0),
+}
+
+
+class DimensionCheck(NamedTuple):
+    """Kompilierte Dimensions-Erwartung eines Parameters"""
+    parameter: str
+    dimension: str              # z.B. 'length'
+    dims: Tuple[int, ...]       # Exponenten (kg, m, s, A, K, mol, cd)
+
+
+class DimensionMismatchError(ValueError):
+    """Parameter-Spalte hat nicht die deklarierte Dimension"""
+
+    def __init__(self, parameter: str, expected: str, rows: Dict[int, str], total_rows: int):
+        self.parameter = parameter
+        self.expected = expected
+        self.rows = rows                # Zeilenindex -> übergebener Wert
+        self.total_rows = total_rows
+        examples = sorted(set(rows.values()))
+        super().__init__(
+            f"Parameter '{parameter}' erwartet Dimension '{expected}' "
+            f"({FastDimensionality(DIMENSIONS[expected])}), "
+            f"{len(rows)} von {total_rows} Werten passen nicht: {examples[:5]}"
+        )
+
+
+def normalize_dimensionality(dimensionality: Any) -> Tuple[float, ...]:
+    """
+    Bringt eine Dimensionalität (schnelles Backend oder Pint) in Tupel-Form.
+
+    Args:
+        dimensionality: FastDimensionality oder Pint-Dimensionalität ({'[length]': 1, ...})
+
+    Returns:
+        Tuple: Exponenten (kg, m, s, A, K, mol, cd)
+    """
+    if isinstance(dimensionality, tuple):
+        return tuple(dimensionality)
+    return tuple(dimensionality.get(name, 0) for name in _BASE_DIMENSIONS)
+
+
+def compile_dimension_checks(parameters: Mapping[str, Any],
+                             warnings: Optional[List[str]] = None,
+                             tool_name: str = "") -> Tuple[DimensionCheck, ...]:
+    """
+    Kompiliert die "dimension"-Angaben der Parameter-Metadaten (bei der Discovery).
+
+    Args:
+        parameters: Parameter-Dict aus get_metadata()
+        warnings: Liste für Discovery-Warnungen (unbekannte Dimensionen)
+        tool_name: Tool-Name für Warnungen
+
+    Returns:
+        Tuple[DimensionCheck, ...]: Nur Parameter mit bekannter Dimension
+    """
+    checks = []
+    for name, info in parameters.items():
+        dimension = info.get('dimension') if isinstance(info, dict) else None
+        if not dimension:
+            continue
+        dims = DIMENSIONS.get(str(dimension).lower())
+        if dims is None:
+            if warnings is not None:
+                warnings.append(f"WARNING: {tool_name}: Unknown dimension '{dimension}' for parameter '{name}' -> not checked")
+            continue
+        checks.append(DimensionCheck(name, str(dimension).lower(), dims))
+    return tuple(checks)
+
+
+def check_parameter_dimensions(checks: Tuple[DimensionCheck, ...], parameters: Dict[str, Any]) -> None:
+    """
+    Prüft alle deklarierten Parameter auf ihre Dimension - ganze Spalten auf einmal.
+
+    Nicht parsebare Werte und unbekannte Einheiten werden hier NICHT gemeldet,
+    das übernimmt weiterhin das Tool (mit seinen zeilenweisen Fehlermeldungen).
+
+    Args:
+        checks: Ergebnis von compile_dimension_checks()
+        parameters: Tool-Parameter (Einzelwert oder Liste pro Parameter)
+
+    Raises:
+        DimensionMismatchError: Beim ersten Parameter mit falscher Dimension
+    """
+    import numpy as np
+    from engineering_mcp.units_utils import convert_column_to_si, compile_unit, UnitsError
+
+    for check in checks:
+        value = parameters.get(check.parameter)
+        if isinstance(value, str):
+            column = [value]
+        elif isinstance(value, (list, tuple)):
+            column = value
+        else:
+            continue
+
+        conversion = convert_column_to_si(column, allow_target=True)
+
+        # Dimension nur pro unterschiedlicher Einheit vergleichen
+        wrong_units = []
+        for unit_str in set(conversion.original_units) - {None}:
+            try:
+                compiled = compile_unit(unit_str)
+            except UnitsError:
+                continue
+            if normalize_dimensionality(compiled.dimensionality) != check.dims:
+                wrong_units.append(unit_str)
+        if not wrong_units:
+            continue
+
+        units = np.array(conversion.original_units, dtype=object)
+        mismatch = np.zeros(len(column), dtype=bool)
+        for unit_str in wrong_units:
+            mismatch |= units == unit_str
+        rows = np.flatnonzero(mismatch)
+        raise DimensionMismatchError(
+            check.parameter, check.dimension,
+            {int(row): column[row] for row in rows.tolist()}, len(column)
+        )
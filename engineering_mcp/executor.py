@@ -0,0 +1,401 @@
+"""
+Executor-Schicht für Engineering-Tools
+
+call_engineering_tool() ruft synchrone Tool-Funktionen nicht mehr direkt auf dem
+Event-Loop-Thread auf:
+
+- Kurze Aufrufe (Einzelwerte, kleine Batches): Thread-Pool
+- Große Batches berechnender Tools: warmer Prozess-Pool. Der Batch wird per
+  split_batch() in Blöcke geteilt, die Blöcke laufen parallel auf allen Kernen
+  und werden in Reihenfolge wieder zusammengeführt.
+
+Der Prozess-Pool ist optional (MCP_PROCESS_WORKERS >= 2) - er kostet beim Start
+einen Interpreter samt Imports pro Worker und lohnt erst bei sehr großen Batches.
+Ist er aktiv, werden die Worker beim Serverstart gestartet (warm_up_process_pool)
+und importieren NumPy, die Einheiten-Schicht und die berechnenden Tool-Module
+vorab; der Content-Hash jedes vorab geladenen Moduls wird im Worker vermerkt.
+Nach einem Hot-Reload lädt ein Worker das Modul neu, sobald sich der Content-Hash
+des Tools ändert. Schlägt der Start fehl, bleibt der Pool deaktiviert.
+
+Jeder Aufruf belegt einen Platz im Limit seines Tools (asyncio.Semaphore) und hat
+ein Zeitlimit. Bei Überschreitung wird ToolTimeoutError ausgelöst - noch nicht
+gestartete Blöcke werden verworfen, eine bereits laufende synchrone Funktion
+rechnet im Thread-Pool zu Ende. Der Platz des Tools bleibt belegt, bis alle
+Executor-Aufträge des Aufrufs fertig sind; da das Standard-Limit pro Tool unter der
+Thread-Anzahl liegt, kann ein hängendes Tool den Pool nicht allein füllen. Kurze
+Hilfsfunktionen (run_sync: Dimensions-Prüfung, Parameter-Reparatur, Cache-Lesen)
+laufen in einem eigenen Thread-Pool und warten nie auf Tool-Threads.
+
+Konfiguration über Umgebungsvariablen:
+    MCP_EXECUTOR_THREADS=4           # Threads für synchrone Tool-Funktionen
+    MCP_HELPER_THREADS=2             # Threads für kurze Hilfsfunktionen (run_sync)
+    MCP_TOOL_CONCURRENCY=2           # Gleichzeitige Aufrufe pro Tool (Standard: Threads / 2)
+    MCP_TOOL_TIMEOUT=60              # Zeitlimit pro Aufruf in Sekunden (0 = keins)
+    MCP_TOOL_CONCURRENCY_OVERRIDES=schrauben_suche_vorspannkraft=2   # tool=wert,...
+    MCP_TOOL_TIMEOUT_OVERRIDES=schrauben_suche_vorspannkraft=20      # tool=wert,...
+    MCP_PROCESS_WORKERS=0            # Worker-Prozesse für große Batches (<2 = aus, Standard)
+    MCP_PROCESS_MIN_ROWS=20000       # Ab dieser Batch-Größe in den Prozess-Pool
+    MCP_PROCESS_CHUNK_SIZE=5000      # Zeilen pro Block im Prozess-Pool
+"""
+
+import os
+import sys
+import asyncio
+import importlib
+import multiprocessing
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextvars import ContextVar
+from functools import partial
+from typing import Dict, Any, Callable, Optional, Set
+
+
+def _parse_tool_overrides(value: str) -> Dict[str, float]:
+    """
+    Liest Pro-Tool-Werte im Format "tool_a=2,tool_b=0.5".
+
+    Args:
+        value: Inhalt der Umgebungsvariable
+
+    Returns:
+        Dict: Tool-Name -> Wert (fehlerhafte Einträge werden mit Warnung ignoriert)
+    """
+    overrides = {}
+    for entry in filter(None, (part.strip() for part in value.split(","))):
+        name, _, number = entry.partition("=")
+        try:
+            overrides[name.strip()] = float(number)
+        except ValueError:
+            print(f"WARNING: Ignoring invalid tool override '{entry}'")
+    return overrides
+
+
+EXECUTOR_THREADS = max(1, int(os.getenv("MCP_EXECUTOR_THREADS", "4")))
+HELPER_THREADS = max(1, int(os.getenv("MCP_HELPER_THREADS", "2")))
+PROCESS_WORKERS = int(os.getenv("MCP_PROCESS_WORKERS", "0"))
+PROCESS_MIN_ROWS = int(os.getenv("MCP_PROCESS_MIN_ROWS", "20000"))
+PROCESS_CHUNK_SIZE = max(2, int(os.getenv("MCP_PROCESS_CHUNK_SIZE", "5000")))
+
+TOOL_CONCURRENCY = max(1, int(os.getenv("MCP_TOOL_CONCURRENCY", str(EXECUTOR_THREADS // 2))))
+TOOL_TIMEOUT = float(os.getenv("MCP_TOOL_TIMEOUT", "60"))
+TOOL_CONCURRENCY_OVERRIDES = _parse_tool_overrides(os.getenv("MCP_TOOL_CONCURRENCY_OVERRIDES", ""))
+TOOL_TIMEOUT_OVERRIDES = _parse_tool_overrides(os.getenv("MCP_TOOL_TIMEOUT_OVERRIDES", ""))
+
+# Prozess-Pool nur mit mehreren Workern sinnvoll (nach fehlgeschlagenem Start False)
+PROCESS_POOL_ENABLED = PROCESS_WORKERS >= 2
+
+# Lazy erzeugte Pools (Prozess-Pool wird nach BrokenProcessPool neu aufgebaut)
+_THREAD_POOL: Optional[ThreadPoolExecutor] = None
+_HELPER_POOL: Optional[ThreadPoolExecutor] = None
+_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+
+# Vorab zu ladende Module (Modulpfad -> Content-Hash), auch für neu aufgebaute Pools
+_PRELOAD_MODULES: Dict[str, str] = {}
+
+# Tool-Name -> Semaphore für gleichzeitige Aufrufe (lazy, pro Tool)
+_TOOL_LIMITERS: Dict[str, asyncio.Semaphore] = {}
+
+# Executor-Aufträge des laufenden run_limited()-Aufrufs (gibt den Platz erst danach frei)
+_CALL_FUTURES: ContextVar[Optional[Set[Future]]] = ContextVar("mcp_call_futures", default=None)
+
+# Nur im Worker-Prozess: Modulpfad -> Content-Hash der geladenen Version
+_WORKER_MODULES: Dict[str, str] = {}
+
+
+class ToolTimeoutError(TimeoutError):
+    """Tool-Aufruf hat sein Zeitlimit überschritten"""
+
+    def __init__(self, tool_name: str, timeout: float):
+        self.tool_name = tool_name
+        self.timeout = timeout
+        super().__init__(f"Tool '{tool_name}' hat das Zeitlimit von {timeout:g} s überschritten")
+
+
+def get_tool_limiter(tool_name: str) -> asyncio.Semaphore:
+    """
+    Semaphore für die gleichzeitigen Aufrufe eines Tools.
+
+    Args:
+        tool_name: Name des Tools
+
+    Returns:
+        asyncio.Semaphore: MCP_TOOL_CONCURRENCY bzw. Pro-Tool-Wert Plätze
+    """
+    limiter = _TOOL_LIMITERS.get(tool_name)
+    if limiter is None:
+        limit = int(TOOL_CONCURRENCY_OVERRIDES.get(tool_name, TOOL_CONCURRENCY))
+        limiter = _TOOL_LIMITERS[tool_name] = asyncio.Semaphore(max(1, limit))
+    return limiter
+
+
+def get_tool_timeout(tool_name: str) -> Optional[float]:
+    """
+    Zeitlimit eines Tool-Aufrufs.
+
+    Args:
+        tool_name: Name des Tools
+
+    Returns:
+        Optional[float]: Sekunden oder None (kein Limit)
+    """
+    timeout = TOOL_TIMEOUT_OVERRIDES.get(tool_name, TOOL_TIMEOUT)
+    return timeout if timeout > 0 else None
+
+
+async def run_limited(tool_name: str, call: Callable[[], Any]) -> Any:
+    """
+    Führt einen Tool-Aufruf mit Pro-Tool-Limit und Zeitlimit aus.
+
+    Das Zeitlimit umfasst auch die Wartezeit auf einen freien Platz. Nach einem
+    Timeout bleibt der Platz belegt, bis die Executor-Aufträge des Aufrufs fertig
+    sind - weitere Aufrufe desselben Tools warten, statt neue Threads zu belegen.
+
+    Args:
+        tool_name: Name des Tools
+        call: Coroutine-Funktion ohne Argumente (eigentliche Ausführung)
+
+    Returns:
+        Any: Tool-Ergebnis
+
+    Raises:
+        ToolTimeoutError: Bei Überschreitung des Zeitlimits
+    """
+    limiter = get_tool_limiter(tool_name)
+
+    async def limited():
+        await limiter.acquire()
+        futures: Set[Future] = set()
+        token = _CALL_FUTURES.set(futures)
+        try:
+            return await call()
+        finally:
+            _CALL_FUTURES.reset(token)
+            _release_when_done(limiter, futures)
+
+    timeout = get_tool_timeout(tool_name)
+    try:
+        return await asyncio.wait_for(limited(), timeout)
+    except asyncio.TimeoutError:
+        raise ToolTimeoutError(tool_name, timeout) from None
+
+
+def _release_when_done(limiter: asyncio.Semaphore, futures: Set[Future]) -> None:
+    """
+    Gibt den Platz eines Tool-Aufrufs frei, sobald alle seine Executor-Aufträge fertig sind.
+
+    Args:
+        limiter: Semaphore des Tools
+        futures: Im Aufruf gestartete Executor-Aufträge
+    """
+    pending = [future for future in futures if not future.done()]
+    if not pending:
+        limiter.release()
+        return
+
+    loop = asyncio.get_running_loop()
+    remaining = [len(pending)]
+
+    def count_down() -> None:
+        remaining[0] -= 1
+        if remaining[0] == 0:
+            limiter.release()
+
+    def finished(_future: Future) -> None:
+        # Läuft im Worker-Thread - Zählen und Freigeben auf dem Event-Loop-Thread
+        try:
+            loop.call_soon_threadsafe(count_down)
+        except RuntimeError:
+            pass  # Event-Loop bereits beendet
+
+    for future in pending:
+        future.add_done_callback(finished)
+
+
+def _submit(pool: Executor, func: Callable, *args: Any) -> "asyncio.Future":
+    """Übergibt einen Auftrag an einen Pool und vermerkt ihn beim laufenden Tool-Aufruf."""
+    future = pool.submit(func, *args)
+    futures = _CALL_FUTURES.get()
+    if futures is not None:
+        futures.add(future)
+    return asyncio.wrap_future(future)
+
+
+async def run_sync(func: Callable, *args: Any) -> Any:
+    """Führt eine kurze synchrone Hilfsfunktion im Hilfs-Pool aus (z.B. Dimensions-Prüfung)."""
+    return await _submit(get_helper_pool(), partial(func, *args))
+
+
+def get_thread_pool() -> ThreadPoolExecutor:
+    """Thread-Pool für synchrone Tool-Funktionen (lazy)."""
+    global _THREAD_POOL
+    if _THREAD_POOL is None:
+        _THREAD_POOL = ThreadPoolExecutor(max_workers=EXECUTOR_THREADS, thread_name_prefix="mcp-tool")
+    return _THREAD_POOL
+
+
+def get_helper_pool() -> ThreadPoolExecutor:
+    """Thread-Pool für kurze Hilfsfunktionen, getrennt von den Tool-Threads (lazy)."""
+    global _HELPER_POOL
+    if _HELPER_POOL is None:
+        _HELPER_POOL = ThreadPoolExecutor(max_workers=HELPER_THREADS, thread_name_prefix="mcp-helper")
+    return _HELPER_POOL
+
+
+def _init_worker(modules: Dict[str, str]) -> None:
+    """
+    Initialisiert einen Worker-Prozess: Einheiten-Schicht und Tool-Module vorab laden.
+
+    Args:
+        modules: Modulpfad -> Content-Hash (wird pro geladenem Modul vermerkt)
+    """
+    import engineering_mcp.batch_engine  # noqa: F401 - lädt NumPy und Dimensionen
+    import engineering_mcp.units_utils  # noqa: F401
+    for module_path, content_hash in modules.items():
+        try:
+            importlib.import_module(module_path)
+        except Exception as e:
+            print(f"WARNING: Worker could not preload {module_path}: {e}")
+            continue
+        _WORKER_MODULES[module_path] = content_hash
+
+
+def _warm_worker() -> int:
+    """Leerer Auftrag, damit der Pool alle Worker startet."""
+    return os.getpid()
+
+
+def get_process_pool(modules: Optional[Dict[str, str]] = None) -> ProcessPoolExecutor:
+    """
+    Prozess-Pool für große Batches (lazy).
+
+    Args:
+        modules: Tool-Module (Modulpfad -> Content-Hash), die jeder Worker beim Start
+            importiert - ohne Angabe die des letzten Aufrufs
+
+    Returns:
+        ProcessPoolExecutor: forkserver (POSIX) bzw. spawn - kein fork aus dem laufenden Server
+    """
+    global _PROCESS_POOL
+    if modules is not None:
+        _PRELOAD_MODULES.clear()
+        _PRELOAD_MODULES.update(modules)
+    if _PROCESS_POOL is None:
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        _PROCESS_POOL = ProcessPoolExecutor(
+            max_workers=PROCESS_WORKERS,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(dict(_PRELOAD_MODULES),)
+        )
+    return _PROCESS_POOL
+
+
+async def warm_up_process_pool(modules: Dict[str, str]) -> int:
+    """
+    Startet alle Worker-Prozesse vorab (erster großer Batch ohne Startkosten).
+
+    Schlägt der Start fehl (z.B. BrokenProcessPool, keine Prozesse erlaubt), wird
+    der Pool verworfen und deaktiviert - große Batches laufen dann im Thread-Pool.
+
+    Args:
+        modules: Module der berechnenden Tools (Modulpfad -> Content-Hash)
+
+    Returns:
+        int: Anzahl gestarteter Worker (0 wenn deaktiviert)
+    """
+    global _PROCESS_POOL, PROCESS_POOL_ENABLED
+    if not PROCESS_POOL_ENABLED:
+        return 0
+    try:
+        pool = get_process_pool(modules)
+        loop = asyncio.get_running_loop()
+        pids = await asyncio.gather(*(loop.run_in_executor(pool, _warm_worker) for _ in range(PROCESS_WORKERS)))
+    except (BrokenProcessPool, OSError) as e:
+        print(f"WARNING: Process pool start failed ({e}) - large batches run in thread pool")
+        if _PROCESS_POOL is not None:
+            _PROCESS_POOL.shutdown(wait=False, cancel_futures=True)
+            _PROCESS_POOL = None
+        PROCESS_POOL_ENABLED = False
+        return 0
+    return len(set(pids))
+
+
+def use_process_pool(batch_rows: int) -> bool:
+    """
+    Entscheidet, ob ein Batch auf den Prozess-Pool verteilt wird.
+
+    Args:
+        batch_rows: Anzahl der Parametersätze (0 = kein Batch)
+
+    Returns:
+        bool: True bei aktiviertem Pool und großem Batch
+    """
+    return PROCESS_POOL_ENABLED and batch_rows >= PROCESS_MIN_ROWS
+
+
+async def run_tool(tool_func: Callable, parameters: Dict[str, Any]) -> Any:
+    """
+    Führt eine Tool-Funktion aus - async direkt, synchron im Thread-Pool.
+
+    Args:
+        tool_func: calculate-Funktion des Tools
+        parameters: Tool-Parameter
+
+    Returns:
+        Any: Tool-Ergebnis
+    """
+    if asyncio.iscoroutinefunction(tool_func):
+        return await tool_func(**parameters)
+    return await _submit(get_thread_pool(), partial(tool_func, **parameters))
+
+
+def _run_chunk(module_path: str, content_hash: str, parameters: Dict[str, Any]) -> Any:
+    """Berechnet einen Batch-Block im Worker-Prozess (lädt geänderte Module neu)."""
+    module = sys.modules.get(module_path)
+    if module is None:
+        module = importlib.import_module(module_path)
+    elif _WORKER_MODULES.get(module_path) != content_hash:
+        module = importlib.reload(module)
+    _WORKER_MODULES[module_path] = content_hash
+    return module.calculate(**parameters)
+
+
+async def run_chunk_in_process(record: Any, tool_func: Callable, parameters: Dict[str, Any]) -> Any:
+    """
+    Berechnet einen Batch-Block im Prozess-Pool.
+
+    Fällt bei einem defekten Pool (Worker abgestürzt) auf den Thread-Pool zurück;
+    der Pool wird beim nächsten Aufruf neu aufgebaut.
+
+    Args:
+        record: Registry-Eintrag des Tools (module_path, content_hash)
+        tool_func: calculate-Funktion (Fallback)
+        parameters: Block-Parameter
+
+    Returns:
+        Any: Tool-Ergebnis des Blocks
+    """
+    global _PROCESS_POOL
+    try:
+        return await _submit(
+            get_process_pool(), _run_chunk, record.module_path, record.content_hash, parameters
+        )
+    except BrokenProcessPool as e:
+        print(f"WARNING: Process pool broken ({e}) - running chunk in thread pool")
+        _PROCESS_POOL = None
+        return await run_tool(tool_func, parameters)
+
+
+def shutdown_executors() -> None:
+    """Beendet Thread-, Hilfs- und Prozess-Pool (Server-Shutdown)."""
+    global _THREAD_POOL, _HELPER_POOL, _PROCESS_POOL
+    if _PROCESS_POOL is not None:
+        _PROCESS_POOL.shutdown(wait=False, cancel_futures=True)
+        _PROCESS_POOL = None
+    if _THREAD_POOL is not None:
+        _THREAD_POOL.shutdown(wait=False, cancel_futures=True)
+        _THREAD_POOL = None
+    if _HELPER_POOL is not None:
+        _HELPER_POOL.shutdown(wait=False, cancel_futures=True)
+        _HELPER_POOL = None
@@ -0,0 +1,414 @@
+"""
+Schnelles Einheiten-Backend für Engineering MCP (ohne Pint)
+
+Tabelle aus SI-Präfixen × Basiseinheiten (m, g, s, N, Pa, bar, L, J, W, ...)
+sowie gängigen Nicht-SI-Einheiten (psi, inch, foot, min, h, t, °C).
+Alle Umrechnungen sind reine Arithmetik: si = wert * scale + offset.
+
+- Einheiten-Ausdrücke wie "N/mm²", "kN*m", "kg/m^3", "km/h" werden unterstützt
+- Text-Ausgabe (str) entspricht der von Pint ("newton / millimeter ** 2"),
+  damit Tool-Ergebnisse unabhängig vom Backend identisch aussehen
+- Unbekannte Einheiten liefern None bzw. werden an Pint weitergereicht
+- Jeder Tabelleneintrag entspricht exakt Pint (Name, Faktor, Offset, Dimension) -
+  geprüft in tests/test_fast_units.py. Was Pint ablehnt ("mm2"), lehnt auch die
+  Tabelle ab; Präfix-Kombinationen, die in Pint eine eigene Einheit sind ("hbar" =
+  Dirac-Konstante, nicht Hektobar), fehlen in der Tabelle und gehen an Pint
+
+🔧 Auswahl über MCP_UNIT_BACKEND=fast|pint (siehe units_utils.py)
+"""
+
+import re
+from typing import Dict, Optional, Tuple, Any
+
+# Reihenfolge der Basisdimensionen
+_BASE_DIMENSIONS = ("[mass]", "[length]", "[time]", "[current]", "[temperature]", "[substance]", "[luminosity]")
+_BASE_UNIT_NAMES = ("kilogram", "meter", "second", "ampere", "kelvin", "mole", "candela")
+
+# SI-Präfixe: (Symbol, Name, Faktor)
+_PREFIXES = (
+    ("T", "tera", 1e12), ("G", "giga", 1e9), ("M", "mega", 1e6), ("k", "kilo", 1e3),
+    ("h", "hecto", 1e2), ("da", "deca", 1e1), ("d", "deci", 1e-1), ("c", "centi", 1e-2),
+    ("m", "milli", 1e-3), ("µ", "micro", 1e-6), ("μ", "micro", 1e-6), ("u", "micro", 1e-6),
+    ("n", "nano", 1e-9), ("p", "pico", 1e-12),
+)
+
+# Einheiten: (Pint-Name, Symbole, Faktor nach SI, Offset, Dimension, mit Präfixen)
+# Dimension: Exponenten für (kg, m, s, A, K, mol, cd)
+_UNITS = (
+    ("meter", ("m",), 1.0, 0.0, (0, 1, 0, 0, 0, 0, 0), True),
+    ("gram", ("g",), 1e-3, 0.0, (1, 0, 0, 0, 0, 0, 0), True),
+    ("second", ("s",), 1.0, 0.0, (0, 0, 1, 0, 0, 0, 0), True),
+    ("newton", ("N",), 1.0, 0.0, (1, 1, -2, 0, 0, 0, 0), True),
+    ("pascal", ("Pa",), 1.0, 0.0, (1, -1, -2, 0, 0, 0, 0), True),
+    ("bar", ("bar",), 1e5, 0.0, (1, -1, -2, 0, 0, 0, 0), True),
+    ("liter", ("l", "L"), 1e-3, 0.0, (0, 3, 0, 0, 0, 0, 0), True),
+    ("joule", ("J",), 1.0, 0.0, (1, 2, -2, 0, 0, 0, 0), True),
+    ("watt", ("W",), 1.0, 0.0, (1, 2, -3, 0, 0, 0, 0), True),
+    ("hertz", ("Hz",), 1.0, 0.0, (0, 0, -1, 0, 0, 0, 0), True),
+    ("ampere", ("A",), 1.0, 0.0, (0, 0, 0, 1, 0, 0, 0), True),
+    ("volt", ("V",), 1.0, 0.0, (1, 2, -3, -1, 0, 0, 0), True),
+    ("kelvin", ("K",), 1.0, 0.0, (0, 0, 0, 0, 1, 0, 0), True),
+    ("degree_Celsius", ("degC", "°C", "celsius"), 1.0, 273.15, (0, 0, 0, 0, 1, 0, 0), False),
+    ("minute", ("min",), 60.0, 0.0, (0, 0, 1, 0, 0, 0, 0), False),
+    ("hour", ("h", "hr"), 3600.0, 0.0, (0, 0, 1, 0, 0, 0, 0), False),
+    ("metric_ton", ("t", "tonne"), 1e3, 0.0, (1, 0, 0, 0, 0, 0, 0), False),
+    ("inch", ("in",), 0.0254, 0.0, (0, 1, 0, 0, 0, 0, 0), False),
+    ("foot", ("ft",), 0.3048, 0.0, (0, 1, 0, 0, 0, 0, 0), False),
+    ("pound_force_per_square_inch", ("psi",), 6894.7572931683635, 0.0, (1, -1, -2, 0, 0, 0, 0), False),
+    ("standard_atmosphere", ("atm", "atmosphere"), 101325.0, 0.0, (1, -1, -2, 0, 0, 0, 0), False),
+)
+
+# Präfix + Symbol, das in Pint eine eigenständige Einheit/Konstante ist - nicht erzeugen
+_PINT_EXPLICIT_NAMES = frozenset({"hbar"})
+
+# Exponenten-Schreibweisen: m², m^2, m**2 (wie Pint NICHT "m2")
+_POWER_PATTERN = re.compile(r'^(.+?)(?:(?:\^|\*\*)([-+]?\d+)|([²³]))$')
+_SUPERSCRIPTS = {"²": 2, "³": 3}
+# Faktoren trennen: "*", "·", Leerzeichen (nicht "**")
+_FACTOR_SPLIT = re.compile(r'\s*(?<!\*)[*·](?!\*)\s*|\s+')
+
+
+def _build_unit_table() -> Dict[str, Tuple[str, float, float, Tuple[int, ...]]]:
+    """Erzeugt die Nachschlagetabelle Symbol/Name -> (Pint-Name, Faktor, Offset, Dimension)."""
+    table = {}
+    for name, symbols, scale, offset, dims, prefixable in _UNITS:
+        for key in (name,) + symbols:
+            table[key] = (name, scale, offset, dims)
+            if len(key) > 3 and key.isalpha():
+                table[key + "s"] = (name, scale, offset, dims)  # Plural (meters, atmospheres)
+        if name == "meter":
+            table["metre"] = table["meter"]
+        if name == "liter":
+            table["litre"] = table["liter"]
+        if not prefixable:
+            continue
+        for prefix_symbol, prefix_name, factor in _PREFIXES:
+            prefixed = (prefix_name + name, scale * factor, offset, dims)
+            for symbol in symbols:
+                if prefix_symbol + symbol not in _PINT_EXPLICIT_NAMES:
+                    table.setdefault(prefix_symbol + symbol, prefixed)
+            table.setdefault(prefix_name + name, prefixed)
+            table.setdefault(prefix_name + name + "s", prefixed)
+    return table
+
+
+_UNIT_TABLE = _build_unit_table()
+
+
+class FastDimensionality(tuple):
+    """Dimension als Exponenten-Tupel (kg, m, s, A, K, mol, cd) - vergleichbar und hashbar"""
+
+    def __str__(self) -> str:
+        parts = [
+            dimension if exponent == 1 else f"{dimension} ** {exponent}"
+            for dimension, exponent in zip(_BASE_DIMENSIONS, self) if exponent
+        ]
+        return " * ".join(parts) if parts else "dimensionless"
+
+
+def _format_factors(factors: Tuple[Tuple[str, int], ...]) -> str:
+    """Formatiert Einheiten-Faktoren wie Pint: alphabetisch, Zähler vor Nenner."""
+    numerator = [(name, exp) for name, exp in sorted(factors) if exp > 0]
+    denominator = [(name, -exp) for name, exp in sorted(factors) if exp < 0]
+
+    def fmt(name, exp):
+        return name if exp == 1 else f"{name} ** {exp}"
+
+    text = " * ".join(fmt(name, exp) for name, exp in numerator) or ("1" if denominator else "dimensionless")
+    for name, exp in denominator:
+        text += f" / {fmt(name, exp)}"
+    return text
+
+
+class FastUnit:
+    """Einheit mit Faktor/Offset nach SI (kompatibel zu den von den Tools genutzten Pint-Operationen)"""
+    __slots__ = ("factors", "scale", "offset", "dims", "_name")
+    __array_ufunc__ = None  # NumPy-Skalare überlassen die Multiplikation dieser Klasse
+
+    def __init__(self, factors: Tuple[Tuple[str, int], ...], scale: float, offset: float, dims: Tuple[int, ...]):
+        self.factors = factors
+        self.scale = scale
+        self.offset = offset
+        self.dims = FastDimensionality(dims)
+        self._name = _format_factors(factors)
+
+    @property
+    def dimensionality(self) -> FastDimensionality:
+        return self.dims
+
+    @property
+    def is_multiplicative(self) -> bool:
+        return self.offset == 0.0
+
+    def _combine(self, other: "FastUnit", sign: int) -> "FastUnit":
+        if not (self.is_multiplicative and other.is_multiplicative):
+            raise ValueError(f"Einheit mit Offset kann nicht kombiniert werden: {self} / {other}")
+        exponents: Dict[str, int] = dict(self.factors)
+        for name, exp in other.factors:
+            exponents[name] = exponents.get(name, 0) + sign * exp
+        factors = tuple((name, exp) for name, exp in exponents.items() if exp)
+        dims = tuple(a + sign * b for a, b in zip(self.dims, other.dims))
+        scale = self.scale * other.scale if sign > 0 else self.scale / other.scale
+        return FastUnit(factors, scale, 0.0, dims)
+
+    def __mul__(self, other):
+        if isinstance(other, FastUnit):
+            return self._combine(other, 1)
+        if isinstance(other, (int, float)):
+            return FastQuantity(other, self)
+        return NotImplemented
+
+    def __rmul__(self, other):
+        if isinstance(other, (int, float)):
+            return FastQuantity(other, self)
+        return NotImplemented
+
+    def __truediv__(self, other):
+        if isinstance(other, FastUnit):
+            return self._combine(other, -1)
+        if isinstance(other, (int, float)):
+            return FastQuantity(1.0 / other, self)
+        return NotImplemented
+
+    def __rtruediv__(self, other):
+        if isinstance(other, (int, float)):
+            return FastQuantity(other, self ** -1)
+        return NotImplemented
+
+    def __pow__(self, power: int) -> "FastUnit":
+        if not self.is_multiplicative:
+            raise ValueError(f"Einheit mit Offset kann nicht potenziert werden: {self}")
+        return FastUnit(
+            tuple((name, exp * power) for name, exp in self.factors),
+            self.scale ** power, 0.0, tuple(d * power for d in self.dims)
+        )
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, FastUnit):
+            return self.factors_key() == other.factors_key()
+        if isinstance(other, str):
+            return self._name == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.factors_key())
+
+    def factors_key(self) -> Tuple[Tuple[str, int], ...]:
+        return tuple(sorted(self.factors))
+
+    def __str__(self) -> str:
+        return self._name
+
+    def __format__(self, spec: str) -> str:
+        return format(self._name, spec)
+
+    def __repr__(self) -> str:
+        return f"<Unit('{self._name}')>"
+
+
+def base_unit_for(dims: Tuple[int, ...]) -> FastUnit:
+    """SI-Basiseinheit zu einer Dimension (z.B. Druck -> kilogram / meter / second ** 2)."""
+    factors = tuple((name, exp) for name, exp in zip(_BASE_UNIT_NAMES, dims) if exp)
+    return FastUnit(factors, 1.0, 0.0, dims)
+
+
+class FastQuantity:
+    """Zahlenwert mit FastUnit (Teilmenge der Pint-Quantity-Schnittstelle)"""
+    __slots__ = ("magnitude", "units")
+    __array_ufunc__ = None
+
+    def __init__(self, magnitude: float, units: FastUnit):
+        self.magnitude = magnitude
+        self.units = units
+
+    @property
+    def m(self) -> float:
+        return self.magnitude
+
+    @property
+    def dimensionality(self) -> FastDimensionality:
+        return self.units.dims
+
+    def _si_magnitude(self) -> float:
+        return self.magnitude * self.units.scale + self.units.offset
+
+    def to_base_units(self) -> "FastQuantity":
+        return FastQuantity(self._si_magnitude(), base_unit_for(self.units.dims))
+
+    def m_as(self, target) -> float:
+        return self.to(target).magnitude
+
+    def to(self, target) -> Any:
+        if isinstance(target, str):
+            unit = parse_unit(target)
+            if unit is None:
+                return self._to_pint(target)
+            target = unit
+        if isinstance(target, FastQuantity):
+            target = target.units
+        if not isinstance(target, FastUnit):
+            return self._to_pint(target)
+        if target.dims != self.units.dims:
+            raise ValueError(f"Cannot convert from '{self.units}' ({self.units.dims}) to '{target}' ({target.dims})")
+        return FastQuantity((self._si_magnitude() - target.offset) / target.scale, target)
+
+    def _to_pint(self, target) -> Any:
+        """Umrechnung in eine nur Pint bekannte Einheit (Pint wird erst hier geladen)."""
+        from engineering_mcp.units_utils import get_pint_ureg
+        pint_ureg = get_pint_ureg()
+        base = self.to_base_units()
+        return pint_ureg.Quantity(base.magnitude, str(base.units)).to(target)
+
+    # Arithmetik (gleiche Semantik wie Pint für multiplikative Einheiten)
+    def __mul__(self, other):
+        if isinstance(other, FastQuantity):
+            return FastQuantity(self.magnitude * other.magnitude, self.units * other.units)
+        if isinstance(other, FastUnit):
+            return FastQuantity(self.magnitude, self.units * other)
+        if isinstance(other, (int, float)):
+            return FastQuantity(self.magnitude * other, self.units)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, FastQuantity):
+            return FastQuantity(self.magnitude / other.magnitude, self.units / other.units)
+        if isinstance(other, FastUnit):
+            return FastQuantity(self.magnitude, self.units / other)
+        if isinstance(other, (int, float)):
+            return FastQuantity(self.magnitude / other, self.units)
+        return NotImplemented
+
+    def __rtruediv__(self, other):
+        if isinstance(other, (int, float)):
+            return FastQuantity(other / self.magnitude, self.units ** -1)
+        return NotImplemented
+
+    def __pow__(self, power: int) -> "FastQuantity":
+        return FastQuantity(self.magnitude ** power, self.units ** power)
+
+    def __neg__(self) -> "FastQuantity":
+        return FastQuantity(-self.magnitude, self.units)
+
+    def __add__(self, other):
+        if isinstance(other, FastQuantity):
+            return FastQuantity(self.magnitude + other.to(self.units).magnitude, self.units)
+        return NotImplemented
+
+    def __sub__(self, other):
+        if isinstance(other, FastQuantity):
+            return FastQuantity(self.magnitude - other.to(self.units).magnitude, self.units)
+        return NotImplemented
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, FastQuantity):
+            return self.dimensionality == other.dimensionality and self._si_magnitude() == other._si_magnitude()
+        return NotImplemented
+
+    def __lt__(self, other) -> bool:
+        return self.magnitude < other.to(self.units).magnitude
+
+    def __gt__(self, other) -> bool:
+        return self.magnitude > other.to(self.units).magnitude
+
+    __hash__ = None
+
+    def __str__(self) -> str:
+        return f"{self.magnitude} {self.units}"
+
+    def __format__(self, spec: str) -> str:
+        return f"{format(self.magnitude, spec)} {self.units}"
+
+    def __repr__(self) -> str:
+        return f"<Quantity({self.magnitude}, '{self.units}')>"
+
+
+def _lookup_factor(token: str) -> Optional[FastUnit]:
+    """Einzelner Faktor wie 'mm', 'm²', 'mm^2', 's**-1'."""
+    exponent = 1
+    entry = _UNIT_TABLE.get(token)
+    if entry is None:
+        match = _POWER_PATTERN.match(token)
+        if not match:
+            return None
+        token = match.group(1)
+        exponent = int(match.group(2)) if match.group(2) else _SUPERSCRIPTS[match.group(3)]
+        entry = _UNIT_TABLE.get(token)
+        if entry is None:
+            return None
+    name, scale, offset, dims = entry
+    unit = FastUnit(((name, 1),), scale, offset, dims)
+    return unit if exponent == 1 else unit ** exponent
+
+
+def parse_unit(unit_str: str) -> Optional[FastUnit]:
+    """
+    Parst einen Einheiten-Ausdruck mit der eingebauten Tabelle.
+
+    Args:
+        unit_str: z.B. "mm", "N/mm²", "kN*m", "kg/m^3", "°C"
+
+    Returns:
+        Optional[FastUnit]: None wenn die Einheit nicht in der Tabelle ist
+        (Aufrufer fällt dann auf Pint zurück)
+    """
+    text = unit_str.strip()
+    if not text or '(' in text or ')' in text:
+        return None
+
+    parts = text.split('/')
+    result = None
+    for index, part in enumerate(parts):
+        tokens = [token for token in _FACTOR_SPLIT.split(part.strip()) if token]
+        if not tokens:
+            return None
+        for token in tokens:
+            unit = _lookup_factor(token)
+            if unit is None:
+                return None
+            try:
+                if result is None:
+                    result = unit if index == 0 else unit ** -1
+                else:
+                    result = result * unit if index == 0 else result / unit
+            except ValueError:
+                return None  # Offset-Einheit in zusammengesetztem Ausdruck -> Pint
+    return result
+
+
+class FastUnitRegistry:
+    """
+    Leichtgewichtige Registry mit Pint-kompatibler Schnittstelle
+    (ureg.meter, ureg("N/mm²"), ureg.Quantity(wert, einheit)).
+
+    Unbekannte Einheiten werden an die Pint-Registry weitergereicht (lazy).
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        unit = parse_unit(name)
+        if unit is not None:
+            return unit
+        from engineering_mcp.units_utils import get_pint_ureg
+        return getattr(get_pint_ureg(), name)
+
+    def __call__(self, expression: str) -> Any:
+        unit = parse_unit(expression)
+        if unit is not None:
+            return FastQuantity(1.0, unit)
+        from engineering_mcp.units_utils import get_pint_ureg
+        return get_pint_ureg()(expression)
+
+    def Quantity(self, value: float, units: Any) -> Any:
+        if isinstance(units, str):
+            parsed = parse_unit(units)
+            if parsed is None:
+                from engineering_mcp.units_utils import get_pint_ureg
+                return get_pint_ureg().Quantity(value, units)
+            units = parsed
+        if isinstance(units, FastUnit):
+            return FastQuantity(value, units)
+        from engineering_mcp.units_utils import get_pint_ureg
+        return get_pint_ureg().Quantity(value, units)
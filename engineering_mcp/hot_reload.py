@@ -0,0 +1,67 @@
+"""
+Hot-Reload für Engineering-Tools
+
+Überwacht das tools/ Verzeichnis im laufenden Server und lädt geänderte
+Tool-Module inkrementell nach (siehe registry.reload_changed_tools).
+Die Registry wird dabei NIE geleert - Client-Sessions bleiben erhalten.
+
+- Mit installiertem `watchfiles` (inotify/FSEvents): Reaktion auf Dateisystem-Events
+- Ohne `watchfiles`: Polling der Datei-Signaturen (mtime, size)
+
+Aktivierung über Umgebungsvariablen:
+    MCP_HOT_RELOAD=true
+    MCP_HOT_RELOAD_INTERVAL=2.0   # Polling-Intervall in Sekunden
+"""
+
+import os
+import asyncio
+from typing import Optional
+
+from engineering_mcp.manifest import TOOLS_DIR
+from engineering_mcp.registry import reload_changed_tools
+
+HOT_RELOAD_ENABLED = os.getenv("MCP_HOT_RELOAD", "false").lower() == "true"
+HOT_RELOAD_INTERVAL = float(os.getenv("MCP_HOT_RELOAD_INTERVAL", "2.0"))
+
+
+async def _reload_in_thread() -> None:
+    """Führt den Reload außerhalb des Event-Loops aus (Imports blockieren)."""
+    try:
+        await asyncio.to_thread(reload_changed_tools)
+    except Exception as e:
+        print(f"ERROR: Tool hot-reload failed: {e}")
+
+
+async def watch_tools(interval: float = HOT_RELOAD_INTERVAL) -> None:
+    """
+    Endlosschleife zur Überwachung des tools/ Verzeichnisses.
+    
+    Args:
+        interval: Polling-Intervall in Sekunden (ohne watchfiles)
+    """
+    try:
+        from watchfiles import awatch
+    except ImportError:
+        awatch = None
+    
+    if awatch is not None:
+        print(f"INFO: Tool hot-reload active (watchfiles) on {TOOLS_DIR}")
+        async for _changes in awatch(TOOLS_DIR, step=int(interval * 1000)):
+            await _reload_in_thread()
+    else:
+        print(f"INFO: Tool hot-reload active (polling every {interval}s) on {TOOLS_DIR}")
+        while True:
+            await asyncio.sleep(interval)
+            await _reload_in_thread()
+
+
+def start_tool_watcher() -> Optional[asyncio.Task]:
+    """
+    Startet den Watcher als Hintergrund-Task, falls MCP_HOT_RELOAD aktiviert ist.
+    
+    Returns:
+        asyncio.Task oder None wenn deaktiviert
+    """
+    if not HOT_RELOAD_ENABLED:
+        return None
+    return asyncio.create_task(watch_tools())
@@ -0,0 +1,342 @@
+"""
+Tool-Manifest für Engineering MCP
+
+Persistiert die Discovery-Ergebnisse aller Engineering-Tools in einer JSON-Datei,
+damit der Server beim Kaltstart nicht jedes Tool-Modul importieren muss.
+
+Pro Modul werden gespeichert:
+- Tool-ID, Kategorie, Tags, has_solving
+- Parameter-Schema (vollständige Metadaten aus get_metadata())
+- Modulpfad und Content-Hash (SHA-256) der Tool-Datei
+- Abhängigkeiten: lokal importierte Module (engineering_mcp.*, tools.*, relativ -
+  transitiv) und die "data_files" aus den Metadaten, zusammengefasst im
+  dependency_hash
+
+⚡ HASH-INVALIDIERUNG: Ändert sich eine Tool-Datei, stimmt ihr Hash nicht mehr
+mit dem Manifest überein und NUR dieses Tool wird neu importiert. Ändert sich
+ein Hilfsmodul oder eine Tabelle, werden alle davon abhängigen Tools neu importiert.
+
+Erzeugung zur Build-Zeit:
+    python -m engineering_mcp.manifest
+"""
+
+import os
+import ast
+import json
+import hashlib
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+# Version des Manifest-Formats - bei Strukturänderungen erhöhen (invalidiert alle Einträge)
+MANIFEST_VERSION = 2
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TOOLS_DIR = os.path.join(PROJECT_ROOT, "tools")
+
+# Speicherort des Manifests (über Umgebungsvariable überschreibbar)
+MANIFEST_PATH = os.getenv(
+    "MCP_TOOL_MANIFEST",
+    os.path.join(PROJECT_ROOT, ".cache", "tool_manifest.json")
+)
+
+# Manifest deaktivieren (z.B. für Debugging): MCP_TOOL_MANIFEST_DISABLED=true
+MANIFEST_DISABLED = os.getenv("MCP_TOOL_MANIFEST_DISABLED", "false").lower() == "true"
+
+
+def iter_tool_files(tools_dir: str = TOOLS_DIR, package: str = "tools") -> List[Tuple[str, str, str]]:
+    """
+    Listet alle Tool-Module unterhalb von tools/ ohne sie zu importieren.
+
+    Folgt denselben Regeln wie pkgutil.iter_modules: Nur Verzeichnisse mit
+    __init__.py werden als Paket durchsucht, Module werden sortiert geliefert.
+
+    Args:
+        tools_dir: Wurzelverzeichnis der Tools
+        package: Modul-Präfix des Wurzelverzeichnisses
+
+    Returns:
+        List[Tuple[str, str, str]]: (modul_name, datei_pfad, kategorie)
+    """
+    found = []
+
+    def walk(directory: str, prefix: str, category: Optional[str]):
+        try:
+            entries = sorted(os.listdir(directory))
+        except OSError:
+            return
+
+        for entry in entries:
+            path = os.path.join(directory, entry)
+            if os.path.isdir(path):
+                if '.' in entry or not os.path.isfile(os.path.join(path, "__init__.py")):
+                    continue
+                # Für geometry.Flaechen etc. - verwende 'geometry' als Kategorie
+                walk(path, f"{prefix}.{entry}", category or entry)
+            elif entry.endswith(".py"):
+                stem = entry[:-3]
+                if stem == "__init__" or '.' in stem:
+                    continue
+                # Module direkt in tools/ erhalten den Paketnamen als Kategorie
+                found.append((f"{prefix}.{stem}", path, category or prefix.split('.')[-1]))
+
+    walk(tools_dir, package, None)
+    return found
+
+
+def compute_file_hash(file_path: str) -> str:
+    """
+    Berechnet den Content-Hash einer Tool-Datei.
+
+    Args:
+        file_path: Pfad zur Datei
+
+    Returns:
+        str: SHA-256 Hexdigest des Dateiinhalts
+    """
+    with open(file_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+# Pfad -> ((mtime_ns, size), Wert): direkte lokale Imports bzw. Content-Hash einer Datei
+_IMPORT_CACHE: Dict[str, Tuple[Tuple[int, int], List[str]]] = {}
+_HASH_CACHE: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+# Top-Level-Pakete, deren Module als lokale Abhängigkeit gelten
+LOCAL_PACKAGES = ("engineering_mcp", "tools")
+
+
+def _signature(file_path: str) -> Tuple[int, int]:
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _module_file(module_name: str) -> Optional[str]:
+    """Datei eines lokalen Moduls ('engineering_mcp.units_utils') oder None"""
+    base = os.path.join(PROJECT_ROOT, *module_name.split('.'))
+    for candidate in (base + ".py", os.path.join(base, "__init__.py")):
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def _direct_local_imports(file_path: str) -> List[str]:
+    """Dateien der direkt importierten lokalen Module (auch Imports in Funktionen)"""
+    signature = _signature(file_path)
+    cached = _IMPORT_CACHE.get(file_path)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=file_path)
+
+    package = os.path.relpath(os.path.dirname(file_path), PROJECT_ROOT).replace(os.sep, '.').split('.')
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = package[:len(package) - node.level + 1]
+                module = '.'.join(base + ([node.module] if node.module else []))
+            else:
+                module = node.module or ''
+            names.append(module)
+            # "from engineering_mcp import persistent_cache" importiert ein Modul
+            names.extend(f"{module}.{alias.name}" for alias in node.names)
+
+    found = set()
+    for name in names:
+        if name.split('.')[0] not in LOCAL_PACKAGES:
+            continue
+        module_file = _module_file(name)
+        if module_file and module_file != file_path:
+            found.add(module_file)
+    result = sorted(found)
+    _IMPORT_CACHE[file_path] = (signature, result)
+    return result
+
+
+def find_local_dependencies(file_path: str) -> List[str]:
+    """
+    Ermittelt alle lokal importierten Module einer Datei (transitiv, per AST).
+
+    Args:
+        file_path: Pfad zur Tool-Datei
+
+    Returns:
+        List[str]: Absolute Pfade der Abhängigkeiten (sortiert, ohne die Datei selbst)
+    """
+    seen = set()
+    pending = [file_path]
+    while pending:
+        current = pending.pop()
+        try:
+            imports = _direct_local_imports(current)
+        except (OSError, SyntaxError, ValueError):
+            continue
+        for dependency in imports:
+            if dependency not in seen and dependency != file_path:
+                seen.add(dependency)
+                pending.append(dependency)
+    return sorted(seen)
+
+
+def compute_dependency_hash(file_paths: List[str]) -> str:
+    """
+    Kombinierter Hash mehrerer Dateien (Hilfsmodule, Tabellen).
+
+    ⚡ Jede Datei wird pro Prozess nur einmal gehasht, solange (mtime, size) gleich bleiben -
+    gemeinsame Module wie units_utils kosten beim Kaltstart also nur einen Hash.
+
+    Args:
+        file_paths: Absolute Pfade
+
+    Returns:
+        str: SHA-256 Hexdigest (fehlende Dateien gehen als 'missing' ein)
+    """
+    digest = hashlib.sha256()
+    for file_path in file_paths:
+        digest.update(os.path.relpath(file_path, PROJECT_ROOT).encode())
+        try:
+            signature = _signature(file_path)
+            cached = _HASH_CACHE.get(file_path)
+            if cached is None or cached[0] != signature:
+                cached = _HASH_CACHE[file_path] = (signature, compute_file_hash(file_path))
+            digest.update(cached[1].encode())
+        except OSError:
+            digest.update(b"missing")
+    return digest.hexdigest()
+
+
+def entry_dependency_hash(entry: Dict) -> str:
+    """
+    Aktueller dependency_hash eines Manifest-Eintrags (zum Vergleich mit dem gespeicherten).
+
+    Args:
+        entry: Manifest-Eintrag
+
+    Returns:
+        str: Hash über die aktuell auf der Platte liegenden Abhängigkeiten
+    """
+    return compute_dependency_hash(
+        [os.path.join(PROJECT_ROOT, path) for path in entry.get("dependencies", [])]
+    )
+
+
+def build_manifest_entry(module_name: str, file_path: str, category: str,
+                         content_hash: str, metadata: Optional[Dict]) -> Dict:
+    """
+    Erstellt einen Manifest-Eintrag für ein Modul.
+
+    Module ohne get_metadata()/calculate() werden mit is_tool=False vermerkt,
+    damit sie beim nächsten Start nicht erneut importiert werden.
+
+    Args:
+        module_name: Voller Modulpfad (z.B. 'tools.pressure.kesselformel')
+        file_path: Pfad zur Tool-Datei
+        category: Tool-Kategorie
+        content_hash: SHA-256 des Dateiinhalts
+        metadata: Ergebnis von get_metadata() oder None
+
+    Returns:
+        Dict: Manifest-Eintrag
+    """
+    dependencies = find_local_dependencies(file_path)
+    if metadata is not None:
+        tool_dir = os.path.dirname(file_path)
+        dependencies += [os.path.join(tool_dir, path) for path in metadata.get('data_files') or []]
+
+    entry = {
+        "module_path": module_name,
+        "file_path": os.path.relpath(file_path, PROJECT_ROOT),
+        "category": category,
+        "content_hash": content_hash,
+        "dependencies": [os.path.relpath(path, PROJECT_ROOT) for path in dependencies],
+        "dependency_hash": compute_dependency_hash(dependencies),
+        "is_tool": metadata is not None,
+    }
+
+    if metadata is not None:
+        entry.update({
+            "tool_id": metadata.get('tool_name', module_name.split('.')[-1]),
+            "tags": metadata.get('tags', []) or metadata.get('tool_tags', []),
+            "has_solving": metadata.get('has_solving', 'symbolic'),
+            "parameters": metadata.get('parameters', {}),
+            "metadata": metadata,
+        })
+
+    return entry
+
+
+def load_manifest(path: str = MANIFEST_PATH) -> Dict[str, Dict]:
+    """
+    Lädt das Manifest von der Festplatte.
+
+    Args:
+        path: Pfad zur Manifest-Datei
+
+    Returns:
+        Dict[str, Dict]: Einträge nach Modulpfad - leer bei fehlendem,
+        defektem oder veraltetem Manifest
+    """
+    if MANIFEST_DISABLED or not os.path.exists(path):
+        return {}
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"WARNING: Tool manifest {path} unreadable - full discovery ({e})")
+        return {}
+
+    if not isinstance(data, dict) or data.get("manifest_version") != MANIFEST_VERSION:
+        print(f"INFO: Tool manifest {path} outdated - full discovery")
+        return {}
+
+    return data.get("modules", {})
+
+
+def save_manifest(modules: Dict[str, Dict], path: str = MANIFEST_PATH) -> bool:
+    """
+    Schreibt das Manifest atomar (temporäre Datei + os.replace).
+
+    Args:
+        modules: Einträge nach Modulpfad
+        path: Pfad zur Manifest-Datei
+
+    Returns:
+        bool: True wenn erfolgreich geschrieben
+    """
+    if MANIFEST_DISABLED:
+        return False
+
+    try:
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tool_manifest_", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "manifest_version": MANIFEST_VERSION,
+                    "modules": modules
+                }, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+        return True
+
+    except Exception as e:
+        # Ohne schreibbares Dateisystem läuft der Server trotzdem - nur ohne Cache
+        print(f"WARNING: Failed to write tool manifest {path}: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    # Build-Zeit: Manifest vollständig neu erzeugen
+    import asyncio
+    from engineering_mcp.registry import discover_engineering_tools
+
+    count = asyncio.run(discover_engineering_tools(use_manifest=False))
+    print(f"INFO: Tool manifest written to {MANIFEST_PATH} ({count} tools)")
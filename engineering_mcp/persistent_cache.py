@@ -0,0 +1,262 @@
+"""
+Persistenter Ergebnis-Cache (SQLite) als zweite Stufe unter dem LRU-Cache
+
+Jeder Redeploy startet mit leerem Prozess-Speicher. Teure, deterministische
+Ergebnisse - Abfragen der Schrauben-Datenbank, numerisch gelöste Ellipsen-
+Halbachsen, gerenderte Markdown-Tabellen - werden deshalb zusätzlich in einer
+lokalen SQLite-Datei abgelegt und überleben Neustarts.
+
+Welche Tools teilnehmen, legt das Tool selbst in get_metadata() fest:
+
+    "persistent_cache": True,
+    "data_files": ["Tabellen/ISO_Metrische_Gewinde_Komplett.csv"],  # relativ zur Tool-Datei
+
+Die Tool-Version im Schlüssel besteht aus Content-Hash des Moduls und Hash der
+Datendateien - eine geänderte Tabelle macht alte Einträge unerreichbar.
+
+⚡ SCHREIBEN IM HINTERGRUND: store() legt Einträge nur in eine Queue. Ein
+Writer-Thread sammelt sie und schreibt alle MCP_PERSISTENT_CACHE_FLUSH Sekunden
+(oder ab MCP_PERSISTENT_CACHE_BATCH Einträgen) in EINER Transaktion - eine
+Anfrage wartet nie auf die Festplatte. Lesen erfolgt über eine Verbindung pro
+Thread (WAL-Modus, blockiert den Writer nicht).
+
+Konfiguration über Umgebungsvariablen:
+    MCP_PERSISTENT_CACHE=true                                # Zweite Stufe aktiv
+    MCP_PERSISTENT_CACHE_PATH=.cache/result_cache.sqlite3    # Speicherort
+    MCP_PERSISTENT_CACHE_FLUSH=2.0                           # Schreibintervall in Sekunden
+    MCP_PERSISTENT_CACHE_BATCH=200                           # Sofort schreiben ab so vielen Einträgen
+    MCP_PERSISTENT_CACHE_MAX_ROWS=50000                      # Älteste Einträge darüber hinaus löschen
+"""
+
+import os
+import json
+import time
+import queue
+import sqlite3
+import threading
+from typing import Dict, Any, Optional, Tuple, List
+
+from engineering_mcp.manifest import PROJECT_ROOT
+
+PERSISTENT_CACHE_ENABLED = os.getenv("MCP_PERSISTENT_CACHE", "true").lower() == "true"
+PERSISTENT_CACHE_PATH = os.getenv(
+    "MCP_PERSISTENT_CACHE_PATH",
+    os.path.join(PROJECT_ROOT, ".cache", "result_cache.sqlite3")
+)
+PERSISTENT_FLUSH_INTERVAL = float(os.getenv("MCP_PERSISTENT_CACHE_FLUSH", "2.0"))
+PERSISTENT_BATCH_SIZE = max(1, int(os.getenv("MCP_PERSISTENT_CACHE_BATCH", "200")))
+PERSISTENT_MAX_ROWS = int(os.getenv("MCP_PERSISTENT_CACHE_MAX_ROWS", "50000"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    tool TEXT NOT NULL,
+    key TEXT NOT NULL,
+    version TEXT NOT NULL,
+    parameters TEXT NOT NULL,
+    result TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (tool, key)
+)
+"""
+
+# Queue für den Writer-Thread: (tool, key, version, parameters, result) oder None (Flush + Ende)
+_WRITE_QUEUE: "queue.SimpleQueue[Optional[Tuple]]" = queue.SimpleQueue()
+_WRITER: Optional[threading.Thread] = None
+_WRITER_LOCK = threading.Lock()
+
+# Lese-Verbindung pro Thread (sqlite3-Verbindungen sind nicht threadübergreifend nutzbar)
+_LOCAL = threading.local()
+
+# Nach einem Datenbankfehler deaktiviert (z.B. schreibgeschütztes Dateisystem)
+_DISABLED = False
+
+_STATS = {"hits": 0, "misses": 0, "written": 0, "skipped": 0}
+
+
+def _connect() -> sqlite3.Connection:
+    """Öffnet die Cache-Datenbank (legt Verzeichnis und Tabelle bei Bedarf an)"""
+    os.makedirs(os.path.dirname(PERSISTENT_CACHE_PATH), exist_ok=True)
+    connection = sqlite3.connect(PERSISTENT_CACHE_PATH, timeout=5.0)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute(_SCHEMA)
+    return connection
+
+
+def _disable(action: str, error: Exception) -> None:
+    global _DISABLED
+    _DISABLED = True
+    print(f"WARNING: Persistent result cache disabled ({action} failed: {error})")
+
+
+def persistent_cache_enabled() -> bool:
+    """True wenn die zweite Cache-Stufe aktiv ist."""
+    return PERSISTENT_CACHE_ENABLED and not _DISABLED
+
+
+def encode_key(key: Tuple) -> str:
+    """Stabile Text-Form eines Cache-Schlüssels ohne Version (repr ist über Neustarts gleich)"""
+    return repr(key[1:])
+
+
+def load(tool_name: str, key: Tuple) -> Optional[Tuple[Dict, Dict]]:
+    """
+    Liest einen Eintrag (blockierend - aus der Event-Loop nur über run_sync() aufrufen).
+
+    Args:
+        tool_name: Name des Tools
+        key: Schlüssel aus make_cache_key() - key[0] ist die Tool-Version
+
+    Returns:
+        Optional[Tuple[Dict, Dict]]: (ergebnis, parameter) oder None
+    """
+    if not persistent_cache_enabled():
+        return None
+    try:
+        connection = getattr(_LOCAL, "connection", None)
+        if connection is None:
+            connection = _LOCAL.connection = _connect()
+        row = connection.execute(
+            "SELECT parameters, result FROM results WHERE tool = ? AND key = ? AND version = ?",
+            (tool_name, encode_key(key), key[0])
+        ).fetchone()
+    except (sqlite3.Error, OSError) as e:
+        _disable("read", e)
+        return None
+    if row is None:
+        _STATS["misses"] += 1
+        return None
+    _STATS["hits"] += 1
+    return json.loads(row[1]), json.loads(row[0])
+
+
+def store(tool_name: str, key: Tuple, parameters: Dict[str, Any], result: Dict) -> None:
+    """
+    Merkt einen Eintrag zum Schreiben vor (kehrt sofort zurück).
+
+    Args:
+        tool_name: Name des Tools
+        key: Schlüssel aus make_cache_key()
+        parameters: Parameter des Aufrufs
+        result: Ergebnis - wird danach nicht mehr verändert (Kopie aus dem LRU-Cache)
+    """
+    if not persistent_cache_enabled():
+        return
+    _ensure_writer()
+    _WRITE_QUEUE.put((tool_name, encode_key(key), key[0], parameters, result))
+
+
+def _ensure_writer() -> None:
+    global _WRITER
+    if _WRITER is not None and _WRITER.is_alive():
+        return
+    with _WRITER_LOCK:
+        if _WRITER is None or not _WRITER.is_alive():
+            _WRITER = threading.Thread(target=_writer_loop, name="persistent-cache-writer", daemon=True)
+            _WRITER.start()
+
+
+def _json_scalar(value: Any) -> Any:
+    """numpy-Skalare (z.B. int64 aus pandas) als Python-Zahl speichern"""
+    if hasattr(value, 'item') and not hasattr(value, '__len__'):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _serialize(parameters: Dict[str, Any], result: Dict) -> Optional[Tuple[str, str]]:
+    """JSON-Form eines Eintrags - None wenn das Ergebnis JSON nicht verlustfrei übersteht"""
+    try:
+        result_json = json.dumps(result, ensure_ascii=False, default=_json_scalar)
+        parameters_json = json.dumps(parameters, ensure_ascii=False, default=_json_scalar)
+    except (TypeError, ValueError):
+        return None
+    # Tupel, NaN, Nicht-String-Schlüssel o.ä. würden beim Laden anders aussehen
+    if json.loads(result_json) != result:
+        return None
+    return parameters_json, result_json
+
+
+def _flush(connection: sqlite3.Connection, pending: List[Tuple]) -> None:
+    """Schreibt gesammelte Einträge in einer Transaktion, kürzt danach auf MCP_PERSISTENT_CACHE_MAX_ROWS"""
+    rows = []
+    now = time.time()
+    for tool_name, key_text, version, parameters, result in pending:
+        serialized = _serialize(parameters, result)
+        if serialized is None:
+            _STATS["skipped"] += 1
+            continue
+        rows.append((tool_name, key_text, version, serialized[0], serialized[1], now))
+    if not rows:
+        return
+    with connection:
+        connection.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)", rows)
+        if PERSISTENT_MAX_ROWS > 0:
+            excess = connection.execute("SELECT COUNT(*) FROM results").fetchone()[0] - PERSISTENT_MAX_ROWS
+            if excess > 0:
+                connection.execute(
+                    "DELETE FROM results WHERE rowid IN "
+                    "(SELECT rowid FROM results ORDER BY stored_at LIMIT ?)", (excess,)
+                )
+    _STATS["written"] += len(rows)
+
+
+def _writer_loop() -> None:
+    """Writer-Thread: sammelt bis Intervall/Batch-Größe erreicht ist, schreibt gebündelt"""
+    try:
+        connection = _connect()
+    except (sqlite3.Error, OSError) as e:
+        _disable("open", e)
+        return
+
+    pending: List[Tuple] = []
+    deadline = None
+    running = True
+    while running:
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            item = _WRITE_QUEUE.get(timeout=timeout)
+        except queue.Empty:
+            item = ()
+        if item is None:
+            running = False
+        elif item:
+            pending.append(item)
+            if deadline is None:
+                deadline = time.monotonic() + PERSISTENT_FLUSH_INTERVAL
+            if len(pending) < PERSISTENT_BATCH_SIZE:
+                continue
+        if pending:
+            try:
+                _flush(connection, pending)
+            except (sqlite3.Error, OSError) as e:
+                _disable("write", e)
+                running = False
+            pending = []
+        deadline = None
+    connection.close()
+
+
+def shutdown_persistent_cache(timeout: float = 5.0) -> None:
+    """Schreibt ausstehende Einträge und beendet den Writer-Thread (Server-Shutdown)."""
+    global _WRITER
+    writer = _WRITER
+    if writer is None or not writer.is_alive():
+        return
+    _WRITE_QUEUE.put(None)
+    writer.join(timeout)
+    _WRITER = None
+
+
+def get_persistent_cache_stats() -> Dict[str, Any]:
+    """
+    Statistik der zweiten Cache-Stufe.
+
+    Returns:
+        Dict: enabled, path, hits, misses, written, skipped (nicht JSON-fähig), pending
+    """
+    return {
+        "enabled": persistent_cache_enabled(),
+        "path": PERSISTENT_CACHE_PATH,
+        **_STATS,
+        "pending": _WRITE_QUEUE.qsize(),
+    }
@@ -10,141 +10,266 @@ bietet Discovery-Funktionen für LLM-Orchestrierung.
 - Andere Parameter haben Werte mit Einheiten
 """
 
+import os
 import re
-import pkgutil
+import sys
+import json
+import time
+import hashlib
 import importlib
-from typing import Dict, List, Optional, Any, Callable
+import threading
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Callable, Mapping, NamedTuple, Tuple, FrozenSet, Iterable
 import asyncio
 
+from engineering_mcp.manifest import (
+    PROJECT_ROOT,
+    iter_tool_files,
+    compute_file_hash,
+    entry_dependency_hash,
+    build_manifest_entry,
+    load_manifest,
+    save_manifest,
+)
+from engineering_mcp.startup_profile import record_module_timing
+from engineering_mcp.dimensions import DimensionCheck, compile_dimension_checks, check_parameter_dimensions
+from engineering_mcp.executor import (
+    run_tool, run_sync, run_limited, run_chunk_in_process, use_process_pool, PROCESS_CHUNK_SIZE
+)
+from engineering_mcp.result_cache import (
+    RESULT_CACHE_ENABLED, make_cache_key, get_cached_result, load_persistent_result,
+    store_result, invalidate_tool, clear_result_cache
+)
+from engineering_mcp.persistent_cache import persistent_cache_enabled
+
+
+class ToolRecord:
+    """
+    Kompakter, unveränderlicher Registry-Eintrag eines Engineering-Tools.
+    
+    ⚡ SPEICHERSPARSAM: __slots__ statt Dict, Strings werden interniert (Tags,
+    Kategorie, has_solving etc. sind prozessweit nur einmal im Speicher) und
+    description/short_description werden nicht dupliziert, sondern aus den
+    Metadaten gelesen. Das Modul-Objekt wird nicht gehalten (liegt in sys.modules).
+    
+    Lazy-Loading erzeugt einen neuen Eintrag (with_function) statt den alten zu verändern.
+    
+    dimension_checks: Bei der Discovery kompilierte Dimensions-Prüfungen der Parameter
+    (siehe engineering_mcp/dimensions.py).
+    """
+    __slots__ = ('name', 'category', 'module_path', 'content_hash', 'tags',
+                 'has_solving', 'metadata', 'function', 'import_time_ms', 'dimension_checks')
+    
+    def __init__(self, name: str, category: str, module_path: str, content_hash: str,
+                 tags: Iterable[str], has_solving: str, metadata: Dict[str, Any],
+                 function: Optional[Callable] = None, import_time_ms: Optional[float] = None,
+                 dimension_checks: Tuple[DimensionCheck, ...] = ()):
+        setattr_ = object.__setattr__
+        setattr_(self, 'name', sys.intern(name))
+        setattr_(self, 'category', sys.intern(category))
+        setattr_(self, 'module_path', sys.intern(module_path))
+        setattr_(self, 'content_hash', content_hash)
+        setattr_(self, 'tags', tuple(sys.intern(tag) for tag in tags))
+        setattr_(self, 'has_solving', sys.intern(has_solving))
+        setattr_(self, 'metadata', metadata)
+        setattr_(self, 'function', function)
+        setattr_(self, 'import_time_ms', import_time_ms)  # None = noch nicht geladen (lazy)
+        setattr_(self, 'dimension_checks', tuple(dimension_checks))
+    
+    def __setattr__(self, key, value):
+        raise AttributeError(f"ToolRecord is immutable (cannot set '{key}')")
+    
+    def __delattr__(self, key):
+        raise AttributeError(f"ToolRecord is immutable (cannot delete '{key}')")
+    
+    def __repr__(self) -> str:
+        return f"ToolRecord(name={self.name!r}, category={self.category!r}, loaded={self.function is not None})"
+    
+    @property
+    def description(self) -> str:
+        return self.metadata.get('description', '')
+    
+    @property
+    def short_description(self) -> str:
+        return self.metadata.get('short_description', '')
+    
+    @property
+    def parameters(self) -> Dict[str, Any]:
+        return self.metadata.get('parameters', {})
+    
+    def with_function(self, function: Callable, import_time_ms: Optional[float]) -> 'ToolRecord':
+        """Neuer Eintrag mit geladener calculate-Funktion (Lazy-Loading)."""
+        return ToolRecord(self.name, self.category, self.module_path, self.content_hash, self.tags,
+                          self.has_solving, self.metadata, function, import_time_ms,
+                          self.dimension_checks)
+    
+    def same_version(self, other: Optional['ToolRecord']) -> bool:
+        """True wenn beide Einträge aus derselben Tool-Datei (Content-Hash) stammen."""
+        return other is not None and (other is self or (
+            other.name == self.name and other.content_hash == self.content_hash))
+    
+    # Kompatibilität zum früheren Dict-Format (record['tags'], record.get('metadata'))
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+    
+    def __contains__(self, key: str) -> bool:
+        return hasattr(self, key)
+
 
 # Globale Engineering-Tool-Registry (NICHT bei MCP registriert!)
-_ENGINEERING_TOOLS_REGISTRY: Dict[str, Dict] = {}
+_ENGINEERING_TOOLS_REGISTRY: Dict[str, ToolRecord] = {}
+
+# Lock für das Lazy-Loading der Tool-Module (verhindert doppelte Imports bei parallelen Aufrufen)
+_TOOL_LOAD_LOCK = threading.Lock()
+
+# Registry-Version und Katalog-Snapshot (wird nur bei Registry-Änderungen neu gebaut)
+_REGISTRY_VERSION = 0
+_TOOL_CATALOG = None
+_CATALOG_LOCK = threading.Lock()
+
+# Eingefrorene Katalog-Einträge pro Tool - gültig solange die Tool-Version (Content-Hash) gleich ist
+_FROZEN_TOOL_INFOS: Dict[str, Tuple[ToolRecord, Mapping[str, Any]]] = {}
+
+# Zuletzt bekannter Manifest-Stand und Datei-Signaturen (mtime_ns, size) für Hot-Reload
+_MANIFEST_MODULES: Dict[str, Dict] = {}
+_MODULE_FILE_STATS: Dict[str, Tuple[int, int]] = {}
+
+# 🔁 Datendateien der Tools (Metadaten "data_files"): Pfad -> ((mtime_ns, size), SHA-256)
+_DATA_FILE_HASHES: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+# Serialisiert Discovery und Hot-Reload
+_RELOAD_LOCK = threading.Lock()
+
+# 📡 Zeilen pro Block, wenn ein Batch mit Fortschrittsmeldung/Streaming ausgeführt wird
+BATCH_CHUNK_SIZE = max(2, int(os.getenv("MCP_BATCH_CHUNK_SIZE", "500")))
+
+# Vorberechnete get_tool_details-Dokumente: tool_name -> (Registry-Eintrag, Details, ETag)
+# ⚡ Gültig solange die Tool-Version gleich ist (Hot-Reload ersetzt nur geänderte Einträge)
+_TOOL_DETAILS_CACHE: Dict[str, Tuple[ToolRecord, Mapping[str, Any], str]] = {}
+
+
+async def discover_engineering_tools(use_manifest: bool = True) -> int:
+    """
+    Entdeckt Engineering-Tools im tools/ Verzeichnis und speichert sie in separater Registry.
+    Async-Variante von discover_engineering_tools_sync().
+    
+    Args:
+        use_manifest: Manifest verwenden (False = alle Module neu importieren)
+    
+    Returns:
+        int: Anzahl der entdeckten Engineering-Tools
+    """
+    return discover_engineering_tools_sync(use_manifest=use_manifest)
+
+
+def ensure_tools_discovered() -> None:
+    """
+    Führt die Discovery einmalig aus, falls sie in diesem Prozess noch nicht lief
+    (z.B. TAG_Manager oder Meta-Tools ohne vorherigen Serverstart).
+    """
+    if _REGISTRY_VERSION == 0:
+        discover_engineering_tools_sync()
 
 
-async def discover_engineering_tools() -> int:
+def discover_engineering_tools_sync(use_manifest: bool = True) -> int:
     """
     Entdeckt Engineering-Tools im tools/ Verzeichnis und speichert sie in separater Registry.
     REGISTRIERT NICHT bei MCP - nur interne Speicherung!
     
+    ⚡ EINZIGER DISCOVERY-DURCHLAUF: Registry, Katalog und Tag-System
+    (tag_definitions.discover_all_tags) basieren auf denselben Metadaten.
+    
     ⚡ NUR NEUE TOOL-STRUKTUR: Erwartet get_metadata() und calculate() Funktionen
     
+    ⚡ MANIFEST-KALTSTART: Tools deren Datei-Hash mit dem Manifest übereinstimmt
+    werden NICHT importiert - Metadaten kommen direkt aus dem Manifest, das Modul
+    wird erst beim ersten Aufruf geladen. Nur neue/geänderte Dateien werden importiert.
+    
+    Args:
+        use_manifest: Manifest verwenden (False = alle Module neu importieren)
+    
     Returns:
         int: Anzahl der entdeckten Engineering-Tools
     """
-    global _ENGINEERING_TOOLS_REGISTRY
-    _ENGINEERING_TOOLS_REGISTRY.clear()
+    global _MANIFEST_MODULES
+    
+    # Neue Registry wird zuerst lokal aufgebaut und dann in einem Schritt übernommen
+    discovered_tools = {}
     
     # Warning-System für Probleme beim Serverstart
     warnings = []
     
     # Prüfe tag_definitions.py Verfügbarkeit (interne Utility)
+    # Tag-Map wird NICHT hier erzeugt - sie wird aus dem Katalog dieser Discovery abgeleitet
     try:
-        from engineering_mcp.tag_definitions import get_tag_definitions
-        get_tag_definitions()
+        from engineering_mcp.tag_definitions import TAG_DESCRIPTIONS
     except Exception as e:
         warnings.append(f"ERROR: tag_definitions.py: Internal Utility not available -> Tools will get 'unknown' Tag ({str(e)})")
     
-    def discover_tools_recursive(module_path, module_name_prefix, category_override=None):
-        """Rekursive Funktion zum Durchsuchen von Unterordnern"""
-        discovered_count = 0
-        
-        try:
-            for finder, name, ispkg in pkgutil.iter_modules(module_path, module_name_prefix + "."):
-                if ispkg:
-                    # Unterordner gefunden - rekursiv durchsuchen
-                    try:
-                        submodule = importlib.import_module(name)
-                        # Für geometry.Flaechen etc. - verwende 'geometry' als Kategorie
-                        subcategory = category_override if category_override else name.split('.')[-1]
-                        discovered_count += discover_tools_recursive(
-                            submodule.__path__, 
-                            name, 
-                            subcategory
-                        )
-                    except Exception as e:
-                        print(f"ERROR: Failed to load submodule {name}: {e}")
-                else:
-                    # Tool-Modul gefunden - NUR NEUE STRUKTUR!
-                    try:
-                        # 🔧 ROBUSTES IMPORT: Einzelner Tool-Fehler blockiert nicht das ganze System
-                        tool_module = None
-                        try:
-                            tool_module = importlib.import_module(name)
-                        except ImportError as ie:
-                            # Spezielle Behandlung für Import-Fehler (z.B. NumPy-Konflikte)
-                            print(f"ERROR: Failed to load {name}: {ie}")
-                            continue
-                        except Exception as generic_error:
-                            # Andere Fehler beim Import
-                            print(f"ERROR: Failed to load {name}: {generic_error}")
-                            continue
-                        
-                        if tool_module is None:
-                            continue
-                        
-                        # NUR NEUE STRUKTUR: get_metadata() und calculate() Funktionen
-                        if hasattr(tool_module, 'get_metadata') and hasattr(tool_module, 'calculate'):
-                            try:
-                                # 🔧 SICHERE METADATEN-EXTRAKTION
-                                metadata = None
-                                try:
-                                    metadata = tool_module.get_metadata()
-                                except Exception as me:
-                                    print(f"ERROR: Failed to get metadata from {name}: {me}")
-                                    continue
-                                
-                                calculate_func = tool_module.calculate
-                                
-                                if calculate_func and callable(calculate_func) and metadata:
-                                    # Speichere in separater Registry
-                                    tool_id = metadata.get('tool_name', name.split('.')[-1])
-                                    category = category_override if category_override else name.split('.')[-2]
-                                    
-                                    # Prüfe auf fehlende Tags - unterstütze sowohl "tags" als auch "tool_tags"
-                                    tool_tags = metadata.get('tags', []) or metadata.get('tool_tags', [])
-                                    if not tool_tags:
-                                        tool_tags = ['unknown']
-                                        warnings.append(f"WARNING: {tool_id}: No tags defined -> 'unknown' assigned")
-                                    
-                                    _ENGINEERING_TOOLS_REGISTRY[tool_id] = {
-                                        'name': tool_id,
-                                        'description': metadata.get('description', ''),
-                                        'short_description': metadata.get('short_description', ''),
-                                        'tags': tool_tags,
-                                        'function': calculate_func,
-                                        'category': category,
-                                        'module': tool_module,
-                                        'metadata': metadata,
-        
-                                        'has_solving': metadata.get('has_solving', 'symbolic')
-                                    }
-                                    print(f"SUCCESS: Discovered {tool_id} in {category}")
-                                    discovered_count += 1
-                                else:
-                                    print(f"WARNING: Tool {name}: Invalid calculate function or metadata")
-                            except Exception as e:
-                                print(f"ERROR: Failed to process {name}: {e}")
-                        else:
-                            print(f"WARNING: Tool {name} ignored: No get_metadata() or calculate() function (old structure not supported)")
-                            
-                    except Exception as e:
-                        print(f"ERROR: Failed to load {name}: {e}")
-        except Exception as e:
-            print(f"ERROR: Failed to search {module_name_prefix}: {e}")
-        
-        return discovered_count
-    
     try:
-        # Dynamischer Import aller Tool-Module
+        # Dynamischer Import des Tool-Pakets (nur __init__, keine Tools)
         import tools
-        
-        # Starte rekursive Suche ab tools/
-        total_discovered = discover_tools_recursive(tools.__path__, tools.__name__)
-        
     except ImportError:
         print("INFO: No Engineering tools found (tools/ directory missing)")
         return 0
     
+    cached_modules = load_manifest() if use_manifest else {}
+    manifest_modules = {}
+    file_stats = {}
+    manifest_hits = 0
+    
+    for name, file_path, category in iter_tool_files(tools.__path__[0], tools.__name__):
+        try:
+            file_stats[name] = _file_signature(file_path)
+            content_hash = compute_file_hash(file_path)
+        except OSError as e:
+            print(f"ERROR: Failed to read {name}: {e}")
+            continue
+        
+        cached = cached_modules.get(name)
+        if (cached and cached.get('content_hash') == content_hash
+                and cached.get('dependency_hash') == entry_dependency_hash(cached)):
+            # ⚡ Manifest-Treffer: Kein Import, Modul wird lazy beim ersten Aufruf geladen
+            entry = cached
+            tool_module = None
+            import_time_ms = None
+            manifest_hits += 1
+            record_module_timing(name, source="manifest")
+        else:
+            entry, tool_module, import_time_ms = _inspect_tool_module(name, file_path, category, content_hash)
+            if entry is None:
+                # Import-Fehler werden nicht gecacht - beim nächsten Start erneut versuchen
+                continue
+        
+        manifest_modules[name] = entry
+        
+        if not entry.get('is_tool'):
+            continue
+        
+        record = _make_registry_entry(entry, tool_module, import_time_ms, warnings)
+        discovered_tools[record.name] = record
+        print(f"SUCCESS: Discovered {record.name} in {record.category}")
+    
+    # Registry übernehmen (gleiches Dict-Objekt - Meta-Tools halten Referenzen darauf)
+    with _RELOAD_LOCK:
+        _ENGINEERING_TOOLS_REGISTRY.clear()
+        _ENGINEERING_TOOLS_REGISTRY.update(discovered_tools)
+        _MANIFEST_MODULES = manifest_modules
+        _MODULE_FILE_STATS.clear()
+        _MODULE_FILE_STATS.update(file_stats)
+    
+    # Manifest nur schreiben wenn sich etwas geändert hat
+    if manifest_modules != cached_modules:
+        save_manifest(manifest_modules)
+    
+    print(f"INFO: Tool manifest: {manifest_hits}/{len(manifest_modules)} modules loaded without import")
+    
     # Ausgabe der Warnings beim Serverstart
     if warnings:
         print(f"\nWARNING: {len(warnings)} tools with issues detected:")
@@ -152,66 +277,421 @@ async def discover_engineering_tools() -> int:
             print(f"   {warning}")
         print()
     
+    # Katalog-Snapshot für den nächsten Zugriff invalidieren
+    invalidate_tool_catalog()
+    
     return len(_ENGINEERING_TOOLS_REGISTRY)
 
 
-def get_tool_info_for_llm(include_engineering: bool = True) -> List[Dict]:
+def _file_signature(file_path: str) -> Tuple[int, int]:
+    """Schnelle Änderungserkennung über (mtime_ns, size) - Hash nur bei Abweichung."""
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _tool_version(record: ToolRecord) -> str:
     """
-    Erstellt strukturierte Tool-Informationen für LLM-Discovery.
+    Tool-Version für die Ergebnis-Caches: Content-Hash des Moduls kombiniert mit
+    dem dependency_hash aus dem Manifest (lokale Imports + Datendateien beim Start)
+    und - bei Tools mit "data_files" - dem aktuellen Hash dieser Dateien.
     
-    ⚡ TARGET-SYSTEM: Alle Tools verwenden target-Parameter-System
+    ⚡ Die Datendateien werden nur bei geänderter Signatur (mtime, size) neu gehasht.
     
     Args:
-        include_engineering: Engineering-Tools einbeziehen
+        record: Registry-Eintrag
         
     Returns:
-        List[Dict]: Tool-Informationen mit target_parameters
+        str: Versions-Hash
     """
-    tool_info = []
+    entry = _MANIFEST_MODULES.get(record.module_path)
+    if not entry:
+        return record.content_hash
     
-    if include_engineering:
-        for tool_name, tool_data in _ENGINEERING_TOOLS_REGISTRY.items():
-            # ⚡ NUR NEUE TOOL-STRUKTUR: Metadaten aus get_metadata()
-            target_parameters = []
-            if 'metadata' in tool_data and 'parameters' in tool_data['metadata']:
-                # Neue Struktur: Parameters in Metadaten
-                target_parameters = list(tool_data['metadata']['parameters'].keys())
-            else:
-                print(f"WARNING: Tool {tool_name}: No metadata found - will be skipped")
+    tool_dir = os.path.dirname(os.path.join(PROJECT_ROOT, entry['file_path']))
+    digest = hashlib.sha256(record.content_hash.encode())
+    digest.update(entry.get('dependency_hash', '').encode())
+    for relative_path in record.metadata.get('data_files') or []:
+        path = os.path.join(tool_dir, relative_path)
+        try:
+            signature = _file_signature(path)
+            cached = _DATA_FILE_HASHES.get(path)
+            if cached is None or cached[0] != signature:
+                cached = _DATA_FILE_HASHES[path] = (signature, compute_file_hash(path))
+            digest.update(cached[1].encode())
+        except OSError:
+            digest.update(f"missing:{relative_path}".encode())
+    return digest.hexdigest()
+
+
+def _make_registry_entry(entry: Dict, tool_module: Any, import_time_ms: Optional[float],
+                         warnings: List[str]) -> ToolRecord:
+    """
+    Erstellt einen Registry-Eintrag aus einem Manifest-Eintrag.
+    
+    Args:
+        entry: Manifest-Eintrag (is_tool=True)
+        tool_module: Geladenes Modul oder None (lazy)
+        import_time_ms: Gemessene Import-Zeit oder None
+        warnings: Liste für Discovery-Warnungen
+        
+    Returns:
+        ToolRecord: Registry-Eintrag
+    """
+    tool_id = entry['tool_id']
+    
+    # Prüfe auf fehlende Tags - unterstütze sowohl "tags" als auch "tool_tags"
+    tool_tags = entry.get('tags') or []
+    if not tool_tags:
+        tool_tags = ['unknown']
+        warnings.append(f"WARNING: {tool_id}: No tags defined -> 'unknown' assigned")
+    
+    return ToolRecord(
+        name=tool_id,
+        category=entry['category'],
+        module_path=entry['module_path'],
+        content_hash=entry['content_hash'],
+        tags=tool_tags,
+        has_solving=entry.get('has_solving', 'symbolic'),
+        metadata=entry['metadata'],
+        function=tool_module.calculate if tool_module else None,
+        import_time_ms=import_time_ms,
+        # ⚡ Dimensions-Angaben einmalig kompilieren - geprüft wird bei jedem Aufruf
+        dimension_checks=compile_dimension_checks(entry.get('parameters') or {}, warnings, tool_id)
+    )
+
+
+def _inspect_tool_module(name: str, file_path: str, category: str, content_hash: str,
+                         reload: bool = False):
+    """
+    Importiert ein Tool-Modul und erstellt seinen Manifest-Eintrag.
+    
+    🔧 ROBUSTES IMPORT: Einzelner Tool-Fehler blockiert nicht das ganze System
+    
+    Args:
+        name: Voller Modulpfad
+        file_path: Pfad zur Tool-Datei
+        category: Tool-Kategorie
+        content_hash: SHA-256 des Dateiinhalts
+        reload: Bereits geladenes Modul neu ausführen (Hot-Reload)
+        
+    Returns:
+        Tuple: (manifest_eintrag, modul, import_zeit_ms) - (None, None, None) bei Fehlern
+    """
+    try:
+        start = time.perf_counter()
+        if reload and name in sys.modules:
+            tool_module = importlib.reload(sys.modules[name])
+        else:
+            tool_module = importlib.import_module(name)
+        import_time_ms = (time.perf_counter() - start) * 1000
+    except ImportError as ie:
+        # Spezielle Behandlung für Import-Fehler (z.B. NumPy-Konflikte)
+        print(f"ERROR: Failed to load {name}: {ie}")
+        return None, None, None
+    except Exception as generic_error:
+        # Andere Fehler beim Import
+        print(f"ERROR: Failed to load {name}: {generic_error}")
+        return None, None, None
+    
+    # NUR NEUE STRUKTUR: get_metadata() und calculate() Funktionen
+    if not (hasattr(tool_module, 'get_metadata') and hasattr(tool_module, 'calculate')):
+        print(f"WARNING: Tool {name} ignored: No get_metadata() or calculate() function (old structure not supported)")
+        if not reload:
+            record_module_timing(name, import_time_ms, source="import")
+        return build_manifest_entry(name, file_path, category, content_hash, None), None, None
+    
+    # 🔧 SICHERE METADATEN-EXTRAKTION
+    try:
+        start = time.perf_counter()
+        metadata = tool_module.get_metadata()
+        metadata_time_ms = (time.perf_counter() - start) * 1000
+    except Exception as me:
+        print(f"ERROR: Failed to get metadata from {name}: {me}")
+        return None, None, None
+    
+    if not reload:
+        # Hot-Reload verändert das Startup-Profil nicht
+        record_module_timing(name, import_time_ms, metadata_time_ms, source="import")
+    
+    if not metadata or not callable(tool_module.calculate):
+        print(f"WARNING: Tool {name}: Invalid calculate function or metadata")
+        return None, None, None
+    
+    return build_manifest_entry(name, file_path, category, content_hash, metadata), tool_module, import_time_ms
+
+
+def _resolve_tool_function(tool_name: str) -> Callable:
+    """
+    Liefert die calculate-Funktion eines Tools - LAZY: Das Modul wird erst beim
+    ersten Aufruf importiert, die Import-Zeit wird im Registry-Eintrag vermerkt.
+    
+    Args:
+        tool_name: Name des Tools
+        
+    Returns:
+        Callable: calculate-Funktion des Tools
+        
+    Raises:
+        ValueError: Wenn das Tool-Modul nicht geladen werden kann
+    """
+    record = _ENGINEERING_TOOLS_REGISTRY[tool_name]
+    if record.function is not None:
+        return record.function
+    
+    with _TOOL_LOAD_LOCK:
+        # Erneut prüfen - ein paralleler Aufruf kann das Modul bereits geladen haben
+        record = _ENGINEERING_TOOLS_REGISTRY[tool_name]
+        if record.function is not None:
+            return record.function
+        
+        try:
+            start = time.perf_counter()
+            tool_module = importlib.import_module(record.module_path)
+            import_time_ms = (time.perf_counter() - start) * 1000
+        except Exception as e:
+            raise ValueError(f"Tool {tool_name} could not be loaded from {record.module_path}: {e}")
+        
+        loaded = record.with_function(getattr(tool_module, 'calculate', None), import_time_ms)
+        # Nur ersetzen, wenn kein Hot-Reload den Eintrag inzwischen getauscht hat
+        if _ENGINEERING_TOOLS_REGISTRY.get(tool_name) is record:
+            _ENGINEERING_TOOLS_REGISTRY[tool_name] = loaded
+        record_module_timing(record.module_path, import_time_ms, source="lazy")
+        print(f"INFO: Lazy-loaded {tool_name} in {import_time_ms:.1f} ms")
+    
+    return loaded.function
+
+
+def reload_changed_tools() -> Dict[str, List[str]]:
+    """
+    Inkrementeller Hot-Reload: Lädt NUR geänderte Tool-Module neu.
+    
+    - Änderungserkennung über (mtime, size), bestätigt per Content-Hash
+    - Registry-Einträge werden einzeln und atomar ersetzt (kein Leeren der Registry)
+    - Fehlerhafte Module behalten ihren bisherigen, funktionierenden Eintrag
+    - Katalog-Snapshot und Tag-Cache werden invalidiert, Manifest aktualisiert
+    - Ergebnis-Cache: betroffene Tools werden geleert, bei geänderten
+      Hilfsmodulen (kein Tool) der gesamte Cache
+    
+    Returns:
+        Dict: {"reloaded": [...], "added": [...], "removed": [...], "errors": [...]}
+    """
+    global _MANIFEST_MODULES
+    result = {"reloaded": [], "added": [], "removed": [], "errors": []}
+    
+    try:
+        import tools
+    except ImportError:
+        return result
+    
+    warnings = []
+    
+    with _RELOAD_LOCK:
+        manifest_modules = dict(_MANIFEST_MODULES)
+        seen_modules = set()
+        changed = False
+        
+        for name, file_path, category in iter_tool_files(tools.__path__[0], tools.__name__):
+            seen_modules.add(name)
+            try:
+                signature = _file_signature(file_path)
+                if _MODULE_FILE_STATS.get(name) == signature:
+                    continue
+                _MODULE_FILE_STATS[name] = signature
+                content_hash = compute_file_hash(file_path)
+            except OSError as e:
+                print(f"ERROR: Failed to read {name}: {e}")
                 continue
             
-            tool_info.append({
-                "name": tool_name,
-                "description": tool_data.get('description', ''),
-                "short_description": tool_data.get('short_description', tool_data.get('description', '').split('.')[0]),
-                "tags": tool_data.get('tags', []),
-                "target_parameters": target_parameters,  # ⚡ Neue Namensgebung!
-                "has_solving": tool_data.get('has_solving', 'symbolic'),  # ⚡ NEUE PARAMETER-STRUKTUR
-                "target_parameters_info": tool_data['metadata'].get('target_parameters_info', {}),  # ⚡ Detaillierte Parameter-Info
+            old_entry = manifest_modules.get(name)
+            if old_entry and old_entry.get('content_hash') == content_hash:
+                continue  # Nur Zeitstempel geändert
+            
+            entry, tool_module, import_time_ms = _inspect_tool_module(
+                name, file_path, category, content_hash, reload=True
+            )
+            if entry is None:
+                # Alter Eintrag bleibt aktiv - erneuter Versuch bei der nächsten Änderung
+                result["errors"].append(name)
+                continue
+            
+            manifest_modules[name] = entry
+            changed = True
+            
+            old_tool_id = old_entry.get('tool_id') if old_entry and old_entry.get('is_tool') else None
+            new_tool_id = entry.get('tool_id') if entry.get('is_tool') else None
+            if not old_tool_id and not new_tool_id:
+                clear_result_cache()  # Hilfsmodul - kann jedes Tool betreffen
+            if old_tool_id:
+                invalidate_tool(old_tool_id)
+            if old_tool_id and old_tool_id != new_tool_id:
+                _ENGINEERING_TOOLS_REGISTRY.pop(old_tool_id, None)
+                result["removed"].append(old_tool_id)
+            
+            if new_tool_id:
+                # ⚡ Atomarer Tausch: Ein einzelner Dict-Eintrag wird ersetzt
+                _ENGINEERING_TOOLS_REGISTRY[new_tool_id] = _make_registry_entry(
+                    entry, tool_module, import_time_ms, warnings
+                )
+                result["reloaded" if old_tool_id == new_tool_id else "added"].append(new_tool_id)
+        
+        # Gelöschte Dateien entfernen
+        for name in set(manifest_modules) - seen_modules:
+            old_entry = manifest_modules.pop(name)
+            _MODULE_FILE_STATS.pop(name, None)
+            sys.modules.pop(name, None)
+            if old_entry.get('is_tool'):
+                _ENGINEERING_TOOLS_REGISTRY.pop(old_entry['tool_id'], None)
+                invalidate_tool(old_entry['tool_id'])
+                result["removed"].append(old_entry['tool_id'])
+            else:
+                clear_result_cache()
+            changed = True
+        
+        if changed:
+            _MANIFEST_MODULES = manifest_modules
+            invalidate_tool_catalog()
+    
+    if changed:
+        save_manifest(manifest_modules)
+        precompute_tool_details()
+        for warning in warnings:
+            print(f"   {warning}")
+        print(f"INFO: Hot-reload: reloaded={result['reloaded']} added={result['added']} "
+              f"removed={result['removed']} errors={result['errors']}")
+    
+    return result
+
+
+def get_example_values() -> List[str]:
+    """
+    Sammelt alle Beispielwerte (example / batch_example) aus den Tool-Metadaten.
+    
+    Returns:
+        List[str]: Werte wie "100 bar" - Grundlage für das Einheiten-Warm-up
+    """
+    values = []
+    for record in list(_ENGINEERING_TOOLS_REGISTRY.values()):
+        for param_info in record.parameters.values():
+            if not isinstance(param_info, dict):
+                continue
+            for key in ('example', 'batch_example'):
+                example = param_info.get(key)
+                if isinstance(example, str):
+                    values.append(example)
+                elif isinstance(example, list):
+                    values.extend(value for value in example if isinstance(value, str))
+    return values
+
+
+def get_solving_modules() -> Dict[str, str]:
+    """
+    Module aller berechnenden Tools (has_solving != "none").
+    
+    Returns:
+        Dict[str, str]: Modulpfad -> Content-Hash - die Worker des Prozess-Pools
+        importieren diese Module vorab und vermerken den Hash
+    """
+    return {record.module_path: record.content_hash
+            for record in sorted(_ENGINEERING_TOOLS_REGISTRY.values(), key=lambda r: r.module_path)
+            if record.has_solving != "none"}
+
 
-                "source": "engineering_registry"
-            })
+def get_tool_load_stats() -> Dict[str, Dict]:
+    """
+    Gibt den Lade-Status aller Tools zurück (Lazy-Loading-Übersicht).
+    
+    Returns:
+        Dict: tool_name -> {loaded, import_time_ms, module_path}
+    """
+    return {
+        tool_name: {
+            "loaded": record.function is not None,
+            "import_time_ms": record.import_time_ms,
+            "module_path": record.module_path,
+        }
+        for tool_name, record in _ENGINEERING_TOOLS_REGISTRY.items()
+    }
+
+
+class ToolCatalog(NamedTuple):
+    """Unveränderlicher Katalog-Snapshot für LLM-Discovery"""
+    version: int
+    engineering_tools: Tuple[Mapping[str, Any], ...]
+    meta_tools: Tuple[Mapping[str, Any], ...]
+    all_tools: Tuple[Mapping[str, Any], ...]
+    tag_index: Mapping[str, FrozenSet[int]]      # Tag -> Positionen in all_tools
+    tag_counts: Mapping[str, int]                # Tag -> Anzahl Tools
+    tag_overview: Tuple[Mapping[str, Any], ...]  # Vorberechnete Tag-Übersicht
+
+
+def _freeze_tool_info(info: Dict) -> Mapping[str, Any]:
+    """Macht einen Katalog-Eintrag schreibgeschützt (Listen werden zu Tupeln)."""
+    return MappingProxyType({
+        key: tuple(value) if isinstance(value, list) else value
+        for key, value in info.items()
+    })
+
+
+def _build_engineering_tool_infos() -> List[Mapping[str, Any]]:
+    """
+    Erstellt die (eingefrorenen) Katalog-Einträge aller Engineering-Tools aus der Registry.
+    
+    Einträge unveränderter Tools werden wiederverwendet - nach einem Hot-Reload
+    wird nur der Eintrag des geänderten Tools neu erzeugt.
+    """
+    tool_info = []
+    
+    for tool_name, record in list(_ENGINEERING_TOOLS_REGISTRY.items()):
+        cached = _FROZEN_TOOL_INFOS.get(tool_name)
+        if cached is not None and record.same_version(cached[0]):
+            tool_info.append(cached[1])
+            continue
+        
+        # ⚡ NUR NEUE TOOL-STRUKTUR: Metadaten aus get_metadata()
+        if 'parameters' not in record.metadata:
+            print(f"WARNING: Tool {tool_name}: No metadata found - will be skipped")
+            continue
+        
+        frozen = _freeze_tool_info({
+            "name": tool_name,
+            "description": record.description,
+            "short_description": record.short_description,
+            "tags": record.tags,
+            "target_parameters": list(record.parameters.keys()),  # ⚡ Neue Namensgebung!
+            "has_solving": record.has_solving,  # ⚡ NEUE PARAMETER-STRUKTUR
+            "target_parameters_info": record.metadata.get('target_parameters_info', {}),  # ⚡ Detaillierte Parameter-Info
+
+            "source": "engineering_registry"
+        })
+        _FROZEN_TOOL_INFOS[tool_name] = (record, frozen)
+        tool_info.append(frozen)
+    
+    # Einträge entfernter Tools verwerfen
+    for tool_name in set(_FROZEN_TOOL_INFOS) - set(_ENGINEERING_TOOLS_REGISTRY):
+        _FROZEN_TOOL_INFOS.pop(tool_name, None)
     
-    # Meta-Tools hinzufügen (ohne Fallback!)
+    return tool_info
+
+
+def _build_meta_tool_infos() -> List[Dict]:
+    """
+    Erstellt die Katalog-Einträge der Meta-Tools aus tools/Meta.
+    
+    Die Module werden über importlib.import_module geladen - bereits vom Server
+    importierte Meta-Tools werden dadurch NICHT erneut ausgeführt.
+    """
+    tool_info = []
     meta_tools_loaded = 0
     try:
-        # Lade Meta-Tool-Definitionen direkt aus den Dateien
         import os
-        import importlib.util
         
         meta_tools_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "tools", "Meta")
         
         if os.path.exists(meta_tools_dir):
-            for filename in os.listdir(meta_tools_dir):
+            for filename in sorted(os.listdir(meta_tools_dir)):
                 if filename.endswith('.py') and not filename.startswith('__'):
                     try:
-                        # Dynamisches Import der Meta-Tool-Module
-                        spec = importlib.util.spec_from_file_location(
-                            f"meta_tool_{filename[:-3]}", 
-                            os.path.join(meta_tools_dir, filename)
-                        )
-                        module = importlib.util.module_from_spec(spec)
-                        spec.loader.exec_module(module)
+                        module = importlib.import_module(f"tools.Meta.{filename[:-3]}")
                         
                         # Hole TOOL_METADATA wenn verfügbar
                         if hasattr(module, 'TOOL_METADATA'):
@@ -238,6 +718,156 @@ def get_tool_info_for_llm(include_engineering: bool = True) -> List[Dict]:
     return tool_info
 
 
+def _build_tag_index(all_tools: Tuple[Mapping[str, Any], ...]) -> Mapping[str, FrozenSet[int]]:
+    """
+    Erstellt den invertierten Tag-Index: Tag -> Menge der Katalog-Positionen.
+    
+    Positionen statt Namen erlauben eine sortierte Rückgabe in Katalog-Reihenfolge
+    ohne erneuten Scan über alle Tools.
+    """
+    index: Dict[str, set] = {}
+    for position, info in enumerate(all_tools):
+        for tag in info.get("tags", ()):
+            index.setdefault(tag, set()).add(position)
+    return MappingProxyType({tag: frozenset(positions) for tag, positions in index.items()})
+
+
+def _build_tag_overview(all_tools: Tuple[Mapping[str, Any], ...],
+                        tag_index: Mapping[str, FrozenSet[int]]) -> Tuple[Mapping[str, Any], ...]:
+    """
+    Erstellt die Tag-Übersicht (bekannte Tags zuerst, dann alphabetisch) einmalig pro Snapshot.
+    """
+    try:
+        from engineering_mcp.tag_definitions import TAG_DESCRIPTIONS
+    except Exception:
+        TAG_DESCRIPTIONS = {}
+    
+    overview = []
+    for tag in set(TAG_DESCRIPTIONS.keys()) | set(tag_index.keys()):
+        tools = sorted(all_tools[position]["name"] for position in tag_index.get(tag, ()))
+        is_known = tag in TAG_DESCRIPTIONS
+        overview.append(_freeze_tool_info({
+            "tag": tag,
+            "description": TAG_DESCRIPTIONS[tag] if is_known else "⚠️ UNBEKANNTER TAG - Bitte Beschreibung in tag_definitions.py hinzufügen!",
+            "tool_count": len(tools),
+            "tools": tools[:5],  # Zeige nur erste 5 Tools
+            "more_tools": max(0, len(tools) - 5),
+            "is_known": is_known
+        }))
+    
+    # Sortiere Tags: Bekannte zuerst, dann alphabetisch
+    overview.sort(key=lambda x: (not x["is_known"], x["tag"]))
+    return tuple(overview)
+
+
+def query_tools_by_tags(any_of: Iterable[str] = (), all_of: Iterable[str] = (),
+                        none_of: Iterable[str] = ()) -> List[Mapping[str, Any]]:
+    """
+    Beantwortet Tag-Abfragen über Mengenoperationen auf dem invertierten Index.
+    
+    Args:
+        any_of: ODER - Tool muss mindestens einen dieser Tags haben
+        all_of: UND - Tool muss alle diese Tags haben
+        none_of: NICHT - Tool darf keinen dieser Tags haben
+        
+    Returns:
+        List[Mapping]: Treffer in Katalog-Reihenfolge (leere Abfrage = alle Tools)
+    """
+    catalog = get_tool_catalog()
+    index = catalog.tag_index
+    empty = frozenset()
+    any_of, all_of, none_of = list(any_of), list(all_of), list(none_of)
+    
+    if any_of:
+        positions = frozenset().union(*(index.get(tag, empty) for tag in any_of))
+    else:
+        positions = frozenset(range(len(catalog.all_tools)))
+    
+    for tag in all_of:
+        positions &= index.get(tag, empty)
+    for tag in none_of:
+        positions -= index.get(tag, empty)
+    
+    return [catalog.all_tools[position] for position in sorted(positions)]
+
+
+def get_tag_overview() -> Tuple[Mapping[str, Any], ...]:
+    """Gibt die vorberechnete Tag-Übersicht des aktuellen Katalogs zurück."""
+    return get_tool_catalog().tag_overview
+
+
+def get_tag_counts() -> Mapping[str, int]:
+    """Gibt die vorberechnete Anzahl Tools pro Tag zurück."""
+    return get_tool_catalog().tag_counts
+
+
+def get_registry_version() -> int:
+    """Gibt die aktuelle Registry-Version zurück (steigt bei jeder Änderung)."""
+    return _REGISTRY_VERSION
+
+
+def invalidate_tool_catalog() -> None:
+    """
+    Markiert die Registry als geändert - der Katalog-Snapshot wird beim
+    nächsten Zugriff neu erstellt.
+    """
+    global _REGISTRY_VERSION
+    _REGISTRY_VERSION += 1
+
+
+def get_tool_catalog() -> ToolCatalog:
+    """
+    Liefert den Katalog-Snapshot und baut ihn nur neu, wenn sich die Registry
+    seit dem letzten Aufbau geändert hat.
+    
+    Returns:
+        ToolCatalog: Unveränderlicher Snapshot (Engineering- und Meta-Tools)
+    """
+    global _TOOL_CATALOG
+    catalog = _TOOL_CATALOG
+    if catalog is not None and catalog.version == _REGISTRY_VERSION:
+        return catalog
+    
+    with _CATALOG_LOCK:
+        if _TOOL_CATALOG is None or _TOOL_CATALOG.version != _REGISTRY_VERSION:
+            # Meta-Tools ändern sich nur mit dem Code - aus altem Snapshot übernehmen
+            meta_tools = _TOOL_CATALOG.meta_tools if _TOOL_CATALOG is not None else tuple(
+                _freeze_tool_info(info) for info in _build_meta_tool_infos()
+            )
+            engineering_tools = tuple(_build_engineering_tool_infos())
+            all_tools = engineering_tools + meta_tools
+            tag_index = _build_tag_index(all_tools)
+            _TOOL_CATALOG = ToolCatalog(
+                version=_REGISTRY_VERSION,
+                engineering_tools=engineering_tools,
+                meta_tools=meta_tools,
+                all_tools=all_tools,
+                tag_index=tag_index,
+                tag_counts=MappingProxyType({tag: len(positions) for tag, positions in tag_index.items()}),
+                tag_overview=_build_tag_overview(all_tools, tag_index),
+            )
+        return _TOOL_CATALOG
+
+
+def get_tool_info_for_llm(include_engineering: bool = True) -> List[Mapping[str, Any]]:
+    """
+    Erstellt strukturierte Tool-Informationen für LLM-Discovery.
+    
+    ⚡ TARGET-SYSTEM: Alle Tools verwenden target-Parameter-System
+    ⚡ GECACHT: Liest aus dem Katalog-Snapshot (siehe get_tool_catalog())
+    
+    Args:
+        include_engineering: Engineering-Tools einbeziehen
+        
+    Returns:
+        List[Mapping]: Schreibgeschützte Tool-Informationen mit target_parameters
+    """
+    catalog = get_tool_catalog()
+    if include_engineering:
+        return list(catalog.all_tools)
+    return list(catalog.meta_tools)
+
+
 def get_symbolic_tools_summary() -> Dict:
     """
     Erstellt eine kategorisierte Übersicht aller target-basierten Tools.
@@ -251,9 +881,9 @@ def get_symbolic_tools_summary() -> Dict:
         "target_based_tools": []
     }
     
-    for tool_name, tool_data in _ENGINEERING_TOOLS_REGISTRY.items():
-        if tool_data.get('has_solving', 'symbolic') != 'none':
-            category = tool_data.get('category', 'unknown')
+    for tool_name, record in _ENGINEERING_TOOLS_REGISTRY.items():
+        if record.has_solving != 'none':
+            category = record.category
             
             # Kategorie initialisieren falls noch nicht vorhanden
             if category not in summary["categories"]:
@@ -263,15 +893,11 @@ def get_symbolic_tools_summary() -> Dict:
                 }
             
             # Tool-Info sammeln
-            target_params = []
-            if 'metadata' in tool_data and 'parameters' in tool_data['metadata']:
-                target_params = list(tool_data['metadata']['parameters'].keys())
-                
             tool_info = {
                 "name": tool_name,
-                "description": tool_data.get('description', ''),
-                "target_parameters": target_params,
-                "has_solving": tool_data.get('has_solving', 'symbolic'),  # ⚡ NEUE PARAMETER-STRUKTUR
+                "description": record.description,
+                "target_parameters": list(record.parameters.keys()),
+                "has_solving": record.has_solving,  # ⚡ NEUE PARAMETER-STRUKTUR
             }
             
             summary["categories"][category]["tools"].append(tool_info)
@@ -281,35 +907,131 @@ def get_symbolic_tools_summary() -> Dict:
     return summary
 
 
-async def call_engineering_tool(tool_name: str, parameters: Dict) -> Any:
+def _batch_rows(parameters: Dict) -> int:
+    """Anzahl Parametersätze eines Batches (0 ohne Listen)"""
+    return max((len(value) for value in parameters.values() if isinstance(value, list)), default=0)
+
+
+async def call_engineering_tool(tool_name: str, parameters: Dict,
+                                on_chunk: Optional[Callable[[Dict, int, int], Any]] = None,
+                                keep_results: bool = True) -> Any:
     """
     Führt ein Engineering-Tool aus der Registry aus.
     
+    ⚡ EXECUTOR: Synchrone Tools laufen im Thread-Pool, große Batches berechnender
+    Tools (ab MCP_PROCESS_MIN_ROWS Zeilen) werden in Blöcken parallel auf den
+    Prozess-Pool verteilt (siehe engineering_mcp/executor.py). Jeder Aufruf läuft
+    mit Pro-Tool-Limit und Zeitlimit - die Event-Loop wird nie blockiert.
+    
+    📡 CHUNKS: Mit on_chunk werden auch kleinere Batches in Blöcken zu
+    BATCH_CHUNK_SIZE Zeilen ausgeführt. Nach jedem Block (in Reihenfolge) wird
+    on_chunk(block_ergebnis, erledigt, gesamt) awaited (Fortschritt/Streaming).
+    
+    🔁 ERGEBNIS-CACHE: Einzelaufrufe werden vor dem Ausführen im LRU-Cache
+    nachgeschlagen (Schlüssel: Tool-Version + SI-normierte Eingaben, siehe
+    engineering_mcp/result_cache.py) - ein Treffer belegt weder Limit noch Thread.
+    Tools mit "persistent_cache" in den Metadaten werden danach in der SQLite-Stufe
+    gesucht (engineering_mcp/persistent_cache.py), neue Ergebnisse dort im
+    Hintergrund gespeichert.
+    
     Args:
         tool_name: Name des Tools
         parameters: Tool-Parameter (mit target-Parameter)
+        on_chunk: Async-Callback pro berechnetem Block (batch_index bereits global)
+        keep_results: False = Zeilen nach on_chunk verwerfen, nur Zusammenfassung zurückgeben
         
     Returns:
         Any: Tool-Ergebnis
         
     Raises:
         ValueError: Bei unbekanntem Tool
+        DimensionMismatchError: Wenn eine Parameter-Spalte nicht die deklarierte Dimension hat
+        ToolTimeoutError: Wenn der Aufruf sein Zeitlimit (MCP_TOOL_TIMEOUT) überschreitet
+        SweepError: Bei ungültiger Sweep-Angabe
     """
     if tool_name not in _ENGINEERING_TOOLS_REGISTRY:
         available_tools = list(_ENGINEERING_TOOLS_REGISTRY.keys())
         raise ValueError(f"Unknown tool: {tool_name}. Available tools: {available_tools}")
     
-    tool_data = _ENGINEERING_TOOLS_REGISTRY[tool_name]
-    tool_func = tool_data.get('function')
+    cache_key = None
+    persistent = False
+    if RESULT_CACHE_ENABLED:
+        record = _ENGINEERING_TOOLS_REGISTRY[tool_name]
+        cache_key = make_cache_key(_tool_version(record), parameters)
+        if cache_key is not None:
+            cached = get_cached_result(tool_name, cache_key, parameters)
+            persistent = bool(record.metadata.get('persistent_cache')) and persistent_cache_enabled()
+            if cached is None and persistent:
+                cached = await run_sync(load_persistent_result, tool_name, cache_key, parameters)
+            if cached is not None:
+                return cached
+    
+    result = await run_limited(
+        tool_name, lambda: _execute_tool(tool_name, parameters, on_chunk, keep_results)
+    )
+    if cache_key is not None:
+        store_result(tool_name, cache_key, parameters, result, persistent)
+    return result
+
+
+async def _execute_tool(tool_name: str, parameters: Dict,
+                        on_chunk: Optional[Callable[[Dict, int, int], Any]],
+                        keep_results: bool) -> Any:
+    """Ausführung von call_engineering_tool() innerhalb von Pro-Tool-Limit und Zeitlimit"""
+    # 🔁 Parameter-Sweeps ({"linspace": [...]}) serverseitig zu Batch-Spalten expandieren
+    if any(isinstance(value, dict) for value in parameters.values()):
+        from engineering_mcp.sweeps import has_sweeps, expand_sweeps
+        if has_sweeps(parameters):
+            parameters = await run_sync(expand_sweeps, parameters)
+    
+    # ⚡ Dimensions-Prüfung VOR dem Lösen: ganze Batch-Spalten werden auf einmal abgelehnt
+    record = _ENGINEERING_TOOLS_REGISTRY[tool_name]
+    if record.dimension_checks:
+        await run_sync(check_parameter_dimensions, record.dimension_checks, parameters)
+    
+    # Erster Aufruf importiert das Modul (lazy) - ebenfalls außerhalb der Event-Loop
+    tool_func = record.function or await run_sync(_resolve_tool_function, tool_name)
     
     if not tool_func:
         raise ValueError(f"Tool {tool_name} has no executable function")
     
-    # Führe Tool aus (async wenn möglich)
-    if asyncio.iscoroutinefunction(tool_func):
-        return await tool_func(**parameters)
-    else:
-        return tool_func(**parameters)
+    # Nur berechnende Tools (has_solving != "none") unterstützen den Batch-Modus
+    total = _batch_rows(parameters) if record.has_solving != "none" else 0
+    in_processes = use_process_pool(total) and not asyncio.iscoroutinefunction(tool_func)
+    chunks = None
+    if in_processes or (on_chunk is not None and total):
+        from engineering_mcp.batch_engine import split_batch
+        chunks = split_batch(parameters, PROCESS_CHUNK_SIZE if in_processes else BATCH_CHUNK_SIZE)
+    if not chunks:
+        return await run_tool(tool_func, parameters)
+    
+    from engineering_mcp.batch_engine import offset_batch_indices, merge_batch_results
+    
+    # Prozess-Pool: alle Blöcke sofort verteilen, Ergebnisse in Reihenfolge abholen
+    pending = [
+        asyncio.ensure_future(run_chunk_in_process(record, tool_func, chunk)) for _, chunk in chunks
+    ] if in_processes else None
+    
+    parts = []
+    done = 0
+    try:
+        for index, (offset, chunk) in enumerate(chunks):
+            part = await (pending[index] if pending else run_tool(tool_func, chunk))
+            if not (isinstance(part, dict) and part.get("batch_mode")):
+                # Formatfehler (z.B. Einzelwerte gemischt) -> ungeteilt, damit die Meldung gleich bleibt
+                return await run_tool(tool_func, parameters)
+            offset_batch_indices(part, offset)
+            done += part["total_calculations"]
+            if on_chunk is not None:
+                await on_chunk(part, done, total)
+            if not keep_results:
+                part.pop("results", None)
+            parts.append(part)
+    finally:
+        for future in pending or ():
+            future.cancel()
+    
+    return merge_batch_results(parts, keep_results)
 
 
 def get_category_description(category: str) -> str:
@@ -345,45 +1067,40 @@ async def discover_tools(mcp_instance: Any) -> int:
     return await discover_engineering_tools()
 
 
-async def get_tool_details(tool_name: str) -> Dict:
+def _build_tool_details(tool_name: str, record: ToolRecord) -> Dict:
     """
-    Liefert vollständige Dokumentation für ein spezifisches Tool.
+    Baut die vollständige Dokumentation für ein Tool aus seinem Registry-Eintrag.
     
     ⚡ TARGET-SYSTEM: Generiert Schema für alle-Parameter-required mit target-Unterstützung
     
     Args:
         tool_name: Name des Tools
+        record: Registry-Eintrag des Tools
         
     Returns:
         Dict: Ausführliche Tool-Dokumentation
         
     Raises:
-        ValueError: Bei unbekanntem Tool
+        ValueError: Bei Tools ohne Metadaten
     """
-    if tool_name not in _ENGINEERING_TOOLS_REGISTRY:
-        available_tools = list(_ENGINEERING_TOOLS_REGISTRY.keys())
-        raise ValueError(f"Unknown tool: {tool_name}. The tool name is incorrect. Use list_engineering_tools(tags=['all']) to see all available tools, or call the tool list_engineering_tools with a corresponding tag.")
-    
-    tool_data = _ENGINEERING_TOOLS_REGISTRY[tool_name]
-    
     # Basis-Informationen
     details = {
         "tool_name": tool_name,
         "name": tool_name,
-        "tags": tool_data.get('tags', []),
-        "short_description": tool_data.get('short_description', tool_data.get('description', '').split('.')[0]),
-        "full_description": tool_data.get('description', ''),
+        "tags": list(record.tags),
+        "short_description": record.short_description,
+        "full_description": record.description,
 
-        "has_solving": tool_data.get('has_solving', 'symbolic')  # ⚡ NEUE PARAMETER-STRUKTUR
+        "has_solving": record.has_solving  # ⚡ NEUE PARAMETER-STRUKTUR
     }
     
     # ⚡ NUR NEUE STRUKTUR: Parameters aus Metadaten
-    if 'metadata' in tool_data and 'parameters' in tool_data['metadata']:
+    if 'parameters' in record.metadata:
         # Neue Struktur: Parameters in Metadaten
-        details['target_parameters'] = list(tool_data['metadata']['parameters'].keys())
+        details['target_parameters'] = list(record.parameters.keys())
         
         # Weitere Metadaten aus neuer Struktur
-        metadata = tool_data['metadata']
+        metadata = record.metadata
         if 'examples' in metadata:
             details['examples'] = metadata['examples']
         if 'parameters' in metadata:
@@ -394,13 +1111,14 @@ async def get_tool_details(tool_name: str) -> Dict:
         raise ValueError(f"Tool {tool_name} has no metadata - old structure not supported!")
     
     # ⚡ TARGET-BASIERTES INPUT SCHEMA: Alle Parameter required!
-    if details.get('target_parameters') and tool_data.get('has_solving', 'symbolic') != 'none':
+    if details.get('target_parameters') and record.has_solving != 'none':
         # Target-basiertes Schema: Alle Parameter sind required
         schema_properties = {}
         for var in details['target_parameters']:
             # Prüfe ob Parameter Batch-Support hat
             param_info = details.get('parameters', {}).get(var, {})
             param_type = param_info.get('type', 'string')
+            dimension = param_info.get('dimension')
             
             if 'array' in param_type:
                 # Batch-fähiger Parameter
@@ -423,7 +1141,11 @@ async def get_tool_details(tool_name: str) -> Dict:
                     "type": "string",
                     "description": f"Wert für {var} mit Einheit (z.B. '100 mm') oder 'target' für Berechnung"
                 }
-        
+
+            if dimension:
+                # Erwartete Dimension - falsche Einheiten werden vor der Berechnung abgelehnt
+                schema_properties[var]["dimension"] = dimension
+
         details['input_schema'] = {
             "type": "object",
             "properties": schema_properties,
@@ -515,7 +1237,7 @@ async def get_tool_details(tool_name: str) -> Dict:
             ]
     
     # TARGET-PARAMETER-FORMAT-HINWEIS
-    if tool_data.get('has_solving', 'symbolic') != 'none':
+    if record.has_solving != 'none':
         details['parameter_format'] = {
             "system": "TARGET-PARAMETER-SYSTEM",
             "important": "Alle Parameter sind PFLICHT - einer als 'target', die anderen mit Einheiten!",
@@ -539,6 +1261,15 @@ async def get_tool_details(tool_name: str) -> Dict:
                 "Jeder Index repräsentiert einen vollständigen Parametersatz",
                 "Keine Mischung von Listen und einzelnen Werten erlaubt"
             ],
+            "sweeps": {
+                "description": "Parameterstudien ohne Listen: Sweep-Angabe statt Wert, mehrere Sweeps = kartesisches Produkt",
+                "syntax": [
+                    '{"linspace": ["10 bar", "300 bar", 200]}',
+                    '{"logspace": ["1 mm", "1 m", 50]}',
+                    '{"grid": ["5 mm", "8 mm", "10 mm"]}'
+                ],
+                "rules": "Einzelwerte (auch 'target') gelten für alle Zeilen, Sweeps und Listen nicht mischen"
+            },
             "advantages": [
                 "Unbegrenzte Anzahl von Berechnungen in einem Aufruf",
                 "Vollständige Nachverfolgbarkeit mit batch_index",
@@ -596,4 +1327,110 @@ async def get_tool_details(tool_name: str) -> Dict:
             "note": "Keine target-Parameter - alle Werte direkt angeben"
         }
     
-    return details 
\ No newline at end of file
+    return details 
+
+
+def _compute_details_etag(details: Dict) -> str:
+    """
+    Berechnet den Content-Hash (ETag) eines Details-Dokuments.
+    
+    Args:
+        details: Tool-Dokumentation
+        
+    Returns:
+        str: Gekürzter SHA-256 Hexdigest der kanonischen JSON-Darstellung
+    """
+    payload = json.dumps(details, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def _get_cached_tool_details(tool_name: str) -> Tuple[Mapping[str, Any], str]:
+    """
+    Liefert das vorberechnete Details-Dokument eines Tools und baut es nur neu,
+    wenn sich die Tool-Version (Content-Hash) geändert hat.
+    
+    Args:
+        tool_name: Name des Tools
+        
+    Returns:
+        Tuple[Mapping, str]: (schreibgeschütztes Details-Dokument, ETag)
+        
+    Raises:
+        ValueError: Bei unbekanntem Tool oder Tool ohne Metadaten
+    """
+    if tool_name not in _ENGINEERING_TOOLS_REGISTRY:
+        raise ValueError(f"Unknown tool: {tool_name}. The tool name is incorrect. Use list_engineering_tools(tags=['all']) to see all available tools, or call the tool list_engineering_tools with a corresponding tag.")
+    
+    record = _ENGINEERING_TOOLS_REGISTRY[tool_name]
+    cached = _TOOL_DETAILS_CACHE.get(tool_name)
+    if cached is not None and record.same_version(cached[0]):
+        return cached[1], cached[2]
+    
+    details = _build_tool_details(tool_name, record)
+    etag = _compute_details_etag(details)
+    details['etag'] = etag
+    frozen = MappingProxyType(details)
+    _TOOL_DETAILS_CACHE[tool_name] = (record, frozen, etag)
+    return frozen, etag
+
+
+def precompute_tool_details() -> int:
+    """
+    Baut die Details-Dokumente aller Tools vorab auf (Server-Start / nach Hot-Reload).
+    
+    Unveränderte Tools werden übersprungen, Einträge gelöschter Tools entfernt.
+    
+    Returns:
+        int: Anzahl der Tools mit gültigem Details-Dokument
+    """
+    for tool_name in set(_TOOL_DETAILS_CACHE) - set(_ENGINEERING_TOOLS_REGISTRY):
+        _TOOL_DETAILS_CACHE.pop(tool_name, None)
+    
+    count = 0
+    for tool_name in list(_ENGINEERING_TOOLS_REGISTRY):
+        try:
+            _get_cached_tool_details(tool_name)
+            count += 1
+        except ValueError as e:
+            print(f"WARNING: Tool details for {tool_name} not available: {e}")
+    return count
+
+
+def get_tool_details_etag(tool_name: str) -> str:
+    """
+    Gibt den aktuellen ETag der Tool-Dokumentation zurück.
+    
+    Args:
+        tool_name: Name des Tools
+        
+    Returns:
+        str: ETag (ändert sich nur, wenn sich die Dokumentation ändert)
+        
+    Raises:
+        ValueError: Bei unbekanntem Tool
+    """
+    return _get_cached_tool_details(tool_name)[1]
+
+
+async def get_tool_details(tool_name: str, known_etag: Optional[str] = None) -> Dict:
+    """
+    Liefert vollständige Dokumentation für ein spezifisches Tool.
+    
+    ⚡ VORBERECHNET: Das Dokument wird einmal pro Tool-Version gebaut und gecacht
+    ⚡ ETAG: Stimmt known_etag mit dem aktuellen ETag überein, wird nur eine
+    kurze "not_modified"-Antwort geliefert
+    
+    Args:
+        tool_name: Name des Tools
+        known_etag: ETag einer früher abgerufenen Dokumentation (optional)
+        
+    Returns:
+        Dict: Ausführliche Tool-Dokumentation (Kopie - darf erweitert werden)
+        
+    Raises:
+        ValueError: Bei unbekanntem Tool
+    """
+    details, etag = _get_cached_tool_details(tool_name)
+    if known_etag and known_etag == etag:
+        return {"tool_name": tool_name, "etag": etag, "not_modified": True}
+    return dict(details)
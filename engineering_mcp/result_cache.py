@@ -0,0 +1,287 @@
+"""
+Ergebnis-Cache für Engineering-Tools (prozessweit, über Anfragen hinweg)
+
+Viele Anfragen wiederholen sich ("Fläche eines Kreises mit r = 5 cm"). Einzel-
+aufrufe werden deshalb pro Tool in einem LRU-Cache gehalten:
+
+    Schlüssel = (Tool-Version, Parameter -> (Einheit, SI-Wert gerundet))
+
+- Tool-Version = Content-Hash des Moduls (plus Hash der "data_files" aus den
+  Metadaten): nach einem Hot-Reload oder einer geänderten Tabelle trifft kein
+  alter Eintrag mehr, der Tool-Cache wird beim Hot-Reload zusätzlich geleert
+- SI-Werte werden auf MCP_RESULT_CACHE_DIGITS signifikante Stellen gerundet -
+  "5 cm", "5.0 cm" und "5.000 cm" treffen denselben Eintrag. Die Einheit bleibt
+  Teil des Schlüssels, da die Anzeige-Einheit des Ergebnisses davon abhängen kann
+- 'target' und Werte ohne Einheit (z.B. "M10") gehen unverändert ein
+- Nur erfolgreiche Ergebnisse werden gespeichert, Rückgabe immer als Kopie;
+  vom Aufrufer abweichend geschriebene Eingaben ("5.0 cm" statt "5 cm") werden
+  in den Echo-Abschnitten des Ergebnisses (gegebene_werte, input_parameters,
+  input_combination) pro Parameter auf die Schreibweise des Aufrufers gesetzt
+
+Batches und Sweeps werden nicht gecacht (eigene Zeilen-Deduplizierung in run_batch()).
+
+Tools mit "persistent_cache": True in den Metadaten erhalten zusätzlich eine
+zweite, persistente Stufe (SQLite, siehe engineering_mcp/persistent_cache.py):
+Fehlschläge im Speicher werden dort nachgeschlagen, neue Ergebnisse im
+Hintergrund dorthin geschrieben.
+
+Konfiguration über Umgebungsvariablen:
+    MCP_RESULT_CACHE=true            # Cache aktiv
+    MCP_RESULT_CACHE_SIZE=256        # Einträge pro Tool
+    MCP_RESULT_CACHE_TTL=3600        # Lebensdauer in Sekunden (0 = unbegrenzt)
+    MCP_RESULT_CACHE_DIGITS=12       # Signifikante Stellen der SI-Werte im Schlüssel
+"""
+
+import os
+import copy
+import json
+import time
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+from engineering_mcp.units_utils import parse_value_with_unit, compile_unit, UnitsError
+from engineering_mcp.sweeps import is_sweep_spec
+from engineering_mcp import persistent_cache
+
+RESULT_CACHE_ENABLED = os.getenv("MCP_RESULT_CACHE", "true").lower() == "true"
+RESULT_CACHE_SIZE = max(1, int(os.getenv("MCP_RESULT_CACHE_SIZE", "256")))
+RESULT_CACHE_TTL = float(os.getenv("MCP_RESULT_CACHE_TTL", "3600"))
+RESULT_CACHE_DIGITS = int(os.getenv("MCP_RESULT_CACHE_DIGITS", "12"))
+
+
+class CacheEntry:
+    """Gespeichertes Ergebnis mit den Original-Eingaben (für abweichende Schreibweisen)"""
+    __slots__ = ('result', 'parameters', 'stored_at')
+
+    def __init__(self, result: Dict, parameters: Dict[str, Any], stored_at: float):
+        self.result = result
+        self.parameters = parameters
+        self.stored_at = stored_at
+
+
+# Tool-Name -> LRU (Schlüssel -> CacheEntry), älteste Einträge vorne
+_RESULT_CACHE: Dict[str, "OrderedDict[Tuple, CacheEntry]"] = {}
+
+# Tool-Name -> {"hits", "misses", "evictions", "expired"}
+_CACHE_STATS: Dict[str, Dict[str, int]] = {}
+
+_CACHE_LOCK = threading.Lock()
+
+# Ergebnis-Abschnitte, in denen Tools ihre Eingaben pro Parametername zurückgeben
+_ECHO_KEYS = frozenset({"gegebene_werte", "input_parameters", "input_combination"})
+
+
+def _normalize_value(value: Any) -> Any:
+    """Schlüssel-Anteil eines Parameterwerts: (Einheit, SI gerundet), 'target' oder Rohwert"""
+    if isinstance(value, dict):
+        return ('raw', json.dumps(value, sort_keys=True, default=str))
+    if not isinstance(value, str):
+        return ('raw', repr(value))
+    text = value.strip()
+    if text.lower() == 'target':
+        return ('target',)
+    try:
+        magnitude, unit_str = parse_value_with_unit(text)
+        compiled = compile_unit(unit_str)
+    except UnitsError:
+        return ('raw', text)
+    si_value = magnitude * compiled.scale + compiled.offset
+    return (unit_str, float(f"{si_value:.{RESULT_CACHE_DIGITS}g}"))
+
+
+def make_cache_key(version: str, parameters: Dict[str, Any]) -> Optional[Tuple]:
+    """
+    Baut den Cache-Schlüssel eines Einzelaufrufs.
+
+    Args:
+        version: Tool-Version (Content-Hash des Moduls, ggf. mit Hash der Datendateien)
+        parameters: Tool-Parameter
+
+    Returns:
+        Optional[Tuple]: Schlüssel oder None (Batch/Sweep - nicht cachebar)
+    """
+    if any(isinstance(value, list) or is_sweep_spec(value) for value in parameters.values()):
+        return None
+    return (version,) + tuple(
+        (name, _normalize_value(value)) for name, value in sorted(parameters.items())
+    )
+
+
+def _stats(tool_name: str) -> Dict[str, int]:
+    stats = _CACHE_STATS.get(tool_name)
+    if stats is None:
+        stats = _CACHE_STATS[tool_name] = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+    return stats
+
+
+def _respell_echo(echo: Dict[str, Any], respelled: Dict[str, Tuple[Any, Any]]) -> Dict[str, Any]:
+    """Echo-Abschnitt: Wert eines Parameters ersetzen, wenn er der gespeicherten Eingabe entspricht"""
+    result = {}
+    for name, item in echo.items():
+        spelling = respelled.get(name)
+        if spelling is not None and item == spelling[0]:
+            result[name] = spelling[1]
+        else:
+            result[name] = _respell(item, respelled)
+    return result
+
+
+def _respell(value: Any, respelled: Dict[str, Tuple[Any, Any]]) -> Any:
+    """
+    Kopie eines Ergebnisses mit der Schreibweise des aktuellen Aufrufs (rekursiv).
+
+    Ersetzt wird nur in den Echo-Abschnitten (_ECHO_KEYS) und nur unter dem Namen
+    des jeweiligen Parameters - gleiche Strings an anderer Stelle bleiben unverändert.
+
+    Args:
+        value: Gespeichertes Ergebnis (oder Teil davon)
+        respelled: Parametername -> (gespeicherte Eingabe, aktuelle Eingabe)
+    """
+    if isinstance(value, dict):
+        return {
+            key: _respell_echo(item, respelled) if key in _ECHO_KEYS and isinstance(item, dict)
+            else _respell(item, respelled)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_respell(item, respelled) for item in value]
+    return value
+
+
+def _result_for(entry: CacheEntry, parameters: Dict[str, Any]) -> Dict:
+    """Kopie des gespeicherten Ergebnisses in der Schreibweise des aktuellen Aufrufs"""
+    if entry.parameters == parameters:
+        return copy.deepcopy(entry.result)
+    respelled = {
+        name: (entry.parameters[name], value)
+        for name, value in parameters.items()
+        if entry.parameters.get(name) != value
+    }
+    return _respell(entry.result, respelled)
+
+
+def _insert(tool_name: str, key: Tuple, entry: CacheEntry) -> None:
+    """Fügt einen Eintrag in den LRU-Cache ein (Aufrufer hält _CACHE_LOCK)"""
+    lru = _RESULT_CACHE.get(tool_name)
+    if lru is None:
+        lru = _RESULT_CACHE[tool_name] = OrderedDict()
+    lru[key] = entry
+    lru.move_to_end(key)
+    while len(lru) > RESULT_CACHE_SIZE:
+        lru.popitem(last=False)
+        _stats(tool_name)["evictions"] += 1
+
+
+def get_cached_result(tool_name: str, key: Tuple, parameters: Dict[str, Any]) -> Optional[Dict]:
+    """
+    Liefert ein gespeichertes Ergebnis (als Kopie) oder None.
+
+    Args:
+        tool_name: Name des Tools
+        key: Ergebnis von make_cache_key()
+        parameters: Parameter des aktuellen Aufrufs (Schreibweise für das Ergebnis)
+
+    Returns:
+        Optional[Dict]: Ergebnis oder None bei Miss/abgelaufenem Eintrag
+    """
+    with _CACHE_LOCK:
+        stats = _stats(tool_name)
+        lru = _RESULT_CACHE.get(tool_name)
+        entry = lru.get(key) if lru is not None else None
+        if entry is None:
+            stats["misses"] += 1
+            return None
+        if RESULT_CACHE_TTL > 0 and time.monotonic() - entry.stored_at > RESULT_CACHE_TTL:
+            del lru[key]
+            stats["expired"] += 1
+            stats["misses"] += 1
+            return None
+        lru.move_to_end(key)
+        stats["hits"] += 1
+    return _result_for(entry, parameters)
+
+
+def load_persistent_result(tool_name: str, key: Tuple, parameters: Dict[str, Any]) -> Optional[Dict]:
+    """
+    Schlägt einen Speicher-Fehlschlag in der persistenten Stufe nach (blockierend -
+    aus der Event-Loop über run_sync() aufrufen). Treffer wandern in den LRU-Cache.
+
+    Args:
+        tool_name: Name des Tools
+        key: Ergebnis von make_cache_key()
+        parameters: Parameter des aktuellen Aufrufs
+
+    Returns:
+        Optional[Dict]: Ergebnis oder None
+    """
+    loaded = persistent_cache.load(tool_name, key)
+    if loaded is None:
+        return None
+    entry = CacheEntry(loaded[0], loaded[1], time.monotonic())
+    with _CACHE_LOCK:
+        _insert(tool_name, key, entry)
+    return _result_for(entry, parameters)
+
+
+def store_result(tool_name: str, key: Tuple, parameters: Dict[str, Any], result: Any,
+                 persistent: bool = False) -> None:
+    """
+    Speichert ein erfolgreiches Ergebnis (Fehler-Dicts und Nicht-Dicts werden ignoriert).
+
+    Args:
+        tool_name: Name des Tools
+        key: Ergebnis von make_cache_key()
+        parameters: Parameter des Aufrufs
+        result: Tool-Ergebnis (wird kopiert)
+        persistent: Zusätzlich im Hintergrund in die persistente Stufe schreiben
+    """
+    if not isinstance(result, dict) or "error" in result:
+        return
+    entry = CacheEntry(copy.deepcopy(result), dict(parameters), time.monotonic())
+    with _CACHE_LOCK:
+        _insert(tool_name, key, entry)
+    if persistent:
+        # Der Eintrag wird nie verändert (Treffer liefern Kopien) - kein zweites deepcopy nötig
+        persistent_cache.store(tool_name, key, entry.parameters, entry.result)
+
+
+def invalidate_tool(tool_name: str) -> None:
+    """Leert den Cache eines Tools (Hot-Reload)."""
+    with _CACHE_LOCK:
+        _RESULT_CACHE.pop(tool_name, None)
+
+
+def clear_result_cache() -> None:
+    """Leert den gesamten Cache (z.B. nach Reload eines Hilfsmoduls)."""
+    with _CACHE_LOCK:
+        _RESULT_CACHE.clear()
+
+
+def get_result_cache_stats() -> Dict[str, Any]:
+    """
+    Trefferstatistik des Ergebnis-Caches.
+
+    Returns:
+        Dict: Konfiguration, Summen und Werte pro Tool (hits, misses, hit_rate, entries, ...)
+    """
+    with _CACHE_LOCK:
+        tools = {}
+        for tool_name in sorted(set(_CACHE_STATS) | set(_RESULT_CACHE)):
+            stats = dict(_stats(tool_name))
+            lookups = stats["hits"] + stats["misses"]
+            stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else None
+            stats["entries"] = len(_RESULT_CACHE.get(tool_name, ()))
+            tools[tool_name] = stats
+    hits = sum(stats["hits"] for stats in tools.values())
+    misses = sum(stats["misses"] for stats in tools.values())
+    return {
+        "enabled": RESULT_CACHE_ENABLED,
+        "max_entries_per_tool": RESULT_CACHE_SIZE,
+        "ttl_seconds": RESULT_CACHE_TTL,
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / (hits + misses), 3) if hits + misses else None,
+        "tools": tools,
+        "persistent": persistent_cache.get_persistent_cache_stats(),
+    }
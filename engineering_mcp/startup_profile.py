@@ -0,0 +1,128 @@
+"""
+Startup-Profil für Engineering MCP
+
+Erfasst die Zeitachse des Serverstarts, um Regressionen der Bootzeit
+einem konkreten Tool oder einer Startphase zuordnen zu können:
+
+- Startphasen (Discovery, Katalog, Tool-Details, Tag-System, ...)
+- Pro Tool-Modul: Import-Zeit, get_metadata()-Zeit, Quelle (Import/Manifest/Lazy)
+- Aufbauzeit der Pint-Registry
+- Gesamtzeit vom Prozessstart bis "bereit"
+
+Abrufbar über 0_Server_Informations (Kurzfassung) und den Admin-Endpunkt
+/admin/startup in web.py (vollständig).
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Any
+
+# Referenzpunkt: Import dieses Moduls (erfolgt als erstes in server.py)
+_PROCESS_START = time.perf_counter()
+_PROCESS_START_WALL = time.time()
+
+# Startphasen in Ausführungsreihenfolge
+_PHASES: List[Dict[str, Any]] = []
+
+# Modulpfad -> {import_time_ms, metadata_time_ms, source}
+_MODULE_TIMINGS: Dict[str, Dict[str, Any]] = {}
+
+# Zeitpunkt "Server bereit" (ms seit Prozessstart)
+_READY_AT_MS: Optional[float] = None
+
+
+def _elapsed_ms() -> float:
+    """Millisekunden seit Prozessstart."""
+    return (time.perf_counter() - _PROCESS_START) * 1000
+
+
+@contextmanager
+def startup_phase(name: str):
+    """
+    Misst eine Startphase.
+
+    Args:
+        name: Name der Phase (z.B. 'tool_discovery')
+    """
+    started_at = _elapsed_ms()
+    try:
+        yield
+    finally:
+        _PHASES.append({
+            "phase": name,
+            "started_at_ms": round(started_at, 2),
+            "duration_ms": round(_elapsed_ms() - started_at, 2),
+        })
+
+
+def record_module_timing(module_path: str, import_time_ms: Optional[float] = None,
+                         metadata_time_ms: Optional[float] = None, source: str = "import") -> None:
+    """
+    Vermerkt die Ladekosten eines Tool-Moduls.
+
+    Args:
+        module_path: Voller Modulpfad
+        import_time_ms: Import-Zeit (None = nicht importiert)
+        metadata_time_ms: Laufzeit von get_metadata() (None = nicht ausgeführt)
+        source: 'import' (Discovery), 'manifest' (ohne Import) oder 'lazy' (erster Aufruf)
+    """
+    timing = _MODULE_TIMINGS.setdefault(module_path, {})
+    if source == "lazy":
+        # Startwerte erhalten - Lazy-Import zusätzlich ausweisen
+        timing["lazy_import_time_ms"] = round(import_time_ms, 2) if import_time_ms is not None else None
+        timing.setdefault("source", "manifest")
+        return
+    timing.update({
+        "import_time_ms": round(import_time_ms, 2) if import_time_ms is not None else None,
+        "metadata_time_ms": round(metadata_time_ms, 2) if metadata_time_ms is not None else None,
+        "source": source,
+    })
+
+
+def mark_ready() -> None:
+    """Markiert den Server als bereit (nur der erste Aufruf zählt)."""
+    global _READY_AT_MS
+    if _READY_AT_MS is None:
+        _READY_AT_MS = _elapsed_ms()
+
+
+def get_startup_report(top_n: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Erstellt den strukturierten Startup-Bericht.
+
+    Args:
+        top_n: Nur die N teuersten Module ausgeben (None = alle)
+
+    Returns:
+        Dict: ready, time_to_ready_ms, phases, pint_registry_build_ms, modules, totals
+    """
+    from engineering_mcp.units_utils import get_ureg_build_time_ms, UNIT_BACKEND
+
+    modules = [
+        {"module_path": module_path, **timing}
+        for module_path, timing in _MODULE_TIMINGS.items()
+    ]
+    modules.sort(
+        key=lambda m: (m.get("import_time_ms") or 0) + (m.get("metadata_time_ms") or 0),
+        reverse=True
+    )
+
+    report = {
+        "ready": _READY_AT_MS is not None,
+        "process_started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(_PROCESS_START_WALL)),
+        "time_to_ready_ms": round(_READY_AT_MS, 2) if _READY_AT_MS is not None else None,
+        "phases": list(_PHASES),
+        "unit_backend": UNIT_BACKEND,
+        "pint_registry_build_ms": get_ureg_build_time_ms(),
+        "totals": {
+            "modules": len(modules),
+            "imported": sum(1 for m in modules if m.get("source") == "import"),
+            "from_manifest": sum(1 for m in modules if m.get("source") == "manifest"),
+            "import_time_ms": round(sum(m.get("import_time_ms") or 0 for m in modules), 2),
+            "metadata_time_ms": round(sum(m.get("metadata_time_ms") or 0 for m in modules), 2),
+        },
+        "modules": modules[:top_n] if top_n is not None else modules,
+    }
+    if report["pint_registry_build_ms"] is None:
+        report["pint_registry_note"] = "Pint registry not built yet (lazy - built on first exotic unit)"
+    return report
@@ -0,0 +1,243 @@
+"""
+Statische Metadaten-Extraktion für Engineering MCP
+
+Liest Modul-Konstanten (TOOL_NAME, TOOL_TAGS, HAS_SOLVING, TOOL_METADATA, ...)
+aus Tool-Dateien per `ast`, OHNE den Tool-Code auszuführen.
+
+- Ausgewertet werden NUR Literale auf Modulebene (Strings, Zahlen, Listen, Dicts, ...)
+  sowie Verweise auf bereits ausgewertete Konstanten, f-Strings und String-Verkettung
+- Funktionsaufrufe, Imports oder sonstiger Code werden nie ausgeführt
+- Ergebnisse werden pro Datei nach mtime/Größe gecacht (thread-sicher)
+
+⚡ Verwendung überall dort, wo Metadaten ohne laufende Registry benötigt werden
+(Tag-Fallback in tag_definitions.py, TAG_Manager).
+"""
+
+import os
+import ast
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+
+
+class _NotLiteral(Exception):
+    """Ausdruck ist kein auswertbares Literal"""
+    pass
+
+
+# Cache: Dateipfad -> ((mtime_ns, size), Ergebnis)
+_STATIC_METADATA_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _evaluate(node: ast.AST, constants: Dict[str, Any]) -> Any:
+    """
+    Wertet einen AST-Knoten aus, sofern er nur aus Literalen besteht.
+
+    Raises:
+        _NotLiteral: Wenn der Ausdruck Code enthält, der ausgeführt werden müsste
+    """
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.Name):
+        if node.id in constants:
+            return constants[node.id]
+        raise _NotLiteral(node.id)
+    if isinstance(node, ast.List):
+        return [_evaluate(element, constants) for element in node.elts]
+    if isinstance(node, ast.Tuple):
+        return tuple(_evaluate(element, constants) for element in node.elts)
+    if isinstance(node, ast.Set):
+        return {_evaluate(element, constants) for element in node.elts}
+    if isinstance(node, ast.Dict):
+        if any(key is None for key in node.keys):
+            raise _NotLiteral("dict unpacking")
+        return {
+            _evaluate(key, constants): _evaluate(value, constants)
+            for key, value in zip(node.keys, node.values)
+        }
+    if isinstance(node, ast.JoinedStr):
+        # f-String: nur einfache Platzhalter ohne Format-Spezifikation
+        parts = []
+        for value in node.values:
+            if isinstance(value, ast.FormattedValue):
+                if value.format_spec is not None or value.conversion != -1:
+                    raise _NotLiteral("f-string format")
+                parts.append(str(_evaluate(value.value, constants)))
+            else:
+                parts.append(str(_evaluate(value, constants)))
+        return "".join(parts)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        left = _evaluate(node.left, constants)
+        right = _evaluate(node.right, constants)
+        if type(left) is not type(right) or not isinstance(left, (str, list, tuple)):
+            raise _NotLiteral("add")
+        return left + right
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        operand = _evaluate(node.operand, constants)
+        if not isinstance(operand, (int, float)) or isinstance(operand, bool):
+            raise _NotLiteral("unary")
+        return -operand if isinstance(node.op, ast.USub) else operand
+    raise _NotLiteral(type(node).__name__)
+
+
+def _evaluate_returned_dict(function: ast.FunctionDef, constants: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Wertet das von get_metadata() zurückgegebene Dict-Literal teilweise aus.
+
+    Nur Einträge deren Schlüssel und Wert literal sind werden übernommen -
+    die Funktion selbst wird nicht ausgeführt.
+    """
+    returned = {}
+    for statement in function.body:
+        if isinstance(statement, ast.Return) and isinstance(statement.value, ast.Dict):
+            for key, value in zip(statement.value.keys, statement.value.values):
+                if key is None:
+                    continue
+                try:
+                    returned[_evaluate(key, constants)] = _evaluate(value, constants)
+                except _NotLiteral:
+                    continue
+    return returned
+
+
+def parse_static_metadata(source: str) -> Dict[str, Any]:
+    """
+    Extrahiert alle literalen Modul-Konstanten aus Quelltext.
+
+    Zusätzlich werden die literalen Einträge des von get_metadata() zurückgegebenen
+    Dicts unter dem Schlüssel "get_metadata" geliefert (für Tools ohne TOOL_*-Konstanten).
+
+    Args:
+        source: Python-Quelltext
+
+    Returns:
+        Dict: {"constants": {NAME: wert}, "line_numbers": {NAME: (start, ende)},
+               "get_metadata": {schlüssel: wert}}
+
+    Raises:
+        SyntaxError: Bei ungültigem Quelltext
+    """
+    tree = ast.parse(source)
+    constants: Dict[str, Any] = {}
+    line_numbers: Dict[str, Tuple[int, int]] = {}
+    metadata_function = None
+
+    for statement in tree.body:
+        if isinstance(statement, ast.FunctionDef) and statement.name == "get_metadata":
+            metadata_function = statement
+            continue
+        if isinstance(statement, ast.Assign):
+            targets = statement.targets
+        elif isinstance(statement, ast.AnnAssign) and statement.value is not None:
+            targets = [statement.target]
+        else:
+            continue
+
+        names = [target.id for target in targets if isinstance(target, ast.Name)]
+        if not names:
+            continue
+
+        try:
+            value = _evaluate(statement.value, constants)
+        except _NotLiteral:
+            # Nicht-literale Neuzuweisung überschreibt einen früheren Wert
+            for name in names:
+                constants.pop(name, None)
+                line_numbers.pop(name, None)
+            continue
+
+        for name in names:
+            constants[name] = value
+            line_numbers[name] = (statement.lineno, statement.end_lineno)
+
+    # get_metadata() erst nach allen Konstanten auswerten (Funktionen laufen nach dem Modul-Import)
+    returned = _evaluate_returned_dict(metadata_function, constants) if metadata_function else {}
+
+    return {"constants": constants, "line_numbers": line_numbers, "get_metadata": returned}
+
+
+def extract_static_metadata(file_path: str) -> Dict[str, Any]:
+    """
+    Extrahiert die literalen Modul-Konstanten einer Datei (gecacht nach mtime/Größe).
+
+    Args:
+        file_path: Pfad zur Python-Datei
+
+    Returns:
+        Dict: {"constants": {...}, "line_numbers": {...}, "get_metadata": {...}}
+        - leer bei Lese-/Syntaxfehlern
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return {"constants": {}, "line_numbers": {}, "get_metadata": {}}
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _CACHE_LOCK:
+        cached = _STATIC_METADATA_CACHE.get(file_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            result = parse_static_metadata(f.read())
+    except (OSError, SyntaxError, ValueError) as e:
+        print(f"WARNING: Static metadata extraction failed for {file_path}: {e}")
+        result = {"constants": {}, "line_numbers": {}, "get_metadata": {}}
+
+    with _CACHE_LOCK:
+        _STATIC_METADATA_CACHE[file_path] = (signature, result)
+    return result
+
+
+def get_static_tool_info(file_path: str) -> Dict[str, Any]:
+    """
+    Liefert die Discovery-relevanten Tool-Informationen ohne Ausführung.
+
+    Unterstützt Engineering-Tools (TOOL_NAME/TOOL_TAGS/HAS_SOLVING oder Literale
+    in get_metadata()) und Meta-Tools (TOOL_METADATA).
+
+    Args:
+        file_path: Pfad zur Tool-Datei
+
+    Returns:
+        Dict: tool_name, tags, has_solving, short_description (None wenn nicht definiert)
+    """
+    extracted = extract_static_metadata(file_path)
+    constants = extracted["constants"]
+    returned = extracted["get_metadata"]
+    tool_metadata = constants.get("TOOL_METADATA")
+    if not isinstance(tool_metadata, dict):
+        tool_metadata = {}
+
+    default_name = os.path.splitext(os.path.basename(file_path))[0]
+    return {
+        "tool_name": (constants.get("TOOL_NAME") or returned.get("tool_name")
+                      or tool_metadata.get("name") or default_name),
+        "tags": list(constants.get("TOOL_TAGS") or returned.get("tags") or returned.get("tool_tags")
+                     or tool_metadata.get("tags") or []),
+        "has_solving": constants.get("HAS_SOLVING") or returned.get("has_solving"),
+        "short_description": constants.get("TOOL_SHORT_DESCRIPTION") or returned.get("short_description"),
+    }
+
+
+def extract_static_metadata_many(file_paths: List[str], max_workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Extrahiert Metadaten für viele Dateien parallel (Datei-I/O überlappt).
+
+    Args:
+        file_paths: Liste von Dateipfaden
+        max_workers: Anzahl Threads (Standard: ThreadPoolExecutor-Default)
+
+    Returns:
+        Dict: Dateipfad -> Ergebnis von get_static_tool_info()
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(file_paths, executor.map(get_static_tool_info, file_paths)))
+
+
+def clear_static_metadata_cache() -> None:
+    """Leert den Cache der statischen Metadaten."""
+    with _CACHE_LOCK:
+        _STATIC_METADATA_CACHE.clear()
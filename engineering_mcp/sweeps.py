@@ -0,0 +1,252 @@
+"""
+Parameter-Sweeps für Engineering MCP
+
+Statt jede Zeile eines Batches als Liste zu übergeben, kann ein Parameter als
+Sweep angegeben werden - der Server erzeugt die Werte selbst:
+
+    {"linspace": ["10 bar", "300 bar", 200]}     # 200 Werte, gleichmäßig verteilt
+    {"logspace": ["1 mm", "1 m", 50]}            # 50 Werte, logarithmisch verteilt
+    {"grid": ["5 mm", "8 mm", "10 mm"]}          # explizite Werte
+
+Alle Sweep-Parameter eines Aufrufs bilden ein kartesisches Produkt (erster
+Parameter variiert am langsamsten), Einzelwerte (auch 'target') gelten für alle
+Zeilen. Listen und Sweeps dürfen nicht gemischt werden. Dicts mit anderen
+Schlüsseln (z.B. gewinde_bereich {"von": ..., "bis": ...}) sind normale Werte,
+ein einzelner Schlüssel ähnlich einer Sweep-Art ({"linspce": ...}) ist ein Fehler.
+
+⚡ DIREKT IN NUMPY: Die Werte werden in der Einheit des Startwerts auf 6 signifikante
+Stellen gerundet berechnet. Jede erzeugte Spalte (SweepColumn) trägt ihre fertige
+SI-Umrechnung mit - convert_column_to_si() muss nichts parsen, das Produkt wird
+über Index-Arrays statt über Zeilen-Dicts aufgebaut. Die Strings ("11.4573 bar")
+entsprechen exakt den SI-Werten und erscheinen wie gewohnt im Ergebnis.
+
+Konfiguration:
+    MCP_SWEEP_MAX_ROWS=100000    # Maximale Zeilenzahl eines Sweeps (Produkt)
+"""
+
+import os
+import difflib
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from engineering_mcp.units_utils import ColumnConversion, parse_value_with_unit, compile_unit, UnitsError
+
+SWEEP_MAX_ROWS = int(os.getenv("MCP_SWEEP_MAX_ROWS", "100000"))
+
+# Sweep-Schlüssel -> Beschreibung (für Fehlermeldungen und Tool-Details)
+SWEEP_KINDS = {
+    "linspace": '{"linspace": [start, stop, anzahl]} - gleichmäßig verteilt, z.B. ["10 bar", "300 bar", 200]',
+    "logspace": '{"logspace": [start, stop, anzahl]} - logarithmisch verteilt, z.B. ["1 mm", "1 m", 50]',
+    "grid": '{"grid": [wert, wert, ...]} - explizite Werte, z.B. ["5 mm", "8 mm", "10 mm"]',
+}
+
+
+class SweepError(ValueError):
+    """Ungültige Sweep-Angabe"""
+
+    def __init__(self, parameter: str, problem: str):
+        self.parameter = parameter
+        self.problem = problem
+        super().__init__(f"Parameter '{parameter}': {problem}")
+
+
+class SweepColumn(list):
+    """
+    Vom Server erzeugte Parameter-Spalte: Liste von "Wert Einheit"-Strings plus
+    fertige SI-Umrechnung (wird von convert_column_to_si() direkt übernommen).
+    """
+
+    def __init__(self, values: List[str], conversion: ColumnConversion):
+        super().__init__(values)
+        self.conversion = conversion
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            # Blöcke (split_batch) behalten ihre SI-Werte
+            return SweepColumn(list.__getitem__(self, index), _take_conversion(self.conversion, index))
+        return list.__getitem__(self, index)
+
+    def take(self, rows: List[int]) -> "SweepColumn":
+        """Zeilenauswahl per Index-Liste (z.B. eindeutige Zeilen), behält die SI-Werte"""
+        values = [list.__getitem__(self, row) for row in rows]
+        return SweepColumn(values, _take_conversion(self.conversion, np.asarray(rows, dtype=np.intp)))
+
+
+def _take_conversion(conversion: ColumnConversion, rows) -> ColumnConversion:
+    """Zeilenauswahl (Slice oder Index-Array) einer fehlerfreien Spalten-Umrechnung"""
+    original_units = np.asarray(conversion.original_units, dtype=object)[rows].tolist()
+    si_units = np.asarray(conversion.si_units, dtype=object)[rows].tolist()
+    return ColumnConversion(
+        si_values=conversion.si_values[rows],
+        error_mask=conversion.error_mask[rows],
+        target_mask=conversion.target_mask[rows],
+        errors={},
+        original_units=tuple(original_units),
+        si_units=tuple(si_units),
+    )
+
+
+def is_sweep_spec(value: Any) -> bool:
+    """
+    Prüft, ob ein Parameterwert eine Sweep-Angabe ist.
+
+    Args:
+        value: Parameterwert
+
+    Returns:
+        bool: True bei {"linspace": ...}, {"logspace": ...} oder {"grid": ...}
+    """
+    return isinstance(value, dict) and len(value) == 1 and next(iter(value)) in SWEEP_KINDS
+
+
+def _misspelled_sweep_kind(value: Any) -> Optional[str]:
+    """Nächstliegende Sweep-Art für {"linspce": ...}, {"Grid": ...} o.ä. - sonst None"""
+    if not isinstance(value, dict) or len(value) != 1:
+        return None
+    kind = next(iter(value))
+    if not isinstance(kind, str) or kind in SWEEP_KINDS:
+        return None
+    matches = difflib.get_close_matches(kind.lower(), SWEEP_KINDS, n=1, cutoff=0.7)
+    return matches[0] if matches else None
+
+
+def has_sweeps(params: Dict[str, Any]) -> bool:
+    """
+    Prüft, ob mindestens ein Parameter als Sweep angegeben ist.
+
+    Args:
+        params: Parametername -> Einzelwert, Liste oder Sweep-Angabe
+
+    Returns:
+        bool: True wenn expand_sweeps() nötig ist (andere Dicts, z.B. ein
+        gewinde_bereich, sind normale Parameterwerte)
+    """
+    return any(
+        is_sweep_spec(value) or _misspelled_sweep_kind(value) for value in params.values()
+    )
+
+
+def _parse_point(parameter: str, raw: Any) -> Tuple[float, str]:
+    """Parst einen Start-/Stopp-/Grid-Wert ("10 bar") zu (Wert, Einheit)"""
+    if not isinstance(raw, str):
+        raise SweepError(parameter, f"Werte müssen Strings mit Einheit sein, erhalten: {raw!r}")
+    try:
+        value, unit_str = parse_value_with_unit(raw)
+        compile_unit(unit_str)
+    except UnitsError as e:
+        raise SweepError(parameter, f"'{raw}' ist kein gültiger Wert mit Einheit: {e}") from None
+    return value, unit_str
+
+
+def _round_values(values: np.ndarray) -> np.ndarray:
+    """Rundet auf 6 signifikante Stellen - genau das, was im String steht"""
+    return np.array([float(f"{value:.6g}") for value in values.tolist()], dtype=np.float64)
+
+
+def _axis_values(parameter: str, kind: str, args: Any) -> Tuple[np.ndarray, str]:
+    """
+    Berechnet die Werte einer Sweep-Achse in der Einheit des Startwerts.
+
+    Returns:
+        Tuple[np.ndarray, str]: Werte (gerundet) und Einheit
+    """
+    if kind == "grid":
+        if not isinstance(args, list) or not args:
+            raise SweepError(parameter, f"grid erwartet eine nicht-leere Liste - {SWEEP_KINDS['grid']}")
+        points = [_parse_point(parameter, raw) for raw in args]
+        unit_str = points[0][1]
+        reference = compile_unit(unit_str)
+        values = []
+        for (value, unit), raw in zip(points, args):
+            compiled = compile_unit(unit)
+            if compiled.dimensionality != reference.dimensionality:
+                raise SweepError(parameter, f"'{raw}' hat eine andere Dimension als '{args[0]}'")
+            si_value = value * compiled.scale + compiled.offset
+            values.append((si_value - reference.offset) / reference.scale)
+        return _round_values(np.asarray(values, dtype=np.float64)), unit_str
+
+    if not isinstance(args, list) or len(args) != 3:
+        raise SweepError(parameter, f"{kind} erwartet [start, stop, anzahl] - {SWEEP_KINDS[kind]}")
+    start_raw, stop_raw, count = args
+    if isinstance(count, str) and count.strip().isdigit():
+        count = int(count)
+    if not isinstance(count, int) or isinstance(count, bool) or count < 2:
+        raise SweepError(parameter, f"anzahl muss eine ganze Zahl >= 2 sein, erhalten: {count!r}")
+    if count > SWEEP_MAX_ROWS:
+        raise SweepError(parameter, f"anzahl {count} überschreitet das Maximum von {SWEEP_MAX_ROWS} Zeilen")
+
+    start, unit_str = _parse_point(parameter, start_raw)
+    stop_value, stop_unit = _parse_point(parameter, stop_raw)
+    reference, stop_compiled = compile_unit(unit_str), compile_unit(stop_unit)
+    if stop_compiled.dimensionality != reference.dimensionality:
+        raise SweepError(parameter, f"'{stop_raw}' hat eine andere Dimension als '{start_raw}'")
+    stop = (stop_value * stop_compiled.scale + stop_compiled.offset - reference.offset) / reference.scale
+
+    if kind == "linspace":
+        return _round_values(np.linspace(start, stop, count)), unit_str
+    if start <= 0 or stop <= 0:
+        raise SweepError(parameter, "logspace erfordert positive Start- und Stoppwerte")
+    return _round_values(np.geomspace(start, stop, count)), unit_str
+
+
+def _sweep_column(values: np.ndarray, unit_str: str, rows: np.ndarray) -> SweepColumn:
+    """Baut eine Spalte aus Achsenwerten und Zeilen-Indizes (Strings + SI pro Achsenwert einmal)"""
+    compiled = compile_unit(unit_str)
+    axis_strings = np.array([f"{value:g} {unit_str}" for value in values.tolist()], dtype=object)
+    axis_si = values * compiled.scale + compiled.offset
+    count = len(rows)
+    conversion = ColumnConversion(
+        si_values=axis_si[rows],
+        error_mask=np.zeros(count, dtype=bool),
+        target_mask=np.zeros(count, dtype=bool),
+        errors={},
+        original_units=(unit_str,) * count,
+        si_units=(compiled.si_unit_str,) * count,
+    )
+    return SweepColumn(axis_strings[rows].tolist(), conversion)
+
+
+def expand_sweeps(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Expandiert Sweep-Angaben zu Batch-Spalten gleicher Länge.
+
+    Args:
+        params: Parametername -> Einzelwert oder Sweep-Angabe
+
+    Returns:
+        Dict: Parametername -> Liste (Sweeps als SweepColumn, Einzelwerte wiederholt)
+
+    Raises:
+        SweepError: Bei fehlerhafter/falsch geschriebener Angabe, gemischten Listen oder zu vielen Zeilen
+    """
+    axes: Dict[str, Tuple[np.ndarray, str]] = {}
+    for name, value in params.items():
+        suggestion = _misspelled_sweep_kind(value)
+        if suggestion:
+            raise SweepError(name, f"Unbekannte Sweep-Angabe '{next(iter(value))}' - gemeint ist wohl "
+                                   f"{SWEEP_KINDS[suggestion]}")
+        if is_sweep_spec(value):
+            kind, args = next(iter(value.items()))
+            axes[name] = _axis_values(name, kind, args)
+        elif isinstance(value, list):
+            raise SweepError(name, "Listen und Sweeps können nicht gemischt werden - Liste als {\"grid\": [...]} angeben")
+
+    total = 1
+    for values, _ in axes.values():
+        total *= len(values)
+    if total > SWEEP_MAX_ROWS:
+        raise SweepError(", ".join(axes), f"Das Produkt ergibt {total} Zeilen (Maximum {SWEEP_MAX_ROWS})")
+
+    # Kartesisches Produkt über Index-Arrays: erster Sweep-Parameter variiert am langsamsten
+    expanded: Dict[str, Any] = {}
+    stride = total
+    for name, value in params.items():
+        if name in axes:
+            values, unit_str = axes[name]
+            stride //= len(values)
+            rows = (np.arange(total) // stride) % len(values)
+            expanded[name] = _sweep_column(values, unit_str, rows)
+        else:
+            expanded[name] = [value] * total
+    return expanded
@@ -10,11 +10,6 @@ Dynamisches Tag-System:
 
 from typing import Dict, Any, Set, List
 import os
-import sys
-import importlib.util
-import inspect
-import ast
-import re
 
 # ===== ZENTRALE TAG-BESCHREIBUNGEN =====
 # Hier werden NUR die Beschreibungen gepflegt!
@@ -44,174 +39,92 @@ TAG_DESCRIPTIONS = {
 
 }
 
-# Cache für entdeckte Tags
+# Cache für entdeckte Tags (gültig für eine Registry-Version)
 _discovered_tags_cache = None
+_discovered_tags_version = None
 _unknown_tags_cache = set()
 
 def clear_tag_cache():
     """
     Leert den Tag-Discovery-Cache, um Änderungen zu erkennen.
     """
-    global _discovered_tags_cache, _unknown_tags_cache
+    global _discovered_tags_cache, _discovered_tags_version, _unknown_tags_cache
     _discovered_tags_cache = None
+    _discovered_tags_version = None
     _unknown_tags_cache = set()
 
 def discover_all_tags_robust() -> Dict[str, Set[str]]:
     """
-    Robuste Version: Parst Python-Dateien direkt ohne sie zu importieren.
-    Funktioniert auch bei Import-Fehlern.
+    Robuste Version: Liest TOOL_NAME/TOOL_TAGS/TOOL_METADATA statisch per AST,
+    ohne die Dateien zu importieren oder auszuführen.
+    Funktioniert auch bei Import-Fehlern. Wird nicht mehr von discover_all_tags()
+    verwendet - nur noch für Werkzeuge ohne laufende Registry.
     
     Returns:
         Dict: Mapping von Tag zu Set von Tool-Namen die diesen Tag verwenden
     """
+    from engineering_mcp.static_metadata import extract_static_metadata_many
+    
     tag_to_tools = {}
     tools_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'tools')
     
-    # Durchsuche alle Python-Dateien im tools Verzeichnis
+    # Sammle alle Python-Dateien im tools Verzeichnis
+    file_paths = []
     for root, dirs, files in os.walk(tools_dir):
         # Überspringe __pycache__ und andere System-Verzeichnisse
         dirs[:] = [d for d in dirs if not d.startswith('__') and not d.startswith('.')]
         
         for file in files:
             if file.endswith('.py') and not file.startswith('__'):
-                file_path = os.path.join(root, file)
-                
-                try:
-                    # Lese Datei-Inhalt
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    # Einfachere Methode: Suche direkt im Code mit Regex
-                    # Tool name - suche in get_metadata() oder TOOL_METADATA
-                    tool_match = re.search(r'"tool_name"\s*:\s*"([^"]+)"', content)
-                    if not tool_match:
-                        tool_match = re.search(r'"name"\s*:\s*"([^"]+)"', content)
-                    tool_name = tool_match.group(1) if tool_match else file[:-3]
-                    
-                    # Tags - suche nach tags Array oder tool_tags
-                    tags_found = False
-                    
-                    # Methode 1: "tags": [...]
-                    tags_match = re.search(r'"tags"\s*:\s*\[(.*?)\]', content, re.DOTALL)
-                    if tags_match:
-                        tags_str = tags_match.group(1)
-                        tags = re.findall(r'["\']([^"\']+)["\']', tags_str)
-                        tags_found = True
-                    
-                    # Methode 2: "tool_tags": TOOL_TAGS oder TOOL_TAGS = [...]
-                    if not tags_found:
-                        tool_tags_match = re.search(r'"tool_tags"\s*:\s*TOOL_TAGS', content)
-                        if tool_tags_match:
-                            # Suche nach TOOL_TAGS = [...]
-                            tool_tags_def = re.search(r'TOOL_TAGS\s*=\s*\[(.*?)\]', content, re.DOTALL)
-                            if tool_tags_def:
-                                tags_str = tool_tags_def.group(1)
-                                tags = re.findall(r'["\']([^"\']+)["\']', tags_str)
-                                tags_found = True
-                    
-                    if tags_found:
-                        # Füge Tool zu jedem Tag hinzu
-                        for tag in tags:
-                            if tag not in tag_to_tools:
-                                tag_to_tools[tag] = set()
-                            tag_to_tools[tag].add(tool_name)
-                            
-                            # Prüfe ob Tag unbekannt ist
-                            if tag not in TAG_DESCRIPTIONS:
-                                _unknown_tags_cache.add(tag)
-                                        
-                except Exception as e:
-                    # Fehler beim Parsen ignorieren
-                    pass
+                file_paths.append(os.path.join(root, file))
+    
+    for file_path, info in extract_static_metadata_many(file_paths).items():
+        # Füge Tool zu jedem Tag hinzu
+        for tag in info['tags']:
+            if tag not in tag_to_tools:
+                tag_to_tools[tag] = set()
+            tag_to_tools[tag].add(info['tool_name'])
+            
+            # Prüfe ob Tag unbekannt ist
+            if tag not in TAG_DESCRIPTIONS:
+                _unknown_tags_cache.add(tag)
     
     return tag_to_tools
 
 def discover_all_tags() -> Dict[str, Set[str]]:
     """
-    Durchsucht alle Tools im /tools Verzeichnis und sammelt deren Tags.
-    Versucht zuerst Import, dann robustes Parsing.
+    Sammelt die Tags aller Tools (Engineering- und Meta-Tools).
+    
+    ⚡ GEMEINSAME DISCOVERY: Die Tags werden aus dem Katalog der Registry-Discovery
+    abgeleitet (invertierter Tag-Index) - Tool-Dateien werden NICHT erneut ausgeführt.
+    Der Cache folgt der Registry-Version und wird bei Registry-Änderungen neu aufgebaut.
     
     Returns:
         Dict: Mapping von Tag zu Set von Tool-Namen die diesen Tag verwenden
     """
-    global _discovered_tags_cache
+    global _discovered_tags_cache, _discovered_tags_version
+    
+    from engineering_mcp.registry import ensure_tools_discovered, get_tool_catalog
     
-    # Cache verwenden wenn verfügbar
-    if _discovered_tags_cache is not None:
+    # Registry einmalig befüllen falls noch keine Discovery lief (z.B. TAG_Manager)
+    ensure_tools_discovered()
+    catalog = get_tool_catalog()
+    
+    # Cache verwenden wenn verfügbar und zur aktuellen Registry-Version passend
+    if _discovered_tags_cache is not None and _discovered_tags_version == catalog.version:
         return _discovered_tags_cache
     
-    # Versuche zuerst die Import-Methode
     tag_to_tools = {}
-    import_failed_files = []
-    tools_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'tools')
-    
-    # Durchsuche alle Python-Dateien im tools Verzeichnis
-    for root, dirs, files in os.walk(tools_dir):
-        # Überspringe __pycache__ und andere System-Verzeichnisse
-        dirs[:] = [d for d in dirs if not d.startswith('__') and not d.startswith('.')]
+    for tag, positions in catalog.tag_index.items():
+        tag_to_tools[tag] = {catalog.all_tools[position]["name"] for position in positions}
         
-        for file in files:
-            if file.endswith('.py') and not file.startswith('__'):
-                file_path = os.path.join(root, file)
-                
-                try:
-                    # Lade Modul dynamisch
-                    spec = importlib.util.spec_from_file_location("temp_module", file_path)
-                    if spec and spec.loader:
-                        module = importlib.util.module_from_spec(spec)
-                        spec.loader.exec_module(module)
-                        
-                        # Suche nach get_metadata Funktion (Engineering-Tools)
-                        if hasattr(module, 'get_metadata'):
-                            metadata = module.get_metadata()
-                            
-                            # Extrahiere Tags - unterstütze sowohl "tags" als auch "tool_tags"
-                            tags = metadata.get('tags', []) or metadata.get('tool_tags', [])
-                            tool_name = metadata.get('tool_name', file[:-3])  # Fallback zu Dateiname
-                            
-                            # Füge Tool zu jedem Tag hinzu
-                            for tag in tags:
-                                if tag not in tag_to_tools:
-                                    tag_to_tools[tag] = set()
-                                tag_to_tools[tag].add(tool_name)
-                                
-                                # Prüfe ob Tag unbekannt ist
-                                if tag not in TAG_DESCRIPTIONS:
-                                    _unknown_tags_cache.add(tag)
-                        
-                        # Suche nach TOOL_METADATA (Meta-Tools)
-                        elif hasattr(module, 'TOOL_METADATA'):
-                            meta_data = module.TOOL_METADATA
-                            
-                            # Extrahiere Tags aus TOOL_METADATA
-                            tags = meta_data.get('tags', [])
-                            tool_name = meta_data.get('name', file[:-3])  # Fallback zu Dateiname
-                            
-                            # Füge Tool zu jedem Tag hinzu
-                            for tag in tags:
-                                if tag not in tag_to_tools:
-                                    tag_to_tools[tag] = set()
-                                tag_to_tools[tag].add(tool_name)
-                                
-                                # Prüfe ob Tag unbekannt ist
-                                if tag not in TAG_DESCRIPTIONS:
-                                    _unknown_tags_cache.add(tag)
-                                    
-                except Exception as e:
-                    # Merke Datei für robustes Parsing
-                    import_failed_files.append(file_path)
-    
-    # Wenn Dateien beim Import fehlgeschlagen sind, verwende robustes Parsing
-    if import_failed_files:
-        robust_tags = discover_all_tags_robust()
-        # Merge Ergebnisse
-        for tag, tools in robust_tags.items():
-            if tag not in tag_to_tools:
-                tag_to_tools[tag] = set()
-            tag_to_tools[tag].update(tools)
+        # Prüfe ob Tag unbekannt ist
+        if tag not in TAG_DESCRIPTIONS:
+            _unknown_tags_cache.add(tag)
     
     # Cache aktualisieren
     _discovered_tags_cache = tag_to_tools
+    _discovered_tags_version = catalog.version
     
     return tag_to_tools
 
@@ -4,34 +4,98 @@ Units Utility für Engineering MCP Server
 
 Dieses Modul behandelt alle Einheiten-Operationen:
 - Eingabe-Validierung (Einheiten müssen vorhanden sein)
-- Umrechnung in SI-Einheiten
+- Umrechnung in SI-Einheiten (einzeln oder spaltenweise für Batch-Aufrufe)
 - Größenordnungs-optimierte Ausgabe in gleicher Grundeinheit
 
 🔧 OPTIMIERT: Lazy Loading für Pint um NumPy-Konflikte zu vermeiden
 """
 
-from typing import Dict, Any, Union, Tuple
+from typing import Dict, Any, List, Union, Tuple, Optional, NamedTuple, Iterable
+from functools import lru_cache
+import bisect
+import math
+import os
 import re
+import time
+
+# Einheiten-Backend: "fast" = eingebaute Tabelle (Pint nur für exotische Einheiten), "pint" = immer Pint
+UNIT_BACKEND = os.getenv("MCP_UNIT_BACKEND", "fast").lower()
 
 # Globale Variable für Pint Registry (Lazy Loading)
 _ureg = None
 
+# Registry des schnellen Backends (ohne Pint)
+_fast_ureg = None
+
+# Aufbauzeit der Pint Registry in ms (für das Startup-Profil)
+_ureg_build_ms = None
+
+# Persistenter Pint-Cache (geparste Definitionen) - leer = deaktiviert
+PINT_CACHE_DIR = os.getenv(
+    "MCP_PINT_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "pint")
+)
+
+# Einheiten-Warm-up beim Serverstart (MCP_UNIT_WARMUP=false zum Deaktivieren)
+UNIT_WARMUP_ENABLED = os.getenv("MCP_UNIT_WARMUP", "true").lower() == "true"
+
 def get_ureg():
+    """
+    Liefert die Unit Registry des konfigurierten Backends (MCP_UNIT_BACKEND).
+    
+    ⚡ FAST-BACKEND: Gängige Einheiten werden ohne Pint per Tabelle umgerechnet -
+    Pint wird erst beim ersten exotischen Einheiten-String geladen.
+    
+    Returns:
+        FastUnitRegistry oder pint.UnitRegistry (gleiche Schnittstelle für die Tools)
+    """
+    global _fast_ureg
+    if UNIT_BACKEND == "pint":
+        return get_pint_ureg()
+    if _fast_ureg is None:
+        from engineering_mcp.fast_units import FastUnitRegistry
+        _fast_ureg = FastUnitRegistry()
+    return _fast_ureg
+
+def get_pint_ureg():
     """
     Lazy Loading für Pint UnitRegistry um NumPy-Konflikte zu vermeiden.
     
+    ⚡ PERSISTENTER CACHE: Die geparsten Einheiten-Definitionen werden in
+    PINT_CACHE_DIR gespeichert - ab dem zweiten Start wird die Registry aus
+    dem Cache geladen statt neu aufgebaut.
+    
     Returns:
-        pint.UnitRegistry: Die globale Unit Registry
+        pint.UnitRegistry: Die globale Pint Unit Registry
     """
-    global _ureg
+    global _ureg, _ureg_build_ms
     if _ureg is None:
         try:
+            start = time.perf_counter()
             import pint
-            _ureg = pint.UnitRegistry()
+            if PINT_CACHE_DIR:
+                try:
+                    _ureg = pint.UnitRegistry(cache_folder=PINT_CACHE_DIR)
+                except Exception as e:
+                    # Defekter oder nicht schreibbarer Cache - Registry ohne Cache aufbauen
+                    print(f"WARNING: Pint cache {PINT_CACHE_DIR} unusable - building registry without cache ({e})")
+                    _ureg = pint.UnitRegistry()
+            else:
+                _ureg = pint.UnitRegistry()
+            _ureg_build_ms = (time.perf_counter() - start) * 1000
         except ImportError as e:
             raise ImportError(f"Pint nicht verfügbar: {e}")
     return _ureg
 
+def get_ureg_build_time_ms() -> Optional[float]:
+    """
+    Gibt die Aufbauzeit der Pint Registry zurück (inkl. Pint-Import).
+    
+    Returns:
+        Optional[float]: Zeit in ms oder None wenn die Registry noch nicht gebaut wurde
+    """
+    return round(_ureg_build_ms, 2) if _ureg_build_ms is not None else None
+
 # Export für direkte Verwendung über __getattr__
 def __getattr__(name):
     """Module-level __getattr__ für dynamische Attribute - ermöglicht 'from units_utils import ureg'"""
@@ -43,6 +107,227 @@ class UnitsError(Exception):
     """Fehler bei Einheiten-Operationen"""
     pass
 
+# Regex für Zahl + Einheit (einmalig kompiliert)
+_VALUE_UNIT_PATTERN = re.compile(r'^\s*([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)\s*([a-zA-Z°]+.*?)\s*$')
+
+# Maximale Anzahl kompilierter Einheiten im LRU-Cache
+UNIT_CACHE_SIZE = int(os.getenv("MCP_UNIT_CACHE_SIZE", "1024"))
+
+class CompiledUnit(NamedTuple):
+    """Vorkompilierte Umrechnung einer Einheit nach SI: si = wert * scale + offset"""
+    scale: float
+    offset: float
+    dimensionality: Any      # pint Dimensionalität (hashbar, vergleichbar)
+    canonical_name: str      # z.B. 'millimeter'
+    si_units: Any            # pint Unit der SI-Basiseinheit
+    si_unit_str: str         # z.B. 'meter'
+    
+    def to_si(self, value: float) -> float:
+        """Rechnet einen Zahlenwert in die SI-Basiseinheit um."""
+        return value * self.scale + self.offset
+
+@lru_cache(maxsize=UNIT_CACHE_SIZE)
+def compile_unit(unit_str: str) -> CompiledUnit:
+    """
+    Kompiliert einen Einheiten-String EINMALIG über Pint zu Faktor/Offset nach SI.
+    
+    ⚡ GECACHT (LRU): Jede unterschiedliche Einheit läuft nur einmal durch Pint -
+    danach ist die SI-Umrechnung eine einfache Multiplikation.
+    
+    Args:
+        unit_str: Einheit wie "mm", "bar", "N/mm²", "degC"
+        
+    Returns:
+        CompiledUnit: scale, offset, dimensionality, canonical_name, si_units
+        
+    Raises:
+        UnitsError: Bei unbekannter Einheit
+    """
+    if UNIT_BACKEND != "pint":
+        from engineering_mcp.fast_units import parse_unit, base_unit_for
+        unit = parse_unit(unit_str)
+        if unit is not None:
+            base = base_unit_for(unit.dims)
+            return CompiledUnit(
+                scale=unit.scale,
+                offset=unit.offset,
+                dimensionality=unit.dims,
+                canonical_name=str(unit),
+                si_units=base,
+                si_unit_str=str(base)
+            )
+    
+    # Exotische Einheit (oder Pint-Backend): einmalig über Pint kompilieren
+    try:
+        ureg = get_pint_ureg()  # Lazy loading
+        parsed = ureg(unit_str)
+        units = parsed.units
+        magnitude = getattr(parsed, 'magnitude', 1.0)
+        
+        # Zwei-Punkt-Umrechnung: unterstützt auch Einheiten mit Offset (°C, °F)
+        zero = ureg.Quantity(0.0, units).to_base_units()
+        one = ureg.Quantity(1.0, units).to_base_units()
+    except Exception as e:
+        raise UnitsError(f"Unbekannte Einheit '{unit_str}': {str(e)}")
+    
+    offset = float(zero.magnitude)
+    return CompiledUnit(
+        scale=float(one.magnitude - offset) * magnitude,
+        offset=offset,
+        dimensionality=one.dimensionality,
+        canonical_name=str(units),
+        si_units=one.units,
+        si_unit_str=str(one.units)
+    )
+
+# Anzeige-Einheiten pro Dimension: (untere Grenze des SI-Betrags, Einheit), aufsteigend.
+# Gewählt wird über den Betrag - negative Werte erhalten dieselbe Einheit wie positive.
+# Beträge unter der ersten Grenze, darüber (_DISPLAY_UPPER_LIMITS), 0 und NaN erhalten
+# die Fallback-Einheit (SI-Einheit). Spannung (stress) teilt die Druck-Tabelle.
+#
+# Länge: Grenzen entsprechen exakt der bisherigen Präfix-Regel (Wert zwischen 0.1 und 1000,
+# möglichst nahe an 1, Startwert = Betrag in Metern) - daher auch dam/hm und die
+# Meter-Bereiche zwischen nm/μm/mm.
+_DISPLAY_UNIT_TABLES = {
+    "length": ((1e-10, "nm"), (2 / (1e9 + 1), "m"), (1e-7, "μm"), (2 / (1e6 + 1), "m"),
+               (1e-4, "mm"), (1e-3 * 20 / 11, "cm"), (2 / 101, "m"),
+               (20 / 11, "dam"), (1e1 * 20 / 11, "hm"), (1e2 * 20 / 11, "km"),
+               (1e5, "Mm"), (1e8, "Gm"), (1e11, "Tm")),
+    "area": ((0.0, "mm**2"), (1e-4, "cm**2"), (1e-2, "dm**2"), (1.0, "m**2"), (1e6, "km**2")),
+    "volume": ((0.0, "mm**3"), (1e-6, "cm**3"), (1e-3, "liter"), (1.0, "m**3")),
+    "pressure": ((0.0, "Pa"), (1e3, "kPa"), (1e5, "bar"), (1e6, "MPa"), (1e9, "GPa")),
+    "force": ((0.0, "N"), (1e3, "kN"), (1e6, "MN")),
+}
+_DISPLAY_FALLBACK_UNITS = {"length": "m", "area": "m**2", "volume": "m**3", "pressure": "Pa", "force": "N"}
+_DISPLAY_UPPER_LIMITS = {"length": 1e15}
+
+class DisplayUnitTable(NamedTuple):
+    """Vorberechnete Auswahltabelle der Anzeige-Einheiten einer Dimension"""
+    dimension: str
+    log_bounds: Tuple[float, ...]    # log10 der unteren Grenzen (aufsteigend, -inf = ab 0)
+    log_upper: float                 # log10 der oberen Grenze (darüber Fallback)
+    factors: Tuple[float, ...]       # SI-Wert einer Anzeige-Einheit
+    units: Tuple[Any, ...]           # Einheiten-Objekte des aktiven Backends
+    unit_strs: Tuple[str, ...]       # Text wie von Pint ("millimeter ** 2")
+    fallback: int                    # Index der Fallback-Einheit
+
+# Dimensions-Exponenten -> DisplayUnitTable (lazy aufgebaut)
+_DISPLAY_TABLES: Optional[Dict[Tuple, DisplayUnitTable]] = None
+
+def _get_display_tables() -> Dict[Tuple, DisplayUnitTable]:
+    """Baut die Anzeige-Tabellen einmalig auf (Faktoren über compile_unit)."""
+    global _DISPLAY_TABLES
+    if _DISPLAY_TABLES is None:
+        from engineering_mcp.dimensions import DIMENSIONS
+        ureg = get_ureg()
+        tables = {}
+        for dimension, entries in _DISPLAY_UNIT_TABLES.items():
+            exprs = [expr for _, expr in entries] + [_DISPLAY_FALLBACK_UNITS[dimension]]
+            units = tuple(ureg(expr).units for expr in exprs)
+            tables[DIMENSIONS[dimension]] = DisplayUnitTable(
+                dimension=dimension,
+                log_bounds=tuple(math.log10(bound) if bound > 0 else -math.inf for bound, _ in entries),
+                log_upper=math.log10(_DISPLAY_UPPER_LIMITS.get(dimension, math.inf)),
+                factors=tuple(compile_unit(expr).scale for expr in exprs),
+                units=units,
+                unit_strs=tuple(str(unit) for unit in units),
+                fallback=len(entries)
+            )
+        _DISPLAY_TABLES = tables
+    return _DISPLAY_TABLES
+
+def get_display_table(dimensionality) -> Optional[DisplayUnitTable]:
+    """
+    Liefert die Anzeige-Tabelle für eine Dimension.
+    
+    Args:
+        dimensionality: Dimensionsname ('area'), Exponenten-Tupel oder Pint-Dimensionalität
+        
+    Returns:
+        Optional[DisplayUnitTable]: None wenn für die Dimension keine Tabelle existiert
+    """
+    from engineering_mcp.dimensions import DIMENSIONS, normalize_dimensionality
+    if isinstance(dimensionality, str):
+        dims = DIMENSIONS.get(dimensionality.lower())
+    else:
+        dims = normalize_dimensionality(dimensionality)
+    return _get_display_tables().get(dims)
+
+def _select_display_unit(table: DisplayUnitTable, magnitude: float) -> int:
+    """Index der Anzeige-Einheit für einen SI-Wert (bisect auf log10 des Betrags)."""
+    magnitude = abs(magnitude)
+    if not magnitude > 0:  # 0, NaN
+        return table.fallback
+    log_value = math.log10(magnitude)
+    if log_value > table.log_upper:
+        return table.fallback
+    index = bisect.bisect_right(table.log_bounds, log_value) - 1
+    return index if index >= 0 else table.fallback
+
+def _optimize_with_table(si_quantity, table: Optional[DisplayUnitTable]):
+    """Rechnet eine SI-Quantity über die Tabelle in die Anzeige-Einheit um (ohne .to())."""
+    if table is None:
+        return si_quantity
+    try:
+        magnitude = float(si_quantity.magnitude)
+    except (TypeError, ValueError):
+        return si_quantity  # Arrays -> optimize_output_units_array()
+    index = _select_display_unit(table, magnitude)
+    return get_ureg().Quantity(magnitude / table.factors[index], table.units[index])
+
+def warm_up_units(value_strings: Iterable[str]) -> Dict[str, Any]:
+    """
+    Kompiliert alle Einheiten aus den gegebenen Beispielwerten vorab (Serverstart).
+    
+    Füllt den Einheiten-Cache und - beim Pint-Backend oder für exotische
+    Einheiten - die Pint-Registry samt ihrer internen Parse-Caches, damit die
+    erste Anfrage nach einem Deploy nicht die Aufbaukosten trägt.
+    
+    Args:
+        value_strings: Werte wie "100 bar", "50 mm" (z.B. aus PARAMETER_*["example"])
+        
+    Returns:
+        Dict: units, failed, pint_loaded, duration_ms
+    """
+    start = time.perf_counter()
+    
+    units = set(_DISPLAY_FALLBACK_UNITS.values())
+    for entries in _DISPLAY_UNIT_TABLES.values():
+        units.update(expr for _, expr in entries)
+    for value_str in value_strings:
+        try:
+            units.add(parse_value_with_unit(value_str)[1])
+        except UnitsError:
+            continue  # 'target', Tabellenwerte etc.
+    
+    if UNIT_BACKEND == "pint":
+        get_pint_ureg()
+    
+    failed = []
+    for unit_str in sorted(units):
+        try:
+            compile_unit(unit_str)
+        except Exception:
+            failed.append(unit_str)
+    
+    # Anzeige-Tabellen der optimize_*-Funktionen vorab aufbauen
+    _get_display_tables()
+    
+    return {
+        "units": len(units),
+        "failed": failed,
+        "pint_loaded": _ureg is not None,
+        "duration_ms": round((time.perf_counter() - start) * 1000, 2)
+    }
+
+def get_unit_cache_info():
+    """Gibt Trefferstatistik des Einheiten-Caches zurück (hits, misses, maxsize, currsize)."""
+    return compile_unit.cache_info()
+
+def clear_unit_cache() -> None:
+    """Leert den Cache der kompilierten Einheiten."""
+    compile_unit.cache_clear()
+
 def parse_value_with_unit(value_str: str) -> Tuple[float, str]:
     """
     Parst einen String mit Wert und Einheit.
@@ -59,9 +344,7 @@ def parse_value_with_unit(value_str: str) -> Tuple[float, str]:
     if not isinstance(value_str, str):
         raise UnitsError(f"Eingabe muss String mit Einheit sein, erhalten: {type(value_str)}")
     
-    # Regex für Zahl + Einheit
-    pattern = r'^\s*([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)\s*([a-zA-Z°]+.*?)\s*$'
-    match = re.match(pattern, value_str.strip())
+    match = _VALUE_UNIT_PATTERN.match(value_str.strip())
     
     if not match:
         raise UnitsError(f"Keine gültige Einheit in '{value_str}' gefunden. Format: 'Wert Einheit' (z.B. '5.2 mm')")
@@ -84,155 +367,165 @@ def convert_to_si(value_str: str):
     Raises:
         UnitsError: Bei Parsing- oder Konvertierungsfehlern
     """
-    try:
-        ureg = get_ureg()  # Lazy loading
-        value, unit_str = parse_value_with_unit(value_str)
-        
-        # Pint Quantity erstellen
-        quantity = value * ureg(unit_str)
+    si_value, _, compiled = _convert_value_to_si(value_str)
+    return get_ureg().Quantity(si_value, compiled.si_units)
+
+def _convert_value_to_si(value_str: str) -> Tuple[float, str, CompiledUnit]:
+    """
+    Parst und rechnet einen Wert-String über den Einheiten-Cache nach SI um.
+    
+    Returns:
+        Tuple: (si_wert, original_einheit, kompilierte_einheit)
         
-        # In SI umwandeln
-        si_quantity = quantity.to_base_units()
+    Raises:
+        UnitsError: Bei Parsing- oder Konvertierungsfehlern
+    """
+    value, unit_str = parse_value_with_unit(value_str)
+    try:
+        compiled = compile_unit(unit_str)
+    except UnitsError as e:
+        raise UnitsError(f"Fehler beim Konvertieren von '{value_str}': {str(e)}")
+    return compiled.to_si(value), unit_str, compiled
+
+def convert_to_si_value(value_str: str) -> Tuple[float, str]:
+    """
+    Wie convert_to_si(), liefert aber nur Zahlenwert und SI-Einheit (ohne Pint-Quantity).
+    
+    Args:
+        value_str: String wie "5.2 mm"
         
-        return si_quantity
+    Returns:
+        Tuple: (si_wert, si_einheit) z.B. (0.0052, 'meter')
         
-    except Exception as e:
-        if isinstance(e, UnitsError):
-            raise
-        raise UnitsError(f"Fehler beim Konvertieren von '{value_str}': {str(e)}")
+    Raises:
+        UnitsError: Bei Parsing- oder Konvertierungsfehlern
+    """
+    si_value, _, compiled = _convert_value_to_si(value_str)
+    return si_value, compiled.si_unit_str
 
-def optimize_output_unit(si_quantity, reference_unit_str: str):
+def optimize_output_unit(si_quantity, reference_unit_str: Optional[str] = None):
     """
     Optimiert die Ausgabeeinheit basierend auf Größenordnung.
-    Behält die gleiche Grundeinheit wie die Referenz-Eingabe.
+    
+    ⚡ TABELLENGESTEUERT: Die Anzeige-Einheit wird per bisect auf log10(Betrag) aus einer
+    vorberechneten Tabelle pro Dimension gewählt (Länge, Fläche, Volumen, Druck/Spannung,
+    Kraft) und per Division umgerechnet - kein Pint-.to() pro Ergebnis.
+    
+    Für Länge, Fläche und Druck entspricht die Auswahl positiver Werte exakt der
+    bisherigen Präfix-/Schwellen-Logik. Negative Werte erhalten die Einheit ihres
+    Betrags, 0 bleibt in SI. Volumen und Kraft (bisher SI) sind neu tabelliert.
     
     Args:
-        si_quantity: Ergebnis in SI-Einheiten (pint.Quantity)
-        reference_unit_str: Original-Einheit der Eingabe (z.B. "mm")
+        si_quantity: Ergebnis in SI-Einheiten (Quantity)
+        reference_unit_str: Optional, ohne Einfluss auf die Auswahl - wurde auch bisher
+            nicht ausgewertet und bleibt nur für bestehende Aufrufer erhalten
         
     Returns:
-        pint.Quantity mit optimierter Einheit
+        Quantity mit optimierter Einheit (unverändert für Dimensionen ohne Tabelle)
     """
     try:
-        ureg = get_ureg()  # Lazy loading
-        
-        # Bestimme Dimensionalität basierend auf der Ergebnis-Quantity
-        result_dimensionality = si_quantity.dimensionality
-        magnitude = si_quantity.magnitude
-        
-        # Spezialbehandlung für verschiedene Dimensionalitäten
-        if result_dimensionality == (ureg.meter ** 2).dimensionality:
-            # Flächeneinheiten
-            return optimize_area_unit(si_quantity, reference_unit_str)
-        elif result_dimensionality == (ureg.meter ** 3).dimensionality:
-            # Volumeneinheiten - später implementieren
-            return si_quantity
-        elif result_dimensionality == ureg.pascal.dimensionality:
-            # Druckeinheiten
-            return optimize_pressure_unit(si_quantity, reference_unit_str)
-        elif result_dimensionality == ureg.meter.dimensionality:
-            # Längeneinheiten
-            return optimize_length_unit(si_quantity, reference_unit_str)
-        else:
-            # Fallback: nutze SI-Einheit
-            return si_quantity
-            
+        return _optimize_with_table(si_quantity, get_display_table(si_quantity.dimensionality))
     except Exception:
         # Fallback: SI-Einheit zurückgeben
         return si_quantity
 
-def optimize_length_unit(si_quantity, reference_unit_str: str):
+def optimize_length_unit(si_quantity, reference_unit_str: Optional[str] = None):
     """
     Optimiert Längeneinheiten basierend auf Größenordnung.
     """
     try:
-        ureg = get_ureg()  # Lazy loading
-        magnitude = si_quantity.magnitude  # in Metern
-        
-        # Häufige Einheiten-Präfixe (von klein zu groß)
-        prefixes = [
-            ('n', 1e-9), ('μ', 1e-6), ('m', 1e-3), ('c', 1e-2), 
-            ('', 1), ('da', 1e1), ('h', 1e2), ('k', 1e3), 
-            ('M', 1e6), ('G', 1e9), ('T', 1e12)
-        ]
-        
-        # Finde bestes Präfix (Wert sollte zwischen 0.1 und 1000 liegen)
-        best_prefix = ''
-        best_factor = 1
-        best_value = magnitude
-        
-        for prefix, factor in prefixes:
-            test_value = magnitude / factor
-            if 0.1 <= test_value <= 1000:
-                if abs(test_value - 1) < abs(best_value - 1):  # Näher an 1
-                    best_prefix = prefix
-                    best_factor = factor
-                    best_value = test_value
-        
-        # Optimierte Einheit erstellen
-        optimized_unit_str = f"{best_prefix}m"
-        try:
-            optimized_unit = ureg(optimized_unit_str)
-            return si_quantity.to(optimized_unit)
-        except:
-            return si_quantity
-            
+        return _optimize_with_table(si_quantity, get_display_table("length"))
     except Exception:
         return si_quantity
 
-def optimize_pressure_unit(si_quantity, reference_unit_str: str):
+def optimize_pressure_unit(si_quantity, reference_unit_str: Optional[str] = None):
     """
     Optimiert Druckeinheiten basierend auf Größenordnung.
     """
     try:
-        ureg = get_ureg()  # Lazy loading
-        magnitude = si_quantity.magnitude  # in Pascal
-        
-        # Bestimme beste Druckeinheit
-        if magnitude >= 1e9:  # >= 1 GPa
-            return si_quantity.to(ureg.gigapascal)
-        elif magnitude >= 1e6:  # >= 1 MPa
-            return si_quantity.to(ureg.megapascal)
-        elif magnitude >= 1e5:  # >= 100 kPa (≈ 1 bar)
-            return si_quantity.to(ureg.bar)
-        elif magnitude >= 1e3:  # >= 1 kPa
-            return si_quantity.to(ureg.kilopascal)
-        else:  # < 1 kPa
-            return si_quantity.to(ureg.pascal)
-            
+        return _optimize_with_table(si_quantity, get_display_table("pressure"))
     except Exception:
         return si_quantity
 
-def optimize_area_unit(si_quantity, reference_unit_str: str):
+def optimize_area_unit(si_quantity, reference_unit_str: Optional[str] = None):
     """
     Speziell für Flächeneinheiten optimierte Ausgabe.
     
     Args:
         si_quantity: Flächenwert in m²
-        reference_unit_str: Original-Längeneinheit (z.B. "mm")
+        reference_unit_str: Optional, ohne Einfluss (siehe optimize_output_unit)
         
     Returns:
-        pint.Quantity mit optimierter Flächeneinheit
+        Quantity mit optimierter Flächeneinheit
     """
     try:
-        ureg = get_ureg()  # Lazy loading
-        magnitude = si_quantity.magnitude  # in m²
-        
-        # Bestimme optimale Flächeneinheit basierend auf Größenordnung
-        if magnitude >= 1e6:  # >= 1 km²
-            return si_quantity.to(ureg.kilometer**2)
-        elif magnitude >= 1:  # >= 1 m²
-            return si_quantity.to(ureg.meter**2)
-        elif magnitude >= 0.01:  # >= 1 dm²
-            return si_quantity.to(ureg.decimeter**2)
-        elif magnitude >= 0.0001:  # >= 1 cm²
-            return si_quantity.to(ureg.centimeter**2)
-        else:  # < 1 cm²
-            return si_quantity.to(ureg.millimeter**2)
-            
+        return _optimize_with_table(si_quantity, get_display_table("area"))
     except Exception:
         return si_quantity
 
+def optimize_volume_unit(si_quantity, reference_unit_str: Optional[str] = None):
+    """
+    Optimiert Volumeneinheiten basierend auf Größenordnung (mm³, cm³, Liter, m³).
+    """
+    try:
+        return _optimize_with_table(si_quantity, get_display_table("volume"))
+    except Exception:
+        return si_quantity
+
+class DisplayColumn(NamedTuple):
+    """Spaltenweise optimierte Ausgabe (eine Zeile pro Batch-Eintrag)"""
+    values: Any                      # numpy.ndarray float64 in Anzeige-Einheit
+    unit_index: Any                  # numpy.ndarray intp - Index in unit_strs
+    unit_strs: Tuple[str, ...]       # Einheiten-Texte der Tabelle
+
+def optimize_output_units_array(si_values, dimensionality) -> DisplayColumn:
+    """
+    Vektorisiertes Gegenstück zu optimize_output_unit() für ganze Batch-Spalten.
+    
+    ⚡ Eine np.searchsorted-Operation wählt die Einheiten aller Zeilen, eine Division
+    rechnet um - die Ausgabe ist identisch zu optimize_output_unit() pro Zeile.
+    
+    Args:
+        si_values: SI-Beträge (Liste oder numpy.ndarray)
+        dimensionality: Dimensionsname ('length'), Exponenten-Tupel oder Pint-Dimensionalität
+        
+    Returns:
+        DisplayColumn: values, unit_index, unit_strs (ohne Tabelle: SI-Werte, leerer Einheiten-Text)
+    """
+    import numpy as np
+    
+    values = np.asarray(si_values, dtype=np.float64)
+    table = get_display_table(dimensionality)
+    if table is None:
+        return DisplayColumn(values.copy(), np.zeros(values.shape, dtype=np.intp), ("",))
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_values = np.log10(np.abs(values))
+    index = np.searchsorted(np.asarray(table.log_bounds), log_values, side='right') - 1
+    invalid = ~(log_values > -np.inf) | (log_values > table.log_upper) | (index < 0)
+    index[invalid] = table.fallback
+    
+    return DisplayColumn(values / np.asarray(table.factors)[index], index, table.unit_strs)
+
+def format_output_column(si_values, dimensionality, precision: str = ".6g") -> list:
+    """
+    Formatiert eine ganze Spalte SI-Werte als "Wert Einheit"-Strings (wie die Tools: .6g).
+    
+    Args:
+        si_values: SI-Beträge (NaN = Zeile ohne Ergebnis)
+        dimensionality: Dimensionsname, Exponenten-Tupel oder Pint-Dimensionalität
+        precision: Format-Spezifikation des Zahlenwerts
+        
+    Returns:
+        list: Strings wie "12.5 millimeter" - None für NaN-Zeilen
+    """
+    column = optimize_output_units_array(si_values, dimensionality)
+    unit_strs = column.unit_strs
+    return [
+        None if value != value else f"{value:{precision}} {unit_strs[index]}"
+        for value, index in zip(column.values.tolist(), column.unit_index.tolist())
+    ]
+
 def validate_inputs_have_units(**kwargs) -> Dict[str, Any]:
     """
     Validiert, dass alle Eingabe-Parameter Einheiten haben.
@@ -258,20 +551,143 @@ def validate_inputs_have_units(**kwargs) -> Dict[str, Any]:
                 f"Erhalten: {value} ({type(value)})"
             )
         
-        # Konvertiere zu SI
-        si_quantity = convert_to_si(value)
+        # Konvertiere zu SI (einmal parsen, Einheit aus dem Cache)
+        si_value, original_unit, compiled = _convert_value_to_si(value)
         
         # Speichere SI-Wert und Original-Einheit
-        _, original_unit = parse_value_with_unit(value)
         result[param_name] = {
-            'si_value': si_quantity.magnitude,
-            'si_unit': str(si_quantity.units),
+            'si_value': si_value,
+            'si_unit': compiled.si_unit_str,
             'original_unit': original_unit,
-            'quantity': si_quantity
+            'quantity': get_ureg().Quantity(si_value, compiled.si_units)
         }
     
     return result 
 
+class ColumnConversion(NamedTuple):
+    """Ergebnis einer spaltenweisen SI-Umrechnung (eine Zeile pro Batch-Eintrag)"""
+    si_values: Any                       # numpy.ndarray float64 - NaN bei Fehler/target
+    error_mask: Any                      # numpy.ndarray bool - True = Zeile ungültig
+    target_mask: Any                     # numpy.ndarray bool - True = Zeile ist 'target'
+    errors: Dict[int, str]               # Zeilenindex -> Fehlermeldung
+    original_units: Tuple[Optional[str], ...]
+    si_units: Tuple[Optional[str], ...]
+
+def convert_column_to_si(values, allow_target: bool = True) -> ColumnConversion:
+    """
+    Rechnet eine ganze Spalte von "Wert Einheit"-Strings in SI um.
+    
+    ⚡ VEKTORISIERT: Jeder unterschiedliche String wird nur einmal geparst, die Zeilen
+    werden nach Einheit gruppiert und pro Einheit mit einer NumPy-Operation umgerechnet
+    (Einheit über compile_unit() gecacht). Fehler brechen die Spalte nicht ab, sondern
+    werden pro Zeile in error_mask/errors gemeldet.
+    
+    Args:
+        values: Liste von Strings wie ["5 mm", "0.2 m", "target"]
+        allow_target: 'target' (beliebige Schreibweise) als gültigen Platzhalter akzeptieren
+        
+    Returns:
+        ColumnConversion: si_values (float64), error_mask, target_mask, errors,
+        original_units, si_units
+    """
+    # Vom Server erzeugte Spalten (Parameter-Sweeps) bringen ihre SI-Umrechnung mit
+    precomputed = getattr(values, 'conversion', None)
+    if isinstance(precomputed, ColumnConversion):
+        return precomputed
+    
+    import numpy as np
+    
+    count = len(values)
+    errors: Dict[int, str] = {}
+    
+    # 1) Parsen - jeder unterschiedliche String nur einmal (Nicht-Strings -> Schlüssel None)
+    keys = [raw if isinstance(raw, str) else None for raw in values]
+    unit_names: List[str] = []
+    unit_index: Dict[str, int] = {}
+    parsed: Dict[Optional[str], Tuple[float, int, Optional[str]]] = {None: (np.nan, -3, None)}
+    for raw in dict.fromkeys(keys):
+        if raw is None:
+            continue
+        if allow_target and raw.strip().lower() == 'target':
+            parsed[raw] = (np.nan, -2, None)
+            continue
+        try:
+            value, unit_str = parse_value_with_unit(raw)
+        except UnitsError as e:
+            parsed[raw] = (np.nan, -1, str(e))
+            continue
+        unit_id = unit_index.get(unit_str)
+        if unit_id is None:
+            unit_id = unit_index[unit_str] = len(unit_names)
+            unit_names.append(unit_str)
+        parsed[raw] = (value, unit_id, None)
+    
+    entries = [parsed[key] for key in keys]
+    magnitudes = np.fromiter((entry[0] for entry in entries), dtype=np.float64, count=count)
+    unit_ids = np.fromiter((entry[1] for entry in entries), dtype=np.intp, count=count)
+    target_mask = unit_ids == -2
+    error_mask = (unit_ids == -1) | (unit_ids == -3)
+    for row in np.flatnonzero(error_mask).tolist():
+        raw = values[row]
+        errors[row] = entries[row][2] if keys[row] is not None else f"Eingabe muss String mit Einheit sein, erhalten: {type(raw)}"
+    
+    # 2) Umrechnen - eine NumPy-Operation pro Einheit
+    si_values = np.full(count, np.nan, dtype=np.float64)
+    unit_labels: List[Optional[str]] = [None] * len(unit_names)
+    si_labels: List[Optional[str]] = [None] * len(unit_names)
+    for unit_id, unit_str in enumerate(unit_names):
+        rows = np.flatnonzero(unit_ids == unit_id)
+        try:
+            compiled = compile_unit(unit_str)
+        except UnitsError as e:
+            error_mask[rows] = True
+            for row in rows.tolist():
+                errors[row] = f"Fehler beim Konvertieren von '{values[row]}': {str(e)}"
+            continue
+        si_values[rows] = magnitudes[rows] * compiled.scale + compiled.offset
+        unit_labels[unit_id] = unit_str
+        si_labels[unit_id] = compiled.si_unit_str
+    
+    # Einheit pro Zeile (None bei target/Fehler)
+    unit_labels.append(None)
+    si_labels.append(None)
+    lookup = np.where(unit_ids >= 0, unit_ids, len(unit_names)).tolist()
+    original_units = [unit_labels[unit_id] for unit_id in lookup]
+    si_units = [si_labels[unit_id] for unit_id in lookup]
+    
+    return ColumnConversion(
+        si_values=si_values,
+        error_mask=error_mask,
+        target_mask=target_mask,
+        errors=errors,
+        original_units=tuple(original_units),
+        si_units=tuple(si_units)
+    )
+
+def validate_batch_inputs_have_units(allow_target: bool = True, **columns) -> Dict[str, ColumnConversion]:
+    """
+    Batch-Gegenstück zu validate_inputs_have_units(): Rechnet alle Parameter-Spalten
+    eines Batch-Aufrufs spaltenweise nach SI um.
+    
+    Args:
+        allow_target: 'target' als Platzhalter akzeptieren
+        **columns: Parametername -> Liste von "Wert Einheit"-Strings
+        
+    Returns:
+        Dict: Parametername -> ColumnConversion
+        
+    Raises:
+        UnitsError: Wenn die Spalten unterschiedlich lang sind
+    """
+    lengths = {name: len(column) for name, column in columns.items()}
+    if len(set(lengths.values())) > 1:
+        raise UnitsError(f"Alle Batch-Parameter müssen Listen gleicher Länge sein (erhalten: {lengths})")
+    
+    return {
+        name: convert_column_to_si(column, allow_target=allow_target)
+        for name, column in columns.items()
+    }
+
 def convert_pressure(pressure_value: str, target_unit: str) -> Dict:
     """
     Konvertiert Druckwerte zwischen verschiedenen Einheiten.
@@ -1,12 +1,20 @@
+# Zuerst importieren: Referenzpunkt für das Startup-Profil
+from engineering_mcp.startup_profile import startup_phase, mark_ready
 from fastmcp import FastMCP, Context
 import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from engineering_mcp.registry import (
     discover_engineering_tools,
     get_tool_info_for_llm, 
+    get_tool_catalog,
+    precompute_tool_details,
+    get_example_values,
+    get_solving_modules,
     call_engineering_tool,
     get_tool_details as get_tool_details_from_registry
 )
+from engineering_mcp.units_utils import warm_up_units, UNIT_WARMUP_ENABLED
+from engineering_mcp.executor import warm_up_process_pool, PROCESS_POOL_ENABLED
 
 # Session State wird jetzt zentral in tools.Meta.session_state verwaltet
 
@@ -149,6 +157,41 @@ WICHTIGE REGELN:
   - Index 1: flaeche=50cm², radius=10cm, durchmesser=target
   - Index 2: flaeche=target, radius=15cm, durchmesser=30cm
 
+  PARAMETER-SWEEPS (statt langer Listen):
+  Für Parameterstudien einen Parameter als Sweep angeben - der Server erzeugt die Werte:
+  - {"linspace": ["10 bar", "300 bar", 200]} - 200 gleichmäßig verteilte Werte
+  - {"logspace": ["1 mm", "1 m", 50]} - 50 logarithmisch verteilte Werte
+  - {"grid": ["5 mm", "8 mm", "10 mm"]} - explizite Werte
+  Mehrere Sweeps bilden ein kartesisches Produkt, Einzelwerte (auch "target") gelten für alle Zeilen.
+  Sweeps und Listen nicht mischen. Beispiel - Wanddicke für 200 Drücke:
+  ```json
+  {
+    "tool_name": "kesselformel",
+    "parameters": {
+      "druck": {"linspace": ["10 bar", "300 bar", 200]},
+      "durchmesser": "500 mm",
+      "wanddicke": "target",
+      "zulaessige_spannung": "160 MPa"
+    }
+  }
+  ```
+
+  KOMPAKTES ANTWORTFORMAT (empfohlen ab ca. 20 Parametersätzen):
+  Mit call_tool(..., result_format="columnar") kommt statt einer Zeile pro Parametersatz
+  ein Array pro Feld zurück (Index = batch_index):
+  - "inputs": {parameter: [...]} - die übergebenen Werte
+  - "target_parameter": [...] - berechneter Parameter pro Index
+  - "columns": {"ergebnis": {parameter: [...]}, "si_werte": {...}} - None bei Fehlern/anderem target
+  - "per_target": {target: {"formel": ..., ...}} - pro target konstante Angaben, nur einmal
+  - "errors": [{"batch_index": i, "error": ...}] - nur fehlgeschlagene Indizes
+  Ist ein Array überall gleich (z.B. ein übertragener Einzelwert), steht statt der Liste nur der Wert.
+
+  GROSSE BATCHES (Fortschritt & Streaming):
+  Große Batches werden in Blöcken berechnet, der Fortschritt wird als Progress-Notification gemeldet.
+  Mit call_tool(..., stream_results=True) kommt jeder Block sofort als Log-Notification
+  (logger "engineering_batch", {"batch_offset": ..., "chunk": {...}}) - die Antwort selbst enthält
+  dann nur noch die Zusammenfassung (total_calculations, successful, failed, chunks).
+
   ❌ FALSCHE BATCH-FORMATE:
   ```json
   // FALSCH: Gemischte Listen und Einzelwerte
@@ -215,73 +258,99 @@ async def list_engineering_tools_tool(tags: List[str], ctx: Context = None) -> D
     name=get_tool_details_module.TOOL_METADATA["name"],
     description=get_tool_details_module.TOOL_METADATA["description"]
 )
-async def get_tool_details_tool(tool_name: str = "", ctx: Context = None) -> Dict:
+async def get_tool_details_tool(tool_name: str = "", known_etag: Optional[str] = None, ctx: Context = None) -> Dict:
     # Reine Weiterleitung - alle Logik in Meta-Tool
-    return await get_tool_details_module.get_tool_details(tool_name=tool_name)
+    return await get_tool_details_module.get_tool_details(tool_name=tool_name, known_etag=known_etag)
 
 # Registriere Call Tool
 @mcp.tool(
     name=call_tool_module.TOOL_METADATA["name"],
     description=call_tool_module.TOOL_METADATA["description"]
 )
-async def call_tool_tool(tool_name: str = "", parameters: Dict[str, Any] = {}, ctx: Context = None) -> Dict:
-    # Reine Weiterleitung - alle Logik in Meta-Tool
-    return await call_tool_module.call_tool(tool_name=tool_name, parameters=parameters)
+async def call_tool_tool(tool_name: str = "", parameters: Dict[str, Any] = {}, result_format: str = "rows",
+                         stream_results: bool = False, ctx: Context = None) -> Dict:
+    # Reine Weiterleitung - alle Logik in Meta-Tool (ctx für Fortschritt/Streaming großer Batches)
+    return await call_tool_module.call_tool(tool_name=tool_name, parameters=parameters, result_format=result_format,
+                                            stream_results=stream_results, ctx=ctx)
 
 async def init_all_tools():
     """Initialisiert Engineering-Tools"""
     
     # Entdecke Engineering-Tools (bleiben in separater Registry)
-    engineering_count = await discover_engineering_tools()
+    with startup_phase("tool_discovery"):
+        engineering_count = await discover_engineering_tools()
+    
+    # Katalog-Snapshot inkl. invertiertem Tag-Index vorab aufbauen (erste Discovery-Anfrage = Dictionary-Zugriff)
+    with startup_phase("tool_catalog"):
+        get_tool_catalog()
+    
+    # get_tool_details-Dokumente inkl. ETag vorab aufbauen (Abruf = Cache-Zugriff)
+    with startup_phase("tool_details"):
+        precompute_tool_details()
+    
+    # Einheiten aus allen Tool-Beispielen vorab kompilieren (erste Anfrage ohne Aufbaukosten)
+    if UNIT_WARMUP_ENABLED:
+        with startup_phase("unit_warmup"):
+            warmup = warm_up_units(get_example_values())
+        print(f"INFO: Unit warm-up: {warmup['units']} units in {warmup['duration_ms']:.1f} ms "
+              f"(pint loaded: {warmup['pint_loaded']})")
+    
+    # Worker-Prozesse für große Batches vorab starten (Tool-Module bereits importiert)
+    if PROCESS_POOL_ENABLED:
+        with startup_phase("process_pool"):
+            workers = await warm_up_process_pool(get_solving_modules())
+        if workers:
+            print(f"INFO: Process pool ready: {workers} workers")
     
     # Tag-System validieren (nach Discovery, um Circular Imports zu vermeiden)
-    try:
-        from engineering_mcp.tag_definitions import validate_tag_system, get_tag_statistics, get_tag_definitions, clear_tag_cache
+    with startup_phase("tag_system"):
+        try:
+            from engineering_mcp.tag_definitions import validate_tag_system, get_tag_statistics, get_tag_definitions, clear_tag_cache
         
-        # Cache leeren um aktuelle Änderungen zu erkennen
-        clear_tag_cache()
+            # Cache leeren um aktuelle Änderungen zu erkennen
+            clear_tag_cache()
         
-        print("\n🏷️ TAG-SYSTEM ANALYSE:")
-        print("=" * 50)
+            print("\n🏷️ TAG-SYSTEM ANALYSE:")
+            print("=" * 50)
         
-        # Hole detaillierte Statistiken
-        stats = get_tag_statistics()
-        print(f"📊 STATISTIKEN:")
-        print(f"   Gesamt Tags im System: {stats['total_tags']}")
-        print(f"   Bekannte Tag-Beschreibungen: {stats['known_tags']}")
-        print(f"   Unbekannte Tags: {stats['unknown_tags']}")
-        print(f"   Gesamt Tools kategorisiert: {stats['total_tools']}")
+            # Hole detaillierte Statistiken
+            stats = get_tag_statistics()
+            print(f"📊 STATISTIKEN:")
+            print(f"   Gesamt Tags im System: {stats['total_tags']}")
+            print(f"   Bekannte Tag-Beschreibungen: {stats['known_tags']}")
+            print(f"   Unbekannte Tags: {stats['unknown_tags']}")
+            print(f"   Gesamt Tools kategorisiert: {stats['total_tools']}")
         
-        # Zeige TOP Tags
-        print(f"\n🔝 TOP VERWENDETE TAGS:")
-        for tag, count in stats['most_used_tags'][:8]:  # Top 8 zeigen
-            print(f"   {tag}: {count} Tools")
+            # Zeige TOP Tags
+            print(f"\n🔝 TOP VERWENDETE TAGS:")
+            for tag, count in stats['most_used_tags'][:8]:  # Top 8 zeigen
+                print(f"   {tag}: {count} Tools")
         
-        # Hole Tag-Definitionen für Details
-        definitions = get_tag_definitions()
+            # Hole Tag-Definitionen für Details
+            definitions = get_tag_definitions()
         
-        # Zeige aktive Tag-Kategorien
-        active_tags = {tag: info for tag, info in definitions.items() if info['tool_count'] > 0}
-        print(f"\n📂 AKTIVE TAG-KATEGORIEN ({len(active_tags)}):")
-        for tag, info in sorted(active_tags.items(), key=lambda x: x[1]['tool_count'], reverse=True):
-            tools_preview = ', '.join(info['tools'][:3])
-            if len(info['tools']) > 3:
-                tools_preview += f" ... (+{len(info['tools'])-3} weitere)"
-            print(f"   ✅ {tag} ({info['tool_count']}): {tools_preview}")
+            # Zeige aktive Tag-Kategorien
+            active_tags = {tag: info for tag, info in definitions.items() if info['tool_count'] > 0}
+            print(f"\n📂 AKTIVE TAG-KATEGORIEN ({len(active_tags)}):")
+            for tag, info in sorted(active_tags.items(), key=lambda x: x[1]['tool_count'], reverse=True):
+                tools_preview = ', '.join(info['tools'][:3])
+                if len(info['tools']) > 3:
+                    tools_preview += f" ... (+{len(info['tools'])-3} weitere)"
+                print(f"   ✅ {tag} ({info['tool_count']}): {tools_preview}")
         
-        # Validierungswarnungen
-        warnings = validate_tag_system()
-        if warnings:
-            print(f"\n⚠️ VALIDIERUNG:")
-            for warning in warnings:
-                print(f"   {warning}")
-        else:
-            print(f"\n✅ VALIDIERUNG: Alle Tags korrekt definiert")
+            # Validierungswarnungen
+            warnings = validate_tag_system()
+            if warnings:
+                print(f"\n⚠️ VALIDIERUNG:")
+                for warning in warnings:
+                    print(f"   {warning}")
+            else:
+                print(f"\n✅ VALIDIERUNG: Alle Tags korrekt definiert")
         
-        print("")  # Leerzeile für bessere Lesbarkeit
+            print("")  # Leerzeile für bessere Lesbarkeit
         
-    except Exception as e:
-        print(f"⚠️ Tag-System Analyse fehlgeschlagen: {e}")
+        except Exception as e:
+            print(f"⚠️ Tag-System Analyse fehlgeschlagen: {e}")
     
     # Meta-Tools sind bereits bei Import registriert worden
     meta_count = 5  # clock, server_informations, list_engineering_tools, get_tool_details, call_tool
@@ -299,6 +368,8 @@ async def init_all_tools():
     print(f"   2. 2_get_tool_details")
     print(f"   3. 3_call_tool")
     
+    mark_ready()
+    
     return total_tools
 
 # Server-Initialisierung
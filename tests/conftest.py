@@ -0,0 +1,105 @@
+"""
+Gemeinsame Fixtures: temporärer tools/-Baum für Discovery, Manifest und Hot-Reload
+"""
+
+import os
+import sys
+import time
+import importlib
+
+import pytest
+
+from engineering_mcp import manifest, registry, result_cache
+
+TOOL_TEMPLATE = '''
+{imports}
+
+def get_metadata():
+    return {{
+        "tool_name": "{name}",
+        "tags": ["elementar"],
+        "has_solving": "symbolic",
+        "short_description": "{description}",
+        "description": "{description}",
+        "parameters": {{"seite": {{"type": "string", "dimension": "length", "example": "2 m"}}}},
+        "data_files": {data_files!r},
+    }}
+
+
+def calculate(seite):
+    return {{"gegebene_werte": {{"seite": seite}}, "faktor": {factor}}}
+'''
+
+
+class ToolTree:
+    """Temporäres Projekt mit eigenem tools/-Paket (Kategorie 'demo')"""
+
+    def __init__(self, root):
+        self.root = root
+        self.manifest_path = str(root / ".cache" / "tool_manifest.json")
+        # Eindeutige mtimes, auch wenn zwei Änderungen in denselben Timer-Tick fallen
+        self._mtime_ns = time.time_ns()
+
+    def write(self, relative_path, text):
+        path = self.root / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+        self._mtime_ns += 10 ** 9
+        os.utime(path, ns=(self._mtime_ns, self._mtime_ns))
+        importlib.invalidate_caches()
+        return path
+
+    def write_tool(self, module, name=None, description="Demo-Tool", factor=1,
+                   imports="", data_files=()):
+        return self.write(f"tools/demo/{module}.py", TOOL_TEMPLATE.format(
+            name=name or module, description=description, factor=factor,
+            imports=imports, data_files=list(data_files)
+        ))
+
+    def remove(self, relative_path):
+        os.remove(self.root / relative_path)
+        importlib.invalidate_caches()
+
+    def unload(self):
+        """Tool-Module aus sys.modules entfernen (wie ein neuer Prozess)"""
+        for name in [name for name in sys.modules if name.startswith("tools.demo.")]:
+            del sys.modules[name]
+
+
+@pytest.fixture
+def tool_tree(tmp_path, monkeypatch):
+    tree = ToolTree(tmp_path)
+    tree.write("tools/__init__.py", "")
+    tree.write("tools/demo/__init__.py", "")
+
+    # Echtes tools-Paket verstecken und nach dem Test wiederherstellen
+    hidden = {name: module for name, module in sys.modules.items() if name == "tools" or name.startswith("tools.")}
+    for name in hidden:
+        del sys.modules[name]
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+
+    monkeypatch.setattr(manifest, "PROJECT_ROOT", str(tmp_path))
+    monkeypatch.setattr(registry, "PROJECT_ROOT", str(tmp_path))
+    monkeypatch.setattr(manifest, "_IMPORT_CACHE", {})
+    monkeypatch.setattr(manifest, "_HASH_CACHE", {})
+    monkeypatch.setattr(registry, "load_manifest", lambda: manifest.load_manifest(tree.manifest_path))
+    monkeypatch.setattr(registry, "save_manifest", lambda modules: manifest.save_manifest(modules, tree.manifest_path))
+
+    registered = dict(registry._ENGINEERING_TOOLS_REGISTRY)
+    registry._ENGINEERING_TOOLS_REGISTRY.clear()
+    for name in ("_MANIFEST_MODULES", "_MODULE_FILE_STATS", "_DATA_FILE_HASHES",
+                 "_TOOL_DETAILS_CACHE", "_FROZEN_TOOL_INFOS"):
+        monkeypatch.setattr(registry, name, {})
+    monkeypatch.setattr(registry, "_REGISTRY_VERSION", registry._REGISTRY_VERSION)
+    monkeypatch.setattr(registry, "_TOOL_CATALOG", None)
+    monkeypatch.setattr(result_cache, "_RESULT_CACHE", {})
+    monkeypatch.setattr(result_cache, "_CACHE_STATS", {})
+
+    yield tree
+
+    for name in [name for name in sys.modules if name == "tools" or name.startswith("tools.")]:
+        del sys.modules[name]
+    sys.modules.update(hidden)
+    registry._ENGINEERING_TOOLS_REGISTRY.clear()
+    registry._ENGINEERING_TOOLS_REGISTRY.update(registered)
@@ -0,0 +1,307 @@
+"""
+Batch-Engine
+
+- Vektorisierte Kernel müssen exakt dieselben Zeilen liefern wie _solve_single()
+  der Tools (Einzelaufruf), inklusive Fehlerzeilen
+- Das Spaltenformat (to_columnar) enthält dieselben Daten wie die Zeilen
+- In Blöcken berechnete (und gestreamte) Batches ergeben dasselbe Ergebnis
+- Identische Parametersätze werden einmal berechnet, die Zeilen bleiben unabhängig
+"""
+
+import json
+import random
+import importlib
+
+import pytest
+
+pytest.importorskip("pint")
+from engineering_mcp.batch_engine import get_batch_kernels  # noqa: E402
+
+BATCH_TOOLS = [
+    "tools.geometry.Flaechen.circle_area", "tools.geometry.Flaechen.dreieck",
+    "tools.geometry.Flaechen.ellipse", "tools.geometry.Flaechen.parallelogramm",
+    "tools.geometry.Flaechen.rechteck", "tools.geometry.Flaechen.ring",
+    "tools.geometry.Flaechen.trapez", "tools.geometry.Umfang.dreieck",
+    "tools.geometry.Umfang.ellipse", "tools.geometry.Umfang.kreis",
+    "tools.geometry.Umfang.rechteck", "tools.geometry.Volumen.kegel",
+    "tools.geometry.Volumen.kugel", "tools.geometry.Volumen.prisma",
+    "tools.geometry.Volumen.pyramide", "tools.geometry.Volumen.quader",
+    "tools.geometry.Volumen.zylinder", "tools.pressure.kesselformel",
+]
+
+UNITS = {
+    "length": ["mm", "cm", "m", "km", "µm", "in", "dm"],
+    "area": ["mm²", "cm²", "m²", "mm^2", "ha"],
+    "volume": ["cm³", "l", "m³", "mm³", "ml"],
+    "pressure": ["bar", "MPa", "Pa", "kPa", "N/mm²"],
+}
+
+# Zeilen, die Kernel an _solve_single() zurückgeben müssen (Fehler, Grenzfälle)
+INVALID = ["abc", "5", "-3 mm", "0 mm", None, "target", "1e400 mm", "3 foo"]
+
+
+def _dumps(value):
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def _random_columns(module, rows, seed):
+    rng = random.Random(seed)
+    parameters = module.get_metadata()["parameters"]
+    names = list(parameters)
+    columns = {name: [] for name in names}
+    for _ in range(rows):
+        target = rng.choice(names)
+        for name in names:
+            if name == target:
+                columns[name].append("target")
+            else:
+                magnitude = 10 ** rng.uniform(-4, 4)
+                unit = rng.choice(UNITS[parameters[name]["dimension"]])
+                columns[name].append(f"{magnitude:.{rng.randint(1, 8)}g} {unit}")
+        if rng.random() < 0.15:
+            columns[rng.choice(names)][-1] = rng.choice(INVALID)
+    return columns
+
+
+def _expected_row(module, index, combination):
+    """Zeile, wie run_batch() sie aus einem Einzelaufruf bilden muss"""
+    nested = module.__name__.endswith("kesselformel")
+    try:
+        single = module.calculate(**combination)
+    except Exception as e:
+        if nested:
+            return {"batch_index": index, "input_combination": combination,
+                    "error": f"Berechnungsfehler: {str(e)}"}
+        return {"batch_index": index, "input_combination": combination,
+                "error": str(e), "type": type(e).__name__}
+    if not nested:
+        return {**single, "batch_index": index, "input_combination": combination}
+    if "error" in single:
+        return {"batch_index": index, "input_combination": combination, "error": single["error"]}
+    return {"batch_index": index, "input_combination": combination, "ergebnis": single}
+
+
+@pytest.mark.parametrize("module_path", BATCH_TOOLS)
+def test_tool_registers_kernels(module_path):
+    module = importlib.import_module(module_path)
+    assert get_batch_kernels(module.TOOL_NAME)
+
+
+@pytest.mark.parametrize("module_path", BATCH_TOOLS)
+def test_batch_rows_match_single_calls(module_path):
+    module = importlib.import_module(module_path)
+    columns = _random_columns(module, rows=80, seed=module_path)
+    result = module.calculate(**columns)
+
+    assert result["batch_mode"] is True
+    assert result["total_calculations"] == 80
+    names = list(columns)
+    for index, row in enumerate(result["results"]):
+        combination = {name: columns[name][index] for name in names}
+        assert _dumps(row) == _dumps(_expected_row(module, index, combination)), index
+    assert result["failed"] == sum(1 for row in result["results"] if "error" in row)
+    assert result["successful"] == 80 - result["failed"]
+
+
+def test_batch_format_errors_unchanged():
+    module = importlib.import_module("tools.geometry.Flaechen.circle_area")
+    mixed = module.calculate(flaeche="target", radius=["1 m", "2 m"])
+    assert mixed["error"] == "Batch-Modus erfordert, dass ALLE Parameter Listen sind"
+    uneven = module.calculate(flaeche=["target", "target"], radius=["1 m"])
+    assert uneven["error"] == "Alle Parameter-Listen müssen die gleiche Länge haben"
+
+
+# ================================================================================================
+# Spaltenformat (to_columnar)
+# ================================================================================================
+
+def _column_value(column, index):
+    return column[index] if isinstance(column, list) else column
+
+
+def _row_from_columnar(columnar, index):
+    """Erfolgreiche Zeile aus dem Spaltenformat zurückgewinnen (ohne Zeilen-Only-Felder)"""
+    target = _column_value(columnar["target_parameter"], index)
+    row = {"target_parameter": target, **columnar["per_target"].get(str(target), {})}
+    for key, column in columnar["columns"].items():
+        if isinstance(column, dict):
+            values = {sub_key: _column_value(values, index) for sub_key, values in column.items()}
+            values = {sub_key: value for sub_key, value in values.items() if value is not None}
+            if values:
+                row[key] = values
+        elif _column_value(column, index) is not None:
+            row[key] = _column_value(column, index)
+    return row
+
+
+@pytest.mark.parametrize("module_path", ["tools.geometry.Flaechen.dreieck", "tools.geometry.Volumen.quader",
+                                         "tools.pressure.kesselformel"])
+def test_columnar_holds_same_data_as_rows(module_path):
+    from engineering_mcp.batch_engine import to_columnar
+
+    module = importlib.import_module(module_path)
+    columns = _random_columns(module, rows=60, seed=module_path)
+    rows_result = module.calculate(**columns)
+    columnar = to_columnar(rows_result)
+
+    assert columnar["result_format"] == "columnar"
+    for key in ("total_calculations", "successful", "failed"):
+        assert columnar[key] == rows_result[key]
+    for name, values in columnar["inputs"].items():
+        assert [_column_value(values, i) for i in range(60)] == columns[name]
+
+    errors = iter(columnar["errors"])
+    for index, row in enumerate(rows_result["results"]):
+        if "error" in row:
+            assert next(errors) == {key: value for key, value in row.items() if key != "input_combination"}
+            continue
+        payload = row["ergebnis"] if "target_parameter" not in row else row
+        expected = {key: value for key, value in payload.items()
+                    if key not in ("batch_index", "input_combination", "gegebene_werte")}
+        assert _row_from_columnar(columnar, index) == expected, index
+    assert next(errors, None) is None
+
+
+def test_columnar_compacts_constant_columns():
+    from engineering_mcp.batch_engine import to_columnar
+
+    module = importlib.import_module("tools.geometry.Flaechen.rechteck")
+    result = to_columnar(module.calculate(flaeche=["target"] * 3, laenge=["2 m", "3 m", "4 m"],
+                                          breite=["1 m"] * 3))
+    assert result["inputs"] == {"flaeche": "target", "laenge": ["2 m", "3 m", "4 m"], "breite": "1 m"}
+    assert result["target_parameter"] == "flaeche"
+    assert "formel" in result["per_target"]["flaeche"]
+    assert result["columns"]["ergebnis"]["flaeche"] == ["2 meter ** 2", "3 meter ** 2", "4 meter ** 2"]
+    assert result["errors"] == []
+
+
+def test_columnar_leaves_non_batch_results_unchanged():
+    from engineering_mcp.batch_engine import to_columnar
+
+    single = {"target_parameter": "flaeche", "ergebnis": {"flaeche": "1 meter ** 2"}}
+    streamed = {"batch_mode": True, "total_calculations": 4, "successful": 4, "failed": 0,
+                "streamed": True, "chunks": 2}
+    assert to_columnar(single) is single
+    assert to_columnar(streamed) is streamed
+    assert to_columnar({"error": "x"}) == {"error": "x"}
+
+
+# ================================================================================================
+# Blöcke (split_batch / merge_batch_results) und Streaming
+# ================================================================================================
+
+def test_split_batch_only_for_large_batches():
+    from engineering_mcp.batch_engine import split_batch
+
+    assert split_batch({"flaeche": "target", "radius": "1 m"}, 2) is None
+    assert split_batch({"flaeche": ["target"] * 3, "radius": ["1 m"] * 2}, 2) is None
+    assert split_batch({"flaeche": ["target"] * 5, "radius": ["1 m"] * 5}, 5) is None
+
+
+def test_split_batch_avoids_single_row_chunks():
+    from engineering_mcp.batch_engine import split_batch
+
+    params = {"flaeche": "target", "radius": [f"{i} m" for i in range(1, 12)]}
+    chunks = split_batch(params, 5)
+    assert [start for start, _ in chunks] == [0, 5]
+    assert [chunk["radius"] for _, chunk in chunks] == [params["radius"][:5], params["radius"][5:]]
+    assert all(chunk["flaeche"] == "target" for _, chunk in chunks)
+
+
+@pytest.mark.parametrize("chunk_size", [2, 7, 25])
+def test_merged_chunks_equal_unchunked_batch(chunk_size):
+    from engineering_mcp.batch_engine import split_batch, offset_batch_indices, merge_batch_results
+
+    module = importlib.import_module("tools.geometry.Volumen.quader")
+    columns = _random_columns(module, rows=50, seed="chunks")
+    parts = [offset_batch_indices(module.calculate(**chunk), start)
+             for start, chunk in split_batch(columns, chunk_size)]
+
+    assert _dumps(merge_batch_results(parts)) == _dumps(module.calculate(**columns))
+    summary = merge_batch_results(parts, keep_results=False)
+    assert summary["streamed"] is True and summary["chunks"] == len(parts)
+    assert "results" not in summary and summary["total_calculations"] == 50
+
+
+@pytest.fixture(scope="module")
+def registry():
+    from engineering_mcp import registry
+    registry.ensure_tools_discovered()
+    return registry
+
+
+def test_call_engineering_tool_streams_chunks_in_order(registry, monkeypatch):
+    import asyncio
+
+    monkeypatch.setattr(registry, "BATCH_CHUNK_SIZE", 4)
+    module = importlib.import_module("tools.geometry.Flaechen.circle_area")
+    params = {"flaeche": ["target"] * 10, "radius": [f"{i} cm" for i in range(1, 11)]}
+    received = []
+
+    async def on_chunk(part, done, total):
+        received.append(([row["batch_index"] for row in part["results"]], done, total))
+
+    streamed = asyncio.run(registry.call_engineering_tool("kreis_flaeche", params, on_chunk, keep_results=False))
+    assert received == [([0, 1, 2, 3], 4, 10), ([4, 5, 6, 7], 8, 10), ([8, 9], 10, 10)]
+    assert streamed == {"batch_mode": True, "total_calculations": 10, "successful": 10, "failed": 0,
+                        "streamed": True, "chunks": 3}
+
+    collected = asyncio.run(registry.call_engineering_tool("kreis_flaeche", params, on_chunk))
+    assert _dumps(collected) == _dumps(module.calculate(**params))
+
+
+# ================================================================================================
+# Zusammenfassung identischer Parametersätze
+# ================================================================================================
+
+def test_unique_rows():
+    from engineering_mcp.batch_engine import _unique_rows
+
+    columns = {"a": ["1 m", "2 m", "1 m", "1 m", "100 cm"], "b": ["x", "x", "x", "y", "x"]}
+    assert _unique_rows(columns) == ([0, 1, 3, 4], [0, 1, 0, 2, 3])
+    # Nicht hashbare Werte: keine Zusammenfassung
+    assert _unique_rows({"a": [{"v": 1}, {"v": 1}]}) == ([0, 1], [0, 1])
+
+
+def test_duplicates_are_solved_once():
+    from engineering_mcp.batch_engine import run_batch
+
+    calls = []
+
+    def solve_single(x, y):
+        calls.append((x, y))
+        if x == "boom":
+            raise ValueError("kaputt")
+        return {"gegebene_werte": {"x": x}, "ergebnis": {"y": f"{x}!"}}
+
+    params = {"x": ["a", "b", "a", "boom", "boom", "a"], "y": ["target"] * 6}
+    result = run_batch("no_kernel_tool", params, solve_single)
+
+    assert calls == [("a", "target"), ("b", "target"), ("boom", "target")]
+    rows = result["results"]
+    assert [row["batch_index"] for row in rows] == list(range(6))
+    assert rows[0]["ergebnis"] == rows[2]["ergebnis"] == rows[5]["ergebnis"] == {"y": "a!"}
+    assert rows[3] == {"batch_index": 3, "input_combination": {"x": "boom", "y": "target"},
+                       "error": "kaputt", "type": "ValueError"}
+    assert rows[4]["batch_index"] == 4 and rows[4]["error"] == "kaputt"
+    assert (result["successful"], result["failed"]) == (4, 2)
+
+    # Zeilen teilen keine veränderlichen Dicts
+    rows[0]["ergebnis"]["y"] = "changed"
+    rows[0]["gegebene_werte"]["x"] = "changed"
+    assert rows[2]["ergebnis"] == {"y": "a!"} and rows[5]["gegebene_werte"] == {"x": "a"}
+
+
+@pytest.mark.parametrize("module_path", ["tools.geometry.Flaechen.trapez", "tools.geometry.Umfang.ellipse",
+                                         "tools.pressure.kesselformel"])
+def test_batch_with_duplicates_matches_single_calls(module_path):
+    module = importlib.import_module(module_path)
+    pool = _random_columns(module, rows=15, seed=module_path + ":dup")
+    picks = random.Random(module_path).choices(range(15), k=90)
+    columns = {name: [values[i] for i in picks] for name, values in pool.items()}
+    result = module.calculate(**columns)
+
+    names = list(columns)
+    for index, row in enumerate(result["results"]):
+        combination = {name: columns[name][index] for name in names}
+        assert _dumps(row) == _dumps(_expected_row(module, index, combination)), index
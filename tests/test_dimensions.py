@@ -0,0 +1,104 @@
+"""
+Dimensions-Prüfung: Kompilieren der "dimension"-Angaben, Ablehnung ganzer Spalten
+und strukturierter Fehler in call_tool
+"""
+
+import asyncio
+import importlib
+
+import pytest
+
+pytest.importorskip("pint")
+from engineering_mcp import units_utils  # noqa: E402
+from engineering_mcp.dimensions import (  # noqa: E402
+    DIMENSIONS, DimensionMismatchError, compile_dimension_checks, check_parameter_dimensions,
+    normalize_dimensionality
+)
+
+PARAMETERS = {
+    "flaeche": {"type": "string | array", "dimension": "area"},
+    "radius": {"type": "string | array", "dimension": "Length"},
+    "anzahl": {"type": "integer"},
+}
+
+
+@pytest.fixture
+def checks():
+    return compile_dimension_checks(PARAMETERS)
+
+
+def test_compile_keeps_declared_dimensions(checks):
+    assert [(check.parameter, check.dimension) for check in checks] == [("flaeche", "area"), ("radius", "length")]
+    assert checks[1].dims == DIMENSIONS["length"]
+
+
+def test_unknown_dimension_warns_and_is_not_checked():
+    warnings = []
+    checks = compile_dimension_checks({"radius": {"dimension": "lenght"}}, warnings, "test_tool")
+    assert checks == ()
+    assert warnings == ["WARNING: test_tool: Unknown dimension 'lenght' for parameter 'radius' -> not checked"]
+    check_parameter_dimensions(checks, {"radius": "5 bar"})
+
+
+def test_matching_units_pass(checks):
+    check_parameter_dimensions(checks, {"flaeche": "target", "radius": "5 cm"})
+    check_parameter_dimensions(checks, {"flaeche": ["2 m²", "target"], "radius": ["target", "3 in"]})
+
+
+def test_single_value_with_wrong_unit(checks):
+    with pytest.raises(DimensionMismatchError) as info:
+        check_parameter_dimensions(checks, {"flaeche": "target", "radius": "5 bar"})
+    error = info.value
+    assert (error.parameter, error.expected) == ("radius", "length")
+    assert error.rows == {0: "5 bar"}
+    assert error.total_rows == 1
+
+
+def test_mixed_column_reports_wrong_rows(checks):
+    column = ["5 cm", "2 bar", "3 mm", "1 kg", "2 bar"]
+    with pytest.raises(DimensionMismatchError) as info:
+        check_parameter_dimensions(checks, {"flaeche": ["target"] * 5, "radius": column})
+    assert info.value.rows == {1: "2 bar", 3: "1 kg", 4: "2 bar"}
+    assert info.value.total_rows == 5
+    assert "3 von 5 Werten passen nicht" in str(info.value)
+
+
+def test_target_and_unparseable_values_are_left_to_the_tool(checks):
+    check_parameter_dimensions(checks, {
+        "flaeche": ["target", "TARGET", "abc"],
+        "radius": ["5 cm", "zwei Meter", "3 gibtsnicht"],
+        "anzahl": 3,
+    })
+
+
+def test_pint_backend(checks, monkeypatch):
+    monkeypatch.setattr(units_utils, "UNIT_BACKEND", "pint")
+    units_utils.compile_unit.cache_clear()
+    try:
+        dimensionality = units_utils.compile_unit("N/mm²").dimensionality
+        assert not isinstance(dimensionality, tuple)
+        assert normalize_dimensionality(dimensionality) == DIMENSIONS["pressure"]
+
+        check_parameter_dimensions(checks, {"flaeche": "target", "radius": ["5 cm", "2 ft"]})
+        with pytest.raises(DimensionMismatchError) as info:
+            check_parameter_dimensions(checks, {"flaeche": "target", "radius": ["5 cm", "2 bar"]})
+        assert info.value.rows == {1: "2 bar"}
+    finally:
+        units_utils.compile_unit.cache_clear()
+
+
+def test_call_tool_returns_dimension_mismatch():
+    from engineering_mcp.registry import ensure_tools_discovered
+    from tools.Meta.session_state import add_to_whitelist
+
+    ensure_tools_discovered()
+    call_tool = importlib.import_module("tools.Meta.3_call_tool").call_tool
+    add_to_whitelist("kreis_flaeche")
+
+    result = asyncio.run(call_tool("kreis_flaeche", {"flaeche": "target", "radius": ["5 cm", "2 bar", "3 mm"]}))
+    assert result["error"] == "DIMENSION_MISMATCH"
+    assert result["parameter"] == "radius"
+    assert result["expected_dimension"] == "length"
+    assert result["invalid_rows"] == [1]
+    assert (result["invalid_count"], result["total_rows"]) == (1, 3)
+    assert "kreis_flaeche" in result["help_action"]
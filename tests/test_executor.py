@@ -0,0 +1,141 @@
+"""
+Executor-Schicht: Pro-Tool-Limit nach Timeouts, Content-Hash der Worker-Module und Start-Fehler
+"""
+
+import os
+import time
+import asyncio
+import importlib
+import threading
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from engineering_mcp import executor
+
+MODULE = "tools.geometry.Flaechen.circle_area"
+
+
+@pytest.fixture
+def worker_modules(monkeypatch):
+    monkeypatch.setattr(executor, "_WORKER_MODULES", {})
+    reloads = []
+    real_reload = importlib.reload
+    monkeypatch.setattr(importlib, "reload", lambda module: reloads.append(module.__name__) or real_reload(module))
+    return reloads
+
+
+@pytest.mark.skipif("MCP_PROCESS_WORKERS" in os.environ, reason="Pool explizit konfiguriert")
+def test_process_pool_is_opt_in():
+    assert executor.PROCESS_WORKERS == 0
+    assert executor.PROCESS_POOL_ENABLED is False
+    assert not executor.use_process_pool(10 ** 6)
+
+
+def test_preloaded_module_is_not_reloaded(worker_modules):
+    executor._init_worker({MODULE: "hash-a"})
+    assert executor._WORKER_MODULES == {MODULE: "hash-a"}
+
+    result = executor._run_chunk(MODULE, "hash-a", {"flaeche": "target", "radius": "2 m"})
+    assert "error" not in result
+    assert worker_modules == []
+
+
+def test_changed_hash_reloads_once(worker_modules):
+    executor._init_worker({MODULE: "hash-a"})
+    executor._run_chunk(MODULE, "hash-b", {"flaeche": "target", "radius": "2 m"})
+    executor._run_chunk(MODULE, "hash-b", {"flaeche": "target", "radius": "2 m"})
+    assert worker_modules == [MODULE]
+    assert executor._WORKER_MODULES[MODULE] == "hash-b"
+
+
+def test_failed_preload_is_not_recorded(worker_modules):
+    executor._init_worker({"tools.does_not_exist": "hash-a"})
+    assert executor._WORKER_MODULES == {}
+
+
+class _BrokenPool:
+    def __init__(self):
+        self.shut_down = False
+
+    def submit(self, *args, **kwargs):
+        raise BrokenProcessPool("worker died during startup")
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+
+
+def test_warm_up_failure_disables_pool(monkeypatch, capsys):
+    pool = _BrokenPool()
+
+    def fake_get_process_pool(modules=None):
+        executor._PROCESS_POOL = pool
+        return pool
+
+    monkeypatch.setattr(executor, "PROCESS_WORKERS", 2)
+    monkeypatch.setattr(executor, "PROCESS_POOL_ENABLED", True)
+    monkeypatch.setattr(executor, "_PROCESS_POOL", None)
+    monkeypatch.setattr(executor, "get_process_pool", fake_get_process_pool)
+
+    assert asyncio.run(executor.warm_up_process_pool({MODULE: "hash-a"})) == 0
+    assert executor.PROCESS_POOL_ENABLED is False
+    assert executor._PROCESS_POOL is None
+    assert pool.shut_down
+    assert not executor.use_process_pool(10 ** 6)
+    assert "WARNING: Process pool start failed" in capsys.readouterr().out
+
+
+@pytest.fixture
+def small_pools(monkeypatch):
+    monkeypatch.setattr(executor, "EXECUTOR_THREADS", 4)
+    monkeypatch.setattr(executor, "HELPER_THREADS", 1)
+    monkeypatch.setattr(executor, "TOOL_CONCURRENCY", 2)
+    monkeypatch.setattr(executor, "TOOL_TIMEOUT", 0.2)
+    monkeypatch.setattr(executor, "_THREAD_POOL", None)
+    monkeypatch.setattr(executor, "_HELPER_POOL", None)
+    monkeypatch.setattr(executor, "_TOOL_LIMITERS", {})
+    release = threading.Event()
+    yield release
+    release.set()
+    executor.shutdown_executors()
+
+
+def test_timed_out_tool_cannot_starve_other_tools(small_pools):
+    release = small_pools
+
+    def slow():
+        release.wait(10)
+        return "slow"
+
+    def quick(value):
+        return value
+
+    async def call(tool_name, func, parameters):
+        return await executor.run_limited(tool_name, lambda: executor.run_tool(func, parameters))
+
+    async def scenario():
+        for _ in range(2):
+            results = await asyncio.gather(*(call("slow_tool", slow, {}) for _ in range(4)),
+                                           return_exceptions=True)
+            assert all(isinstance(result, executor.ToolTimeoutError) for result in results)
+
+        # Slots bleiben belegt, solange die Threads des Tools rechnen
+        limiter = executor.get_tool_limiter("slow_tool")
+        assert limiter.locked()
+        assert await call("quick_tool", quick, {"value": "ok"}) == "ok"
+        assert await executor.run_sync(quick, "helper") == "helper"
+
+        release.set()
+        deadline = time.monotonic() + 5
+        while limiter.locked() and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        assert not limiter.locked()
+        assert await call("slow_tool", quick, {"value": "again"}) == "again"
+
+    asyncio.run(scenario())
+
+
+def test_default_tool_limit_leaves_threads_free():
+    if "MCP_TOOL_CONCURRENCY" in os.environ:
+        pytest.skip("Limit explizit konfiguriert")
+    assert executor.TOOL_CONCURRENCY < executor.EXECUTOR_THREADS or executor.EXECUTOR_THREADS == 1
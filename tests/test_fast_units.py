@@ -0,0 +1,66 @@
+"""
+Parität des schnellen Einheiten-Backends mit Pint
+
+Jeder Eintrag der Tabelle und typische zusammengesetzte Ausdrücke müssen in Pint
+dieselbe Einheit ergeben (Name, Faktor, Offset, Dimension). Was Pint ablehnt,
+darf die Tabelle nicht annehmen.
+"""
+
+import pytest
+
+from engineering_mcp.fast_units import _BASE_DIMENSIONS, _UNIT_TABLE, parse_unit
+
+pytest.importorskip("pint")
+from engineering_mcp.units_utils import get_pint_ureg  # noqa: E402
+
+EXPRESSIONS = [
+    "m^2", "m**2", "m²", "mm³", "N/mm²", "N/mm^2", "kN*m", "N m", "N·m", "kg/m^3",
+    "km/h", "m/s**2", "s**-1", "m^-1", "kN/m", "MPa", "bar", "psi", "°C", "degC",
+]
+
+# Von Pint abgelehnt - die Tabelle darf sie nicht auflösen
+REJECTED = ["mm2", "m2", "cm3", "N/mm2"]
+
+# In Pint eigenständige Einheiten, die nicht als Präfix + Einheit gelesen werden dürfen
+PINT_EXPLICIT = ["hbar"]
+
+
+def _pint_unit(expression):
+    ureg = get_pint_ureg()
+    quantity = ureg.Quantity(1.0, expression)
+    if quantity._ok_for_muldiv():
+        offset = 0.0
+        scale = quantity.to_base_units().magnitude
+    else:
+        offset = ureg.Quantity(0.0, expression).to_base_units().magnitude
+        scale = quantity.to_base_units().magnitude - offset
+    dimensions = {name: exponent for name, exponent in quantity.dimensionality.items() if exponent}
+    return str(quantity.units), scale, offset, dimensions
+
+
+def _fast_dimensions(unit):
+    return {name: exponent for name, exponent in zip(_BASE_DIMENSIONS, unit.dims) if exponent}
+
+
+@pytest.mark.parametrize("expression", sorted(_UNIT_TABLE) + EXPRESSIONS)
+def test_matches_pint(expression):
+    unit = parse_unit(expression)
+    assert unit is not None
+    name, scale, offset, dimensions = _pint_unit(expression)
+    assert str(unit) == name
+    assert unit.scale == pytest.approx(scale, rel=1e-12)
+    assert unit.offset == pytest.approx(offset, abs=1e-12)
+    assert _fast_dimensions(unit) == dimensions
+
+
+@pytest.mark.parametrize("expression", REJECTED)
+def test_rejects_what_pint_rejects(expression):
+    import pint
+    with pytest.raises(pint.UndefinedUnitError):
+        get_pint_ureg().Quantity(1.0, expression)
+    assert parse_unit(expression) is None
+
+
+@pytest.mark.parametrize("expression", PINT_EXPLICIT)
+def test_leaves_pint_names_to_pint(expression):
+    assert parse_unit(expression) is None
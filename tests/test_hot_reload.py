@@ -0,0 +1,116 @@
+"""
+Hot-Reload (reload_changed_tools): Ändern, Hinzufügen, Löschen und fehlerhafte Module
+auf einem temporären tools/-Baum
+"""
+
+import sys
+import json
+import asyncio
+
+import pytest
+
+from engineering_mcp import registry, result_cache
+
+PARAMETERS = {"seite": "2 m"}
+
+
+@pytest.fixture
+def tools(tool_tree, monkeypatch):
+    # Meta-Tools liegen im echten tools/-Paket - für den Katalog hier nicht nötig
+    monkeypatch.setattr(registry, "_build_meta_tool_infos", lambda: [])
+    tool_tree.write_tool("quadrat")
+    tool_tree.write_tool("kreis")
+    tool_tree.unload()
+    registry.discover_engineering_tools_sync()
+    for name in ("quadrat", "kreis"):
+        _call(name)
+    return tool_tree
+
+
+def _call(tool_name):
+    return asyncio.run(registry.call_engineering_tool(tool_name, dict(PARAMETERS)))
+
+
+def _catalog_names():
+    return [info["name"] for info in registry.get_tool_catalog().engineering_tools]
+
+
+def _manifest_on_disk(tool_tree):
+    with open(tool_tree.manifest_path, encoding="utf-8") as f:
+        return json.load(f)["modules"]
+
+
+def test_unchanged_tree_does_nothing(tools):
+    version = registry.get_registry_version()
+    assert registry.reload_changed_tools() == {"reloaded": [], "added": [], "removed": [], "errors": []}
+    assert registry.get_registry_version() == version
+
+
+def test_edited_tool_is_swapped(tools):
+    old = registry._ENGINEERING_TOOLS_REGISTRY["quadrat"]
+    catalog = registry.get_tool_catalog()
+    tools.write_tool("quadrat", factor=2, description="Geändert")
+
+    assert registry.reload_changed_tools()["reloaded"] == ["quadrat"]
+    new = registry._ENGINEERING_TOOLS_REGISTRY["quadrat"]
+    assert new is not old and new.content_hash != old.content_hash
+    assert registry._ENGINEERING_TOOLS_REGISTRY["kreis"].content_hash == registry._MANIFEST_MODULES["tools.demo.kreis"]["content_hash"]
+
+    # Ergebnis-Cache nur für das geänderte Tool geleert, Katalog neu aufgebaut
+    assert "quadrat" not in result_cache._RESULT_CACHE
+    assert "kreis" in result_cache._RESULT_CACHE
+    assert registry.get_tool_catalog() is not catalog
+    assert registry.get_tool_catalog().engineering_tools[_catalog_names().index("quadrat")]["short_description"] == "Geändert"
+    assert _call("quadrat")["faktor"] == 2
+    assert _manifest_on_disk(tools)["tools.demo.quadrat"]["content_hash"] == new.content_hash
+
+
+def test_added_tool_is_registered(tools):
+    catalog = registry.get_tool_catalog()
+    tools.write_tool("dreieck")
+
+    assert registry.reload_changed_tools()["added"] == ["dreieck"]
+    assert "dreieck" in registry._ENGINEERING_TOOLS_REGISTRY
+    assert registry.get_tool_catalog() is not catalog
+    assert "dreieck" in _catalog_names()
+    assert _call("dreieck")["faktor"] == 1
+    # Bestehende Tools und ihr Cache bleiben unberührt
+    assert set(result_cache._RESULT_CACHE) >= {"quadrat", "kreis"}
+
+
+def test_deleted_tool_is_removed(tools):
+    tools.remove("tools/demo/quadrat.py")
+
+    assert registry.reload_changed_tools()["removed"] == ["quadrat"]
+    assert "quadrat" not in registry._ENGINEERING_TOOLS_REGISTRY
+    assert "tools.demo.quadrat" not in sys.modules
+    assert "tools.demo.quadrat" not in _manifest_on_disk(tools)
+    assert "quadrat" not in result_cache._RESULT_CACHE
+    assert _catalog_names() == ["kreis"]
+    with pytest.raises(ValueError, match="Unknown tool: quadrat"):
+        _call("quadrat")
+
+
+def test_syntax_error_keeps_old_entry(tools, capsys):
+    old = registry._ENGINEERING_TOOLS_REGISTRY["quadrat"]
+    version = registry.get_registry_version()
+    tools.write("tools/demo/quadrat.py", "def get_metadata(:\n")
+
+    assert registry.reload_changed_tools() == {"reloaded": [], "added": [], "removed": [], "errors": ["tools.demo.quadrat"]}
+    assert "ERROR: Failed to load tools.demo.quadrat" in capsys.readouterr().out
+    # Alter Eintrag bleibt aktiv und rechnet weiter
+    assert registry._ENGINEERING_TOOLS_REGISTRY["quadrat"] is old
+    assert registry.get_registry_version() == version
+    assert _call("quadrat")["faktor"] == 1
+
+    # Nach der Korrektur wird das Tool normal neu geladen
+    tools.write_tool("quadrat", factor=3)
+    assert registry.reload_changed_tools()["reloaded"] == ["quadrat"]
+    assert _call("quadrat")["faktor"] == 3
+
+
+def test_helper_change_clears_whole_result_cache(tools):
+    tools.write("tools/demo/hilfe.py", "FAKTOR = 2\n")
+    assert registry.reload_changed_tools() == {"reloaded": [], "added": [], "removed": [], "errors": []}
+    assert result_cache._RESULT_CACHE == {}
+    assert registry._MANIFEST_MODULES["tools.demo.hilfe"]["is_tool"] is False
@@ -0,0 +1,88 @@
+"""
+Tool-Manifest: lokale Abhängigkeiten, dependency_hash und Kaltstart ohne Import
+"""
+
+import os
+import sys
+
+from engineering_mcp import manifest, registry
+
+HELPER_IMPORT = "from tools.demo.hilfe import FAKTOR"
+
+
+def _discover(tool_tree):
+    tool_tree.unload()
+    registry.discover_engineering_tools_sync()
+    return registry._ENGINEERING_TOOLS_REGISTRY
+
+
+def test_dependencies_are_transitive_and_relative(tool_tree):
+    tool_tree.write("tools/demo/basis.py", "WERT = 1\n")
+    tool_tree.write("tools/demo/hilfe.py", "from .basis import WERT\nFAKTOR = WERT\n")
+    tool_path = tool_tree.write_tool("quadrat", imports=HELPER_IMPORT + "\nimport os")
+
+    dependencies = manifest.find_local_dependencies(str(tool_path))
+    assert [os.path.relpath(path, tool_tree.root) for path in dependencies] == [
+        os.path.join("tools", "demo", "basis.py"),
+        os.path.join("tools", "demo", "hilfe.py"),
+    ]
+
+
+def test_helper_change_invalidates_importing_tool(tool_tree):
+    tool_tree.write("tools/demo/hilfe.py", "FAKTOR = 2\n")
+    tool_tree.write_tool("quadrat", imports=HELPER_IMPORT)
+    tool_tree.write_tool("kreis")
+    _discover(tool_tree)
+    entry = dict(registry._MANIFEST_MODULES["tools.demo.quadrat"])
+    assert os.path.join("tools", "demo", "hilfe.py") in entry["dependencies"]
+
+    tool_tree.write("tools/demo/hilfe.py", "FAKTOR = 3\n")
+    assert manifest.entry_dependency_hash(entry) != entry["dependency_hash"]
+    tools = _discover(tool_tree)
+
+    # Nur das abhängige Tool wird neu importiert, das andere kommt aus dem Manifest
+    assert tools["quadrat"].function is not None
+    assert tools["kreis"].function is None
+    assert registry._MANIFEST_MODULES["tools.demo.quadrat"]["dependency_hash"] != entry["dependency_hash"]
+    assert registry._MANIFEST_MODULES["tools.demo.quadrat"]["content_hash"] == entry["content_hash"]
+
+
+def test_data_file_change_invalidates_entry_and_version(tool_tree):
+    tool_tree.write("tools/demo/tabelle.csv", "M10;1.5\n")
+    tool_tree.write_tool("gewinde", data_files=["tabelle.csv"])
+    record = _discover(tool_tree)["gewinde"]
+    assert os.path.join("tools", "demo", "tabelle.csv") in registry._MANIFEST_MODULES["tools.demo.gewinde"]["dependencies"]
+    version = registry._tool_version(record)
+    assert registry._tool_version(record) == version
+
+    tool_tree.write("tools/demo/tabelle.csv", "M10;1.5\nM12;1.75\n")
+    assert registry._tool_version(record) != version
+
+    record = _discover(tool_tree)["gewinde"]
+    assert record.function is not None
+    assert registry._tool_version(record) != version
+
+
+def test_matching_manifest_loads_without_import(tool_tree, capsys):
+    tool_tree.write("tools/demo/hilfe.py", "FAKTOR = 2\n")
+    tool_tree.write_tool("quadrat", imports=HELPER_IMPORT)
+    assert _discover(tool_tree)["quadrat"].function is not None
+    assert os.path.exists(tool_tree.manifest_path)
+    capsys.readouterr()
+
+    record = _discover(tool_tree)["quadrat"]
+    assert record.function is None
+    assert "tools.demo.quadrat" not in sys.modules
+    assert "tools.demo.hilfe" not in sys.modules
+    assert "INFO: Tool manifest: 2/2 modules loaded without import" in capsys.readouterr().out
+    assert record.metadata["parameters"]["seite"]["dimension"] == "length"
+    assert [check.parameter for check in record.dimension_checks] == ["seite"]
+
+
+def test_changed_tool_file_is_reimported(tool_tree):
+    tool_tree.write_tool("quadrat", description="Alt")
+    _discover(tool_tree)
+    tool_tree.write_tool("quadrat", description="Neu")
+    record = _discover(tool_tree)["quadrat"]
+    assert record.function is not None
+    assert record.short_description == "Neu"
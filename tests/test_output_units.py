@@ -0,0 +1,141 @@
+"""
+Tabellengesteuerte Ausgabe-Einheiten gegen die bisherige Logik
+
+Die Referenz-Funktionen unten sind die früheren optimize_length_unit/
+optimize_pressure_unit/optimize_area_unit (Präfix-Schleife bzw. Schwellen mit
+Pint-.to()). Für positive Werte muss die Tabelle dieselbe Einheit und denselben
+Wert liefern; negative Werte erhalten die Einheit ihres Betrags, 0 bleibt in SI.
+"""
+
+import pytest
+
+pytest.importorskip("pint")
+import numpy as np  # noqa: E402
+
+from engineering_mcp.units_utils import (  # noqa: E402
+    get_pint_ureg, optimize_output_unit, optimize_length_unit,
+    optimize_output_units_array, format_output_column
+)
+
+
+def _baseline_length(si_quantity):
+    ureg = get_pint_ureg()
+    magnitude = si_quantity.magnitude
+    prefixes = [
+        ('n', 1e-9), ('μ', 1e-6), ('m', 1e-3), ('c', 1e-2),
+        ('', 1), ('da', 1e1), ('h', 1e2), ('k', 1e3),
+        ('M', 1e6), ('G', 1e9), ('T', 1e12)
+    ]
+    best_prefix = ''
+    best_value = magnitude
+    for prefix, factor in prefixes:
+        test_value = magnitude / factor
+        if 0.1 <= test_value <= 1000 and abs(test_value - 1) < abs(best_value - 1):
+            best_prefix = prefix
+            best_value = test_value
+    return si_quantity.to(ureg(f"{best_prefix}m"))
+
+
+def _baseline_pressure(si_quantity):
+    ureg = get_pint_ureg()
+    magnitude = si_quantity.magnitude
+    if magnitude >= 1e9:
+        return si_quantity.to(ureg.gigapascal)
+    if magnitude >= 1e6:
+        return si_quantity.to(ureg.megapascal)
+    if magnitude >= 1e5:
+        return si_quantity.to(ureg.bar)
+    if magnitude >= 1e3:
+        return si_quantity.to(ureg.kilopascal)
+    return si_quantity.to(ureg.pascal)
+
+
+def _baseline_area(si_quantity):
+    ureg = get_pint_ureg()
+    magnitude = si_quantity.magnitude
+    if magnitude >= 1e6:
+        return si_quantity.to(ureg.kilometer ** 2)
+    if magnitude >= 1:
+        return si_quantity.to(ureg.meter ** 2)
+    if magnitude >= 0.01:
+        return si_quantity.to(ureg.decimeter ** 2)
+    if magnitude >= 0.0001:
+        return si_quantity.to(ureg.centimeter ** 2)
+    return si_quantity.to(ureg.millimeter ** 2)
+
+
+BASELINES = {
+    "meter": _baseline_length,
+    "pascal": _baseline_pressure,
+    "meter ** 2": _baseline_area,
+}
+
+MAGNITUDES = sorted(
+    {mantissa * 10.0 ** exponent for exponent in range(-11, 15) for mantissa in (1.0, 1.7, 1.82, 2.0, 5.0, 9.99)}
+    | {0.1, 0.19, 0.198, 0.2, 1.818, 1.819, 18.18, 18.19, 181.8, 181.9, 1e5, 1e6, 1e9}
+)
+
+# Alte Präfix-Schleife: 1e-10 / 1e-9 ergibt 0.0999... < 0.1 (Rundung) - die Tabelle
+# wählt hier mathematisch korrekt 0.1 nm statt 1e-10 m
+BASELINE_ROUNDING_ARTIFACTS = {("meter", 1e-10)}
+
+
+def _quantity(magnitude, unit):
+    return get_pint_ureg().Quantity(magnitude, unit)
+
+
+@pytest.mark.parametrize("si_unit", sorted(BASELINES))
+def test_positive_values_match_baseline(si_unit):
+    baseline = BASELINES[si_unit]
+    for magnitude in MAGNITUDES:
+        if (si_unit, magnitude) in BASELINE_ROUNDING_ARTIFACTS:
+            continue
+        expected = baseline(_quantity(magnitude, si_unit))
+        actual = optimize_output_unit(_quantity(magnitude, si_unit), "mm")
+        assert str(actual.units) == str(expected.units), magnitude
+        assert actual.magnitude == pytest.approx(expected.magnitude, rel=1e-12), magnitude
+
+
+@pytest.mark.parametrize("si_unit", sorted(BASELINES) + ["meter ** 3", "newton"])
+def test_negative_values_use_unit_of_magnitude(si_unit):
+    for magnitude in MAGNITUDES:
+        positive = optimize_output_unit(_quantity(magnitude, si_unit))
+        negative = optimize_output_unit(_quantity(-magnitude, si_unit))
+        assert str(negative.units) == str(positive.units), magnitude
+        assert negative.magnitude == -positive.magnitude
+
+
+@pytest.mark.parametrize("si_unit", sorted(BASELINES) + ["meter ** 3", "newton"])
+def test_zero_stays_si(si_unit):
+    result = optimize_output_unit(_quantity(0.0, si_unit))
+    assert str(result.units) == si_unit
+    assert result.magnitude == 0.0
+
+
+def test_reference_unit_does_not_change_selection():
+    quantity = _quantity(0.05, "meter")
+    assert str(optimize_length_unit(quantity).units) == str(optimize_length_unit(quantity, "km").units)
+
+
+def test_untabled_dimension_unchanged():
+    quantity = _quantity(3.0, "second")
+    assert optimize_output_unit(quantity, "s") is quantity
+
+
+@pytest.mark.parametrize("si_unit", sorted(BASELINES) + ["meter ** 3", "newton"])
+def test_array_matches_scalar(si_unit):
+    values = [sign * magnitude for magnitude in MAGNITUDES for sign in (1, -1)] + [0.0, float("nan")]
+    column = optimize_output_units_array(values, _quantity(1.0, si_unit).dimensionality)
+    for value, display, index in zip(values, column.values, column.unit_index):
+        if value != value:
+            assert np.isnan(display)
+            continue
+        scalar = optimize_output_unit(_quantity(value, si_unit))
+        assert column.unit_strs[index] == str(scalar.units)
+        assert display == pytest.approx(scalar.magnitude, rel=1e-12)
+
+
+def test_format_output_column():
+    assert format_output_column([0.0125, -0.0125, float("nan")], "length") == [
+        "1.25 centimeter", "-1.25 centimeter", None
+    ]
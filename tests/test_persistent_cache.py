@@ -0,0 +1,156 @@
+"""
+Persistenter Ergebnis-Cache (SQLite): Schreiben/Lesen über den Writer-Thread,
+Invalidierung über die Tool-Version und Zusammenspiel mit dem LRU-Cache
+"""
+
+import sqlite3
+import threading
+
+import numpy as np
+import pytest
+
+from engineering_mcp import persistent_cache, result_cache
+
+TOOL = "test_tool"
+PARAMETERS = {"flaeche": "target", "radius": "5 cm"}
+RESULT = {"gegebene_werte": {"radius": "5 cm"}, "ergebnis": {"flaeche": "78.5398 centimeter ** 2"}}
+
+
+@pytest.fixture(autouse=True)
+def cache_file(tmp_path, monkeypatch):
+    path = tmp_path / "result_cache.sqlite3"
+    monkeypatch.setattr(persistent_cache, "PERSISTENT_CACHE_PATH", str(path))
+    monkeypatch.setattr(persistent_cache, "PERSISTENT_CACHE_ENABLED", True)
+    monkeypatch.setattr(persistent_cache, "_DISABLED", False)
+    monkeypatch.setattr(persistent_cache, "_LOCAL", threading.local())
+    monkeypatch.setattr(persistent_cache, "_STATS", {"hits": 0, "misses": 0, "written": 0, "skipped": 0})
+    monkeypatch.setattr(result_cache, "_RESULT_CACHE", {})
+    monkeypatch.setattr(result_cache, "_CACHE_STATS", {})
+    yield path
+    persistent_cache.shutdown_persistent_cache()
+    # Einträge, die ein abgebrochener Writer nicht mehr geschrieben hat
+    while not persistent_cache._WRITE_QUEUE.empty():
+        persistent_cache._WRITE_QUEUE.get_nowait()
+
+
+def _restart():
+    """Ausstehende Einträge schreiben, danach wie ein neuer Prozess mit frischer Lese-Verbindung"""
+    persistent_cache.shutdown_persistent_cache()
+    connection = getattr(persistent_cache._LOCAL, "connection", None)
+    if connection is not None:
+        connection.close()
+    persistent_cache._LOCAL = threading.local()
+
+
+def _key(version, parameters=PARAMETERS):
+    return result_cache.make_cache_key(version, parameters)
+
+
+def test_round_trip():
+    persistent_cache.store(TOOL, _key("v1"), PARAMETERS, RESULT)
+    _restart()
+    assert persistent_cache.load(TOOL, _key("v1")) == (RESULT, PARAMETERS)
+    assert persistent_cache.get_persistent_cache_stats()["written"] == 1
+
+
+def test_other_version_or_tool_misses():
+    persistent_cache.store(TOOL, _key("v1"), PARAMETERS, RESULT)
+    _restart()
+    assert persistent_cache.load(TOOL, _key("v2")) is None
+    assert persistent_cache.load("other_tool", _key("v1")) is None
+    assert persistent_cache.get_persistent_cache_stats()["misses"] == 2
+
+
+def test_numpy_scalars_are_stored_as_numbers():
+    result = {"anzahl": np.int64(3), "wert": np.float64(2.5)}
+    persistent_cache.store(TOOL, _key("v1"), PARAMETERS, result)
+    _restart()
+    assert persistent_cache.load(TOOL, _key("v1"))[0] == {"anzahl": 3, "wert": 2.5}
+
+
+def test_results_that_change_in_json_are_skipped():
+    persistent_cache.store(TOOL, _key("v1"), PARAMETERS, {"punkt": (1, 2)})
+    persistent_cache.store(TOOL, _key("v1", {"radius": "6 cm"}), PARAMETERS, {"wert": float("nan")})
+    _restart()
+    assert persistent_cache.load(TOOL, _key("v1")) is None
+    assert persistent_cache.get_persistent_cache_stats()["skipped"] == 2
+
+
+def test_oldest_rows_are_trimmed(cache_file, monkeypatch):
+    monkeypatch.setattr(persistent_cache, "PERSISTENT_MAX_ROWS", 3)
+    old = [_key("v1", {"radius": f"{i} cm"}) for i in range(2)]
+    new = [_key("v1", {"radius": f"{i} cm"}) for i in range(2, 5)]
+    for key in old:
+        persistent_cache.store(TOOL, key, PARAMETERS, RESULT)
+    _restart()
+    for key in new:
+        persistent_cache.store(TOOL, key, PARAMETERS, RESULT)
+    _restart()
+
+    with sqlite3.connect(cache_file) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM results").fetchone()[0] == 3
+    assert all(persistent_cache.load(TOOL, key) is None for key in old)
+    assert all(persistent_cache.load(TOOL, key) is not None for key in new)
+
+
+def test_database_error_disables_cache(tmp_path, monkeypatch, capsys):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    # Verzeichnis nicht anlegbar (Datei im Weg) - Cache aus statt Fehler im Tool-Aufruf
+    monkeypatch.setattr(persistent_cache, "PERSISTENT_CACHE_PATH", str(blocker / "cache.sqlite3"))
+    assert persistent_cache.load(TOOL, _key("v1")) is None
+    assert not persistent_cache.persistent_cache_enabled()
+    assert "Persistent result cache disabled" in capsys.readouterr().out
+    persistent_cache.store(TOOL, _key("v1"), PARAMETERS, RESULT)
+    assert persistent_cache.get_persistent_cache_stats()["pending"] == 0
+
+
+def test_second_level_fills_memory_cache_and_respells():
+    key = _key("v1")
+    result_cache.store_result(TOOL, key, PARAMETERS, RESULT, persistent=True)
+    _restart()
+    result_cache.clear_result_cache()
+
+    current = {"flaeche": "target", "radius": "5.0 cm"}
+    assert result_cache.get_cached_result(TOOL, key, current) is None
+    loaded = result_cache.load_persistent_result(TOOL, key, current)
+    assert loaded["gegebene_werte"] == {"radius": "5.0 cm"}
+    assert loaded["ergebnis"] == RESULT["ergebnis"]
+    assert result_cache.get_cached_result(TOOL, key, PARAMETERS) == RESULT
+
+
+def test_tool_version_follows_data_files(tmp_path, monkeypatch):
+    from engineering_mcp import registry
+
+    (tmp_path / "tool.py").write_text("")
+    table = tmp_path / "tabelle.csv"
+    table.write_text("M10;1.5\n")
+    record = registry.ToolRecord("data_tool", "test", "tests.data_tool", "content-hash", (), "none",
+                                 {"data_files": ["tabelle.csv"], "persistent_cache": True})
+    monkeypatch.setitem(registry._MANIFEST_MODULES, record.module_path,
+                        {"file_path": str(tmp_path / "tool.py"), "dependency_hash": "deps-1"})
+
+    version = registry._tool_version(record)
+    assert registry._tool_version(record) == version
+    persistent_cache.store(record.name, _key(version), PARAMETERS, RESULT)
+    _restart()
+    assert persistent_cache.load(record.name, _key(version)) is not None
+
+    table.write_text("M10;1.5\nM12;1.75\n")
+    changed = registry._tool_version(record)
+    assert changed != version
+    assert persistent_cache.load(record.name, _key(changed)) is None
+
+    monkeypatch.setitem(registry._MANIFEST_MODULES, record.module_path,
+                        {"file_path": str(tmp_path / "tool.py"), "dependency_hash": "deps-2"})
+    assert registry._tool_version(record) not in (version, changed)
+
+
+def test_writer_open_error_disables_cache(tmp_path, monkeypatch, capsys):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    monkeypatch.setattr(persistent_cache, "PERSISTENT_CACHE_PATH", str(blocker / "cache.sqlite3"))
+    persistent_cache.store(TOOL, _key("v1"), PARAMETERS, RESULT)
+    persistent_cache._WRITER.join(5)
+    assert not persistent_cache.persistent_cache_enabled()
+    assert "Persistent result cache disabled (open failed" in capsys.readouterr().out
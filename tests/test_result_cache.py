@@ -0,0 +1,108 @@
+"""
+Ergebnis-Cache: Schlüssel (normalisierte SI-Werte) und Schreibweise der Eingaben in Treffern
+"""
+
+import pytest
+
+from engineering_mcp import result_cache
+from engineering_mcp.result_cache import make_cache_key, store_result, get_cached_result
+
+TOOL = "test_tool"
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(result_cache, "_RESULT_CACHE", {})
+    monkeypatch.setattr(result_cache, "_CACHE_STATS", {})
+
+
+def _key(**parameters):
+    return make_cache_key("v1", parameters)
+
+
+def test_key_ignores_spelling_of_same_value():
+    assert _key(radius="5 cm") == _key(radius="5.0 cm") == _key(radius=" 5.000 cm ")
+
+
+def test_key_keeps_unit_and_value():
+    assert _key(radius="5 cm") != _key(radius="50 mm")
+    assert _key(radius="5 cm") != _key(radius="6 cm")
+
+
+def test_key_target_and_raw_values():
+    assert _key(flaeche="target") == _key(flaeche="TARGET")
+    assert _key(schraube="M10") != _key(schraube="M12")
+    assert _key(schraube="M10") == _key(schraube=" M10")
+
+
+def test_key_contains_version():
+    assert make_cache_key("v1", {"radius": "5 cm"}) != make_cache_key("v2", {"radius": "5 cm"})
+
+
+def test_batches_and_sweeps_are_not_cached():
+    assert _key(radius=["5 cm", "6 cm"]) is None
+    assert _key(radius={"linspace": ["1 cm", "5 cm", 5]}) is None
+
+
+def _rectangle_result(laenge, breite):
+    return {
+        "gegebene_werte": {"laenge": laenge, "breite": breite},
+        "ergebnis": {"flaeche": "25 centimeter ** 2"},
+        "hinweis": laenge,
+        "details": [{"wert": laenge}],
+    }
+
+
+def test_hit_respells_each_parameter_separately():
+    stored = {"flaeche": "target", "laenge": "5 cm", "breite": "5 cm"}
+    key = make_cache_key("v1", stored)
+    store_result(TOOL, key, stored, _rectangle_result("5 cm", "5 cm"))
+
+    current = {"flaeche": "target", "laenge": "5.0 cm", "breite": "5 cm"}
+    assert make_cache_key("v1", current) == key
+    result = get_cached_result(TOOL, key, current)
+
+    assert result["gegebene_werte"] == {"laenge": "5.0 cm", "breite": "5 cm"}
+    # Gleicher String außerhalb der Echo-Abschnitte bleibt unverändert
+    assert result["hinweis"] == "5 cm"
+    assert result["details"] == [{"wert": "5 cm"}]
+
+
+def test_hit_respells_swapped_spellings():
+    stored = {"laenge": "5 cm", "breite": "5.0 cm"}
+    key = make_cache_key("v1", stored)
+    store_result(TOOL, key, stored, {"gegebene_werte": dict(stored), "input_parameters": dict(stored)})
+
+    current = {"laenge": "5.0 cm", "breite": "5 cm"}
+    result = get_cached_result(TOOL, key, current)
+    assert result["gegebene_werte"] == current
+    assert result["input_parameters"] == current
+
+
+def test_hit_returns_copy():
+    parameters = {"laenge": "5 cm", "breite": "5 cm"}
+    key = make_cache_key("v1", parameters)
+    store_result(TOOL, key, parameters, _rectangle_result("5 cm", "5 cm"))
+
+    first = get_cached_result(TOOL, key, parameters)
+    first["gegebene_werte"]["laenge"] = "changed"
+    assert get_cached_result(TOOL, key, parameters)["gegebene_werte"]["laenge"] == "5 cm"
+
+
+def test_errors_are_not_stored():
+    parameters = {"laenge": "5 cm"}
+    key = make_cache_key("v1", parameters)
+    store_result(TOOL, key, parameters, {"error": "ungültig"})
+    assert get_cached_result(TOOL, key, parameters) is None
+
+
+def test_respelled_hit_matches_fresh_calculation():
+    pytest.importorskip("pint")
+    from tools.geometry.Flaechen.rechteck import calculate
+
+    stored = {"flaeche": "target", "laenge": "5 cm", "breite": "5 cm"}
+    key = make_cache_key("v1", stored)
+    store_result(TOOL, key, stored, calculate(**stored))
+
+    current = {"flaeche": "target", "laenge": "5.0 cm", "breite": "5 cm"}
+    assert get_cached_result(TOOL, key, current) == calculate(**current)
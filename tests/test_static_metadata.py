@@ -0,0 +1,124 @@
+"""
+Statische Metadaten-Extraktion (ast): Konstanten, Zeilennummern und get_metadata()-Literale
+"""
+
+import os
+import textwrap
+import importlib
+
+import pytest
+
+from engineering_mcp import static_metadata
+from engineering_mcp.static_metadata import parse_static_metadata, extract_static_metadata, get_static_tool_info
+
+
+def _parse(source):
+    return parse_static_metadata(textwrap.dedent(source))
+
+
+def test_multi_line_tags_keep_start_and_end_line():
+    parsed = _parse('''\
+        TOOL_NAME = "kreis_flaeche"
+        TOOL_TAGS = [
+            "elementar",
+            "geometrie",
+        ]
+        HAS_SOLVING = "symbolic"
+    ''')
+    assert parsed["constants"]["TOOL_TAGS"] == ["elementar", "geometrie"]
+    assert parsed["line_numbers"] == {"TOOL_NAME": (1, 1), "TOOL_TAGS": (2, 5), "HAS_SOLVING": (6, 6)}
+
+
+def test_non_literal_reassignment_drops_constant():
+    parsed = _parse('''\
+        TOOL_TAGS = ["elementar"]
+        TOOL_TAGS = sorted(TOOL_TAGS)
+        TOOL_NAME = "alt"
+        TOOL_NAME = "neu"
+    ''')
+    assert "TOOL_TAGS" not in parsed["constants"]
+    assert "TOOL_TAGS" not in parsed["line_numbers"]
+    assert parsed["constants"]["TOOL_NAME"] == "neu"
+    assert parsed["line_numbers"]["TOOL_NAME"] == (4, 4)
+
+
+def test_f_strings_and_concatenation():
+    parsed = _parse('''\
+        PARAM = "radius"
+        COUNT = 2
+        DESC = f"{PARAM} mit Einheit ({COUNT} Werte)"
+        JOINED = "Kreis" + " - " + PARAM
+        TAGS = ["a"] + ["b"]
+        NEGATIVE = -COUNT
+        FORMATTED = f"{COUNT:.2f}"
+        MIXED = "a" + COUNT
+        UNKNOWN = f"{UNDEFINED}"
+    ''')
+    constants = parsed["constants"]
+    assert constants["DESC"] == "radius mit Einheit (2 Werte)"
+    assert constants["JOINED"] == "Kreis - radius"
+    assert constants["TAGS"] == ["a", "b"]
+    assert constants["NEGATIVE"] == -2
+    assert not {"FORMATTED", "MIXED", "UNKNOWN"} & set(constants)
+
+
+def test_get_metadata_dict_literals():
+    parsed = _parse('''\
+        def get_metadata():
+            return {
+                "tool_name": NAME,
+                "tags": ["schrauben"],
+                "has_solving": "none",
+                "parameters": build_parameters(),
+                **EXTRA,
+            }
+
+        NAME = "schrauben_" + "tabelle"
+    ''')
+    # Konstanten nach der Funktion sind beim Aufruf bereits definiert
+    assert parsed["get_metadata"] == {"tool_name": "schrauben_tabelle", "tags": ["schrauben"], "has_solving": "none"}
+
+
+def test_code_is_never_executed():
+    parsed = _parse('''\
+        import os
+        os.remove("/does/not/exist")
+        raise SystemExit(1)
+        TOOL_NAME = "sicher"
+    ''')
+    assert parsed["constants"] == {"TOOL_NAME": "sicher"}
+
+
+def test_tool_info_from_get_metadata_and_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(static_metadata, "_STATIC_METADATA_CACHE", {})
+    path = tmp_path / "demo_tool.py"
+    path.write_text('def get_metadata():\n    return {"tool_name": "demo", "tool_tags": ["elementar"]}\n')
+
+    info = get_static_tool_info(str(path))
+    assert info == {"tool_name": "demo", "tags": ["elementar"], "has_solving": None, "short_description": None}
+    assert extract_static_metadata(str(path)) is extract_static_metadata(str(path))
+
+    path.write_text('TOOL_NAME = "umbenannt"\nTOOL_TAGS = ["mechanik"]\n')
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert get_static_tool_info(str(path))["tool_name"] == "umbenannt"
+    assert get_static_tool_info(str(path))["tags"] == ["mechanik"]
+
+
+def test_syntax_error_gives_empty_result(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(static_metadata, "_STATIC_METADATA_CACHE", {})
+    path = tmp_path / "kaputt.py"
+    path.write_text("TOOL_NAME = (\n")
+    assert extract_static_metadata(str(path)) == {"constants": {}, "line_numbers": {}, "get_metadata": {}}
+    assert "Static metadata extraction failed" in capsys.readouterr().out
+    assert get_static_tool_info(str(path))["tool_name"] == "kaputt"
+
+
+@pytest.mark.parametrize("module", ["tools.geometry.Flaechen.circle_area", "tools.pressure.kesselformel"])
+def test_matches_imported_metadata(module):
+    tool = importlib.import_module(module)
+    metadata = tool.get_metadata()
+    info = get_static_tool_info(tool.__file__)
+    assert info["tool_name"] == metadata["tool_name"]
+    assert info["tags"] == list(metadata.get("tags") or metadata.get("tool_tags"))
+    assert info["has_solving"] == metadata["has_solving"]
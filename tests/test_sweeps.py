@@ -0,0 +1,136 @@
+"""
+Parameter-Sweeps: Expansion (Werte, Reihenfolge, SI-Spalten), Grenzen und Fehlerfälle
+"""
+
+import re
+import asyncio
+import importlib
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pint")
+from engineering_mcp import sweeps  # noqa: E402
+from engineering_mcp.sweeps import SweepError, SweepColumn, expand_sweeps, has_sweeps  # noqa: E402
+from engineering_mcp.units_utils import convert_column_to_si  # noqa: E402
+
+
+def _plain_si(column):
+    """SI-Werte, wie convert_column_to_si() sie aus den Strings berechnen würde"""
+    return convert_column_to_si(list(column)).si_values
+
+
+def test_linspace_values_and_strings():
+    expanded = expand_sweeps({"druck": {"linspace": ["10 bar", "20 bar", 3]}, "wanddicke": "target"})
+    assert list(expanded["druck"]) == ["10 bar", "15 bar", "20 bar"]
+    assert expanded["wanddicke"] == ["target"] * 3
+
+
+def test_logspace_and_count_as_string():
+    expanded = expand_sweeps({"radius": {"logspace": ["1 mm", "1 m", "4"]}})
+    assert list(expanded["radius"]) == ["1 mm", "10 mm", "100 mm", "1000 mm"]
+
+
+def test_grid_converts_to_unit_of_first_value():
+    expanded = expand_sweeps({"laenge": {"grid": ["1 m", "50 cm", "3 mm"]}})
+    assert list(expanded["laenge"]) == ["1 m", "0.5 m", "0.003 m"]
+
+
+def test_product_first_parameter_varies_slowest():
+    expanded = expand_sweeps({
+        "laenge": {"grid": ["1 m", "2 m"]},
+        "breite": {"grid": ["1 cm", "2 cm", "3 cm"]},
+        "flaeche": "target",
+    })
+    assert list(expanded["laenge"]) == ["1 m"] * 3 + ["2 m"] * 3
+    assert list(expanded["breite"]) == ["1 cm", "2 cm", "3 cm"] * 2
+    assert expanded["flaeche"] == ["target"] * 6
+
+
+def test_sweep_columns_carry_exact_si_values():
+    expanded = expand_sweeps({"druck": {"linspace": ["10 bar", "300 bar", 37]},
+                              "radius": {"logspace": ["1 mm", "1 m", 11]}})
+    for column in (expanded["druck"], expanded["radius"]):
+        assert isinstance(column, SweepColumn)
+        np.testing.assert_array_equal(column.conversion.si_values, _plain_si(column))
+
+
+def test_slices_and_row_selection_keep_si_values():
+    column = expand_sweeps({"druck": {"linspace": ["10 bar", "300 bar", 20]}})["druck"]
+    part = column[5:12]
+    picked = column.take([3, 3, 19])
+    for sub in (part, picked):
+        assert isinstance(sub, SweepColumn)
+        np.testing.assert_array_equal(sub.conversion.si_values, _plain_si(sub))
+    assert list(picked) == [column[3], column[3], column[19]]
+
+
+def test_sweep_batch_equals_list_batch():
+    module = importlib.import_module("tools.pressure.kesselformel")
+    params = {"druck": {"linspace": ["10 bar", "300 bar", 25]}, "durchmesser": {"grid": ["500 mm", "1 m"]},
+              "wanddicke": "target", "zulaessige_spannung": "160 MPa"}
+    expanded = expand_sweeps(params)
+    plain = {name: list(column) for name, column in expanded.items()}
+    assert module.calculate(**expanded) == module.calculate(**plain)
+
+
+@pytest.mark.parametrize("spec, message", [
+    ({"linspace": ["1 mm", "2 mm"]}, "erwartet [start, stop, anzahl]"),
+    ({"linspace": ["1 mm", "2 mm", 1]}, "anzahl muss eine ganze Zahl >= 2"),
+    ({"linspace": ["1 mm", "2 mm", 2.5]}, "anzahl muss eine ganze Zahl >= 2"),
+    ({"logspace": ["0 mm", "2 mm", 3]}, "positive Start- und Stoppwerte"),
+    ({"linspace": ["1 mm", "2 bar", 3]}, "andere Dimension"),
+    ({"grid": []}, "nicht-leere Liste"),
+    ({"grid": ["1 mm", 2]}, "Strings mit Einheit"),
+    ({"grid": ["1 mm", "abc"]}, "kein gültiger Wert mit Einheit"),
+])
+def test_invalid_specs(spec, message):
+    with pytest.raises(SweepError, match=re.escape(message)) as info:
+        expand_sweeps({"radius": spec, "flaeche": "target"})
+    assert info.value.parameter == "radius"
+
+
+def test_lists_and_sweeps_cannot_be_mixed():
+    with pytest.raises(SweepError, match="nicht gemischt"):
+        expand_sweeps({"radius": {"grid": ["1 mm"]}, "flaeche": ["target"]})
+
+
+def test_row_limits(monkeypatch):
+    monkeypatch.setattr(sweeps, "SWEEP_MAX_ROWS", 100)
+    with pytest.raises(SweepError, match="überschreitet das Maximum von 100"):
+        expand_sweeps({"radius": {"linspace": ["1 mm", "2 mm", 101]}})
+    with pytest.raises(SweepError, match="ergibt 121 Zeilen") as info:
+        expand_sweeps({"a": {"linspace": ["1 mm", "2 mm", 11]}, "b": {"linspace": ["1 mm", "2 mm", 11]}})
+    assert info.value.parameter == "a, b"
+    assert len(expand_sweeps({"a": {"linspace": ["1 mm", "2 mm", 10]},
+                              "b": {"linspace": ["1 mm", "2 mm", 10]}})["a"]) == 100
+
+
+@pytest.mark.parametrize("kind, suggestion", [("linspce", "linspace"), ("Grid", "grid"), ("logspac", "logspace")])
+def test_misspelled_kind_is_rejected(kind, suggestion):
+    params = {"radius": {kind: ["1 mm", "2 mm", 3]}, "flaeche": "target"}
+    assert has_sweeps(params)
+    with pytest.raises(SweepError, match=f"Unbekannte Sweep-Angabe '{kind}'") as info:
+        expand_sweeps(params)
+    assert sweeps.SWEEP_KINDS[suggestion] in str(info.value)
+
+
+def test_other_dicts_are_plain_values():
+    params = {"gewinde_bereich": {"von": "M6", "bis": "M12"}, "festigkeitsklasse": "8.8"}
+    assert not has_sweeps(params)
+    assert not has_sweeps({"filter": {"norm": "ISO"}})
+
+
+def test_registry_expands_sweeps_before_solving():
+    from engineering_mcp.registry import ensure_tools_discovered, call_engineering_tool
+
+    ensure_tools_discovered()
+    result = asyncio.run(call_engineering_tool(
+        "kreis_flaeche", {"flaeche": "target", "radius": {"linspace": ["1 cm", "10 cm", 10]}}
+    ))
+    assert result["total_calculations"] == 10 and result["successful"] == 10
+    assert [row["input_combination"]["radius"] for row in result["results"]][:3] == ["1 cm", "2 cm", "3 cm"]
+    with pytest.raises(SweepError, match="gemeint ist wohl"):
+        asyncio.run(call_engineering_tool(
+            "kreis_flaeche", {"flaeche": "target", "radius": {"linspce": ["1 cm", "10 cm", 10]}}
+        ))
@@ -0,0 +1,92 @@
+"""
+Vorberechnete Tool-Details: ETag, not_modified-Antworten und Invalidierung nach Hot-Reload
+"""
+
+import asyncio
+import importlib
+
+import pytest
+
+from engineering_mcp import registry
+
+
+def _details(tool_name, known_etag=None):
+    return asyncio.run(registry.get_tool_details(tool_name, known_etag=known_etag))
+
+
+@pytest.fixture
+def tools(tool_tree, monkeypatch):
+    monkeypatch.setattr(registry, "_build_meta_tool_infos", lambda: [])
+    tool_tree.write_tool("quadrat", description="Quadrat")
+    tool_tree.unload()
+    registry.discover_engineering_tools_sync()
+    return tool_tree
+
+
+def test_unchanged_tool_returns_not_modified(tools):
+    details = _details("quadrat")
+    etag = details["etag"]
+    assert details["short_description"] == "Quadrat"
+    assert registry.get_tool_details_etag("quadrat") == etag
+
+    assert _details("quadrat", known_etag=etag) == {"tool_name": "quadrat", "etag": etag, "not_modified": True}
+    assert _details("quadrat", known_etag="veraltet") == details
+    assert _details("quadrat") == details
+
+
+def test_returned_details_are_a_copy(tools):
+    details = _details("quadrat")
+    details["execution_unlocked"] = True
+    assert "execution_unlocked" not in _details("quadrat")
+
+
+def test_metadata_change_changes_etag(tools):
+    etag = _details("quadrat")["etag"]
+    tools.write_tool("quadrat", description="Quadrat (überarbeitet)")
+    assert registry.reload_changed_tools()["reloaded"] == ["quadrat"]
+
+    details = _details("quadrat", known_etag=etag)
+    assert not details.get("not_modified")
+    assert details["short_description"] == "Quadrat (überarbeitet)"
+    assert details["etag"] != etag
+    assert _details("quadrat", known_etag=details["etag"])["not_modified"]
+
+
+def test_code_change_without_new_documentation_keeps_etag(tools):
+    before = _details("quadrat")["etag"]
+    tools.write_tool("quadrat", description="Quadrat", factor=2)
+    assert registry.reload_changed_tools()["reloaded"] == ["quadrat"]
+
+    # Dokument neu gebaut (neuer Registry-Eintrag), Inhalt und damit ETag gleich
+    record, _, etag = registry._TOOL_DETAILS_CACHE["quadrat"]
+    assert record is registry._ENGINEERING_TOOLS_REGISTRY["quadrat"]
+    assert etag == before
+    assert _details("quadrat", known_etag=etag)["not_modified"]
+
+
+def test_unknown_or_removed_tool_raises(tools):
+    etag = _details("quadrat")["etag"]
+    with pytest.raises(ValueError, match="Unknown tool: gibt_es_nicht"):
+        _details("gibt_es_nicht", known_etag=etag)
+
+    tools.remove("tools/demo/quadrat.py")
+    registry.reload_changed_tools()
+    assert "quadrat" not in registry._TOOL_DETAILS_CACHE
+    with pytest.raises(ValueError, match="Unknown tool: quadrat"):
+        _details("quadrat", known_etag=etag)
+
+
+def test_meta_tool_unlocks_on_not_modified_and_rejects_unknown_tools():
+    from tools.Meta.session_state import is_whitelisted
+
+    registry.ensure_tools_discovered()
+    get_tool_details = importlib.import_module("tools.Meta.2_get_tool_details").get_tool_details
+
+    etag = asyncio.run(get_tool_details("kreis_flaeche"))["etag"]
+    result = asyncio.run(get_tool_details("kreis_flaeche", known_etag=etag))
+    assert result["not_modified"] and result["execution_unlocked"]
+    assert is_whitelisted("kreis_flaeche")
+
+    result = asyncio.run(get_tool_details("gibt_es_nicht", known_etag=etag))
+    assert result["error"].startswith("Unknown tool: gibt_es_nicht")
+    assert not is_whitelisted("gibt_es_nicht")
@@ -7,6 +7,7 @@ Einstiegspunkt für neue Benutzer und Referenz für den korrekten Workflow.
 """
 
 from typing import Dict
+from engineering_mcp.startup_profile import get_startup_report
 
 def server_informations() -> Dict:
     """
@@ -14,6 +15,7 @@ def server_informations() -> Dict:
     
     Returns:
         Dict: Umfassende Serverdokumentation mit Workflow-Anweisungen
+        und Startup-Profil (Summen und Phasen - Module pro Pfad nur unter /admin/startup)
     """
     
     server_info = """# Engineering Calculation Server - geprüfte Berechnungstools, Tabellenwerke und Informationen für Ingenieure
@@ -189,7 +191,8 @@ WICHTIGE REGELN:
             "Batch-Mode für Massenberechnungen verfügbar"
         ],
         "tool_type": "meta",
-        "workflow_position": "0/3 - Serverinformationen und Einstiegshilfe"
+        "workflow_position": "0/3 - Serverinformationen und Einstiegshilfe",
+        "startup_profile": get_startup_report(top_n=0)
     }
 
 # Tool-Metadaten für Registry
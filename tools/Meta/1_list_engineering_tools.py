@@ -6,28 +6,33 @@ Listet verfügbare Engineering-Tools auf – der Einstiegspunkt für Tool‑Disc
 Erster Schritt im 3‑stufigen Discovery‑Workflow.
 """
 
-from typing import Dict, List, Annotated
+from typing import Dict, List, Annotated, Tuple
 from pydantic import Field
-import asyncio
 from engineering_mcp.registry import (
     get_tool_info_for_llm,
-    discover_engineering_tools,
+    ensure_tools_discovered,
+    query_tools_by_tags,
+    get_tag_overview,
+    get_tag_counts,
     _ENGINEERING_TOOLS_REGISTRY,
 )
 
 # Tag‑Definitionen werden LAZY geladen um Circular Imports zu vermeiden
 
 def _create_dynamic_tags_field():
-    """Erstellt ein Pydantic‑Field für den *tags*‑Parameter ohne enum‑Einschränkung."""
+    """
+    Erstellt ein Pydantic‑Field für den *tags*‑Parameter ohne enum‑Einschränkung.
+
+    Wird beim Import ausgewertet (vor der Discovery) - verwendet daher nur die
+    zentral gepflegten Tag-Beschreibungen und löst KEINE Tool-Discovery aus.
+    """
     try:
-        from engineering_mcp.tag_definitions import get_tag_definitions
+        from engineering_mcp.tag_definitions import TAG_DESCRIPTIONS
 
-        tag_defs = get_tag_definitions()
         tag_descriptions = {
             "all": "Complete overview - Shows all available Engineering tools (full library overview)"
         }
-        for tag, data in tag_defs.items():
-            tag_descriptions[tag] = data["description"]
+        tag_descriptions.update(TAG_DESCRIPTIONS)
 
         return Field(
             description="REQUIRED: Tags for filtering tools; see 'tag_descriptions' for details",
@@ -60,6 +65,23 @@ def _create_dynamic_tags_field():
         )
 
 
+def _split_tag_query(tags: List[str]) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Zerlegt die Tag-Liste in ODER-, UND- und NICHT-Tags.
+
+    "tag" → ODER, "+tag" → UND (muss vorhanden sein), "-tag" → NICHT (ausschließen)
+    """
+    any_of, all_of, none_of = [], [], []
+    for tag in tags:
+        if tag.startswith("+") and len(tag) > 1:
+            all_of.append(tag[1:])
+        elif tag.startswith("-") and len(tag) > 1:
+            none_of.append(tag[1:])
+        elif tag:
+            any_of.append(tag)
+    return any_of, all_of, none_of
+
+
 # ------------------------------------------------------------
 # Hauptfunktion: list_engineering_tools
 # ------------------------------------------------------------
@@ -72,7 +94,7 @@ def list_engineering_tools(
     # 1) Registry sicherstellen ------------------------------------------------
     if not _ENGINEERING_TOOLS_REGISTRY:
         try:
-            asyncio.run(discover_engineering_tools())
+            ensure_tools_discovered()
         except Exception as e:
             return [
                 {
@@ -86,35 +108,22 @@ def list_engineering_tools(
     # 2) Parameter validieren - SPEZIELLER FALL: Leere Tags = Tag-Übersicht --
     if not tags or (len(tags) == 1 and tags[0] == ""):
         try:
-            from engineering_mcp.tag_definitions import get_tag_definitions
-            tag_defs = get_tag_definitions()
-            
-            # Erstelle vollständige Tag-Übersicht
-            tag_overview = []
-            for tag, info in tag_defs.items():
-                tag_overview.append({
-                    "tag": tag,
-                    "description": info["description"],
-                    "tool_count": info["tool_count"],
-                    "tools": info["tools"][:5],  # Zeige nur erste 5 Tools
-                    "more_tools": max(0, info["tool_count"] - 5),
-                    "is_known": info["is_known"]
-                })
-            
-            # Sortiere Tags: Bekannte zuerst, dann alphabetisch
-            tag_overview.sort(key=lambda x: (not x["is_known"], x["tag"]))
+            # ⚡ Vorberechnete Tag-Übersicht aus dem Katalog-Snapshot
+            tag_overview = [dict(entry) for entry in get_tag_overview()]
             
             return [
                 {
                     "status": "TAG_OVERVIEW",
-                    "message": f"Vollständige Tag-Übersicht - {len(tag_defs)} verfügbare Tags",
+                    "message": f"Vollständige Tag-Übersicht - {len(tag_overview)} verfügbare Tags",
                     "available_tags": tag_overview,
-                    "total_tags": len(tag_defs),
+                    "total_tags": len(tag_overview),
                     "usage_examples": [
                         "tags=['all'] - Alle Tools anzeigen",
                         "tags=['elementar'] - Nur grundlegende geometrische Tools",
                         "tags=['schrauben'] - Nur Schrauben-bezogene Tools",
-                        "tags=['mechanik', 'DIN 13'] - Mehrere Tags kombinieren"
+                        "tags=['mechanik', 'DIN 13'] - Mehrere Tags kombinieren (ODER)",
+                        "tags=['schrauben', '+DIN 13'] - Tag muss zusätzlich vorhanden sein (UND)",
+                        "tags=['elementar', '-meta'] - Tag ausschließen (NICHT)"
                     ]
                 }
             ]
@@ -131,20 +140,16 @@ def list_engineering_tools(
                 }
             ]
 
-    # 3) Tools laden & filtern -------------------------------------------------
-    all_tools = get_tool_info_for_llm(include_engineering=True)
-    if "all" in tags:
-        result_tools = all_tools
-    else:
-        result_tools = [t for t in all_tools if any(tag in t.get("tags", []) for tag in tags)]
+    # 3) Tools filtern über invertierten Tag-Index -----------------------------
+    any_of, all_of, none_of = _split_tag_query(tags)
+    if "all" in any_of:
+        any_of = []  # 'all' = keine ODER-Einschränkung
+    result_tools = query_tools_by_tags(any_of=any_of, all_of=all_of, none_of=none_of)
 
-    if not result_tools and all_tools:
-        try:
-            from engineering_mcp.tag_definitions import get_tag_definitions
-            tag_defs = get_tag_definitions()
-            available_tags = ["all"] + sorted(tag_defs.keys()) if tag_defs else ["all"]
-        except Exception:
-            available_tags = ["all", "unknown"]
+    if not result_tools:
+        all_tools = get_tool_info_for_llm(include_engineering=True)
+        tag_counts = get_tag_counts()
+        available_tags = ["all"] + sorted(tag_counts.keys()) if tag_counts else ["all", "unknown"]
 
         return [
             {
@@ -199,7 +204,9 @@ TOOL_METADATA = {
 • tags=["all"] → Alle verfügbaren Tools anzeigen
 • tags=["elementar"] → Nur geometrische Grundberechnungen  
 • tags=["schrauben"] → Nur Schrauben-bezogene Tools
-• tags=["mechanik", "DIN 13"] → Mehrere Tags kombinieren
+• tags=["mechanik", "DIN 13"] → Mehrere Tags kombinieren (ODER)
+• tags=["schrauben", "+DIN 13"] → "+" = Tag muss zusätzlich vorhanden sein (UND)
+• tags=["elementar", "-meta"] → "-" = Tag ausschließen (NICHT)
 
 ⚠️ WICHTIG: Verwenden Sie NIEMALS geratene Tags! 
 Rufen Sie zuerst tags=[""] auf, um alle verfügbaren Tags zu sehen.
@@ -32,13 +32,16 @@ def _create_dynamic_tool_name_field():
     )
 
 async def get_tool_details(
-    tool_name: Annotated[str, _create_dynamic_tool_name_field()]
+    tool_name: Annotated[str, _create_dynamic_tool_name_field()],
+    known_etag: Optional[str] = None
 ) -> Dict:
     """
     Ruft detaillierte Informationen zu einem spezifischen Tool ab und schaltet es für die Ausführung frei.
     
     Args:
         tool_name: Name des Tools für das Details abgerufen werden sollen
+        known_etag: ETag einer bereits abgerufenen Dokumentation - bei Übereinstimmung
+                    wird die Dokumentation nicht erneut übertragen (Tool wird trotzdem freigeschaltet)
         
     Returns:
         Dict: Detaillierte Tool-Informationen oder Fehlermeldung
@@ -76,12 +79,22 @@ async def get_tool_details(
         }
     
     try:
-        details = await get_tool_details_from_registry(tool_name)
+        details = await get_tool_details_from_registry(tool_name, known_etag=known_etag)
         
         # WHITELIST TOOL für call_tool
         add_to_whitelist(tool_name)
         increment_call_count(tool_name)
         
+        # Dokumentation unverändert - nur Freischaltung bestätigen
+        if details.get('not_modified'):
+            details.update({
+                "execution_unlocked": True,
+                "info": "Tool documentation unchanged since the given etag - use your cached copy",
+                "next_step": f"Use call_tool(tool_name='{tool_name}', parameters={{...}}) for execution",
+                "workflow_step": "2/3"
+            })
+            return details
+        
         # Erweitere Details um Ausführungs-Info
         details.update({
             "execution_unlocked": True,
@@ -120,6 +133,7 @@ TOOL_METADATA = {
     "description": """
     Detailinformationen zu einem spezifischen Engineering‑Tool und Tool‑Freischaltung.
     Bevor Du ein Tool verwenden kannst, musst Du mindestens einmal pro Konversation 2_get_tool_details für dieses Tool aufrufen, um es freizuschalten.
+    Jede Antwort enthält ein 'etag'. Wird dieses als known_etag mitgegeben und hat sich die Dokumentation nicht geändert, wird nur die Freischaltung bestätigt (not_modified=true).
 """,
     "tags": ["meta"]
 }
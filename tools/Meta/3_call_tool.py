@@ -11,6 +11,10 @@ from pydantic import Field, ValidationError
 import json
 import re
 from engineering_mcp.registry import call_engineering_tool, _ENGINEERING_TOOLS_REGISTRY
+from engineering_mcp.dimensions import DimensionMismatchError
+from engineering_mcp.executor import ToolTimeoutError, run_sync
+from engineering_mcp.sweeps import SweepError, SWEEP_KINDS
+from engineering_mcp.batch_engine import RESULT_FORMATS, to_columnar
 from tools.Meta.session_state import is_whitelisted, increment_call_count, get_call_count
 
 def _create_dynamic_tool_name_field():
@@ -32,7 +36,7 @@ def _create_dynamic_tool_name_field():
         }
     )
 
-def _clean_parameter_value(value: Any) -> Union[str, List[str]]:
+def _clean_parameter_value(value: Any) -> Union[str, List[str], Dict]:
     """
     Bereinigt Parameter-Werte von häufigen LLM-Syntax-Fehlern.
     
@@ -40,11 +44,16 @@ def _clean_parameter_value(value: Any) -> Union[str, List[str]]:
         value: Roher Parameter-Wert
     
     Returns:
-        Union[str, List[str]]: Bereinigter Parameter-Wert (String oder Liste für Batch-Mode)
+        Union[str, List[str], Dict]: Bereinigter Parameter-Wert (String, Liste für Batch-Mode
+        oder unveränderte Sweep-Angabe)
     """
     if value is None:
         return "target"
     
+    # Sweep-Angaben ({"linspace": [...]}) expandiert der Server selbst
+    if isinstance(value, dict):
+        return value
+    
     # ✅ NEU: Listen für Batch-Mode unverändert lassen
     if isinstance(value, list):
         # Bereinige jeden Listeneintrag einzeln
@@ -94,9 +103,50 @@ def _repair_parameters(parameters: Dict[str, Any]) -> Dict[str, Union[str, List[
     
     return repaired
 
+def _make_chunk_reporter(ctx: Any, tool_name: str, result_format: str, stream_results: bool):
+    """
+    Erstellt den on_chunk-Callback für call_engineering_tool().
+    
+    Meldet nach jedem Batch-Block den Fortschritt über den MCP-Context und sendet
+    bei stream_results den Block selbst als Log-Notification (logger "engineering_batch").
+    
+    Args:
+        ctx: MCP-Context des Aufrufs
+        tool_name: Name des ausgeführten Tools
+        result_format: "rows" oder "columnar" (Format der gestreamten Blöcke)
+        stream_results: Blöcke senden (sonst nur Fortschritt)
+    
+    Returns:
+        Callable: Async-Callback (block_ergebnis, erledigt, gesamt)
+    """
+    async def report_chunk(part: Dict, done: int, total: int) -> None:
+        await ctx.report_progress(done, total, message=f"{done}/{total} Parametersätze berechnet")
+        if not stream_results:
+            return
+        offset = part["results"][0]["batch_index"] if part.get("results") else 0
+        payload = to_columnar(part) if result_format == "columnar" else part
+        await ctx.log(
+            json.dumps({"tool_name": tool_name, "batch_offset": offset, "chunk": payload}, ensure_ascii=False),
+            level="info",
+            logger_name="engineering_batch"
+        )
+    
+    return report_chunk
+
+def _parameters_echo(result: Dict, repaired_parameters: Dict) -> Any:
+    """Parameter für execution_info - entfällt, wenn die Antwort sie schon enthält"""
+    if result.get("result_format") == "columnar":
+        return "see inputs"
+    if result.get("streamed"):
+        return "see streamed chunks"
+    return repaired_parameters
+
 async def call_tool(
     tool_name: str,
-    parameters: Dict[str, Any]
+    parameters: Dict[str, Any],
+    result_format: str = "rows",
+    stream_results: bool = False,
+    ctx: Optional[Any] = None
 ) -> Dict:
     """
     Führt Engineering-Tools mit ultra-toleranter Parameter-Reparatur aus.
@@ -104,6 +154,10 @@ async def call_tool(
     Args:
         tool_name: Name des auszuführenden Tools
         parameters: Tool-Parameter (werden automatisch repariert)
+        result_format: "rows" (eine Zeile pro Parametersatz) oder "columnar"
+            (ein Array pro Ausgabefeld, nur für Batch-Ergebnisse)
+        stream_results: Batch-Blöcke als Notifications senden statt im Ergebnis sammeln
+        ctx: MCP-Context für Fortschritt und Streaming (None = Batch in einem Stück)
         
     Returns:
         Dict: Tool-Ergebnis oder Fehlermeldung
@@ -184,6 +238,17 @@ async def call_tool(
             ]
         }
     
+    # VALIDATION 5: Prüfe result_format
+    if result_format not in RESULT_FORMATS:
+        return {
+            "error": "INVALID_RESULT_FORMAT",
+            "tool_name": tool_name,
+            "problem": f"result_format must be one of {list(RESULT_FORMATS)}, got '{result_format}'",
+            "allowed_values": list(RESULT_FORMATS),
+            "default": "rows",
+            "workflow_step": "3/3 - Invalid Result Format"
+        }
+    
     # Whitelist-Check
     if not is_whitelisted(tool_name):
         return {
@@ -213,10 +278,10 @@ async def call_tool(
             "workflow_step": "3/3 - Rate Limited"
         }
     
-    # Parameter-Reparatur
-    repaired_parameters = _repair_parameters(parameters) if len(parameters) > 0 else {}
+    # Parameter-Reparatur (bei großen Batches spürbar -> außerhalb der Event-Loop)
+    repaired_parameters = await run_sync(_repair_parameters, parameters) if len(parameters) > 0 else {}
     
-    # VALIDATION 5: Prüfe auf leere Parameter nach Reparatur
+    # VALIDATION 6: Prüfe auf leere Parameter nach Reparatur
     if not repaired_parameters:
         return {
             "error": "EMPTY_PARAMETERS",
@@ -236,22 +301,68 @@ async def call_tool(
     
     try:
         # Führe Tool aus
-        result = await call_engineering_tool(tool_name, repaired_parameters)
+        on_chunk = _make_chunk_reporter(ctx, tool_name, result_format, stream_results) if ctx is not None else None
+        result = await call_engineering_tool(
+            tool_name, repaired_parameters,
+            on_chunk=on_chunk, keep_results=not (stream_results and on_chunk is not None)
+        )
         increment_call_count(tool_name)
         
+        # ⚡ Spaltenformat: Batch-Payload ohne wiederholte Zeilenfelder
+        if result_format == "columnar":
+            result = to_columnar(result)
+        
         # Erweitere Ergebnis um Ausführungs-Kontext
         if isinstance(result, dict):
             result.update({
                 "execution_info": {
             "tool_name": tool_name,
-                    "parameters_used": repaired_parameters,
+                    # Spaltenformat/Stream enthalten die Parameter bereits (inputs bzw. Notifications)
+                    "parameters_used": _parameters_echo(result, repaired_parameters),
                     "workflow_step": "3/3 - COMPLETED",
                     "status": "SUCCESS"
         }
             })
         
         return result
-        
+
+    except DimensionMismatchError as e:
+        # Ganze Spalte abgelehnt - es wurde nichts berechnet
+        return {
+            "error": "DIMENSION_MISMATCH",
+            "tool_name": tool_name,
+            "problem": str(e),
+            "parameter": e.parameter,
+            "expected_dimension": e.expected,
+            "invalid_rows": sorted(e.rows)[:20],
+            "invalid_count": len(e.rows),
+            "total_rows": e.total_rows,
+            "help_action": f"Call get_tool_details(tool_name='{tool_name}') to see the expected dimension of each parameter",
+            "workflow_step": "3/3 - Dimension Mismatch"
+        }
+
+    except SweepError as e:
+        return {
+            "error": "INVALID_SWEEP",
+            "tool_name": tool_name,
+            "problem": str(e),
+            "parameter": e.parameter,
+            "sweep_syntax": list(SWEEP_KINDS.values()),
+            "hinweis": "Alle Sweep-Parameter bilden ein kartesisches Produkt, Einzelwerte gelten für alle Zeilen",
+            "workflow_step": "3/3 - Invalid Sweep"
+        }
+
+    except ToolTimeoutError as e:
+        # Zeitlimit überschritten (inkl. Wartezeit auf einen freien Platz des Tools)
+        return {
+            "error": "TOOL_TIMEOUT",
+            "tool_name": tool_name,
+            "problem": str(e),
+            "timeout_seconds": e.timeout,
+            "suggestion": "Split the batch into smaller calls or retry later - the server may be busy with other calls of this tool",
+            "workflow_step": "3/3 - Timeout"
+        }
+
     except Exception as e:
         return {
             "error": "TOOL_EXECUTION_ERROR",
@@ -267,6 +378,9 @@ TOOL_METADATA = {
     "name": "3_call_tool",
     "description": """ Führt ein Tool mit den übergebenen Parametern aus.
     Wenn Du mehrere Berechnungen mit dem gleichen Tool ausführen musst, verwende immer die Batch-Verarbeitung.
+    Für große Batches result_format="columnar" verwenden: ein Array pro Ausgabefeld statt einer Zeile pro Parametersatz.
+    Große Batches werden blockweise mit Fortschrittsmeldung berechnet; mit stream_results=True kommen die Blöcke
+    als Notifications (logger "engineering_batch") und die Antwort enthält nur die Zusammenfassung.
 
 HELP: Bei Fragen get_tool_details() für Parameter-Info aufrufen""",
     "tags": ["meta"]
@@ -133,14 +133,9 @@ from typing import Dict, Annotated, List, Any, Optional
 import sys
 import os
 
-# Import des Einheiten-Utilities (optional für Tabellenwerk)
+# Import des Einheiten-Utilities (gemeinsame Registry - keine eigene Pint-Registry)
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-try:
-    from engineering_mcp.units_utils import ureg
-except ImportError:
-    # Fallback wenn units_utils nicht verfügbar
-    import pint
-    ureg = pint.UnitRegistry()
+from engineering_mcp.units_utils import ureg
 
 # ================================================================================================
 # 🎯 TABELLEN-DATEN 🎯
@@ -348,6 +343,7 @@ def get_metadata():
         "description": TOOL_DESCRIPTION,  # ✅ Neu
         "tags": TOOL_TAGS,  # ✅ Neu: "tags" statt "tool_tags"
         "has_solving": HAS_SOLVING,
+        "persistent_cache": True,  # Tabellen-Abfrage überdauert Neustarts
         
         # ✅ KRITISCH: Parameters Dictionary für Registry-Discovery
         "parameters": {
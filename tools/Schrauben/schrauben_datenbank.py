@@ -608,6 +608,8 @@ Normen: DIN 13-1 bis DIN 13-11, DIN 13-6, VDI 2230, ISO 262""",
         "tags": ["DIN 13", "VDI 2230", "schrauben"],
 
         "has_solving": "none",
+        "persistent_cache": True,  # Datenbank-Abfrage + Markdown-Tabellen überdauern Neustarts
+        "data_files": ["Tabellen/ISO_Metrische_Gewinde_Komplett.csv"],
         "parameters": {
             FUNCTION_PARAM_GEWINDE_NAME: {
                 "type": "string",
@@ -425,6 +425,8 @@ Normen: DIN 13-6 (Reihen), VDI 2230 (Vorspannkraft), ISO 262 (Geometrie)""",
         "tags": ["DIN 13", "VDI 2230"],
 
         "has_solving": "none",
+        "persistent_cache": True,  # Datenbank-Suche + Markdown-Tabellen überdauern Neustarts
+        "data_files": ["Tabellen/ISO_Metrische_Gewinde_Komplett.csv"],
         "parameters": {
             FUNCTION_PARAM_MIN_VORSPANNKRAFT_NAME: {
                 "type": "string",
@@ -67,6 +67,7 @@ Genauigkeit: Exakte analytische Lösung"""
 # Parameter-Definitionen für Metadaten
 PARAMETER_FLAECHE = {
     "type": "string | array",  # ERWEITERT für Batch
+    "dimension": "area",
     "description": FUNCTION_PARAM_1_DESC,
     "example": FUNCTION_PARAM_1_EXAMPLE,
     "batch_example": ["target", "50 cm²", "100 cm²"]  # NEU
@@ -74,6 +75,7 @@ PARAMETER_FLAECHE = {
 
 PARAMETER_RADIUS = {
     "type": "string | array",  # ERWEITERT für Batch
+    "dimension": "length",
     "description": FUNCTION_PARAM_2_DESC,
     "example": FUNCTION_PARAM_2_EXAMPLE,
     "batch_example": ["5 cm", "target", "10 cm"]  # NEU
@@ -140,70 +142,30 @@ from typing import Dict, Annotated, List, Any, Optional, Union
 import sys
 import os
 import math
+import numpy as np
 
 # Import des Einheiten-Utilities
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from engineering_mcp.units_utils import validate_inputs_have_units, optimize_output_unit, UnitsError, ureg
+from engineering_mcp.batch_engine import batch_kernel, run_batch
 
 # ================================================================================================
-# 🔄 BATCH PROCESSING HELPERS 🔄
+# ⚡ BATCH-KERNEL ⚡
 # ================================================================================================
 
-def is_batch_input(params: Dict[str, Any]) -> bool:
-    """
-    Prüft ob die Parameter im Batch-Modus sind.
-    Batch-Modus: ALLE Parameter sind Listen gleicher Länge.
-    """
-    list_params = [k for k, v in params.items() if isinstance(v, list)]
-    
-    # Wenn keine Listen, kein Batch-Modus
-    if not list_params:
-        return False
-    
-    # ALLE Parameter müssen Listen sein
-    if len(list_params) != len(params):
-        return False
-    
-    # Alle Listen müssen gleiche Länge haben
-    lengths = [len(params[k]) for k in list_params]
-    return len(set(lengths)) == 1 and lengths[0] > 0
+# Vektorisierte Berechnung ganzer Batch-Spalten (SI-Arrays) über engineering_mcp.batch_engine.
+# Fehlerfälle und Zeilen ohne Kernel berechnet die Engine weiterhin über _solve_single().
 
-def prepare_batch_combinations(params: Dict[str, Any]) -> List[Dict[str, str]]:
-    """
-    Erstellt Parametersätze für Batch-Verarbeitung.
-    
-    NEU: Alle Parameter müssen Listen gleicher Länge sein!
-    Jeder Index repräsentiert einen vollständigen Parametersatz.
-    
-    Beispiel:
-    Input: {
-        'flaeche': ['target', '50 cm²', 'target'],
-        'radius': ['5 cm', '8 cm', '10 cm']
-    }
-    Output: [
-        {'flaeche': 'target', 'radius': '5 cm'},
-        {'flaeche': '50 cm²', 'radius': '8 cm'},
-        {'flaeche': 'target', 'radius': '10 cm'}
-    ]
-    """
-    # Prüfe ob Batch-Modus
-    if not is_batch_input(params):
-        # Einzelberechnung - gib Parameter unverändert zurück
-        return [params]
-    
-    # Batch-Modus: Alle Parameter sind Listen
-    # Hole die Anzahl der Berechnungen (alle Listen haben gleiche Länge)
-    num_calculations = len(next(iter(params.values())))
-    
-    # Erstelle Parametersätze für jeden Index
-    combinations = []
-    for i in range(num_calculations):
-        combo = {}
-        for key, values in params.items():
-            combo[key] = values[i]
-        combinations.append(combo)
-    
-    return combinations
+@batch_kernel(TOOL_NAME, "flaeche", formula="A = π × r²",
+              header={"📊 ANALYTICAL SOLUTION": "Geschlossene Formel"})
+def _kernel_flaeche(radius):
+    return np.pi * radius * radius
+
+
+@batch_kernel(TOOL_NAME, "radius", formula="r = √(A/π)",
+              header={"📊 ANALYTICAL SOLUTION": "Geschlossene Formel"})
+def _kernel_radius(flaeche):
+    return np.sqrt(flaeche / np.pi)
 
 # ================================================================================================
 # 🎯 TOOL FUNCTIONS 🎯
@@ -228,67 +190,9 @@ def solve_kreis(
             'radius': radius
         }
         
-        # Validiere Batch-Format
-        list_params = [k for k, v in params_dict.items() if isinstance(v, list)]
-        if list_params:
-            # Einige Parameter sind Listen - prüfe ob ALLE Listen sind
-            non_list_params = [k for k, v in params_dict.items() if not isinstance(v, list)]
-            if non_list_params:
-                return {
-                    "error": "Batch-Modus erfordert, dass ALLE Parameter Listen sind",
-                    "list_params": list_params,
-                    "non_list_params": non_list_params,
-                    "hinweis": "Entweder alle Parameter als einzelne Werte ODER alle als Listen gleicher Länge"
-                }
-            
-            # Prüfe ob alle Listen gleiche Länge haben
-            lengths = {k: len(v) for k, v in params_dict.items()}
-            unique_lengths = set(lengths.values())
-            if len(unique_lengths) > 1:
-                return {
-                    "error": "Alle Parameter-Listen müssen die gleiche Länge haben",
-                    "lengths": lengths,
-                    "hinweis": "Jeder Index repräsentiert einen vollständigen Parametersatz"
-                }
-        
-        # Erstelle alle Kombinationen für Batch-Verarbeitung
-        combinations = prepare_batch_combinations(params_dict)
-        
-        # Wenn nur eine Kombination, führe normale Berechnung durch
-        if len(combinations) == 1:
-            return _solve_single(
-                combinations[0]['flaeche'],
-                combinations[0]['radius']
-            )
-        
-        # Batch-Verarbeitung: Berechne alle Kombinationen
-        results = []
-        for i, combo in enumerate(combinations):
-            try:
-                result = _solve_single(
-                    combo['flaeche'],
-                    combo['radius']
-                )
-                # Füge Batch-Index hinzu
-                result['batch_index'] = i
-                result['input_combination'] = combo
-                results.append(result)
-            except Exception as e:
-                # Bei Fehler in einer Berechnung, füge Fehler-Ergebnis hinzu
-                results.append({
-                    'batch_index': i,
-                    'input_combination': combo,
-                    'error': str(e),
-                    'type': type(e).__name__
-                })
-        
-        return {
-            "batch_mode": True,
-            "total_calculations": len(combinations),
-            "successful": sum(1 for r in results if 'error' not in r),
-            "failed": sum(1 for r in results if 'error' in r),
-            "results": results
-        }
+        # ⚡ Batch-Engine: prüft das Batch-Format, rechnet Zeilen mit Kernel vektorisiert,
+        # alle übrigen zeilenweise über _solve_single()
+        return run_batch(TOOL_NAME, params_dict, _solve_single)
         
     except Exception as e:
         return {
@@ -73,6 +73,7 @@ Genauigkeit: Exakte analytische Lösung"""
 # Parameter-Definitionen für Metadaten
 PARAMETER_FLAECHE = {
     "type": "string | array",  # ERWEITERT für Batch
+    "dimension": "area",
     "description": FUNCTION_PARAM_1_DESC,
     "example": FUNCTION_PARAM_1_EXAMPLE,
     "batch_example": ["target", "20 cm²", "target"]  # NEU
@@ -80,6 +81,7 @@ PARAMETER_FLAECHE = {
 
 PARAMETER_GRUNDSEITE = {
     "type": "string | array",  # ERWEITERT für Batch
+    "dimension": "length",
     "description": FUNCTION_PARAM_2_DESC,
     "example": FUNCTION_PARAM_2_EXAMPLE,
     "batch_example": ["10 cm", "8 cm", "12 cm"]  # NEU
@@ -87,6 +89,7 @@ PARAMETER_GRUNDSEITE = {
 
 PARAMETER_HOEHE = {
     "type": "string | array",  # ERWEITERT für Batch
+    "dimension": "length",
     "description": FUNCTION_PARAM_3_DESC,
     "example": FUNCTION_PARAM_3_EXAMPLE,
     "batch_example": ["4 cm", "target", "6 cm"]  # NEU
@@ -157,71 +160,36 @@ PARAMETER_COUNT = len([name for name in globals() if name.startswith('PARAMETER_
 from typing import Dict, Annotated, List, Any, Optional, Union
 import sys
 import os
+import numpy as np
 
 # Import des Einheiten-Utilities
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from engineering_mcp.units_utils import validate_inputs_have_units, optimize_output_unit, UnitsError, ureg
+from engineering_mcp.batch_engine import batch_kernel, run_batch
 
 # ================================================================================================
-# 🔄 BATCH PROCESSING HELPERS 🔄
+# ⚡ BATCH-KERNEL ⚡
 # ================================================================================================
 
-def is_batch_input(params: Dict[str, Any]) -> bool:
-    """
-    Prüft ob die Parameter im Batch-Modus sind.
-    Batch-Modus: ALLE Parameter sind Listen gleicher Länge.
-    """
-    list_params = [k for k, v in params.items() if isinstance(v, list)]
-    
-    # Wenn keine Listen, kein Batch-Modus
-    if not list_params:
-        return False
-    
-    # ALLE Parameter müssen Listen sein
-    if len(list_params) != len(params):
-        return False
-    
-    # Alle Listen müssen gleiche Länge haben
-    lengths = [len(params[k]) for k in list_params]
-    return len(set(lengths)) == 1 and lengths[0] > 0
+# Vektorisierte Berechnung ganzer Batch-Spalten (SI-Arrays) über engineering_mcp.batch_engine.
+# Fehlerfälle und Zeilen ohne Kernel berechnet die Engine weiterhin über _solve_single().
 
-def prepare_batch_combinations(params: Dict[str, Any]) -> List[Dict[str, str]]:
-    """
-    Erstellt Parametersätze für Batch-Verarbeitung.
-    
-    NEU: Alle Parameter müssen Listen gleicher Länge sein!
-    Jeder Index repräsentiert einen vollständigen Parametersatz.
-    
-    Beispiel:
-    Input: {
-        'flaeche': ['target', '20 cm²', 'target'],
-        'grundseite': ['10 cm', '8 cm', '12 cm'],
-        'hoehe': ['4 cm', 'target', '6 cm']
-    }
-    Output: [
-        {'flaeche': 'target', 'grundseite': '10 cm', 'hoehe': '4 cm'},
-        {'flaeche': '20 cm²', 'grundseite': '8 cm', 'hoehe': 'target'},
-        {'flaeche': 'target', 'grundseite': '12 cm', 'hoehe': '6 cm'}
-    ]
-    """
-    # Prüfe ob Batch-Modus
-    if not is_batch_input(params):
-        # Einzelberechnung - gib Parameter unverändert zurück
-        return [params]
-    
-    # Batch-Modus: Alle Parameter sind Listen
-    # Hole die Anzahl der Berechnungen (alle Listen haben gleiche Länge)
-    num_calculations = len(next(iter(params.values())))
-    
-    # Erstelle Parametersätze für jeden Index
-    combinations = []
-    for i in range(num_calculations):
-        combo = {}
-        for key, values in params.items():
-            combo[key] = values[i]
-        combinations.append(combo)
-    
-    return combinations
+@batch_kernel(TOOL_NAME, "flaeche", formula="A = (g × h) / 2",
+              header={"📊 ANALYTICAL SOLUTION": "Geschlossene Formel"})
+def _kernel_flaeche(grundseite, hoehe):
+    return (grundseite * hoehe) / 2
+
+
+@batch_kernel(TOOL_NAME, "grundseite", formula="g = 2A / h",
+              header={"📊 ANALYTICAL SOLUTION": "Geschlossene Formel"})
+def _kernel_grundseite(flaeche, hoehe):
+    return (2 * flaeche) / hoehe
+
+
+@batch_kernel(TOOL_NAME, "hoehe", formula="h = 2A / g",
+              header={"📊 ANALYTICAL SOLUTION": "Geschlossene Formel"})
+def _kernel_hoehe(flaeche, grundseite):
+    return (2 * flaeche) / grundseite
 
 # ================================================================================================
 # 🎯 TOOL FUNCTIONS 🎯
@@ -248,69 +216,9 @@ def solve_dreieck(
             'hoehe': hoehe
         }
         
-        # Validiere Batch-Format
-        list_params = [k for k, v in params_dict.items() if isinstance(v, list)]
-        if list_params:
-            # Einige Parameter sind Listen - prüfe ob ALLE Listen sind
-            non_list_params = [k for k, v in params_dict.items() if not isinstance(v, list)]
-            if non_list_params:
-                return {
-                    "error": "Batch-Modus erfordert, dass ALLE Parameter Listen sind",
-                    "list_params": list_params,
-                    "non_list_params": non_list_params,
-                    "hinweis": "Entweder alle Parameter als einzelne Werte ODER alle als Listen gleicher Länge"
-                }
-            
-            # Prüfe ob alle Listen gleiche Länge haben
-            lengths = {k: len(v) for k, v in params_dict.items()}
-            unique_lengths = set(lengths.values())
-            if len(unique_lengths) > 1:
-                return {
-                    "error": "Alle Parameter-Listen müssen die gleiche Länge haben",
-                    "lengths": lengths,
-                    "hinweis": "Jeder Index repräsentiert einen vollständigen Parametersatz"
-                }
-        
-        # Erstelle alle Kombinationen für Batch-Verarbeitung
-        combinations = prepare_batch_combinations(params_dict)
-        
-        # Wenn nur eine Kombination, führe normale Berechnung durch
-        if len(combinations) == 1:
-            return _solve_single(
-                combinations[0]['flaeche'],
-                combinations[0]['grundseite'],
-                combinations[0]['hoehe']
-            )
-        
-        # Batch-Verarbeitung: Berechne alle Kombinationen
-        results = []
-        for i, combo in enumerate(combinations):
-            try:
-                result = _solve_single(
-                    combo['flaeche'],
-                    combo['grundseite'],
-                    combo['hoehe']
-                )
-                # Füge Batch-Index hinzu
-                result['batch_index'] = i
-                result['input_combination'] = combo
-                results.append(result)
-            except Exception as e:
-                # Bei Fehler in einer Berechnung, füge Fehler-Ergebnis hinzu
-                results.append({
-                    'batch_index': i,
-                    'input_combination': combo,
-                    'error': str(e),
-                    'type': type(e).__name__
-                })
-        
-        return {
-            "batch_mode": True,
-            "total_calculations": len(combinations),
-            "successful": sum(1 for r in results if 'error' not in r),
-            "failed": sum(1 for r in results if 'error' in r),
-            "results": results
-        }
+        # ⚡ Batch-Engine: prüft das Batch-Format, rechnet Zeilen mit Kernel vektorisiert,
+        # alle übrigen zeilenweise über _solve_single()
+        return run_batch(TOOL_NAME, params_dict, _solve_single)
         
     except Exception as e:
         return {
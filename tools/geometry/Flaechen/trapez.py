@@ -79,6 +79,7 @@ Genauigkeit: Exakte analytische Lösung"""
 # Parameter-Definitionen für Metadaten
 PARAMETER_FLAECHE = {
     "type": "string | array",  # ERWEITERT für Batch
+    "dimension": "area",
     "description": FUNCTION_PARAM_1_DESC,
     "example": FUNCTION_PARAM_1_EXAMPLE,
     "batch_example": ["target", "70 cm²", "target"]  # NEU
@@ -86,6 +87,7 @@ PARAMETER_FLAECHE = {
 
 PARAMETER_GRUNDSEITE_A = {
     "type": "string | array",  # ERWEITERT für Batch
+    "dimension": "length",
     "description": FUNCTION_PARAM_2_DESC,
     "example": FUNCTION_PARAM_2_EXAMPLE,
     "batch_example": ["8 cm", "9 cm", "10 cm"]  # NEU
@@ -93,6 +95,7 @@ PARAMETER_GRUNDSEITE_A = {
 
 PARAMETER_GRUNDSEITE_B = {
     "type": "string | array",  # ERWEITERT für Batch
+    "dimension": "length",
     "description": FUNCTION_PARAM_3_DESC,
     "example": FUNCTION_PARAM_3_EXAMPLE,
     "batch_example": ["12 cm", "11 cm", "14 cm"]  # NEU
@@ -100,6 +103,7 @@ PARAMETER_GRUNDSEITE_B = {
 
 PARAMETER_HOEHE = {
     "type": "string | array",  # ERWEITERT für Batch
+    "dimension": "length",
     "description": FUNCTION_PARAM_4_DESC,
     "example": FUNCTION_PARAM_4_EXAMPLE,
     "batch_example": ["6 cm", "target", "7 cm"]  # NEU
@@ -171,72 +175,42 @@ PARAMETER_COUNT = len([name for name in globals() if name.startswith('PARAMETER_
 from typing import Dict, Annotated, List, Any, Optional, Union
 import sys
 import os
+import numpy as np
 
 # Import des Einheiten-Utilities
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from engineering_mcp.units_utils import validate_inputs_have_units, optimize_output_unit, UnitsError, ureg
+from engineering_mcp.batch_engine import batch_kernel, run_batch
 
 # ================================================================================================
-# 🔄 BATCH PROCESSING HELPERS 🔄
+# ⚡ BATCH-KERNEL ⚡
 # ================================================================================================
 
-def is_batch_input(params: Dict[str, Any]) -> bool:
-    """
-    Prüft ob die Parameter im Batch-Modus sind.
-    Batch-Modus: ALLE Parameter sind Listen gleicher Länge.
-    """
-    list_params = [k for k, v in params.items() if isinstance(v, list)]
-    
-    # Wenn keine Listen, kein Batch-Modus
-    if not list_params:
-        return False
-    
-    # ALLE Parameter müssen Listen sein
-    if len(list_params) != len(params):
-        return False
-    
-    # Alle Listen müssen gleiche Länge haben
-    lengths = [len(params[k]) for k in list_params]
-    return len(set(lengths)) == 1 and lengths[0] > 0
+# Vektorisierte Berechnung ganzer Batch-Spalten (SI-Arrays) über engineering_mcp.batch_engine.
+# Fehlerfälle und Zeilen ohne Kernel berechnet die Engine weiterhin über _solve_single().
+
+@batch_kernel(TOOL_NAME, "flaeche", formula="A = (1/2) × (a + b) × h",
+              header={"📊 ANALYTICAL SOLUTION": "Geschlossene Formel"})
+def _kernel_flaeche(grundseite_a, grundseite_b, hoehe):
+    return 0.5 * (grundseite_a + grundseite_b) * hoehe
 
-def prepare_batch_combinations(params: Dict[str, Any]) -> List[Dict[str, str]]:
-    """
-    Erstellt Parametersätze für Batch-Verarbeitung.
-    
-    NEU: Alle Parameter müssen Listen gleicher Länge sein!
-    Jeder Index repräsentiert einen vollständigen Parametersatz.
-    
-    Beispiel:
-    Input: {
-        'flaeche': ['target', '70 cm²', 'target'],
-        'grundseite_a': ['8 cm', '9 cm', '10 cm'],
-        'grundseite_b': ['12 cm', '11 cm', '14 cm'],
-        'hoehe': ['6 cm', 'target', '7 cm']
-    }
-    Output: [
-        {'flaeche': 'target', 'grundseite_a': '8 cm', 'grundseite_b': '12 cm', 'hoehe': '6 cm'},
-        {'flaeche': '70 cm²', 'grundseite_a': '9 cm', 'grundseite_b': '11 cm', 'hoehe': 'target'},
-        {'flaeche': 'target', 'grundseite_a': '10 cm', 'grundseite_b': '14 cm', 'hoehe': '7 cm'}
-    ]
-    """
-    # Prüfe ob Batch-Modus
-    if not is_batch_input(params):
-        # Einzelberechnung - gib Parameter unverändert zurück
-        return [params]
-    
-    # Batch-Modus: Alle Parameter sind Listen
-    # Hole die Anzahl der Berechnungen (alle Listen haben gleiche Länge)
-    num_calculations = len(next(iter(params.values())))
-    
-    # Erstelle Parametersätze für jeden Index
-    combinations = []
-    for i in range(num_calculations):
-        combo = {}
-        for key, values in params.items():
-            combo[key] = values[i]
-        combinations.append(combo)
-    
-    return combinations
+
+@batch_kernel(TOOL_NAME, "grundseite_a", formula="a = (2A / h) - b",
+              header={"📊 ANALYTICAL SOLUTION": "Geschlossene Formel"})
+def _kernel_grundseite_a(flaeche, grundseite_b, hoehe):
+    return (2 * flaeche / hoehe) - grundseite_b
+
+
+@batch_kernel(TOOL_NAME, "grundseite_b", formula="b = (2A / h) - a",
+              header={"📊 ANALYTICAL SOLUTION": "Geschlossene Formel"})
+def _kernel_grundseite_b(flaeche, grundseite_a, hoehe):
+    return (2 * flaeche / hoehe) - grundseite_a
+
+
+@batch_kernel(TOOL_NAME, "hoehe", formula="h = 2A / (a + b)",
+              header={"📊 ANALYTICAL SOLUTION": "Geschlossene Formel"})
+def _kernel_hoehe(flaeche, grundseite_a, grundseite_b):
+    return (2 * flaeche) / (grundseite_a + grundseite_b)
 
 # ================================================================================================
 # 🎯 TOOL FUNCTIONS 🎯
@@ -265,71 +239,9 @@ def solve_trapez(
             'hoehe': hoehe
         }
         
-        # Validiere Batch-Format
-        list_params = [k for k, v in params_dict.items() if isinstance(v, list)]
-        if list_params:
-            # Einige Parameter sind Listen - prüfe ob ALLE Listen sind
-            non_list_params = [k for k, v in params_dict.items() if not isinstance(v, list)]
-            if non_list_params:
-                return {
-                    "error": "Batch-Modus erfordert, dass ALLE Parameter Listen sind",
-                    "list_params": list_params,
-                    "non_list_params": non_list_params,
-                    "hinweis": "Entweder alle Parameter als einzelne Werte ODER alle als Listen gleicher Länge"
-                }
-            
-            # Prüfe ob alle Listen gleiche Länge haben
-            lengths = {k: len(v) for k, v in params_dict.items()}
-            unique_lengths = set(lengths.values())
-            if len(unique_lengths) > 1:
-                return {
-                    "error": "Alle Parameter-Listen müssen die gleiche Länge haben",
-                    "lengths": lengths,
-                    "hinweis": "Jeder Index repräsentiert einen vollständigen Parametersatz"
-                }
-        
-        # Erstelle alle Kombinationen für Batch-Verarbeitung
-        combinations = prepare_batch_combinations(params_dict)
-        
-        # Wenn nur eine Kombination, führe normale Berechnung durch
-        if len(combinations) == 1:
-            return _solve_single(
-                combinations[0]['flaeche'],
-                combinations[0]['grundseite_a'],
-                combinations[0]['grundseite_b'],
-                combinations[0]['hoehe']
-            )
-        
-        # Batch-Verarbeitung: Berechne alle Kombinationen
-        results = []
-        for i, combo in enumerate(combinations):
-            try:
-                result = _solve_single(
-                    combo['flaeche'],
-                    combo['grundseite_a'],
-                    combo['grundseite_b'],
-                    combo['hoehe']
-                )
-                # Füge Batch-Index hinzu
-                result['batch_index'] = i
-                result['input_combination'] = combo
-                results.append(result)
-            except Exception as e:
-                # Bei Fehler in einer Berechnung, füge Fehler-Ergebnis hinzu
-                results.append({
-                    'batch_index': i,
-                    'input_combination': combo,
-                    'error': str(e),
-                    'type': type(e).__name__
-                })
-        
-        return {
-            "batch_mode": True,
-            "total_calculations": len(combinations),
-            "successful": sum(1 for r in results if 'error' not in r),
-            "failed": sum(1 for r in results if 'error' in r),
-            "results": results
-        }
+        # ⚡ Batch-Engine: prüft das Batch-Format, rechnet Zeilen mit Kernel vektorisiert,
+        # alle übrigen zeilenweise über _solve_single()
+        return run_batch(TOOL_NAME, params_dict, _solve_single)
         
     except Exception as e:
         return {
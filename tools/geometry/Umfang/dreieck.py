@@ -63,6 +63,7 @@ Genauigkeit: Exakte analytische Lösung"""
 # Parameter-Definitionen für Metadaten
 PARAMETER_UMFANG = {
     "type": "string | array",
+    "dimension": "length",
     "description": FUNCTION_PARAM_1_DESC,
     "example": FUNCTION_PARAM_1_EXAMPLE,
     "batch_example": ["target", "36 cm", "target"]
@@ -70,6 +71,7 @@ PARAMETER_UMFANG = {
 
 PARAMETER_SEITE_A = {
     "type": "string | array", 
+    "dimension": "length",
     "description": FUNCTION_PARAM_2_DESC,
     "example": FUNCTION_PARAM_2_EXAMPLE,
     "batch_example": ["3 cm", "target", "10 cm"]
@@ -77,6 +79,7 @@ PARAMETER_SEITE_A = {
 
 PARAMETER_SEITE_B = {
     "type": "string | array",
+    "dimension": "length",
     "description": FUNCTION_PARAM_3_DESC,
     "example": FUNCTION_PARAM_3_EXAMPLE,
     "batch_example": ["4 cm", "12 cm", "target"]
@@ -84,6 +87,7 @@ PARAMETER_SEITE_B = {
 
 PARAMETER_SEITE_C = {
     "type": "string | array",
+    "dimension": "length",
     "description": FUNCTION_PARAM_4_DESC,
     "example": FUNCTION_PARAM_4_EXAMPLE,
     "batch_example": ["5 cm", "16 cm", "8 cm"]
@@ -145,59 +149,50 @@ PARAMETER_COUNT = len([name for name in globals() if name.startswith('PARAMETER_
 from typing import Dict, Annotated, List, Any, Optional, Union
 import sys
 import os
+import numpy as np
 
 # Import des Einheiten-Utilities
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from engineering_mcp.units_utils import validate_inputs_have_units, optimize_output_unit, UnitsError, ureg
+from engineering_mcp.batch_engine import batch_kernel, run_batch
 
 # ================================================================================================
-# 🔄 BATCH PROCESSING HELPERS 🔄
+# ⚡ BATCH-KERNEL ⚡
 # ================================================================================================
 
-def is_batch_input(params: Dict[str, Any]) -> bool:
-    """
-    Prüft ob die Parameter im Batch-Modus sind.
-    Batch-Modus: ALLE Parameter sind Listen gleicher Länge.
-    """
-    list_params = [k for k, v in params.items() if isinstance(v, list)]
-    
-    # Wenn keine Listen, kein Batch-Modus
-    if not list_params:
-        return False
-    
-    # ALLE Parameter müssen Listen sein
-    if len(list_params) != len(params):
-        return False
-    
-    # Alle Listen müssen gleiche Länge haben
-    lengths = [len(params[k]) for k in list_params]
-    return len(set(lengths)) == 1 and lengths[0] > 0
+# Vektorisierte Berechnung ganzer Batch-Spalten (SI-Arrays) über engineering_mcp.batch_engine.
+# Fehlerfälle und Zeilen ohne Kernel berechnet die Engine weiterhin über _solve_single().
+
+def _is_triangle(seite_a, seite_b, seite_c):
+    """Dreiecksungleichung elementweise (wie in _solve_single)"""
+    return (seite_a + seite_b > seite_c) & (seite_a + seite_c > seite_b) & (seite_b + seite_c > seite_a)
+
+
+@batch_kernel(TOOL_NAME, "umfang", formula="U = a + b + c",
+              header={"📊 ANALYTICAL SOLUTION": "Geschlossene Formel"})
+def _kernel_umfang(seite_a, seite_b, seite_c):
+    return np.where(_is_triangle(seite_a, seite_b, seite_c), seite_a + seite_b + seite_c, np.nan)
 
-def prepare_batch_combinations(params: Dict[str, Any]) -> List[Dict[str, str]]:
-    """
-    Erstellt Parametersätze für Batch-Verarbeitung.
-    
-    NEU: Alle Parameter müssen Listen gleicher Länge sein!
-    Jeder Index repräsentiert einen vollständigen Parametersatz.
-    """
-    # Prüfe ob Batch-Modus
-    if not is_batch_input(params):
-        # Einzelberechnung - gib Parameter unverändert zurück
-        return [params]
-    
-    # Batch-Modus: Alle Parameter sind Listen
-    # Hole die Anzahl der Berechnungen (alle Listen haben gleiche Länge)
-    num_calculations = len(next(iter(params.values())))
-    
-    # Erstelle Parametersätze für jeden Index
-    combinations = []
-    for i in range(num_calculations):
-        combo = {}
-        for key, values in params.items():
-            combo[key] = values[i]
-        combinations.append(combo)
-    
-    return combinations
+
+@batch_kernel(TOOL_NAME, "seite_a", formula="a = U - b - c",
+              header={"📊 ANALYTICAL SOLUTION": "Geschlossene Formel"})
+def _kernel_seite_a(umfang, seite_b, seite_c):
+    seite_a = umfang - seite_b - seite_c
+    return np.where(_is_triangle(seite_a, seite_b, seite_c), seite_a, np.nan)
+
+
+@batch_kernel(TOOL_NAME, "seite_b", formula="b = U - a - c",
+              header={"📊 ANALYTICAL SOLUTION": "Geschlossene Formel"})
+def _kernel_seite_b(umfang, seite_a, seite_c):
+    seite_b = umfang - seite_a - seite_c
+    return np.where(_is_triangle(seite_a, seite_b, seite_c), seite_b, np.nan)
+
+
+@batch_kernel(TOOL_NAME, "seite_c", formula="c = U - a - b",
+              header={"📊 ANALYTICAL SOLUTION": "Geschlossene Formel"})
+def _kernel_seite_c(umfang, seite_a, seite_b):
+    seite_c = umfang - seite_a - seite_b
+    return np.where(_is_triangle(seite_a, seite_b, seite_c), seite_c, np.nan)
 
 # ================================================================================================
 # 🎯 TOOL FUNCTIONS 🎯
@@ -226,71 +221,9 @@ def solve_dreieck_umfang(
             'seite_c': seite_c
         }
         
-        # Validiere Batch-Format
-        list_params = [k for k, v in params_dict.items() if isinstance(v, list)]
-        if list_params:
-            # Einige Parameter sind Listen - prüfe ob ALLE Listen sind
-            non_list_params = [k for k, v in params_dict.items() if not isinstance(v, list)]
-            if non_list_params:
-                return {
-                    "error": "Batch-Modus erfordert, dass ALLE Parameter Listen sind",
-                    "list_params": list_params,
-                    "non_list_params": non_list_params,
-                    "hinweis": "Entweder alle Parameter als einzelne Werte ODER alle als Listen gleicher Länge"
-                }
-            
-            # Prüfe ob alle Listen gleiche Länge haben
-            lengths = {k: len(v) for k, v in params_dict.items()}
-            unique_lengths = set(lengths.values())
-            if len(unique_lengths) > 1:
-                return {
-                    "error": "Alle Parameter-Listen müssen die gleiche Länge haben",
-                    "lengths": lengths,
-                    "hinweis": "Jeder Index repräsentiert einen vollständigen Parametersatz"
-                }
-        
-        # Erstelle alle Kombinationen für Batch-Verarbeitung
-        combinations = prepare_batch_combinations(params_dict)
-        
-        # Wenn nur eine Kombination, führe normale Berechnung durch
-        if len(combinations) == 1:
-            return _solve_single(
-                combinations[0]['umfang'],
-                combinations[0]['seite_a'],
-                combinations[0]['seite_b'],
-                combinations[0]['seite_c']
-            )
-        
-        # Batch-Verarbeitung: Berechne alle Kombinationen
-        results = []
-        for i, combo in enumerate(combinations):
-            try:
-                result = _solve_single(
-                    combo['umfang'],
-                    combo['seite_a'],
-                    combo['seite_b'],
-                    combo['seite_c']
-                )
-                # Füge Batch-Index hinzu
-                result['batch_index'] = i
-                result['input_combination'] = combo
-                results.append(result)
-            except Exception as e:
-                # Bei Fehler in einer Berechnung, füge Fehler-Ergebnis hinzu
-                results.append({
-                    'batch_index': i,
-                    'input_combination': combo,
-                    'error': str(e),
-                    'type': type(e).__name__
-                })
-        
-        return {
-            "batch_mode": True,
-            "total_calculations": len(combinations),
-            "successful": sum(1 for r in results if 'error' not in r),
-            "failed": sum(1 for r in results if 'error' in r),
-            "results": results
-        }
+        # ⚡ Batch-Engine: prüft das Batch-Format, rechnet Zeilen mit Kernel vektorisiert,
+        # alle übrigen zeilenweise über _solve_single()
+        return run_batch(TOOL_NAME, params_dict, _solve_single)
         
     except Exception as e:
         return {
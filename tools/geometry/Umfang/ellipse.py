@@ -38,6 +38,7 @@ Genauigkeit: Ramanujan-Fehler < 5×10⁻⁵, numerische Toleranz 1×10⁻¹⁰""
 # Parameter-Definitionen
 PARAMETER_PERIMETER = {
     "type": "string | array",
+    "dimension": "length",
     "description": "Umfang der Ellipse mit Längeneinheit (z.B. '31.42 cm', '314.2 mm', '0.3142 m') oder 'target' für Berechnung. BATCH: Als Teil einer Liste mit vollständigen Parametersätzen",
     "example": "31.42 cm",
     "batch_example": ["target", "40 cm", "target"]
@@ -45,6 +46,7 @@ PARAMETER_PERIMETER = {
 
 PARAMETER_SEMI_MAJOR_AXIS = {
     "type": "string | array", 
+    "dimension": "length",
     "description": "Große Halbachse der Ellipse mit Längeneinheit (z.B. '5 cm', '50 mm', '0.05 m') oder 'target' für Berechnung. BATCH: Als Teil einer Liste mit vollständigen Parametersätzen",
     "example": "5 cm",
     "batch_example": ["6 cm", "target", "8 cm"]
@@ -52,6 +54,7 @@ PARAMETER_SEMI_MAJOR_AXIS = {
 
 PARAMETER_SEMI_MINOR_AXIS = {
     "type": "string | array",
+    "dimension": "length",
     "description": "Kleine Halbachse der Ellipse mit Längeneinheit (z.B. '3 cm', '30 mm', '0.03 m') oder 'target' für Berechnung. BATCH: Als Teil einer Liste mit vollständigen Parametersätzen",
     "example": "3 cm",
     "batch_example": ["4 cm", "5 cm", "target"]
@@ -136,59 +139,31 @@ from typing import Dict, Optional, Annotated, List, Any, Union
 import sys
 import os
 import math
+import numpy as np
 
 # Import des Einheiten-Utilities
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from engineering_mcp.units_utils import validate_inputs_have_units, optimize_output_unit, UnitsError, ureg
+from engineering_mcp.batch_engine import batch_kernel, run_batch
 
 # ================================================================================================
-# 🔄 BATCH PROCESSING HELPERS 🔄
+# ⚡ BATCH-KERNEL ⚡
 # ================================================================================================
 
-def is_batch_input(params: Dict[str, Any]) -> bool:
-    """
-    Prüft ob die Parameter im Batch-Modus sind.
-    Batch-Modus: ALLE Parameter sind Listen gleicher Länge.
-    """
-    list_params = [k for k, v in params.items() if isinstance(v, list)]
-    
-    # Wenn keine Listen, kein Batch-Modus
-    if not list_params:
-        return False
-    
-    # ALLE Parameter müssen Listen sein
-    if len(list_params) != len(params):
-        return False
-    
-    # Alle Listen müssen gleiche Länge haben
-    lengths = [len(params[k]) for k in list_params]
-    return len(set(lengths)) == 1 and lengths[0] > 0
+# Vektorisierte Berechnung ganzer Batch-Spalten (SI-Arrays) über engineering_mcp.batch_engine.
+# Fehlerfälle und Zeilen ohne Kernel berechnet die Engine weiterhin über _solve_single().
+# Halbachsen: kein Kernel - numerische Lösung (Bisektion) pro Zeile.
+
+@batch_kernel(TOOL_NAME, "perimeter", formula="U ≈ π × (a+b) × [1 + 3h/(10+√(4-3h))] (Ramanujan)",
+              trailer={"hinweis": "h = ((a-b)/(a+b))², a = große Halbachse, b = kleine Halbachse",
+                       "berechnungsart": "📊 ANALYTISCHE LÖSUNG (geschlossene Formel)"},
+              labels={"perimeter": "umfang", "semi_major_axis": "grosse_halbachse", "semi_minor_axis": "kleine_halbachse"})
+def _kernel_perimeter(semi_major_axis, semi_minor_axis):
+    # Vertauschte Halbachsen (b > a) -> NaN, _solve_single tauscht sie inkl. Ausgabe
+    a, b = semi_major_axis, semi_minor_axis
+    h = ((a - b) / (a + b))**2
+    return np.where(b > a, np.nan, np.pi * (a + b) * (1 + (3 * h) / (10 + np.sqrt(4 - 3 * h))))
 
-def prepare_batch_combinations(params: Dict[str, Any]) -> List[Dict[str, str]]:
-    """
-    Erstellt Parametersätze für Batch-Verarbeitung.
-    
-    NEU: Alle Parameter müssen Listen gleicher Länge sein!
-    Jeder Index repräsentiert einen vollständigen Parametersatz.
-    """
-    # Prüfe ob Batch-Modus
-    if not is_batch_input(params):
-        # Einzelberechnung - gib Parameter unverändert zurück
-        return [params]
-    
-    # Batch-Modus: Alle Parameter sind Listen
-    # Hole die Anzahl der Berechnungen (alle Listen haben gleiche Länge)
-    num_calculations = len(next(iter(params.values())))
-    
-    # Erstelle Parametersätze für jeden Index
-    combinations = []
-    for i in range(num_calculations):
-        combo = {}
-        for key, values in params.items():
-            combo[key] = values[i]
-        combinations.append(combo)
-    
-    return combinations
 
 def ramanujan_perimeter(a: float, b: float) -> float:
     """
@@ -314,69 +289,9 @@ def solve_ellipse_umfang(
             'semi_minor_axis': semi_minor_axis
         }
         
-        # Validiere Batch-Format
-        list_params = [k for k, v in params_dict.items() if isinstance(v, list)]
-        if list_params:
-            # Einige Parameter sind Listen - prüfe ob ALLE Listen sind
-            non_list_params = [k for k, v in params_dict.items() if not isinstance(v, list)]
-            if non_list_params:
-                return {
-                    "error": "Batch-Modus erfordert, dass ALLE Parameter Listen sind",
-                    "list_params": list_params,
-                    "non_list_params": non_list_params,
-                    "hinweis": "Entweder alle Parameter als einzelne Werte ODER alle als Listen gleicher Länge"
-                }
-            
-            # Prüfe ob alle Listen gleiche Länge haben
-            lengths = {k: len(v) for k, v in params_dict.items()}
-            unique_lengths = set(lengths.values())
-            if len(unique_lengths) > 1:
-                return {
-                    "error": "Alle Parameter-Listen müssen die gleiche Länge haben",
-                    "lengths": lengths,
-                    "hinweis": "Jeder Index repräsentiert einen vollständigen Parametersatz"
-                }
-        
-        # Erstelle alle Kombinationen für Batch-Verarbeitung
-        combinations = prepare_batch_combinations(params_dict)
-        
-        # Wenn nur eine Kombination, führe normale Berechnung durch
-        if len(combinations) == 1:
-            return _solve_single(
-                combinations[0]['perimeter'],
-                combinations[0]['semi_major_axis'],
-                combinations[0]['semi_minor_axis']
-            )
-        
-        # Batch-Verarbeitung: Berechne alle Kombinationen
-        results = []
-        for i, combo in enumerate(combinations):
-            try:
-                result = _solve_single(
-                    combo['perimeter'],
-                    combo['semi_major_axis'],
-                    combo['semi_minor_axis']
-                )
-                # Füge Batch-Index hinzu
-                result['batch_index'] = i
-                result['input_combination'] = combo
-                results.append(result)
-            except Exception as e:
-                # Bei Fehler in einer Berechnung, füge Fehler-Ergebnis hinzu
-                results.append({
-                    'batch_index': i,
-                    'input_combination': combo,
-                    'error': str(e),
-                    'type': type(e).__name__
-                })
-        
-        return {
-            "batch_mode": True,
-            "total_calculations": len(combinations),
-            "successful": sum(1 for r in results if 'error' not in r),
-            "failed": sum(1 for r in results if 'error' in r),
-            "results": results
-        }
+        # ⚡ Batch-Engine: prüft das Batch-Format, rechnet Zeilen mit Kernel vektorisiert,
+        # alle übrigen zeilenweise über _solve_single()
+        return run_batch(TOOL_NAME, params_dict, _solve_single)
         
     except Exception as e:
         return {
@@ -672,6 +587,7 @@ def get_metadata():
         "assumptions": TOOL_ASSUMPTIONS,
         "limitations": TOOL_LIMITATIONS,
         "has_solving": HAS_SOLVING,
+        "persistent_cache": True,  # Numerisch gelöste Halbachsen überdauern Neustarts
         "reference_units": REFERENCE_UNITS
     }
     
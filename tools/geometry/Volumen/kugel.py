@@ -53,6 +53,7 @@ Genauigkeit: Exakte analytische Lösung"""
 # Parameter-Definitionen für Metadaten
 PARAMETER_VOLUMEN = {
     "type": "string | array",
+    "dimension": "volume",
     "description": FUNCTION_PARAM_1_DESC,
     "example": FUNCTION_PARAM_1_EXAMPLE,
     "batch_example": ["target", "1000 cm³", "target"]
@@ -60,6 +61,7 @@ PARAMETER_VOLUMEN = {
 
 PARAMETER_RADIUS = {
     "type": "string | array", 
+    "dimension": "length",
     "description": FUNCTION_PARAM_2_DESC,
     "example": FUNCTION_PARAM_2_EXAMPLE,
     "batch_example": ["6 cm", "target", "8 cm"]
@@ -117,59 +119,26 @@ from typing import Dict, Optional, Annotated, List, Any, Union
 import sys
 import os
 import math
+import numpy as np
 
 # Import des Einheiten-Utilities
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from engineering_mcp.units_utils import validate_inputs_have_units, optimize_output_unit, UnitsError, ureg
+from engineering_mcp.batch_engine import batch_kernel, run_batch
 
 # ================================================================================================
-# 🔄 BATCH PROCESSING HELPERS 🔄
+# ⚡ BATCH-KERNEL ⚡
 # ================================================================================================
 
-def is_batch_input(params: Dict[str, Any]) -> bool:
-    """
-    Prüft ob die Parameter im Batch-Modus sind.
-    Batch-Modus: ALLE Parameter sind Listen gleicher Länge.
-    """
-    list_params = [k for k, v in params.items() if isinstance(v, list)]
-    
-    # Wenn keine Listen, kein Batch-Modus
-    if not list_params:
-        return False
-    
-    # ALLE Parameter müssen Listen sein
-    if len(list_params) != len(params):
-        return False
-    
-    # Alle Listen müssen gleiche Länge haben
-    lengths = [len(params[k]) for k in list_params]
-    return len(set(lengths)) == 1 and lengths[0] > 0
+# Vektorisierte Berechnung ganzer Batch-Spalten (SI-Arrays) über engineering_mcp.batch_engine.
+# Fehlerfälle und Zeilen ohne Kernel berechnet die Engine weiterhin über _solve_single().
+# radius: kein Kernel - die Ausgabe-Einheit hängt von der Schreibweise der Volumen-Einheit ab.
+
+@batch_kernel(TOOL_NAME, "volumen", formula="V = (4/3) × π × r³",
+              trailer={"berechnungsart": "📊 ANALYTICAL SOLUTION"})
+def _kernel_volumen(radius):
+    return (4/3) * np.pi * radius**3
 
-def prepare_batch_combinations(params: Dict[str, Any]) -> List[Dict[str, str]]:
-    """
-    Erstellt Parametersätze für Batch-Verarbeitung.
-    
-    NEU: Alle Parameter müssen Listen gleicher Länge sein!
-    Jeder Index repräsentiert einen vollständigen Parametersatz.
-    """
-    # Prüfe ob Batch-Modus
-    if not is_batch_input(params):
-        # Einzelberechnung - gib Parameter unverändert zurück
-        return [params]
-    
-    # Batch-Modus: Alle Parameter sind Listen
-    # Hole die Anzahl der Berechnungen (alle Listen haben gleiche Länge)
-    num_calculations = len(next(iter(params.values())))
-    
-    # Erstelle Parametersätze für jeden Index
-    combinations = []
-    for i in range(num_calculations):
-        combo = {}
-        for key, values in params.items():
-            combo[key] = values[i]
-        combinations.append(combo)
-    
-    return combinations
 
 def solve_kugel(
     volumen: Annotated[Union[str, List[str]], FUNCTION_PARAM_1_DESC],
@@ -182,67 +151,9 @@ def solve_kugel(
             'radius': radius
         }
         
-        # Validiere Batch-Format
-        list_params = [k for k, v in params_dict.items() if isinstance(v, list)]
-        if list_params:
-            # Einige Parameter sind Listen - prüfe ob ALLE Listen sind
-            non_list_params = [k for k, v in params_dict.items() if not isinstance(v, list)]
-            if non_list_params:
-                return {
-                    "error": "Batch-Modus erfordert, dass ALLE Parameter Listen sind",
-                    "list_params": list_params,
-                    "non_list_params": non_list_params,
-                    "hinweis": "Entweder alle Parameter als einzelne Werte ODER alle als Listen gleicher Länge"
-                }
-            
-            # Prüfe ob alle Listen gleiche Länge haben
-            lengths = {k: len(v) for k, v in params_dict.items()}
-            unique_lengths = set(lengths.values())
-            if len(unique_lengths) > 1:
-                return {
-                    "error": "Alle Parameter-Listen müssen die gleiche Länge haben",
-                    "lengths": lengths,
-                    "hinweis": "Jeder Index repräsentiert einen vollständigen Parametersatz"
-                }
-        
-        # Erstelle alle Kombinationen für Batch-Verarbeitung
-        combinations = prepare_batch_combinations(params_dict)
-        
-        # Wenn nur eine Kombination, führe normale Berechnung durch
-        if len(combinations) == 1:
-            return _solve_single(
-                combinations[0]['volumen'],
-                combinations[0]['radius']
-            )
-        
-        # Batch-Verarbeitung: Berechne alle Kombinationen
-        results = []
-        for i, combo in enumerate(combinations):
-            try:
-                result = _solve_single(
-                    combo['volumen'],
-                    combo['radius']
-                )
-                # Füge Batch-Index hinzu
-                result['batch_index'] = i
-                result['input_combination'] = combo
-                results.append(result)
-            except Exception as e:
-                # Bei Fehler in einer Berechnung, füge Fehler-Ergebnis hinzu
-                results.append({
-                    'batch_index': i,
-                    'input_combination': combo,
-                    'error': str(e),
-                    'type': type(e).__name__
-                })
-        
-        return {
-            "batch_mode": True,
-            "total_calculations": len(combinations),
-            "successful": sum(1 for r in results if 'error' not in r),
-            "failed": sum(1 for r in results if 'error' in r),
-            "results": results
-        }
+        # ⚡ Batch-Engine: prüft das Batch-Format, rechnet Zeilen mit Kernel vektorisiert,
+        # alle übrigen zeilenweise über _solve_single()
+        return run_batch(TOOL_NAME, params_dict, _solve_single)
         
     except Exception as e:
         return {
@@ -323,7 +234,7 @@ def _solve_single(
             
             # Optimiere Ausgabe-Einheit
             volume_quantity = v_si * ureg.meter**3
-            volume_optimized = optimize_volume_unit(volume_quantity, params['radius']['original_unit'])
+            volume_optimized = optimize_output_unit(volume_quantity, params['radius']['original_unit'])
             
             return {
                 "target_parameter": FUNCTION_PARAM_1_NAME,
@@ -384,26 +295,6 @@ def _solve_single(
             "hinweis": "Überprüfen Sie die Eingabe-Parameter und Einheiten"
         }
 
-def optimize_volume_unit(si_quantity, reference_unit_str: str):
-    """
-    Optimiert Volumeneinheiten basierend auf Größenordnung.
-    """
-    try:
-        magnitude = si_quantity.magnitude  # in m³
-        
-        # Bestimme optimale Volumeneinheit
-        if magnitude >= 1:  # >= 1 m³
-            return si_quantity.to(ureg.meter**3)
-        elif magnitude >= 0.001:  # >= 1 dm³ (= 1 Liter)
-            return si_quantity.to(ureg.liter)
-        elif magnitude >= 1e-6:  # >= 1 cm³
-            return si_quantity.to(ureg.centimeter**3)
-        else:  # < 1 cm³
-            return si_quantity.to(ureg.millimeter**3)
-            
-    except Exception:
-        return si_quantity
-
 # ⚡ NEUE TOOL-STRUKTUR: get_metadata() und calculate() Funktionen
 
 def get_metadata():
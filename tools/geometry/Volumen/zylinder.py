@@ -58,18 +58,21 @@ Genauigkeit: Exakte analytische Lösung"""
 # Parameter-Definitionen für Metadaten
 PARAMETER_VOLUMEN = {
     "type": "string",
+    "dimension": "volume",
     "description": FUNCTION_PARAM_1_DESC,
     "example": FUNCTION_PARAM_1_EXAMPLE
 }
 
 PARAMETER_RADIUS = {
     "type": "string", 
+    "dimension": "length",
     "description": FUNCTION_PARAM_2_DESC,
     "example": FUNCTION_PARAM_2_EXAMPLE
 }
 
 PARAMETER_HOEHE = {
     "type": "string",
+    "dimension": "length",
     "description": FUNCTION_PARAM_3_DESC,
     "example": FUNCTION_PARAM_3_EXAMPLE
 }
@@ -132,59 +135,39 @@ from typing import Dict, Optional, Annotated, List, Any, Union
 import sys
 import os
 import math
+import numpy as np
 
 # Import des Einheiten-Utilities
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from engineering_mcp.units_utils import validate_inputs_have_units, optimize_output_unit, UnitsError, ureg
+from engineering_mcp.batch_engine import batch_kernel, run_batch
 
 # ================================================================================================
-# 🔄 BATCH PROCESSING HELPERS 🔄
+# ⚡ BATCH-KERNEL ⚡
 # ================================================================================================
 
-def is_batch_input(params: Dict[str, Any]) -> bool:
-    """
-    Prüft ob die Parameter im Batch-Modus sind.
-    Batch-Modus: ALLE Parameter sind Listen gleicher Länge.
-    """
-    list_params = [k for k, v in params.items() if isinstance(v, list)]
-    
-    # Wenn keine Listen, kein Batch-Modus
-    if not list_params:
-        return False
-    
-    # ALLE Parameter müssen Listen sein
-    if len(list_params) != len(params):
-        return False
-    
-    # Alle Listen müssen gleiche Länge haben
-    lengths = [len(params[k]) for k in list_params]
-    return len(set(lengths)) == 1 and lengths[0] > 0
+# Vektorisierte Berechnung ganzer Batch-Spalten (SI-Arrays) über engineering_mcp.batch_engine.
+# Fehlerfälle und Zeilen ohne Kernel berechnet die Engine weiterhin über _solve_single_zylinder().
 
-def prepare_batch_combinations(params: Dict[str, Any]) -> List[Dict[str, str]]:
-    """
-    Erstellt Parametersätze für Batch-Verarbeitung.
-    
-    NEU: Alle Parameter müssen Listen gleicher Länge sein!
-    Jeder Index repräsentiert einen vollständigen Parametersatz.
-    """
-    # Prüfe ob Batch-Modus
-    if not is_batch_input(params):
-        # Einzelberechnung - gib Parameter unverändert zurück
-        return [params]
-    
-    # Batch-Modus: Alle Parameter sind Listen
-    # Hole die Anzahl der Berechnungen (alle Listen haben gleiche Länge)
-    num_calculations = len(next(iter(params.values())))
-    
-    # Erstelle Parametersätze für jeden Index
-    combinations = []
-    for i in range(num_calculations):
-        combo = {}
-        for key, values in params.items():
-            combo[key] = values[i]
-        combinations.append(combo)
-    
-    return combinations
+# Reihenfolge der si_werte (wie in _solve_single_zylinder)
+_SI_ORDER = ("volumen", "radius", "hoehe")
+
+@batch_kernel(TOOL_NAME, "volumen", formula="V = π × r² × h",
+              si_order=_SI_ORDER, trailer={"berechnungsart": "📊 ANALYTICAL SOLUTION"})
+def _kernel_volumen(radius, hoehe):
+    return np.pi * radius**2 * hoehe
+
+
+@batch_kernel(TOOL_NAME, "radius", formula="r = √(V / (π × h))",
+              si_order=_SI_ORDER, trailer={"berechnungsart": "📊 ANALYTICAL SOLUTION"})
+def _kernel_radius(volumen, hoehe):
+    return np.sqrt(volumen / (np.pi * hoehe))
+
+
+@batch_kernel(TOOL_NAME, "hoehe", formula="h = V / (π × r²)",
+              si_order=_SI_ORDER, trailer={"berechnungsart": "📊 ANALYTICAL SOLUTION"})
+def _kernel_hoehe(volumen, radius):
+    return volumen / (np.pi * radius**2)
 
 # ================================================================================================
 # 🎯 TOOL FUNCTIONS 🎯
@@ -212,69 +195,9 @@ def solve_zylinder(
             'hoehe': hoehe
         }
         
-        # Validiere Batch-Format
-        list_params = [k for k, v in params_dict.items() if isinstance(v, list)]
-        if list_params:
-            # Einige Parameter sind Listen - prüfe ob ALLE Listen sind
-            non_list_params = [k for k, v in params_dict.items() if not isinstance(v, list)]
-            if non_list_params:
-                return {
-                    "error": "Batch-Modus erfordert, dass ALLE Parameter Listen sind",
-                    "list_params": list_params,
-                    "non_list_params": non_list_params,
-                    "hinweis": "Entweder alle Parameter als einzelne Werte ODER alle als Listen gleicher Länge"
-                }
-            
-            # Prüfe ob alle Listen gleiche Länge haben
-            lengths = {k: len(v) for k, v in params_dict.items()}
-            unique_lengths = set(lengths.values())
-            if len(unique_lengths) > 1:
-                return {
-                    "error": "Alle Parameter-Listen müssen die gleiche Länge haben",
-                    "lengths": lengths,
-                    "hinweis": "Jeder Index repräsentiert einen vollständigen Parametersatz"
-                }
-        
-        # Erstelle alle Kombinationen für Batch-Verarbeitung
-        combinations = prepare_batch_combinations(params_dict)
-        
-        # Wenn nur eine Kombination, führe normale Berechnung durch
-        if len(combinations) == 1:
-            return _solve_single_zylinder(
-                combinations[0]['volumen'],
-                combinations[0]['radius'],
-                combinations[0]['hoehe']
-            )
-        
-        # Batch-Verarbeitung: Berechne alle Kombinationen
-        results = []
-        for i, combo in enumerate(combinations):
-            try:
-                result = _solve_single_zylinder(
-                    combo['volumen'],
-                    combo['radius'],
-                    combo['hoehe']
-                )
-                # Füge Batch-Index hinzu
-                result['batch_index'] = i
-                result['input_combination'] = combo
-                results.append(result)
-            except Exception as e:
-                # Bei Fehler in einer Berechnung, füge Fehler-Ergebnis hinzu
-                results.append({
-                    'batch_index': i,
-                    'input_combination': combo,
-                    'error': str(e),
-                    'type': type(e).__name__
-                })
-        
-        return {
-            "batch_mode": True,
-            "total_calculations": len(combinations),
-            "successful": sum(1 for r in results if 'error' not in r),
-            "failed": sum(1 for r in results if 'error' in r),
-            "results": results
-        }
+        # ⚡ Batch-Engine: prüft das Batch-Format, rechnet Zeilen mit Kernel vektorisiert,
+        # alle übrigen zeilenweise über _solve_single_zylinder()
+        return run_batch(TOOL_NAME, params_dict, _solve_single_zylinder)
         
     except Exception as e:
         return {
@@ -360,7 +283,7 @@ def _solve_single_zylinder(
             # Optimiere Ausgabe-Einheit (nutze kleinere Dimension als Referenz)
             ref_unit = params[FUNCTION_PARAM_2_NAME]['original_unit'] if radius_si < height_si else params[FUNCTION_PARAM_3_NAME]['original_unit']
             volume_quantity = volume_si * ureg.meter**3
-            volume_optimized = optimize_volume_unit(volume_quantity, ref_unit)
+            volume_optimized = optimize_output_unit(volume_quantity, ref_unit)
             
             return {
                 "target_parameter": FUNCTION_PARAM_1_NAME,
@@ -454,14 +377,6 @@ def _solve_single_zylinder(
             "funktion": "solve_zylinder"
         }
 
-def optimize_volume_unit(si_quantity, reference_unit_str: str):
-    """Optimiert die Ausgabe-Einheit für Volumen basierend auf der Referenz-Einheit"""
-    try:
-        return optimize_output_unit(si_quantity, reference_unit_str)
-    except:
-        # Standard-Optimierung wenn Referenz-Einheit nicht funktioniert
-        return optimize_output_unit(si_quantity, "meter")
-
 # ================================================================================================
 # 🎯 METADATA FUNCTIONS 🎯
 # ================================================================================================
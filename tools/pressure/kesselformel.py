@@ -57,6 +57,7 @@ Einschränkungen: Gilt für dünnwandige Behälter (s/D < 0.1), alle Werte müss
 # Parameter-Definitionen für Metadaten
 PARAMETER_DRUCK = {
     "type": "string | array",
+    "dimension": "pressure",
     "description": FUNCTION_PARAM_1_DESC,
     "example": FUNCTION_PARAM_1_EXAMPLE,
     "batch_example": ["10 bar", "15 bar", "20 bar"]
@@ -64,6 +65,7 @@ PARAMETER_DRUCK = {
 
 PARAMETER_WANDDICKE = {
     "type": "string | array", 
+    "dimension": "length",
     "description": FUNCTION_PARAM_2_DESC,
     "example": FUNCTION_PARAM_2_EXAMPLE,
     "batch_example": ["5 mm", "8 mm", "10 mm"]
@@ -71,6 +73,7 @@ PARAMETER_WANDDICKE = {
 
 PARAMETER_DURCHMESSER = {
     "type": "string | array",
+    "dimension": "length",
     "description": FUNCTION_PARAM_3_DESC,
     "example": FUNCTION_PARAM_3_EXAMPLE,
     "batch_example": ["300 mm", "500 mm", "800 mm"]
@@ -78,6 +81,7 @@ PARAMETER_DURCHMESSER = {
 
 PARAMETER_ZULAESSIGE_SPANNUNG = {
     "type": "string | array",
+    "dimension": "pressure",
     "description": FUNCTION_PARAM_4_DESC,
     "example": FUNCTION_PARAM_4_EXAMPLE,
     "batch_example": ["160 MPa", "200 MPa", "250 MPa"]
@@ -146,68 +150,43 @@ PARAMETER_COUNT = len([name for name in globals() if name.startswith('PARAMETER_
 from typing import Dict, Annotated, List, Any, Union
 import sys
 import os
+import numpy as np
 
 # Import des Einheiten-Utilities
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from engineering_mcp.units_utils import validate_inputs_have_units, optimize_output_unit, UnitsError, ureg
+from engineering_mcp.batch_engine import batch_kernel, run_batch
 
 # ================================================================================================
-# 🎯 BATCH PROCESSING HELPER FUNCTIONS 🎯
+# ⚡ BATCH-KERNEL ⚡
 # ================================================================================================
 
-def is_batch_input(druck, wanddicke, durchmesser, zulaessige_spannung) -> bool:
-    """Prüft, ob es sich um eine Batch-Eingabe handelt"""
-    return any(isinstance(param, list) for param in [druck, wanddicke, durchmesser, zulaessige_spannung])
+# Vektorisierte Berechnung ganzer Batch-Spalten (SI-Arrays) über engineering_mcp.batch_engine.
+# Fehlerfälle berechnet die Engine weiterhin über _solve_kesselformel_single().
+
+@batch_kernel(TOOL_NAME, "druck", formula="p = (2 × σ_zul × s) / D",
+              header={"📊 ANALYTICAL SOLUTION": "Kesselformel - Druck berechnet"})
+def _kernel_druck(wanddicke, durchmesser, zulaessige_spannung):
+    return (2 * zulaessige_spannung * wanddicke) / durchmesser
 
-def prepare_batch_combinations(druck, wanddicke, durchmesser, zulaessige_spannung) -> Union[List[Dict], Dict]:
-    """
-    Bereitet Batch-Kombinationen vor und validiert sie.
-    
-    Returns:
-        List[Dict]: Liste von Parameter-Kombinationen
-        Dict: Fehler-Dictionary bei ungültiger Eingabe
-    """
-    params = {
-        'druck': druck,
-        'wanddicke': wanddicke, 
-        'durchmesser': durchmesser,
-        'zulaessige_spannung': zulaessige_spannung
-    }
-    
-    # Identifiziere Listen-Parameter
-    list_params = {k: v for k, v in params.items() if isinstance(v, list)}
-    single_params = {k: v for k, v in params.items() if not isinstance(v, list)}
-    
-    if not list_params:
-        return {"error": "Keine Listen-Parameter gefunden"}
-    
-    # Prüfe, dass alle Listen die gleiche Länge haben
-    list_lengths = [len(v) for v in list_params.values()]
-    if len(set(list_lengths)) > 1:
-        return {
-            "error": "Alle Listen-Parameter müssen die gleiche Länge haben",
-            "gefundene_laengen": {k: len(v) for k, v in list_params.items()},
-            "hinweis": "Jeder Index repräsentiert eine vollständige Parameter-Kombination"
-        }
-    
-    # Erstelle Kombinationen
-    batch_length = list_lengths[0]
-    combinations = []
-    
-    for i in range(batch_length):
-        combination = {}
-        
-        # Füge Listen-Werte hinzu
-        for param_name, param_list in list_params.items():
-            combination[param_name] = param_list[i]
-        
-        # Füge Einzel-Werte hinzu  
-        for param_name, param_value in single_params.items():
-            combination[param_name] = param_value
-            
-        combinations.append(combination)
-    
-    return combinations
+
+@batch_kernel(TOOL_NAME, "wanddicke", formula="s = (p × D) / (2 × σ_zul)",
+              header={"📊 ANALYTICAL SOLUTION": "Kesselformel - Wanddicke berechnet"})
+def _kernel_wanddicke(druck, durchmesser, zulaessige_spannung):
+    return (druck * durchmesser) / (2 * zulaessige_spannung)
+
+
+@batch_kernel(TOOL_NAME, "durchmesser", formula="D = (2 × σ_zul × s) / p",
+              header={"📊 ANALYTICAL SOLUTION": "Kesselformel - Durchmesser berechnet"})
+def _kernel_durchmesser(druck, wanddicke, zulaessige_spannung):
+    return (2 * zulaessige_spannung * wanddicke) / druck
+
+
+@batch_kernel(TOOL_NAME, "zulaessige_spannung", formula="σ_zul = (p × D) / (2 × s)",
+              given=("druck", "durchmesser", "wanddicke"),
+              header={"📊 ANALYTICAL SOLUTION": "Kesselformel - Zulässige Spannung berechnet"})
+def _kernel_zulaessige_spannung(druck, wanddicke, durchmesser):
+    return (druck * durchmesser) / (2 * wanddicke)
 
 # ================================================================================================
 # 🎯 TOOL FUNCTIONS 🎯
@@ -236,61 +215,17 @@ def solve_kesselformel(
         List[Dict]: Batch-Verarbeitung mit strukturierten Ergebnissen
     """
     try:
-        # 🎯 BATCH-DETECTION & ORCHESTRATION
-        if is_batch_input(druck, wanddicke, durchmesser, zulaessige_spannung):
-            combinations = prepare_batch_combinations(druck, wanddicke, durchmesser, zulaessige_spannung)
-            
-            if isinstance(combinations, dict) and "error" in combinations:
-                return combinations
-            
-            # Batch-Verarbeitung
-            results = []
-            successful = 0
-            failed = 0
-            
-            for i, combination in enumerate(combinations):
-                try:
-                    single_result = _solve_kesselformel_single(
-                        combination['druck'], 
-                        combination['wanddicke'], 
-                        combination['durchmesser'], 
-                        combination['zulaessige_spannung']
-                    )
-                    
-                    if "error" not in single_result:
-                        successful += 1
-                        results.append({
-                            "batch_index": i,
-                            "input_combination": combination,
-                            "ergebnis": single_result
-                        })
-                    else:
-                        failed += 1
-                        results.append({
-                            "batch_index": i,
-                            "input_combination": combination,
-                            "error": single_result["error"]
-                        })
-                        
-                except Exception as e:
-                    failed += 1
-                    results.append({
-                        "batch_index": i,
-                        "input_combination": combination,
-                        "error": f"Berechnungsfehler: {str(e)}"
-                    })
-            
-            return {
-                "batch_mode": True,
-                "total_calculations": len(combinations),
-                "successful": successful,
-                "failed": failed,
-                "results": results
-            }
+        params_dict = {
+            'druck': druck,
+            'wanddicke': wanddicke,
+            'durchmesser': durchmesser,
+            'zulaessige_spannung': zulaessige_spannung
+        }
         
-        else:
-            # Einzelberechnung
-            return _solve_kesselformel_single(druck, wanddicke, durchmesser, zulaessige_spannung)
+        # 🎯 BATCH-DETECTION & ORCHESTRATION über die Batch-Engine:
+        # Einzelwerte werden auf alle Zeilen übertragen, Einzelergebnis unter "ergebnis"
+        return run_batch(TOOL_NAME, params_dict, _solve_kesselformel_single,
+                         broadcast_scalars=True, nest_results=True)
     
     except Exception as e:
         return {
@@ -1,9 +1,14 @@
 # web.py  — kleinste funktionierende Version
-import os, uvicorn
+import os, hmac, uvicorn
 from starlette.applications import Starlette
-from starlette.responses import PlainTextResponse
+from starlette.responses import PlainTextResponse, JSONResponse
 from starlette.routing import Route
 from server import mcp, init_all_tools
+from engineering_mcp.hot_reload import start_tool_watcher
+from engineering_mcp.executor import shutdown_executors
+from engineering_mcp.startup_profile import get_startup_report
+from engineering_mcp.result_cache import get_result_cache_stats
+from engineering_mcp.persistent_cache import shutdown_persistent_cache
 
 # 1️⃣  Sub-Apps: internes Prefix entfernen (path="/")
 http_app = mcp.http_app(path="/")                        # registriert "/"
@@ -17,17 +22,50 @@ sse_app.router.redirect_slashes  = True
 async def health(_): 
     return PlainTextResponse("OK")
 
+# 3️⃣b Admin-Routen: nur mit MCP_ADMIN_TOKEN (sonst nicht eingehängt),
+#     Aufruf mit Header "Authorization: Bearer <token>"
+ADMIN_TOKEN = os.getenv("MCP_ADMIN_TOKEN", "")
+
+def admin_only(handler):
+    async def guarded(request):
+        supplied = request.headers.get("authorization", "").removeprefix("Bearer ").strip()
+        if not hmac.compare_digest(supplied.encode(), ADMIN_TOKEN.encode()):
+            return PlainTextResponse("Unauthorized", status_code=401)
+        return await handler(request)
+    return guarded
+
+# Startup-Profil (Import-Kosten pro Tool, Phasen, Zeit bis bereit)
+async def startup_profile(_):
+    return JSONResponse(get_startup_report())
+
+# Ergebnis-Cache (Treffer/Fehlschläge pro Tool, Cache-Datei)
+async def result_cache_stats(_):
+    return JSONResponse(get_result_cache_stats())
+
 # 4️⃣  Haupt-App mit erweitertem Lifespan für Engineering-Tools
 async def lifespan(app):
     # Startup: Alle Tools initialisieren
     await init_all_tools()
     
+    # Optional: Hot-Reload geänderter Tools (MCP_HOT_RELOAD=true)
+    watcher = start_tool_watcher()
+    
     # Original lifespan durchführen
-    async with http_app.lifespan(app):
-        yield
+    try:
+        async with http_app.lifespan(app):
+            yield
+    finally:
+        if watcher is not None:
+            watcher.cancel()
+        shutdown_executors()
+        shutdown_persistent_cache()
+
+routes = [Route("/health", health, methods=["GET"])]
+if ADMIN_TOKEN:
+    routes += [Route("/admin/startup", admin_only(startup_profile), methods=["GET"]),
+               Route("/admin/cache", admin_only(result_cache_stats), methods=["GET"])]
 
-app = Starlette(routes=[Route("/health", health, methods=["GET"])],
-                lifespan=lifespan)
+app = Starlette(routes=routes, lifespan=lifespan)
 app.router.redirect_slashes = False                     # root-Router
 
 # 5️⃣  *Ein* Mount je Transport – mit korrektem Präfix